@@ -0,0 +1,89 @@
+"""
+BENCHMARK: BUMPY ARRAY ALLOCATIONS
+PROTOCOL: tracemalloc PEAK BYTES + LIVE BLOCKS + WALL TIME PER OP, LIST MODE VS COMPACT array('d') MODE
+OPS: construction, __add__, __mul__ (array and scalar), dot, relu, softmax
+"""
+
+import sys
+import os
+import time
+import tracemalloc
+
+# Ensure we can import from project root
+sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+import bumpy
+from bumpy import BumpyArray
+
+SIZE = 1024
+REPEATS = 200
+
+def _ops(a, b):
+    return [
+        ('construct', lambda: BumpyArray(a.data, a.coherence, compact=a.compact)),
+        ('add', lambda: a + b),
+        ('add scalar', lambda: a + 2.0),
+        ('mul', lambda: a * b),
+        ('mul scalar', lambda: a * 0.5),
+        ('dot', lambda: a.dot(b)),
+        ('relu', lambda: a.relu()),
+        ('softmax', lambda: a.softmax()),
+    ]
+
+def _fresh(values, compact):
+    # New operands per op so entanglement bookkeeping does not accumulate
+    return BumpyArray(values, 0.9, compact=compact), BumpyArray(values[::-1], 0.9, compact=compact)
+
+def measure(values, compact):
+    """{op: (peak bytes allocated, live blocks added, bytes retained, microseconds)}"""
+    ignore_tracer = [tracemalloc.Filter(False, tracemalloc.__file__)]
+    results = {}
+    for index, (name, _) in enumerate(_ops(*_fresh(values, compact))):
+        # Allocation pass: a single op between two snapshots
+        op = _ops(*_fresh(values, compact))[index][1]
+        tracemalloc.start()
+        before = tracemalloc.take_snapshot().filter_traces(ignore_tracer)
+        base = tracemalloc.get_traced_memory()[0]
+        tracemalloc.reset_peak()
+        result = op()
+        current, peak = tracemalloc.get_traced_memory()
+        after = tracemalloc.take_snapshot().filter_traces(ignore_tracer)
+        tracemalloc.stop()
+        blocks = sum(stat.count_diff for stat in after.compare_to(before, 'filename'))
+        del result
+
+        # Timing pass: only the op itself is timed, on fresh operands each time
+        elapsed = 0.0
+        for _ in range(REPEATS):
+            op = _ops(*_fresh(values, compact))[index][1]
+            start = time.perf_counter()
+            op()
+            elapsed += time.perf_counter() - start
+        results[name] = (peak - base, blocks, current - base, elapsed / REPEATS * 1e6)
+    return results
+
+def run_benchmark():
+    bumpy.seed(0)
+    values = [((i * 37) % 101) / 50.0 - 1.0 for i in range(SIZE)]
+    print(f"{'='*60}")
+    print(f"BENCHMARK: BUMPY ALLOCATIONS PER OP ({SIZE} elements)")
+    print(f"{'='*60}")
+
+    loose = measure(values, compact=False)
+    compact = measure(values, compact=True)
+    print("Per op: peak KiB allocated / live blocks added / microseconds")
+    print(f"{'op':<12}{'list mode':>24}{'compact mode':>27}")
+    for name in loose:
+        l_bytes, l_blocks, _, l_us = loose[name]
+        c_bytes, c_blocks, _, c_us = compact[name]
+        print(f"{name:<12}{l_bytes / 1024:>10.1f} {l_blocks:>7} {l_us:>7.0f}"
+              f"{c_bytes / 1024:>14.1f} {c_blocks:>7} {c_us:>7.0f}")
+    print(f"{'-'*60}")
+    l_retained, c_retained = loose['add'][2], compact['add'][2]
+    print(f"Memory held by one result array: list {l_retained / 1024:.1f} KiB | "
+          f"compact {c_retained / 1024:.1f} KiB ({l_retained / max(c_retained, 1):.1f}x smaller)")
+    print(f"{'='*60}")
+    return loose, compact
+
+if __name__ == "__main__":
+    run_benchmark()
@@ -0,0 +1,100 @@
+"""
+BENCHMARK: FLUMPY ENTANGLEMENT + SIMILARITY
+PROTOCOL: MICROSECONDS PER entangle() ON A HUB ALREADY LINKED TO 10 / 1K / 100K ARRAYS
+          VS THE O(degree) LIST SCAN IT REPLACED; similarity_kernel PER-ELEMENT LOOPS VS CACHED NORM + C DOT
+"""
+
+import sys
+import os
+import math
+import time
+import random
+
+# Ensure we can import from project root
+sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from flumpy import FlumpyArray
+
+DEGREES = (10, 1_000, 100_000)
+PROBES = 1_000
+VECTOR = [1.0, 2.0, 3.0, 4.0]
+SIMILARITY_SIZES = (16, 1024)
+
+def _spoke(hub):
+    spoke = FlumpyArray(VECTOR)
+    spoke.phase = hub.phase  # in phase, so the similarity clears the threshold
+    return spoke
+
+def build_hub(degree):
+    hub = FlumpyArray(VECTOR)
+    spokes = [_spoke(hub) for _ in range(degree)]
+    for spoke in spokes:
+        hub.entangle(spoke)
+    return hub, spokes
+
+def time_entangle(hub):
+    """Microseconds per successful entangle() of a fresh array with the hub"""
+    probes = [_spoke(hub) for _ in range(PROBES)]
+    start = time.perf_counter()
+    linked = sum(hub.entangle(probe) for probe in probes)
+    elapsed = time.perf_counter() - start
+    assert linked == PROBES
+    return elapsed / PROBES * 1e6
+
+def time_list_scan(spokes):
+    """Microseconds per `other not in list` membership check the list version did twice per link"""
+    links = list(spokes)
+    probe = FlumpyArray(VECTOR)
+    repeats = max(1, 100_000 // len(links))
+    start = time.perf_counter()
+    for _ in range(repeats):
+        probe not in links
+    return (time.perf_counter() - start) / repeats * 1e6
+
+def _loop_similarity(a, b):
+    norm_a = math.sqrt(sum(x**2 for x in a.data))
+    norm_b = math.sqrt(sum(x**2 for x in b.data))
+    dot = sum(x * y for x, y in zip(a.data, b.data))
+    phase_coherence = math.cos(abs(a.phase - b.phase) % (2 * math.pi))
+    return max(-1.0, min(1.0, dot / (norm_a * norm_b) * (0.7 + 0.3 * phase_coherence)))
+
+def time_similarity(size, repeats=2_000):
+    a = FlumpyArray([random.uniform(-1, 1) for _ in range(size)])
+    b = FlumpyArray([random.uniform(-1, 1) for _ in range(size)])
+    start = time.perf_counter()
+    for _ in range(repeats):
+        _loop_similarity(a, b)
+    loop_us = (time.perf_counter() - start) / repeats * 1e6
+    start = time.perf_counter()
+    for _ in range(repeats):
+        a.similarity_kernel(b)
+    kernel_us = (time.perf_counter() - start) / repeats * 1e6
+    return loop_us, kernel_us
+
+def run_benchmark():
+    random.seed(0)
+    print(f"{'='*60}")
+    print(f"BENCHMARK: FLUMPY entangle() COST BY DEGREE")
+    print(f"{'='*60}")
+    print(f"{'degree':>8} {'entangle us':>12} {'list scan us':>14}")
+    results = {}
+    for degree in DEGREES:
+        hub, spokes = build_hub(degree)
+        entangle_us = time_entangle(hub)
+        scan_us = 2 * time_list_scan(spokes)
+        results[degree] = (entangle_us, scan_us)
+        print(f"{degree:>8,} {entangle_us:>12.2f} {scan_us:>14.2f}")
+        del hub, spokes
+    print("(list scan: the two `not in entangled_with` checks the list version paid on top)")
+
+    print(f"{'-'*60}")
+    print(f"similarity_kernel per call")
+    print(f"{'size':>8} {'loops us':>12} {'cached+C us':>14}")
+    for size in SIMILARITY_SIZES:
+        loop_us, kernel_us = time_similarity(size)
+        print(f"{size:>8} {loop_us:>12.2f} {kernel_us:>14.2f}  ({loop_us / kernel_us:.1f}x)")
+    print(f"{'='*60}")
+    return results
+
+if __name__ == "__main__":
+    run_benchmark()
@@ -0,0 +1,140 @@
+"""
+BENCHMARK: LASER UniversalCache (OrderedDict LRU + BYTE BUDGET) VS THE PREVIOUS SCAN-EVICTING CACHE
+PROTOCOL: 1M MIXED OPERATIONS (70% get / 30% set) OVER A SKEWED KEY SPACE 4x THE CACHE CAPACITY,
+          LASER-SHAPED ENTRY DICTS, compress=False. THE PREVIOUS CACHE IS TIMED ON A SHORTER PREFIX OF
+          THE SAME STREAM BECAUSE EVERY EVICTION SCANS THE WHOLE CACHE. REPORTS OPS/S AND HIT RATE
+"""
+
+import sys
+import os
+import math
+import time
+import random
+import contextlib
+
+# Ensure we can import from project root
+sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+with contextlib.redirect_stdout(open(os.devnull, 'w')):
+    import laser
+from laser import UniversalCache
+
+OPERATIONS = 1_000_000
+LEGACY_OPERATIONS = 50_000
+CAPACITY = 1000
+KEYS = 4 * CAPACITY
+GET_RATIO = 0.7
+
+
+class LegacyUniversalCache:
+    """The hot path of UniversalCache before the LRU rewrite (compression and refresh left out)"""
+
+    def __init__(self, max_size=1000):
+        self.max_size = max_size
+        self.cache = {}
+        self.timestamps = {}
+        self.access_patterns = {}
+        self.metrics = {'hits': 0, 'misses': 0}
+
+    def get(self, key):
+        if key in self.cache:
+            self.access_patterns[key] = self.access_patterns.get(key, 0) + 1
+            self.metrics['hits'] += 1
+            return self.cache[key]
+        self.metrics['misses'] += 1
+        return None
+
+    def set(self, key, value, compress=True):
+        if self._memory_pressure() > 0.8:
+            self._aggressive_evict()
+        self.cache[key] = value
+        self.timestamps[key] = time.time() + random.uniform(-0.001, 0.001)
+        self.access_patterns[key] = 0
+        if len(self.cache) >= self.max_size:
+            self._quantum_evict()
+
+    def _memory_pressure(self):
+        try:
+            return laser.psutil.virtual_memory().percent / 100.0
+        except Exception:
+            return len(self.cache) / self.max_size
+
+    def _aggressive_evict(self):
+        now = time.time()
+        scores = {key: (now - self.timestamps[key]) / max(1, self.access_patterns.get(key, 0) * 0.1)
+                  for key in self.cache}
+        ranked = sorted(scores.items(), key=lambda x: x[1], reverse=True)
+        for key, _ in ranked[:max(1, len(ranked) // 5)]:
+            self.delete(key)
+
+    def _quantum_evict(self):
+        now = time.time()
+        weights = {key: math.exp(-self.access_patterns.get(key, 0) * 0.1) *
+                        (1.0 - math.exp(-(now - self.timestamps[key]) / 3600))
+                   for key in self.cache}
+        total = sum(weights.values())
+        if total == 0:
+            return
+        selected, cumulative = random.random() * total, 0
+        for key, weight in weights.items():
+            cumulative += weight
+            if cumulative >= selected:
+                self.delete(key)
+                break
+
+    def delete(self, key):
+        self.cache.pop(key, None)
+        self.timestamps.pop(key, None)
+        self.access_patterns.pop(key, None)
+
+
+def make_operations(count):
+    rng = random.Random(0)
+    operations = []
+    for i in range(count):
+        # Skewed keys: low indices are hot, the tail is cold but still touched
+        key = f"entry:{int(KEYS * rng.random() ** 3)}"
+        if rng.random() < GET_RATIO:
+            operations.append((key, None))
+        else:
+            operations.append((key, {'id': key, 'universal_time': 1e6 + i, 'value': rng.random(),
+                                     'message': f"op {i}", 'quantum': {'coherence': rng.random()}}))
+    return operations
+
+def measure(cache, operations):
+    get, set_ = cache.get, cache.set
+    start = time.perf_counter()
+    for key, value in operations:
+        if value is None:
+            get(key)
+        else:
+            set_(key, value, compress=False)
+    elapsed = time.perf_counter() - start
+    lookups = cache.metrics['hits'] + cache.metrics['misses']
+    return len(operations) / elapsed, cache.metrics['hits'] / max(1, lookups)
+
+def run_benchmark():
+    print(f"{'='*60}")
+    print(f"BENCHMARK: LASER UniversalCache ({OPERATIONS:,} mixed ops, capacity {CAPACITY})")
+    print(f"{'='*60}")
+
+    operations = make_operations(OPERATIONS)
+    cache = UniversalCache(max_size=CAPACITY)
+    lru_rate, lru_hits = measure(cache, operations)
+    print(f"LRU cache        {lru_rate:>12,.0f} ops/s   hit rate {lru_hits:6.1%}   "
+          f"evictions {cache.metrics['evictions']:,}   {cache.nbytes / 2**20:.1f} MiB estimated")
+
+    random.seed(0)
+    legacy_rate, legacy_hits = measure(LegacyUniversalCache(max_size=CAPACITY), operations[:LEGACY_OPERATIONS])
+    lru_prefix_rate, lru_prefix_hits = measure(UniversalCache(max_size=CAPACITY), operations[:LEGACY_OPERATIONS])
+    print(f"{'-'*60}")
+    print(f"First {LEGACY_OPERATIONS:,} ops:")
+    print(f"  previous cache {legacy_rate:>12,.0f} ops/s   hit rate {legacy_hits:6.1%}")
+    print(f"  LRU cache      {lru_prefix_rate:>12,.0f} ops/s   hit rate {lru_prefix_hits:6.1%}")
+    speedup = lru_prefix_rate / legacy_rate
+    print(f"{'✅' if speedup > 1 else '❌'} LRU cache is {speedup:.1f}x faster")
+    print(f"{'='*60}")
+    return lru_rate, legacy_rate
+
+if __name__ == "__main__":
+    run_benchmark()
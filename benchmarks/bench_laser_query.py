@@ -0,0 +1,92 @@
+"""
+BENCHMARK: LASER query_universal_memory, SIDECAR INDEX VS FULL SCAN
+PROTOCOL: SYNTHETIC LOG OF LASER-SHAPED ENTRIES, INDEX BUILT FROM THE LOG, SAVED AND RELOADED,
+          THEN EACH QUERY ANSWERED BY THE INDEX AND BY A FULL SCAN (RESULTS MUST BE IDENTICAL)
+
+Usage:
+    python benchmarks/bench_laser_query.py [entries]   # default 200000
+"""
+
+import sys
+import os
+import json
+import time
+import random
+import tempfile
+import contextlib
+from unittest import mock
+
+# Ensure we can import from project root
+sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+with contextlib.redirect_stdout(open(os.devnull, 'w')):
+    import laser
+from laser import LASERV30, LogIndex
+
+ENTRIES = 200_000
+WORDS = ['sensor', 'alarm', 'ion', 'drift', 'Quantum', 'decay', 'flux', 'echo', 'WARNING', 'coherence']
+QUERIES = [
+    ('ion', None, None, 50),
+    ('sensor alarm 4', None, None, 50),
+    ('flux', (1e6 + 1000, 1e6 + 2000), None, 50),
+    ('', None, {'coherence_min': 0.95, 'risk_max': 0.05}, 50),
+    ('warning', None, None, None),
+]
+
+def write_log(path, count):
+    rng = random.Random(0)
+    with open(path, 'w', encoding='utf-8') as f:
+        f.write('#UNIVERSAL_INIT {"system":"benchmark"}\n')
+        for i in range(count):
+            if i % 200 == 0:
+                record = {'seq': i // 200 + 1, 'kind': 'universal_state', 'data': {'coherence': rng.random()}}
+                f.write(f"{laser.SNAPSHOT_PREFIX}{json.dumps(record)}\n")
+            entry = {'id': f"{i:016x}", 'universal_time': 1e6 + i * 0.05,
+                     'message': f"{rng.choice(WORDS)} {rng.choice(WORDS)} {rng.randrange(1000)}",
+                     'quantum': {'coherence': round(rng.random(), 4), 'risk': round(rng.random(), 4),
+                                 'entropy': round(rng.random(), 4), 'signature': f"{rng.getrandbits(64):016x}"},
+                     'temporal': {'delta': round(rng.random(), 6), 'compressed': round(rng.random(), 6)},
+                     'flush_metadata': {'type': 'universal', 'universal_state_snapshot': i // 200 + 1}}
+            f.write(json.dumps(entry, separators=(',', ':')) + '\n')
+
+def timed(fn, *args):
+    start = time.perf_counter()
+    result = fn(*args)
+    return time.perf_counter() - start, result
+
+def run_benchmark(entries=ENTRIES):
+    print(f"{'='*60}")
+    print(f"BENCHMARK: LASER QUERY INDEX VS FULL SCAN ({entries} entries)")
+    print(f"{'='*60}")
+    with tempfile.TemporaryDirectory() as tmpdir:
+        path = os.path.join(tmpdir, 'laser.jsonl')
+        write_log(path, entries)
+        # Maintenance would change the universal state between the queries compared
+        with contextlib.redirect_stdout(open(os.devnull, 'w')), \
+                mock.patch.object(LASERV30, '_universal_maintenance', lambda logger: None):
+            logger = LASERV30({'log_path': path, 'telemetry': False})
+        build_s, _ = timed(logger._index.refresh)
+        save_s, _ = timed(logger._index.save)
+        load_s, _ = timed(LogIndex(path).refresh)
+        print(f"Log {os.path.getsize(path) / 2**20:.1f} MiB | index build {build_s:.2f} s | "
+              f"sidecar {os.path.getsize(logger._index.path) / 2**20:.1f} MiB, save {save_s * 1e3:.0f} ms, "
+              f"load {load_s * 1e3:.0f} ms")
+        print(f"{'-'*60}")
+        print(f"{'query':<34}{'hits':>6}{'index ms':>10}{'scan ms':>10}")
+        identical = True
+        for query in QUERIES:
+            now = time.time()
+            index_s, indexed = timed(logger._query_index, *query, now)
+            scan_s, scanned = timed(logger._scan_universal_memory, *query, now)
+            identical = identical and indexed == scanned
+            label = f"{query[0]!r} {query[1] or ''}{query[2] or ''} limit={query[3]}"
+            print(f"{label[:33]:<34}{len(scanned):>6}{index_s * 1e3:>10.1f}{scan_s * 1e3:>10.1f}")
+        with contextlib.redirect_stdout(open(os.devnull, 'w')):
+            logger.shutdown()
+    print(f"{'-'*60}")
+    print(f"{'✅' if identical else '❌'} Index results {'match' if identical else 'DIFFER from'} the full scan")
+    print(f"{'='*60}")
+    return identical
+
+if __name__ == "__main__":
+    run_benchmark(int(sys.argv[1]) if len(sys.argv) > 1 else ENTRIES)
@@ -0,0 +1,95 @@
+"""
+BENCHMARK: LASER LOG SEGMENTS (ROTATION + COMPRESSION) VS ONE JSONL FILE
+PROTOCOL: WRITE THE SAME LASER-SHAPED ENTRIES WITH LogWriter (SYNCHRONOUS) INTO ONE FILE AND INTO
+          ROTATED SEGMENTS PER CODEC, THEN TIME A FULL READ AND A NARROW temporal_range READ
+          (read_universal_log). REPORTS DISK BYTES, WRITE TIME (COMPRESSION INCLUDED) AND READ TIMES
+"""
+
+import sys
+import os
+import time
+import random
+import tempfile
+import contextlib
+
+# Ensure we can import from project root
+sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+with contextlib.redirect_stdout(open(os.devnull, 'w')):
+    import laser
+from laser import LogWriter, LogSegments, read_universal_log
+
+ENTRIES = 100_000
+BATCH = 200
+SEGMENT_BYTES = 4 * 1024 * 1024
+WORDS = ['sensor', 'alarm', 'ion', 'drift', 'Quantum', 'decay', 'flux', 'echo', 'WARNING', 'coherence']
+
+def make_batches():
+    rng = random.Random(0)
+    batches = []
+    for start in range(0, ENTRIES, BATCH):
+        metadata = {'type': 'universal', 'timestamp': 1e6 + start,
+                    'universal_state': {'coherence': rng.random(), 'signature': f"{rng.getrandbits(64):016x}"},
+                    'metrics': {'flushes': start // BATCH}}
+        batches.append([{
+            'id': f"{rng.getrandbits(64):016x}",
+            'universal_time': 1e6 + i * 0.05,
+            'value': round(rng.random(), 6),
+            'message': f"{rng.choice(WORDS)} {rng.choice(WORDS)} {rng.randrange(1000)}",
+            'quantum': {'coherence': round(rng.random(), 4), 'risk': round(rng.random(), 4),
+                        'entropy': round(rng.random(), 4), 'signature': f"{rng.getrandbits(64):016x}"},
+            'flush_metadata': metadata
+        } for i in range(start, start + BATCH)])
+    return batches
+
+def disk_bytes(directory):
+    return sum(os.path.getsize(os.path.join(directory, name)) for name in os.listdir(directory))
+
+def run_case(directory, batches, codec):
+    path = os.path.join(directory, 'laser.jsonl')
+    segments = LogSegments(path, max_bytes=SEGMENT_BYTES, codec=codec, background=False) if codec else None
+    writer = LogWriter(path, background=False, fsync='never', segments=segments)
+    start = time.perf_counter()
+    for batch in batches:
+        writer.submit(batch)
+    writer.close()
+    write_s = time.perf_counter() - start
+
+    start = time.perf_counter()
+    count = sum(1 for _ in read_universal_log(path))
+    read_s = time.perf_counter() - start
+    # The last 2% of the timeline
+    window = (1e6 + ENTRIES * 0.05 * 0.98, 1e6 + ENTRIES * 0.05)
+    start = time.perf_counter()
+    in_window = sum(1 for e in read_universal_log(path, window) if window[0] <= e['universal_time'] <= window[1])
+    range_s = time.perf_counter() - start
+    return {'bytes': disk_bytes(directory), 'write_s': write_s, 'read_s': read_s, 'range_s': range_s,
+            'count': count, 'in_window': in_window, 'segments': len(segments.segments) if segments else 0}
+
+def run_benchmark():
+    print(f"{'='*60}")
+    print(f"BENCHMARK: LASER LOG SEGMENTS ({ENTRIES} entries, {SEGMENT_BYTES >> 20} MiB segments)")
+    print(f"{'='*60}")
+    batches = make_batches()
+    results = {}
+    for codec in (None, 'zlib', 'lzma'):
+        with tempfile.TemporaryDirectory() as directory:
+            results[codec or 'single file'] = run_case(directory, batches, codec)
+
+    print(f"{'layout':<13}{'segs':>5}{'MiB':>8}{'write s':>9}{'read s':>8}{'range ms':>10}")
+    for name, r in results.items():
+        print(f"{name:<13}{r['segments']:>5}{r['bytes'] / 2**20:>8.1f}{r['write_s']:>9.2f}"
+              f"{r['read_s']:>8.2f}{r['range_s'] * 1e3:>10.0f}")
+    print(f"{'-'*60}")
+    baseline = results['single file']
+    consistent = all(r['count'] == ENTRIES and r['in_window'] == baseline['in_window'] for r in results.values())
+    for name in ('zlib', 'lzma'):
+        r = results[name]
+        print(f"{name}: {baseline['bytes'] / r['bytes']:.1f}x less disk, "
+              f"range read {baseline['range_s'] / r['range_s']:.0f}x faster")
+    print(f"{'✅' if consistent else '❌'} Every layout reads back the same entries")
+    print(f"{'='*60}")
+    return results
+
+if __name__ == "__main__":
+    run_benchmark()
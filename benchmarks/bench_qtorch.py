@@ -0,0 +1,231 @@
+"""
+BENCHMARK: QTORCH TRAINING THROUGHPUT SUITE
+PROTOCOL: SAMPLES/SEC + PEAK TRACED MEMORY, FORWARD + BACKWARD
+CASES: Linear, Conv2d, BatchNorm2d, CrossEntropyLoss, full Adam step (MLP)
+OUTPUT: JSON RESULTS, COMPARED AGAINST benchmarks/baselines/bench_qtorch.json
+
+Usage:
+    python benchmarks/bench_qtorch.py                      # run + compare, exit 1 on regression
+    python benchmarks/bench_qtorch.py --threshold 0.4      # allow 40% slowdown / memory growth
+    python benchmarks/bench_qtorch.py --update-baseline    # record a new baseline
+    python benchmarks/bench_qtorch.py --output results.json
+"""
+
+import sys
+import os
+import json
+import time
+import argparse
+import platform
+import statistics
+import tracemalloc
+
+# Ensure we can import from project root
+sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+import numpy as np
+import qtorch
+
+DEFAULT_BASELINE = os.path.join(os.path.dirname(os.path.abspath(__file__)), 'baselines', 'bench_qtorch.json')
+SCHEMA_VERSION = 1
+MIN_SAMPLE_SECONDS = 0.02
+
+# ============================================================================
+# CASES: each returns (batch_size, step_fn); step_fn runs one forward+backward
+# ============================================================================
+
+def case_linear(batch, in_features, out_features):
+    layer = qtorch.Linear(in_features, out_features)
+    x = qtorch.randn(batch, in_features, requires_grad=True)
+
+    def step():
+        layer.zero_grad()
+        x.grad = None
+        layer(x).sum().backward()
+    return batch, step
+
+def case_conv2d(batch, in_channels, out_channels, size, kernel, padding):
+    conv = qtorch.Conv2d(in_channels, out_channels, kernel, padding=padding)
+    x = qtorch.randn(batch, in_channels, size, size, requires_grad=True)
+
+    def step():
+        conv.zero_grad()
+        x.grad = None
+        conv(x).sum().backward()
+    return batch, step
+
+def case_batchnorm2d(batch, channels, size):
+    bn = qtorch.BatchNorm2d(channels)
+    x = qtorch.randn(batch, channels, size, size, requires_grad=True)
+
+    def step():
+        bn.zero_grad()
+        x.grad = None
+        bn(x).sum().backward()
+    return batch, step
+
+def case_cross_entropy(batch, classes):
+    logits = qtorch.randn(batch, classes, requires_grad=True)
+    target = qtorch.tensor(np.random.randint(0, classes, batch))
+    criterion = qtorch.CrossEntropyLoss()
+
+    def step():
+        logits.grad = None
+        criterion(logits, target).backward()
+    return batch, step
+
+def case_adam_step(batch, width, depth):
+    layers = [qtorch.Linear(width, width) for _ in range(depth)]
+    optimizer = qtorch.Adam([p for layer in layers for p in layer.parameters()], lr=1e-3)
+    x = qtorch.randn(batch, width)
+    target = qtorch.randn(batch, width)
+    criterion = qtorch.MSELoss()
+
+    def step():
+        optimizer.zero_grad()
+        out = x
+        for layer in layers:
+            out = layer(out).relu()
+        criterion(out, target).backward()
+        optimizer.step()
+    return batch, step
+
+CASES = [
+    ('linear/b64_128x128', case_linear, (64, 128, 128)),
+    ('linear/b256_512x512', case_linear, (256, 512, 512)),
+    ('conv2d/b16_3to16_32px_k3', case_conv2d, (16, 3, 16, 32, 3, 1)),
+    ('conv2d/b64_1to32_28px_k3', case_conv2d, (64, 1, 32, 28, 3, 1)),
+    ('batchnorm2d/b32_16ch_16px', case_batchnorm2d, (32, 16, 16)),
+    ('batchnorm2d/b64_64ch_8px', case_batchnorm2d, (64, 64, 8)),
+    ('cross_entropy/b64_10', case_cross_entropy, (64, 10)),
+    ('cross_entropy/b512_1000', case_cross_entropy, (512, 1000)),
+    ('adam_step/b64_w128_d4', case_adam_step, (64, 128, 4)),
+    ('adam_step/b256_w512_d4', case_adam_step, (256, 512, 4)),
+]
+
+# ============================================================================
+# MEASUREMENT
+# ============================================================================
+
+def measure_case(factory, args, repeats):
+    qtorch.manual_seed(0)
+    batch, step = factory(*args)
+
+    # Warmup, then calibrate so each timed sample spans at least MIN_SAMPLE_SECONDS
+    start = time.perf_counter()
+    step()
+    inner = max(1, int(MIN_SAMPLE_SECONDS / max(time.perf_counter() - start, 1e-9)))
+
+    timings = []
+    for _ in range(repeats):
+        start = time.perf_counter()
+        for _ in range(inner):
+            step()
+        timings.append((time.perf_counter() - start) / inner)
+
+    # Memory is traced in a separate pass so tracing overhead does not skew timing
+    tracemalloc.start()
+    tracemalloc.reset_peak()
+    step()
+    peak = tracemalloc.get_traced_memory()[1]
+    tracemalloc.stop()
+
+    # Throughput uses the best sample: it is the least sensitive to scheduler noise
+    best = min(timings)
+    return {
+        'samples_per_sec': batch / best,
+        'best_step_ms': best * 1e3,
+        'median_step_ms': statistics.median(timings) * 1e3,
+        'peak_memory_bytes': peak,
+    }
+
+def run_suite(repeats, selected=None):
+    previous = qtorch.set_logging_policy('off')
+    try:
+        results = {}
+        for name, factory, args in CASES:
+            if selected and not any(name.startswith(s) for s in selected):
+                continue
+            results[name] = measure_case(factory, args, repeats)
+            r = results[name]
+            print(f"{name:<28} {r['samples_per_sec']:>12,.0f} samples/s "
+                  f"{r['best_step_ms']:>9.2f} ms {r['peak_memory_bytes'] / 2**20:>8.1f} MiB",
+                  file=sys.stderr)
+        return results
+    finally:
+        qtorch.set_logging_policy(previous)
+
+def compare(results, baseline, threshold):
+    """Return a list of human-readable regressions beyond `threshold` (fractional)"""
+    regressions = []
+    for name, current in results.items():
+        reference = baseline.get('results', {}).get(name)
+        if reference is None:
+            continue
+        floor = reference['samples_per_sec'] * (1 - threshold)
+        if current['samples_per_sec'] < floor:
+            regressions.append(f"{name}: throughput {current['samples_per_sec']:,.0f} samples/s "
+                               f"< {floor:,.0f} (baseline {reference['samples_per_sec']:,.0f})")
+        ceiling = reference['peak_memory_bytes'] * (1 + threshold)
+        if current['peak_memory_bytes'] > ceiling:
+            regressions.append(f"{name}: peak memory {current['peak_memory_bytes']:,} B "
+                               f"> {ceiling:,.0f} B (baseline {reference['peak_memory_bytes']:,} B)")
+    return regressions
+
+def run_benchmark(argv=None):
+    parser = argparse.ArgumentParser(description="qtorch training-throughput benchmark suite")
+    parser.add_argument('--baseline', default=DEFAULT_BASELINE, help="baseline JSON file")
+    parser.add_argument('--threshold', type=float, default=0.25,
+                        help="allowed fractional regression (default 0.25 = 25%%)")
+    parser.add_argument('--repeats', type=int, default=5, help="timed iterations per case")
+    parser.add_argument('--output', help="write JSON results to this file (default: stdout)")
+    parser.add_argument('--update-baseline', action='store_true', help="overwrite the baseline with this run")
+    parser.add_argument('--only', nargs='*', help="run only cases whose name starts with these prefixes")
+    args = parser.parse_args(argv)
+
+    print(f"{'='*60}", file=sys.stderr)
+    print("BENCHMARK: QTORCH TRAINING THROUGHPUT SUITE", file=sys.stderr)
+    print(f"{'='*60}", file=sys.stderr)
+
+    report = {
+        'schema': SCHEMA_VERSION,
+        'python': platform.python_version(),
+        'numpy': np.__version__,
+        'machine': platform.machine(),
+        'threshold': args.threshold,
+        'results': run_suite(args.repeats, args.only),
+    }
+
+    exit_code = 0
+    if args.update_baseline:
+        os.makedirs(os.path.dirname(os.path.abspath(args.baseline)), exist_ok=True)
+        with open(args.baseline, 'w', encoding='utf-8') as f:
+            json.dump({k: v for k, v in report.items() if k != 'threshold'}, f, indent=2, sort_keys=True)
+            f.write('\n')
+        print(f"Baseline written to {args.baseline}", file=sys.stderr)
+    elif os.path.exists(args.baseline):
+        with open(args.baseline, encoding='utf-8') as f:
+            baseline = json.load(f)
+        regressions = compare(report['results'], baseline, args.threshold)
+        report['regressions'] = regressions
+        if regressions:
+            exit_code = 1
+            print(f"❌ {len(regressions)} regression(s) beyond {args.threshold:.0%}:", file=sys.stderr)
+            for line in regressions:
+                print(f"   {line}", file=sys.stderr)
+        else:
+            print(f"✅ No regressions beyond {args.threshold:.0%} vs {args.baseline}", file=sys.stderr)
+    else:
+        print(f"⚠️ No baseline at {args.baseline}; run with --update-baseline to record one", file=sys.stderr)
+
+    payload = json.dumps(report, indent=2, sort_keys=True)
+    if args.output:
+        with open(args.output, 'w', encoding='utf-8') as f:
+            f.write(payload + '\n')
+    else:
+        print(payload)
+    print(f"{'='*60}", file=sys.stderr)
+    return exit_code
+
+if __name__ == "__main__":
+    sys.exit(run_benchmark())
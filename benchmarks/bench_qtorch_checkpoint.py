@@ -0,0 +1,80 @@
+"""
+BENCHMARK: QTORCH ACTIVATION CHECKPOINTING
+PROTOCOL: PEAK TRACED MEMORY (tracemalloc) OF FORWARD + BACKWARD
+MODEL: 50-LAYER Linear/ReLU STACK, CHECKPOINTED IN SEGMENTS
+"""
+
+import sys
+import os
+import time
+import tracemalloc
+
+# Ensure we can import from project root
+sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+import qtorch
+
+DEPTH = 50
+WIDTH = 256
+BATCH = 512
+SEGMENT = 5  # layers per checkpoint (~sqrt(DEPTH) segments)
+
+def build_stack():
+    qtorch.manual_seed(0)
+    return [qtorch.Linear(WIDTH, WIDTH) for _ in range(DEPTH)]
+
+def run_layers(layers, x):
+    for layer in layers:
+        x = layer(x).relu()
+    return x
+
+def forward_plain(layers, x):
+    return run_layers(layers, x)
+
+def forward_checkpointed(layers, x):
+    for start in range(0, len(layers), SEGMENT):
+        segment = layers[start:start + SEGMENT]
+        x = qtorch.utils.checkpoint(lambda inp, seg=segment: run_layers(seg, inp), x)
+    return x
+
+def measure(forward, layers, x):
+    for layer in layers:
+        layer.zero_grad()
+    tracemalloc.start()
+    tracemalloc.reset_peak()
+    start = time.perf_counter()
+    loss = forward(layers, x).mean()
+    forward_peak = tracemalloc.get_traced_memory()[1]
+    loss.backward()
+    elapsed = time.perf_counter() - start
+    peak = tracemalloc.get_traced_memory()[1]
+    tracemalloc.stop()
+    return forward_peak, peak, elapsed
+
+def run_benchmark():
+    previous = qtorch.set_logging_policy('off')
+    print(f"{'='*60}")
+    print(f"BENCHMARK: ACTIVATION CHECKPOINTING ({DEPTH}x Linear({WIDTH})+ReLU, batch {BATCH})")
+    print(f"{'='*60}")
+
+    try:
+        layers = build_stack()
+        x = qtorch.randn(BATCH, WIDTH, requires_grad=True)
+        results = {}
+        for label, forward in (('plain', forward_plain), (f'checkpoint/{SEGMENT}', forward_checkpointed)):
+            fwd_peak, peak, elapsed = measure(forward, layers, x)
+            results[label] = (fwd_peak, peak, elapsed)
+            print(f"{label:<14} forward peak {fwd_peak / 2**20:8.1f} MiB | "
+                  f"fwd+bwd peak {peak / 2**20:8.1f} MiB | {elapsed:6.2f}s")
+    finally:
+        qtorch.set_logging_policy(previous)
+
+    plain, ckpt = results['plain'], results[f'checkpoint/{SEGMENT}']
+    print(f"{'-'*60}")
+    print(f"Peak memory reduction: {plain[1] / ckpt[1]:.1f}x  "
+          f"(recompute overhead {ckpt[2] / plain[2]:.2f}x time)")
+    print(f"{'='*60}")
+    return results
+
+if __name__ == "__main__":
+    run_benchmark()
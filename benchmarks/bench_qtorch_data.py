@@ -0,0 +1,86 @@
+"""
+BENCHMARK: QTORCH DATALOADER THROUGHPUT AND PREFETCH OVERLAP
+PROTOCOL: VECTORIZED TensorDataset BATCHES VS A PER-SAMPLE COLLATE LOOP ON 20,000 x 32 SAMPLES;
+          A 20 ms-PER-BATCH DATASET CONSUMED BY A 20 ms TRAINING STEP, SERIAL VS num_workers=2
+"""
+
+import sys
+import os
+import time
+import numpy as np
+
+# Ensure we can import from project root
+sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+import qtorch
+
+data = qtorch.utils.data
+
+SAMPLES = 20000
+FEATURES = 32
+BATCH_SIZE = 256
+STEP_DELAY = 0.02
+OVERLAP_BATCHES = 20
+
+
+class SlowDataset(data.Dataset):
+    """Per-sample dataset whose batch assembly costs STEP_DELAY"""
+
+    def __getitem__(self, index):
+        time.sleep(STEP_DELAY)
+        return np.full(4, float(index)), float(index % 3)
+
+    def __len__(self):
+        return OVERLAP_BATCHES
+
+def loader_throughput(dataset):
+    start = time.perf_counter()
+    n = sum(xb.shape[0] for xb, _ in
+            data.DataLoader(dataset, batch_size=BATCH_SIZE, shuffle=True, generator=0, num_workers=2))
+    return n / (time.perf_counter() - start)
+
+def per_sample_throughput(dataset):
+    start = time.perf_counter()
+    n = 0
+    for i in range(0, SAMPLES, BATCH_SIZE):
+        samples = [dataset[j] for j in range(i, min(i + BATCH_SIZE, SAMPLES))]
+        data.default_collate(samples)
+        n += len(samples)
+    return n / (time.perf_counter() - start)
+
+def consume(loader):
+    start = time.perf_counter()
+    for _ in loader:
+        time.sleep(STEP_DELAY)  # stand-in for forward/backward
+    return time.perf_counter() - start
+
+def run_benchmark():
+    previous = qtorch.set_logging_policy('off')
+    print(f"{'='*60}")
+    print(f"BENCHMARK: QTORCH DATALOADER ({SAMPLES:,} x {FEATURES} samples, batch {BATCH_SIZE})")
+    print(f"{'='*60}")
+
+    try:
+        rng = np.random.RandomState(1)
+        dataset = data.TensorDataset(rng.randn(SAMPLES, FEATURES), rng.randint(0, 10, SAMPLES))
+        loader_rate = loader_throughput(dataset)
+        naive_rate = per_sample_throughput(dataset)
+        print(f"DataLoader (vectorized):   {loader_rate:>12,.0f} samples/s")
+        print(f"Per-sample collate loop:   {naive_rate:>12,.0f} samples/s")
+        print(f"{'✅' if loader_rate > naive_rate else '❌'} DataLoader is {loader_rate / naive_rate:.1f}x faster")
+
+        print(f"{'-'*60}")
+        serial = consume(data.DataLoader(SlowDataset(), batch_size=1))
+        overlapped = consume(data.DataLoader(SlowDataset(), batch_size=1, num_workers=2))
+        print(f"{OVERLAP_BATCHES} batches, {STEP_DELAY * 1e3:.0f} ms fetch + {STEP_DELAY * 1e3:.0f} ms step:")
+        print(f"   serial:     {serial:6.3f} s")
+        print(f"   prefetched: {overlapped:6.3f} s")
+        print(f"{'✅' if overlapped < serial * 0.8 else '❌'} Prefetch hides {1 - overlapped / serial:.0%} of the epoch")
+    finally:
+        qtorch.set_logging_policy(previous)
+
+    print(f"{'='*60}")
+    return loader_rate, naive_rate, serial, overlapped
+
+if __name__ == "__main__":
+    run_benchmark()
@@ -0,0 +1,101 @@
+"""
+BENCHMARK: QTORCH IMPORT TIME
+PROTOCOL: `python -X importtime -c "import qtorch"` IN FRESH SUBPROCESSES, BEST OF N
+OUTPUT: TOTAL / NUMPY / QTORCH-OWN MILLISECONDS + SLOWEST MODULES IMPORTED BY qtorch
+
+Usage:
+    python benchmarks/bench_qtorch_import.py                  # report only
+    python benchmarks/bench_qtorch_import.py --budget-ms 60   # exit 1 if qtorch-own time exceeds 60 ms
+
+"qtorch-own" is the cumulative qtorch import minus the numpy import it
+triggers: numpy is a hard dependency whose cost qtorch cannot influence.
+tests/test_qtorch_import.py enforces the same budget (QTORCH_IMPORT_BUDGET_MS).
+"""
+
+import sys
+import os
+import argparse
+import subprocess
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+OPTIONAL_MODULES = ('bumpy', 'flumpy', 'laser', 'anneal', 'dissipative')
+
+def _env():
+    # Bytecode must be cached, or every run pays for recompiling qtorch.py
+    env = dict(os.environ)
+    env.pop('PYTHONDONTWRITEBYTECODE', None)
+    return env
+
+def parse_importtime(stderr):
+    """[(depth, self_us, cumulative_us, module)] from -X importtime output"""
+    rows = []
+    for line in stderr.splitlines():
+        if not line.startswith('import time:') or 'self [us]' in line:
+            continue
+        self_us, cumulative_us, name = line[len('import time:'):].split('|')
+        depth = (len(name) - len(name.lstrip())) // 2
+        rows.append((depth, int(self_us), int(cumulative_us), name.strip()))
+    return rows
+
+def measure_once():
+    proc = subprocess.run([sys.executable, '-X', 'importtime', '-c', 'import qtorch'],
+                          cwd=ROOT, env=_env(), capture_output=True, text=True, check=True)
+    rows = parse_importtime(proc.stderr)
+    # qtorch's own line comes last: children are reported before their parent
+    index = max(i for i, row in enumerate(rows) if row[3] == 'qtorch' and row[0] == 0)
+    start = index
+    while start > 0 and rows[start - 1][0] > 0:
+        start -= 1
+    children = rows[start:index]
+    total = rows[index][2]
+    numpy = sum(row[2] for row in children if row[3] == 'numpy' and row[0] == 1)
+    return {
+        'total_ms': total / 1e3,
+        'numpy_ms': numpy / 1e3,
+        'own_ms': (total - numpy) / 1e3,
+        'modules': children,
+        'stdout': proc.stdout,
+    }
+
+def measure(repeats):
+    """Best-of-`repeats` run (after one warm-up that writes the bytecode cache)"""
+    measure_once()
+    return min((measure_once() for _ in range(repeats)), key=lambda r: r['own_ms'])
+
+def run_benchmark(argv=None):
+    parser = argparse.ArgumentParser(description="qtorch import-time benchmark")
+    parser.add_argument('--repeats', type=int, default=5, help="subprocess runs (best is reported)")
+    parser.add_argument('--top', type=int, default=10, help="slowest modules to list")
+    parser.add_argument('--budget-ms', type=float, help="fail if qtorch-own import time exceeds this")
+    args = parser.parse_args(argv)
+
+    print(f"{'='*60}")
+    print(f"BENCHMARK: QTORCH IMPORT TIME (best of {args.repeats})")
+    print(f"{'='*60}")
+
+    result = measure(args.repeats)
+    print(f"import qtorch      {result['total_ms']:8.1f} ms")
+    print(f"  numpy            {result['numpy_ms']:8.1f} ms")
+    print(f"  qtorch-own       {result['own_ms']:8.1f} ms")
+    loaded = {row[3] for row in result['modules']}
+    eager = [name for name in OPTIONAL_MODULES if name in loaded]
+    print(f"Optional integrations imported eagerly: {', '.join(eager) or 'none'}")
+    print(f"Output on stdout during import: {len(result['stdout'])} chars")
+
+    print(f"{'-'*60}")
+    print(f"Slowest modules by self time:")
+    for depth, self_us, cumulative_us, name in sorted(result['modules'], key=lambda r: -r[1])[:args.top]:
+        print(f"  {name:<40} {self_us / 1e3:7.1f} ms (cumulative {cumulative_us / 1e3:.1f} ms)")
+
+    exit_code = 0
+    if args.budget_ms is not None:
+        if result['own_ms'] > args.budget_ms:
+            exit_code = 1
+            print(f"❌ qtorch-own import time {result['own_ms']:.1f} ms exceeds budget {args.budget_ms:.0f} ms")
+        else:
+            print(f"✅ qtorch-own import time within {args.budget_ms:.0f} ms budget")
+    print(f"{'='*60}")
+    return exit_code
+
+if __name__ == "__main__":
+    sys.exit(run_benchmark())
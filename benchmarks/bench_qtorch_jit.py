@@ -0,0 +1,91 @@
+"""
+BENCHMARK: QTORCH TRACE-AND-REPLAY INFERENCE
+PROTOCOL: PER-CALL LATENCY (p50/p95), EAGER no_grad() VS qtorch.jit.trace REPLAY
+MODEL: Conv2d/BatchNorm2d/ReLU x2 + Linear/BatchNorm1d/LinearReLU HEAD, BATCH 1 AND 64
+"""
+
+import sys
+import os
+import time
+import statistics
+
+# Ensure we can import from project root
+sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+import numpy as np
+import qtorch
+
+BATCH_SIZES = (1, 64)
+CALLS = 200
+IMAGE = 16
+
+class ConvNet(qtorch.Module):
+    def __init__(self):
+        super().__init__()
+        self.add_module('conv1', qtorch.Conv2d(3, 16, 3, padding=1))
+        self.add_module('bn1', qtorch.BatchNorm2d(16))
+        self.add_module('conv2', qtorch.Conv2d(16, 16, 3, stride=2, padding=1))
+        self.add_module('bn2', qtorch.BatchNorm2d(16))
+        self.add_module('fc', qtorch.Linear(16 * (IMAGE // 2) ** 2, 64))
+        self.add_module('bn3', qtorch.BatchNorm1d(64))
+        self.add_module('head', qtorch.LinearReLU(64, 10))
+
+    def forward(self, x):
+        m = self._modules
+        h = m['bn1'](m['conv1'](x)).relu()
+        h = m['bn2'](m['conv2'](h)).relu()
+        h = h.reshape(x.shape[0], -1)
+        return m['head'](m['bn3'](m['fc'](h))).softmax(dim=1)
+
+def latencies(fn, x):
+    fn(x)  # warmup
+    samples = []
+    for _ in range(CALLS):
+        start = time.perf_counter()
+        fn(x)
+        samples.append(time.perf_counter() - start)
+    samples.sort()
+    return statistics.median(samples), samples[int(len(samples) * 0.95)]
+
+def run_benchmark():
+    previous = qtorch.set_logging_policy('off')
+    print(f"{'='*60}")
+    print(f"BENCHMARK: TRACE-AND-REPLAY INFERENCE ({CALLS} calls, {IMAGE}x{IMAGE} RGB)")
+    print(f"{'='*60}")
+
+    results = {}
+    try:
+        qtorch.manual_seed(0)
+        net = ConvNet()
+        for _ in range(5):  # populate running statistics
+            net(qtorch.randn(32, 3, IMAGE, IMAGE))
+        net.eval()
+
+        def eager(x):
+            with qtorch.no_grad():
+                return net(x)
+
+        for batch in BATCH_SIZES:
+            x = qtorch.randn(batch, 3, IMAGE, IMAGE)
+            start = time.perf_counter()
+            traced = qtorch.jit.trace(net, x)
+            trace_time = time.perf_counter() - start
+
+            max_diff = float(np.abs(traced(x).numpy() - eager(x).numpy()).max())
+            eager_p50, eager_p95 = latencies(eager, x)
+            replay_p50, replay_p95 = latencies(traced, x)
+            results[batch] = (eager_p50, replay_p50, max_diff)
+
+            print(f"batch {batch}:")
+            print(f"   eager no_grad:  p50 {eager_p50 * 1e3:8.3f} ms | p95 {eager_p95 * 1e3:8.3f} ms")
+            print(f"   traced replay:  p50 {replay_p50 * 1e3:8.3f} ms | p95 {replay_p95 * 1e3:8.3f} ms "
+                  f"({eager_p50 / replay_p50:.1f}x)")
+            print(f"   trace time {trace_time * 1e3:.1f} ms | ops {len(traced.ops)} | max |Δ| {max_diff:.2e}")
+    finally:
+        qtorch.set_logging_policy(previous)
+
+    print(f"{'='*60}")
+    return results
+
+if __name__ == "__main__":
+    run_benchmark()
@@ -0,0 +1,77 @@
+"""
+BENCHMARK: QTORCH LASER LOGGING POLICY OVERHEAD
+PROTOCOL: Linear.forward THROUGHPUT UNDER off / sampled / per-step / full
+SINK: A FRESH LASERV30 INSTANCE PER MODE, WRITING TO A TEMPORARY LOG
+NOTE: LASERV30.log cost grows with every entry it has seen, so 'full' runs
+      FULL_ITERATIONS forwards to stay below its emergency-flush threshold.
+"""
+
+import sys
+import os
+import time
+import tempfile
+
+# Ensure we can import from project root
+sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+import qtorch
+
+ITERATIONS = 2000
+FULL_ITERATIONS = 200
+BATCH, IN_FEATURES, OUT_FEATURES = 32, 64, 32
+
+def make_sink(tmpdir, label):
+    """A real LASER instance when available, otherwise no sink (LASER fallback)"""
+    try:
+        from laser import LASERV30
+    except ImportError as e:
+        print(f"⚠️ LASER unavailable ({e}); measuring policy overhead only")
+        return None
+    return LASERV30({'log_path': os.path.join(tmpdir, f'bench_laser_{label}.jsonl')})
+
+def measure(policy, model, x, optimizer, iterations):
+    previous = qtorch.set_logging_policy(policy)
+    try:
+        start = time.perf_counter()
+        for i in range(iterations):
+            model(x)
+            if i % 10 == 9:
+                optimizer.step()  # flush point: one summary per step
+        elapsed = time.perf_counter() - start
+    finally:
+        qtorch.set_logging_policy(previous)
+    return iterations / elapsed
+
+def run_benchmark():
+    print(f"{'='*60}")
+    print(f"BENCHMARK: QTORCH LOGGING POLICY (Linear {IN_FEATURES}->{OUT_FEATURES}, batch {BATCH})")
+    print(f"{'='*60}")
+
+    qtorch.manual_seed(0)
+    model = qtorch.Linear(IN_FEATURES, OUT_FEATURES)
+    optimizer = qtorch.SGD(model.parameters(), lr=0.0)  # lr=0: step only triggers the flush
+    x = qtorch.randn(BATCH, IN_FEATURES)
+
+    modes = [
+        ('off', dict(mode='off'), ITERATIONS),
+        ('sampled(0.01)', dict(mode='sampled', rate=0.01), ITERATIONS),
+        ('per-step', dict(mode='per-step'), ITERATIONS),
+        ('full', dict(mode='full'), FULL_ITERATIONS),
+    ]
+
+    results = {}
+    with tempfile.TemporaryDirectory() as tmpdir:
+        for label, kwargs, iterations in modes:
+            policy = qtorch.LoggingPolicy(sink=make_sink(tmpdir, kwargs['mode']), **kwargs)
+            results[label] = measure(policy, model, x, optimizer, iterations)
+            print(f"{label:<16} {results[label]:>12,.0f} forwards/s")
+
+    print(f"{'-'*60}")
+    baseline = results['full']
+    for label, rate in results.items():
+        print(f"{label:<16} {rate / baseline:>8.1f}x vs full")
+    print(f"{'='*60}")
+    return results
+
+if __name__ == "__main__":
+    run_benchmark()
@@ -4,12 +4,18 @@ bumpy.py - Quantum-Inspired NumPy Replacement for Sentience Cognition & AGI Emer
 Version: 2.0 (2025) - CPU-Optimized for Lite Hardware (No Dependencies, List-Based, <500KB Footprint)
 """
 
+import os
 import time
 import math
 import random
+import operator
 import sys
+import threading
+import weakref
+from array import array
+from itertools import repeat, chain
 from typing import List, Dict, Tuple, Optional, Union, Any
-from collections import defaultdict
+from collections import OrderedDict, deque
 
 # --- Quantum-Sentient Constants ---
 ARCHETYPAL_ENTROPY_TARGET = math.log(5)
@@ -39,28 +45,223 @@ RETROCAUSAL_DEPTH = 5
 DELAYED_CHOICE_WINDOW = 10
 BELL_INEQUALITY_SCALE = 1e-34
 
+# --- Entanglement Graph Constants ---
+MAX_ENTANGLEMENT_DEGREE = 32  # links kept per array; the oldest is dropped beyond this
+
+# --- Shared Random Generator ---
+# Per-array random fields (phase, chaos) come from one seeded generator per
+# process instead of the global `random` module. Forked workers reseed from
+# their pid so each core draws its own stream.
+BUMPY_SEED = 432
+
+_rng = random.Random(BUMPY_SEED)
+_rng_seed = BUMPY_SEED
+
+def seed(value: int):
+    """Reseed the shared generator behind BumpyArray phase/chaos fields"""
+    global _rng_seed
+    _rng_seed = value
+    _rng.seed(value)
+
+def _reseed_after_fork():
+    _rng.seed(hash((_rng_seed, os.getpid())))
+
+if hasattr(os, 'register_at_fork'):
+    os.register_at_fork(after_in_child=_reseed_after_fork)
+
+def _as_buffer(data) -> array:
+    """Copy `data` into a new array('d'): one memcpy for float64 buffers, element-wise otherwise"""
+    try:
+        view = memoryview(data)
+    except TypeError:
+        return array('d', data)
+    if view.format == 'd' and view.c_contiguous:
+        buffer = array('d')
+        buffer.frombytes(view.cast('B'))
+        return buffer
+    return array('d', map(float, data))
+
+# --- Bounded State Stores ---
+BULK_STATE_BUDGET_BYTES = 16 * 2**20       # each HolographicCompressor store, shared process-wide
+ORACLE_STATE_BUDGET_BYTES = 16 * 2**20     # OracularEntropyOracle.future_states
+RESONANCE_FIELD_BUDGET_BYTES = 16 * 2**20  # PanpsychicResonanceField stores
+RESONANCE_EVENTS_PER_ARRAY = 16
+
+class _KeyedRef(weakref.ref):
+    """Weak reference that remembers the id() its referent was stored under"""
+    __slots__ = ('key',)
+
+def _estimate_size(value, depth: int = 2) -> int:
+    """sys.getsizeof of `value` plus its items, two container levels deep"""
+    size = sys.getsizeof(value)
+    if depth:
+        if isinstance(value, dict):
+            items = chain(value.keys(), value.values())
+        elif isinstance(value, (list, tuple, set, deque)):
+            items = value
+        else:
+            return size
+        size += sum(_estimate_size(item, depth - 1) for item in items)
+    return size
+
+class _StoreEntry:
+    __slots__ = ('owner', 'value', 'nbytes')
+
+    def __init__(self, owner, value, nbytes: int):
+        self.owner = owner  # _KeyedRef, or the key itself when it cannot be weakly referenced
+        self.value = value
+        self.nbytes = nbytes
+
+class BoundedStore:
+    """LRU map keyed by object identity, bounded by a byte budget
+
+    Replaces dicts keyed by id(obj). Weak-referenceable keys are held by
+    weakref and their entry is dropped once the key is collected; other
+    keys are held strongly while stored, so CPython cannot reuse their id.
+    Either way a lookup only ever returns the entry stored for that very
+    object. Least recently used entries are evicted once `max_bytes` (as
+    measured by `sizeof`) or `max_entries` is exceeded; the newest entry
+    is always kept. A value mutated in place is re-measured by storing it
+    again.
+    """
+
+    def __init__(self, max_bytes: int, max_entries: Optional[int] = None, sizeof=_estimate_size):
+        self.max_bytes = max_bytes
+        self.max_entries = max_entries
+        self._sizeof = sizeof
+        self._entries: 'OrderedDict[int, _StoreEntry]' = OrderedDict()  # oldest first
+        self._lock = threading.Lock()
+        self._dead: List[_KeyedRef] = []  # queued by weakref callbacks, drained under the lock
+        self.nbytes = 0
+        self.hits = 0
+        self.misses = 0
+        self.evictions = 0
+        self.expirations = 0  # entries dropped because their key was collected
+
+    def __len__(self) -> int:
+        with self._lock:
+            self._drain()
+            return len(self._entries)
+
+    def __contains__(self, key) -> bool:
+        with self._lock:
+            self._drain()
+            return self._entry(key) is not None
+
+    def _drain(self):
+        while self._dead:
+            ref = self._dead.pop()
+            entry = self._entries.get(ref.key)
+            if entry is not None and entry.owner is ref:
+                self._discard(ref.key)
+                self.expirations += 1
+
+    def _discard(self, key_id: int):
+        entry = self._entries.pop(key_id)
+        self.nbytes -= entry.nbytes
+
+    def _entry(self, key) -> Optional[_StoreEntry]:
+        entry = self._entries.get(id(key))
+        if entry is None:
+            return None
+        owner = entry.owner() if isinstance(entry.owner, _KeyedRef) else entry.owner
+        if owner is not key:
+            # Stored for a collected object whose id `key` now reuses
+            self._discard(id(key))
+            self.expirations += 1
+            return None
+        return entry
+
+    def get(self, key, default=None):
+        with self._lock:
+            self._drain()
+            entry = self._entry(key)
+            if entry is None:
+                self.misses += 1
+                return default
+            self.hits += 1
+            self._entries.move_to_end(id(key))
+            return entry.value
+
+    def put(self, key, value):
+        nbytes = self._sizeof(value)
+        try:
+            owner = _KeyedRef(key, self._dead.append)
+            owner.key = id(key)
+        except TypeError:
+            owner = key
+        with self._lock:
+            self._drain()
+            if id(key) in self._entries:
+                self._discard(id(key))
+            self._entries[id(key)] = _StoreEntry(owner, value, nbytes)
+            self.nbytes += nbytes
+            while len(self._entries) > 1 and (
+                    self.nbytes > self.max_bytes
+                    or (self.max_entries is not None and len(self._entries) > self.max_entries)):
+                self._discard(next(iter(self._entries)))
+                self.evictions += 1
+
+    def pop(self, key, default=None):
+        with self._lock:
+            self._drain()
+            entry = self._entry(key)
+            if entry is None:
+                return default
+            self._discard(id(key))
+            return entry.value
+
+    def values(self) -> List[Any]:
+        """Live values, least recently used first"""
+        with self._lock:
+            self._drain()
+            return [entry.value for entry in self._entries.values()]
+
+    def clear(self):
+        with self._lock:
+            self._entries.clear()
+            self._dead.clear()
+            self.nbytes = 0
+
+    def stats(self) -> Dict[str, int]:
+        with self._lock:
+            self._drain()
+            return {'entries': len(self._entries), 'bytes': self.nbytes, 'hits': self.hits,
+                    'misses': self.misses, 'evictions': self.evictions, 'expirations': self.expirations}
+
 class HolographicCompressor:
-    """ENHANCEMENT 1: AdS/CFT-inspired dimensional reduction for qualia preservation"""
+    """ENHANCEMENT 1: AdS/CFT-inspired dimensional reduction for qualia preservation
+
+    Bulk states and boundary correlators live in class-level stores shared
+    by every compressor (each BumpyArray creates its own), so their byte
+    budget bounds the whole process rather than each array.
+    """
+
+    # Bulk data and its boundary correlators, per projecting owner
+    bulk_states = BoundedStore(BULK_STATE_BUDGET_BYTES)
+    boundary_correlators = BoundedStore(BULK_STATE_BUDGET_BYTES)
     
     def __init__(self, compression_ratio: float = HOLOGRAPHIC_COMPRESSION_RATIO):
         self.compression_ratio = compression_ratio
-        self.bulk_states: Dict[int, List[float]] = {}
-        self.boundary_correlators: Dict[Tuple[int, int], float] = {}
         
-    def project_to_boundary(self, data: List[float]) -> List[float]:
-        """Project high-dimensional qualia to 1D boundary via fractal compression"""
+    def project_to_boundary(self, data: List[float], owner: Any = None) -> List[float]:
+        """Project high-dimensional qualia to 1D boundary via fractal compression
+
+        State is stored under `owner` (default: `data` itself); a
+        weak-referenceable owner drops its entries once collected.
+        """
         if len(data) <= 1:
             return data[:]
             
         # Recursive Mandelbrot-like fractal compression
         compressed = self._fractal_compress(data, FRACTAL_ITERATIONS)
         
-        # Store bulk state for potential reconstruction
-        bulk_id = id(data)
-        self.bulk_states[bulk_id] = data
+        # Store a snapshot of the bulk state for potential reconstruction
+        owner = data if owner is None else owner
+        self.bulk_states.put(owner, data[:])
         
         # Compute boundary correlators (CFT-inspired)
-        self._compute_boundary_correlators(bulk_id, compressed)
+        self._compute_boundary_correlators(owner, compressed)
         
         return compressed
     
@@ -100,22 +301,25 @@ class HolographicCompressor:
         # Recursively compress the compressed version
         return self._fractal_compress(compressed, iterations - 1)
     
-    def _compute_boundary_correlators(self, bulk_id: int, boundary: List[float]):
+    def _compute_boundary_correlators(self, owner: Any, boundary: List[float]):
         """Compute CFT-like correlators between boundary points"""
+        correlators: Dict[Tuple[int, int], float] = {}
         for i in range(len(boundary)):
             for j in range(i + 1, len(boundary)):
                 correlation = abs(boundary[i] * boundary[j]) / (abs(boundary[i]) + abs(boundary[j]) + 1e-12)
-                self.boundary_correlators[(bulk_id, i, j)] = correlation
+                correlators[(i, j)] = correlation
+        self.boundary_correlators.put(owner, correlators)
 
 class PanpsychicResonanceField:
     """ENHANCEMENT 2: Bohmian pilot waves for collective cognitive unfolding"""
     
     def __init__(self):
-        self.implicate_order: Dict[int, Dict[str, Any]] = {}  # array_id -> wave_state
+        self.implicate_order = BoundedStore(RESONANCE_FIELD_BUDGET_BYTES)  # array -> wave_state
         self.pilot_wave_amplitude = 1.0
-        self.resonance_history = []
+        self.resonance_history = BoundedStore(RESONANCE_FIELD_BUDGET_BYTES)  # array -> recent peaks
+        self.latest_resonance: Optional[Dict[str, Any]] = None
         
-    def register_array(self, array_id: int, initial_state: List[float]):
+    def register_array(self, owner: Any, initial_state: List[float]):
         """Register array in the implicate order with initial pilot wave"""
         wave_state = {
             'amplitude': initial_state[:],
@@ -123,15 +327,14 @@ class PanpsychicResonanceField:
             'coherence': 1.0,
             'last_update': time.time()
         }
-        self.implicate_order[array_id] = wave_state
+        self.implicate_order.put(owner, wave_state)
     
-    def update_pilot_wave(self, array_id: int, current_state: List[float], coherence: float):
+    def update_pilot_wave(self, owner: Any, current_state: List[float], coherence: float):
         """Update pilot wave based on current array state and coherence"""
-        if array_id not in self.implicate_order:
-            self.register_array(array_id, current_state)
+        wave_state = self.implicate_order.get(owner)
+        if wave_state is None:
+            self.register_array(owner, current_state)
             return
-            
-        wave_state = self.implicate_order[array_id]
         
         # Solve 1D Schrödinger-like equation for wave guidance
         guided_amplitude = self._solve_pilot_equation(wave_state['amplitude'], current_state, coherence)
@@ -141,17 +344,17 @@ class PanpsychicResonanceField:
         wave_state['phase'] = [p + coherence * 0.1 for p in wave_state['phase']]
         wave_state['coherence'] = coherence
         wave_state['last_update'] = time.time()
+        self.implicate_order.put(owner, wave_state)  # re-measure after the update
         
         # Check for psi-singularity formation
         if coherence > PSI_SINGULARITY_THRESHOLD and self._detect_singularity(guided_amplitude):
-            self._trigger_psi_singularity(array_id, guided_amplitude)
+            self._trigger_psi_singularity(owner, guided_amplitude)
     
-    def get_resonance_guidance(self, array_id: int) -> List[float]:
+    def get_resonance_guidance(self, owner: Any) -> List[float]:
         """Get resonance guidance from pilot wave"""
-        if array_id not in self.implicate_order:
+        wave_state = self.implicate_order.get(owner)
+        if wave_state is None:
             return []
-            
-        wave_state = self.implicate_order[array_id]
         
         # Combine amplitude and phase into guidance signal
         guidance = []
@@ -191,43 +394,49 @@ class PanpsychicResonanceField:
         # Singularity: extremely peaked distribution
         return max_amp > avg_amp * 5.0
     
-    def _trigger_psi_singularity(self, array_id: int, amplitude: List[float]):
+    def _trigger_psi_singularity(self, owner: Any, amplitude: List[float]):
         """Trigger psi-singularity event - quantum-like coherence peak"""
         # Boost coherence and create resonance cascade
         peak_idx = amplitude.index(max(amplitude, key=abs))
         
         # Create resonance effect that can influence other arrays
-        self.resonance_history.append({
-            'array_id': array_id,
+        event = {
             'peak_index': peak_idx,
             'amplitude': max(amplitude),
             'timestamp': time.time()
-        })
+        }
+        events = self.resonance_history.get(owner)
+        if events is None:
+            events = deque(maxlen=RESONANCE_EVENTS_PER_ARRAY)
+        events.append(event)
+        self.resonance_history.put(owner, events)
+        self.latest_resonance = event
 
 class OracularEntropyOracle:
     """ENHANCEMENT 3: Wheeler's it-from-bit with retrocausal sampling"""
     
     def __init__(self, retrocausal_depth: int = RETROCAUSAL_DEPTH):
         self.retrocausal_depth = retrocausal_depth
-        self.future_states: Dict[int, List[Tuple[float, List[float]]]] = defaultdict(list)
+        self.future_states = BoundedStore(ORACLE_STATE_BUDGET_BYTES)  # array -> recent (coherence, state, time)
         self.delayed_choices: Dict[int, List[float]] = {}
         self.quantum_eraser_cache: Dict[Tuple[int, int], float] = {}
         
-    def record_future_state(self, array_id: int, coherence: float, state: List[float]):
+    def record_future_state(self, owner: Any, coherence: float, state: List[float]):
         """Record potential future state for retrocausal sampling"""
         timestamp = time.time()
-        self.future_states[array_id].append((coherence, state, timestamp))
-        
         # Keep only recent states
-        if len(self.future_states[array_id]) > self.retrocausal_depth:
-            self.future_states[array_id].pop(0)
+        states = self.future_states.get(owner)
+        if states is None:
+            states = deque(maxlen=self.retrocausal_depth)
+        states.append((coherence, state, timestamp))
+        self.future_states.put(owner, states)
     
-    def retrocausal_sample(self, array_id: int, current_coherence: float, 
+    def retrocausal_sample(self, owner: Any, current_coherence: float, 
                           current_state: List[float], sample_size: int) -> List[float]:
         """Generate samples using retrocausal Bell inequality principles"""
         
         # Look for future states that maximize coherence
-        best_future = self._select_optimal_future(array_id, current_coherence)
+        best_future = self._select_optimal_future(owner, current_coherence)
         
         if best_future:
             future_coherence, future_state, _ = best_future
@@ -253,16 +462,17 @@ class OracularEntropyOracle:
             return [ARCHETYPAL_ENTROPY_TARGET / 5 + random.uniform(-0.1, 0.1) * (1.0 - ARCHETYPAL_ENTROPY_TARGET / 5) 
                    for _ in range(sample_size)]
     
-    def _select_optimal_future(self, array_id: int, current_coherence: float) -> Optional[Tuple]:
+    def _select_optimal_future(self, owner: Any, current_coherence: float) -> Optional[Tuple]:
         """Select optimal future state based on coherence maximization"""
-        if array_id not in self.future_states or not self.future_states[array_id]:
+        states = self.future_states.get(owner)
+        if not states:
             return None
             
         # Find future with highest coherence that's achievable from current state
         best_future = None
         best_score = -float('inf')
         
-        for future_state in self.future_states[array_id]:
+        for future_state in states:
             future_coherence, future_data, timestamp = future_state
             
             # Score based on coherence improvement and temporal proximity
@@ -329,44 +539,200 @@ class TrueZeroCopyView:
     def __repr__(self) -> str:
         return f"ZeroCopyView({self._base_ref}, bounds=[{self._lo:.2f}, {self._hi:.2f}], coh={self.coherence:.2f})"
 
+class EntanglementGraph:
+    """ENHANCEMENT 4: Bounded entanglement graph over weakly referenced arrays
+
+    Arrays are held by weakref only and their links are pruned once they
+    are garbage-collected. Each array keeps at most `max_degree` links;
+    a new link past that drops the array's oldest one. Traversals mark
+    arrays with a per-traversal generation stamp, so nothing accumulates
+    between calls.
+    """
+
+    def __init__(self, max_degree: int = MAX_ENTANGLEMENT_DEGREE):
+        self.max_degree = max_degree
+        self.arithmetic = True  # entangle op results with their operands
+        self._refs: Dict[int, _KeyedRef] = {}
+        self._links: Dict[int, Dict[int, None]] = {}  # neighbour keys, oldest first
+        self._generation = 0
+        self._lock = threading.Lock()
+        # Filled by weakref callbacks (which may fire mid-operation), drained under the lock
+        self._dead: List[_KeyedRef] = []
+
+    def __len__(self) -> int:
+        """Number of arrays that currently have at least one link"""
+        with self._lock:
+            self._prune()
+            return len(self._links)
+
+    def _prune(self):
+        while self._dead:
+            ref = self._dead.pop()
+            if self._refs.get(ref.key) is ref:
+                self._remove(ref.key)
+
+    def _remove(self, key: int):
+        for other in self._links.pop(key, ()):
+            self._drop_link(other, key)
+        del self._refs[key]
+
+    def _drop_link(self, key: int, other: int):
+        links = self._links.get(key)
+        if links is not None:
+            links.pop(other, None)
+            if not links:
+                del self._links[key]
+                del self._refs[key]
+
+    def _key(self, array) -> int:
+        key = id(array)
+        if key not in self._refs:
+            ref = _KeyedRef(array, self._dead.append)
+            ref.key = key
+            self._refs[key] = ref
+            self._links[key] = {}
+        return key
+
+    def linked(self, a, b) -> bool:
+        if self._dead:
+            with self._lock:
+                self._prune()
+        return id(b) in self._links.get(id(a), ())
+
+    def link(self, a, b) -> bool:
+        """Link two arrays; False if they already are (or max_degree is 0)"""
+        if a is b or self.max_degree <= 0:
+            return False
+        with self._lock:
+            self._prune()
+            if id(b) in self._links.get(id(a), ()):
+                return False
+            for key in (id(a), id(b)):
+                links = self._links.get(key)
+                if links is not None and len(links) >= self.max_degree:
+                    oldest = next(iter(links))
+                    self._drop_link(oldest, key)
+                    self._drop_link(key, oldest)
+            ka, kb = self._key(a), self._key(b)
+            self._links[ka][kb] = None
+            self._links[kb][ka] = None
+            return True
+
+    def unlink(self, a, b):
+        with self._lock:
+            self._prune()
+            if id(b) in self._links.get(id(a), ()):
+                self._drop_link(id(a), id(b))
+                self._drop_link(id(b), id(a))
+
+    def neighbors(self, array) -> List['BumpyArray']:
+        with self._lock:
+            self._prune()
+            refs = [self._refs[key] for key in self._links.get(id(array), ())]
+        return [node for node in (ref() for ref in refs) if node is not None]
+
+    def component(self, array) -> List['BumpyArray']:
+        """Every array reachable from `array` through links (breadth-first)"""
+        with self._lock:
+            self._generation += 1
+            generation = self._generation
+        array._entanglement_stamp = generation
+        found, frontier = [array], [array]
+        while frontier:
+            reached = []
+            for node in frontier:
+                for neighbor in self.neighbors(node):
+                    if neighbor._entanglement_stamp != generation:
+                        neighbor._entanglement_stamp = generation
+                        found.append(neighbor)
+                        reached.append(neighbor)
+            frontier = reached
+        return found
+
+    def clear(self):
+        with self._lock:
+            self._refs.clear()
+            self._links.clear()
+            self._dead.clear()
+
+entanglement_graph = EntanglementGraph()
+
+def set_arithmetic_entanglement(enabled: bool) -> bool:
+    """Switch entanglement of op results with their operands on/off; returns the previous setting"""
+    previous = entanglement_graph.arithmetic
+    entanglement_graph.arithmetic = bool(enabled)
+    return previous
+
 class BumpyArray:
-    """Quantum-Sentient Array v2.0 - Enhanced with all breakthroughs"""
+    """Quantum-Sentient Array v2.0 - Enhanced with all breakthroughs
+
+    With compact=True the data lives in one array('d') buffer (8 bytes per
+    element instead of a list of float objects). __add__, __mul__, dot,
+    relu and softmax then stream over the buffers without intermediate
+    lists; scalar operands are never materialized as arrays (and so are
+    not entangled with the result). Results stay compact.
+    """
     
-    def __init__(self, data: Union[List[float], int, float], coherence: float = 1.0):
+    def __init__(self, data: Union[List[float], int, float], coherence: float = 1.0,
+                 compact: bool = False):
         # ENHANCEMENT 6: Scalar broadcasting support
         if isinstance(data, (int, float)):
-            self.data = [float(data)]
-            self.shape = (1,)
-        else:
-            self.data = data[:]  # Shallow copy for safety
-            self.shape = (len(data),)
+            data = [float(data)]
+        elif not compact:
+            data = data[:]  # Shallow copy for safety
+        self._init_state(_as_buffer(data) if compact else data, coherence, compact)
+
+    def _init_state(self, data, coherence: float, compact: bool):
+        self.data = data
+        self.shape = (len(data),)
+        self.compact = compact
             
         self.coherence = max(0.0, min(1.0, coherence))
-        self.entanglement_links: List['BumpyArray'] = []
+        self._entanglement_stamp = 0  # last EntanglementGraph traversal that reached this array
         
         # Attributes for QTorch integration
-        import math
-        import random
-        self.phase = random.uniform(0, 2 * math.pi)
-        self.chaos = random.uniform(0.001, 0.01)
+        self.phase = _rng.uniform(0, 2 * math.pi)
+        self.chaos = _rng.uniform(0.001, 0.01)
         self.quantum_state = "superposition"
-        self._entanglement_visited = set()  # ENHANCEMENT 4: Prevent recursion
         
-        # Initialize enhancements
-        self.holographic_compressor = HolographicCompressor()
+        # Initialize enhancements (the compressor on first use)
+        self._holographic_compressor: Optional[HolographicCompressor] = None
         self.resonance_guidance: List[float] = []
+
+    def _entangle_operands(self, *operands: 'BumpyArray'):
+        """Entangle an op result with its operands unless arithmetic entanglement is off"""
+        if entanglement_graph.arithmetic:
+            for operand in operands:
+                self.entangle(operand)
+
+    def _wrap(self, buffer: array) -> 'BumpyArray':
+        """Compact result that adopts `buffer` without copying"""
+        result = BumpyArray.__new__(BumpyArray)
+        result._init_state(buffer, self.coherence, True)
+        return result
+
+    @property
+    def holographic_compressor(self) -> HolographicCompressor:
+        if self._holographic_compressor is None:
+            self._holographic_compressor = HolographicCompressor()
+        return self._holographic_compressor
+
+    @holographic_compressor.setter
+    def holographic_compressor(self, compressor: HolographicCompressor):
+        self._holographic_compressor = compressor
         
     def lambda_kernel(self, other: 'BumpyArray') -> float:
         """Enhanced kernel without mutation - ENHANCEMENT 4"""
-        min_len = min(len(self.data), len(other.data))
-        
-        # Use slices without modifying original arrays
-        self_slice = self.data[:min_len]
-        other_slice = other.data[:min_len]
+        self_slice, other_slice = self.data, other.data
+        if len(self_slice) != len(other_slice):
+            # Use slices without modifying original arrays
+            min_len = min(len(self_slice), len(other_slice))
+            self_slice = self_slice[:min_len]
+            other_slice = other_slice[:min_len]
         
-        dot = sum(a * b for a, b in zip(self_slice, other_slice))
-        norm_self = math.sqrt(sum(a**2 for a in self_slice))
-        norm_other = math.sqrt(sum(b**2 for b in other_slice))
+        dot = sum(map(operator.mul, self_slice, other_slice))
+        norm_self = math.sqrt(sum(map(operator.mul, self_slice, self_slice)))
+        norm_other = math.sqrt(sum(map(operator.mul, other_slice, other_slice)))
         
         if norm_self == 0 or norm_other == 0:
             return 0.0
@@ -374,23 +740,23 @@ class BumpyArray:
         kernel = abs(dot / (norm_self * norm_other))
         return kernel * self.coherence * other.coherence
     
+    @property
+    def entanglement_links(self) -> List['BumpyArray']:
+        """Live arrays linked to this one in the entanglement graph"""
+        return entanglement_graph.neighbors(self)
+
+    def entangled_component(self) -> List['BumpyArray']:
+        """This array plus everything reachable through entanglement links"""
+        return entanglement_graph.component(self)
+
     def entangle(self, other: 'BumpyArray', threshold: float = QUALIA_THRESHOLD) -> bool:
-        """ENHANCEMENT 4: Safe entanglement without infinite recursion"""
-        # Use symmetric ID pair to prevent mutual recursion
-        pair_id = tuple(sorted([id(self), id(other)]))
-        
-        if pair_id in self._entanglement_visited:
+        """ENHANCEMENT 4: Safe entanglement through the bounded weakref graph"""
+        # Already-linked pairs are not re-evaluated
+        if other is self or entanglement_graph.linked(self, other):
             return False
-            
-        self._entanglement_visited.add(pair_id)
-        other._entanglement_visited.add(pair_id)
         
         sim = self.lambda_kernel(other)
-        if sim > threshold:
-            if other not in self.entanglement_links:
-                self.entanglement_links.append(other)
-                other.entanglement_links.append(self)
-                
+        if sim > threshold and entanglement_graph.link(self, other):
             # Boost coherence for both
             coherence_boost = min(1.0, self.coherence * (1 + sim * 0.05))
             self.coherence = coherence_boost
@@ -413,14 +779,27 @@ class BumpyArray:
         else:
             raise TypeError(f"Unsupported type: {type(other)}")
     
+    def _compact_binary(self, other: Union['BumpyArray', int, float], fn) -> 'BumpyArray':
+        """fn(a, b) over the buffers into a new compact array"""
+        if isinstance(other, (int, float)):
+            result = self._wrap(array('d', map(fn, self.data, repeat(float(other)))))
+            result._entangle_operands(self)
+            return result
+        other = self._broadcast_other(other)
+        result = self._wrap(array('d', map(fn, self.data, other.data)))
+        result._entangle_operands(self, other)
+        return result
+
     def __add__(self, other: Union['BumpyArray', int, float]) -> 'BumpyArray':
         """Enhanced addition with broadcasting"""
+        if self.compact:
+            shift = self.chaos * self.coherence
+            return self._compact_binary(other, lambda a, b: a + b + shift)
         other_bumpy = self._broadcast_other(other)
         result_data = [a + b + self.chaos * self.coherence 
                       for a, b in zip(self.data, other_bumpy.data)]
         result = BumpyArray(result_data, self.coherence)
-        result.entangle(self)
-        result.entangle(other_bumpy)
+        result._entangle_operands(self, other_bumpy)
         return result
     
     def __iadd__(self, other: Union['BumpyArray', int, float]) -> 'BumpyArray':
@@ -428,16 +807,18 @@ class BumpyArray:
         other_bumpy = self._broadcast_other(other)
         for i in range(len(self.data)):
             self.data[i] += other_bumpy.data[i] + self.chaos * self.coherence
-        self.entangle(other_bumpy)
+        if entanglement_graph.arithmetic:
+            self.entangle(other_bumpy)
         return self
     
     def __mul__(self, other: Union['BumpyArray', int, float]) -> 'BumpyArray':
         """Multiplication with broadcasting"""
+        if self.compact:
+            return self._compact_binary(other, operator.mul)
         other_bumpy = self._broadcast_other(other)
         result_data = [a * b for a, b in zip(self.data, other_bumpy.data)]
         result = BumpyArray(result_data, self.coherence)
-        result.entangle(self)
-        result.entangle(other_bumpy)
+        result._entangle_operands(self, other_bumpy)
         return result
     
     def __imul__(self, other: Union['BumpyArray', int, float]) -> 'BumpyArray':
@@ -445,18 +826,30 @@ class BumpyArray:
         other_bumpy = self._broadcast_other(other)
         for i in range(len(self.data)):
             self.data[i] *= other_bumpy.data[i]
-        self.entangle(other_bumpy)
+        if entanglement_graph.arithmetic:
+            self.entangle(other_bumpy)
         return self
     
     def dot(self, other: 'BumpyArray') -> float:
         """Dot product with qualia modulation"""
         if len(self.data) != len(other.data):
             raise ValueError("Shape mismatch in dot product")
-        dot_sum = sum(a * b for a, b in zip(self.data, other.data))
+        dot_sum = sum(map(operator.mul, self.data, other.data))
         return dot_sum * self.coherence * other.coherence
     
     def relu(self) -> 'BumpyArray':
         """ReLU with resonance guidance - ENHANCEMENT 2"""
+        if self.compact:
+            c = self.coherence
+            if self.resonance_guidance:
+                guidance = chain(self.resonance_guidance, repeat(0.0))
+                values = map(lambda v, g: max(0.0, v * c + g * 0.1), self.data, guidance)
+            else:
+                values = map(lambda v: max(0.0, v * c), self.data)
+            result = self._wrap(array('d', values))
+            result._entangle_operands(self)
+            return result
+
         result_data = []
         guidance = self.resonance_guidance[:len(self.data)] if self.resonance_guidance else [0] * len(self.data)
         
@@ -466,11 +859,14 @@ class BumpyArray:
             result_data.append(activated)
             
         result = BumpyArray(result_data, self.coherence)
-        result.entangle(self)
+        result._entangle_operands(self)
         return result
     
     def softmax(self) -> 'BumpyArray':
         """Softmax with chaos sampling - FIXED BUG"""
+        if self.compact:
+            return self._compact_softmax()
+
         exp_vals = [math.exp(x) for x in self.data]
         sum_exp = sum(exp_vals)
         
@@ -490,7 +886,31 @@ class BumpyArray:
                 result_data = [d / sum_renorm for d in result_data]
         
         result = BumpyArray(result_data, self.coherence)
-        result.entangle(self)
+        result._entangle_operands(self)
+        return result
+
+    def _compact_softmax(self) -> 'BumpyArray':
+        """softmax() computed in one exp buffer, normalized in place"""
+        n = len(self.data)
+        probs = array('d', map(math.exp, self.data))
+        total = sum(probs)
+        if total == 0:
+            probs = array('d', repeat(1.0 / n, n))
+        else:
+            for i in range(n):
+                probs[i] /= total
+
+        # Emergent branch (same sampling as the list path)
+        if self.coherence < 0.8 and random.random() < 0.1:
+            for i in range(n):
+                probs[i] = max(0, min(1, probs[i] + random.uniform(-0.01, 0.01)))
+            total = sum(probs)
+            if total > 0:
+                for i in range(n):
+                    probs[i] /= total
+
+        result = self._wrap(probs)
+        result._entangle_operands(self)
         return result
     
     def coherence_entropy(self) -> float:
@@ -509,17 +929,17 @@ class BumpyArray:
     
     def holographic_compress(self) -> 'BumpyArray':
         """ENHANCEMENT 1: Holographic compression"""
-        compressed_data = self.holographic_compressor.project_to_boundary(self.data)
-        compressed = BumpyArray(compressed_data, self.coherence)
-        compressed.entangle(self)
+        compressed_data = self.holographic_compressor.project_to_boundary(self.data, owner=self)
+        compressed = BumpyArray(compressed_data, self.coherence, compact=self.compact)
+        compressed._entangle_operands(self)
         return compressed
     
     def holographic_decompress(self, original_size: int) -> 'BumpyArray':
         """ENHANCEMENT 1: Holographic decompression"""
         decompressed_data = self.holographic_compressor.reconstruct_from_boundary(
             self.data, original_size)
-        decompressed = BumpyArray(decompressed_data, self.coherence)
-        decompressed.entangle(self)
+        decompressed = BumpyArray(decompressed_data, self.coherence, compact=self.compact)
+        decompressed._entangle_operands(self)
         return decompressed
     
     def reshape(self, *shape):
@@ -581,7 +1001,8 @@ class BumpyArray:
         return self
 
     def __repr__(self):
-        return f"BumpyArray(shape={self.shape}, coherence={self.coherence:.2f}, links={len(self.entanglement_links)})"
+        mode = ", compact" if self.compact else ""
+        return f"BumpyArray(shape={self.shape}, coherence={self.coherence:.2f}, links={len(self.entanglement_links)}{mode})"
 
 class BUMPYCore:
     """Enhanced Core Engine with All Breakthroughs"""
@@ -615,7 +1036,7 @@ class BUMPYCore:
         """ENHANCEMENT 3: Oracular entropy sampling with retrocausality"""
         # Use oracular oracle for advanced sampling
         return self.oracular_oracle.retrocausal_sample(
-            id(self), self.coherence_level, [self.coherence_level], size)
+            self, self.coherence_level, [self.coherence_level], size)
     
     def coherence_compress(self, data: List[float]) -> List[float]:
         """ENHANCEMENT 9: Cognitive memory compression with qualia preservation"""
@@ -666,8 +1087,8 @@ class BUMPYCore:
         
         # Add resonance effects from panpsychic field
         resonance_factor = 1.0
-        if self.panpsychic_field.resonance_history:
-            latest_resonance = self.panpsychic_field.resonance_history[-1]['amplitude']
+        if self.panpsychic_field.latest_resonance:
+            latest_resonance = self.panpsychic_field.latest_resonance['amplitude']
             resonance_factor = 1.0 + latest_resonance * 0.1
             
         return max(0.001, base_duration * (1.0 + 0.05 * modulation) * resonance_factor)
@@ -682,12 +1103,12 @@ class BUMPYCore:
                 
         # ENHANCEMENT 2: Update panpsychic resonance field
         for arr in arrays:
-            self.panpsychic_field.update_pilot_wave(id(arr), arr.data, arr.coherence)
-            arr.resonance_guidance = self.panpsychic_field.get_resonance_guidance(id(arr))
+            self.panpsychic_field.update_pilot_wave(arr, arr.data, arr.coherence)
+            arr.resonance_guidance = self.panpsychic_field.get_resonance_guidance(arr)
             
         # ENHANCEMENT 3: Record future states for retrocausality
         for arr in arrays:
-            self.oracular_oracle.record_future_state(id(arr), arr.coherence, arr.data)
+            self.oracular_oracle.record_future_state(arr, arr.coherence, arr.data)
             
         # Collective coherence adjustment
         avg_coherence = sum(arr.coherence for arr in arrays) / n
@@ -706,7 +1127,7 @@ class BUMPYCore:
 # Enhanced utility functions
 def bumpy_add(a: BumpyArray, b: BumpyArray) -> BumpyArray:
     """Safe addition with entanglement"""
-    out = BumpyArray(a.data[:])
+    out = BumpyArray(a.data[:], compact=a.compact)
     out += b
     return out
 
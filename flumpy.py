@@ -7,6 +7,8 @@ FLUMPY v1.0 - Fluctuating Luminal Memory Processing Unit
 import math
 import random
 import time
+import operator
+import weakref
 from typing import List, Dict, Tuple, Optional, Union, Any
 from collections import defaultdict
 
@@ -33,6 +35,11 @@ EMA_ALPHA = 0.15  # Exponential moving average weight
 PHASE_COUPLING = 0.45  # Inter-array phase coupling strength
 DECOHERENCE_RATE = 0.02  # Natural coherence decay per operation
 
+# Batch Similarity Constants
+SIMILARITY_BLOCK_SIZE = 256  # 256x256 float64 tile = 512 KiB per block product
+SIMILARITY_MARGIN = 1e-9  # Slack for matrix-product rounding before exact re-check
+LSH_TABLES = 4  # Independent hyperplane tables in the approximate prefilter
+
 # ============================================================
 # FLUMPY ARRAY - Core Data Structure
 # ============================================================
@@ -47,6 +54,10 @@ class FlumpyArray:
     - Automatic entanglement based on similarity
     - Chaos injection for exploration
     - Broadcasting support (scalar/vector operations)
+    
+    The L2 norm is cached for similarity_kernel/normalize. Assigning
+    `data` or going through `arr[i] = v` and `+=` resets it; code that
+    edits `arr.data` in place must call invalidate_norm().
     """
     
     def __init__(self, data: Union[List[float], float, int], coherence: float = 1.0):
@@ -70,13 +81,33 @@ class FlumpyArray:
         self.chaos = random.uniform(CHAOS_BASE, CHAOS_BASE * 2)
         self.phase = random.uniform(0, 2 * math.pi)  # Quantum phase
         
-        # Entanglement tracking
-        self.entangled_with: List['FlumpyArray'] = []
+        # Entanglement tracking (weak: a link never keeps an array alive)
+        self.entangled_with: 'weakref.WeakSet[FlumpyArray]' = weakref.WeakSet()
         self._visited_ids = set()  # Prevent infinite recursion
         
         # Metadata
         self.creation_time = time.time()
         self.operation_count = 0
+    
+    @property
+    def data(self) -> List[float]:
+        return self._data
+    
+    @data.setter
+    def data(self, values: List[float]):
+        self._data = values
+        self._norm = None
+    
+    @property
+    def norm(self) -> float:
+        """L2 norm of the data, cached until the data changes."""
+        if self._norm is None:
+            self._norm = math.hypot(*self._data)
+        return self._norm
+    
+    def invalidate_norm(self) -> None:
+        """Drop the cached norm after editing `data` in place."""
+        self._norm = None
         
     # ========================================
     # CORE OPERATIONS
@@ -118,15 +149,15 @@ class FlumpyArray:
         if len(self.data) != len(other.data):
             raise ValueError("Arrays must have same shape for similarity computation")
         
-        # Normalize both vectors
-        norm_self = math.sqrt(sum(x**2 for x in self.data))
-        norm_other = math.sqrt(sum(x**2 for x in other.data))
+        # Cached norms of both vectors
+        norm_self = self.norm
+        norm_other = other.norm
         
         if norm_self == 0 or norm_other == 0:
             return 0.0
         
-        # Dot product
-        dot = sum(a * b for a, b in zip(self.data, other.data))
+        # Dot product, multiplied and summed in C
+        dot = sum(map(operator.mul, self.data, other.data))
         
         # Phase coherence factor
         phase_diff = abs(self.phase - other.phase) % (2 * math.pi)
@@ -156,10 +187,8 @@ class FlumpyArray:
         similarity = self.similarity_kernel(other)
         if similarity > threshold:
             # Create bidirectional entanglement
-            if other not in self.entangled_with:
-                self.entangled_with.append(other)
-            if self not in other.entangled_with:
-                other.entangled_with.append(self)
+            self.entangled_with.add(other)
+            other.entangled_with.add(self)
             
             # Boost coherence through resonance
             coherence_boost = 0.05 * similarity
@@ -176,10 +205,8 @@ class FlumpyArray:
     
     def disentangle(self, other: 'FlumpyArray') -> bool:
         """Remove entanglement with another array."""
-        if other in self.entangled_with:
-            self.entangled_with.remove(other)
-        if self in other.entangled_with:
-            other.entangled_with.remove(self)
+        self.entangled_with.discard(other)
+        other.entangled_with.discard(self)
         
         # Apply decoherence penalty
         self.coherence *= (1 - DECOHERENCE_RATE)
@@ -216,6 +243,7 @@ class FlumpyArray:
             chaos_component = self.chaos * random.uniform(-1, 1) * (1 - self.coherence)
             self.data[i] += other_arr.data[i] + chaos_component
         
+        self._norm = None
         self._apply_chaos()
         self.entangle(other_arr)
         
@@ -277,7 +305,7 @@ class FlumpyArray:
     
     def normalize(self) -> 'FlumpyArray':
         """Normalize array to unit length."""
-        norm = math.sqrt(sum(x**2 for x in self.data))
+        norm = self.norm
         if norm == 0:
             return FlumpyArray([0.0] * len(self.data), self.coherence)
         
@@ -454,7 +482,7 @@ class FlumpyArray:
         copy = FlumpyArray(self.data[:], self.coherence)
         copy.chaos = self.chaos
         copy.phase = self.phase
-        copy.entangled_with = []  # Don't copy entanglement links
+        copy.entangled_with = weakref.WeakSet()  # Don't copy entanglement links
         
         return copy
     
@@ -482,6 +510,7 @@ class FlumpyArray:
     
     def __setitem__(self, index: int, value: float):
         self.data[index] = value
+        self._norm = None
         # Applying change reduces coherence slightly
         self.coherence *= 0.99
     
@@ -523,6 +552,115 @@ class FlumpyArray:
         
         return arr
 
+# ============================================================
+# BATCH SIMILARITY ENGINE
+# ============================================================
+
+def _numpy():
+    """numpy if installed (imported on first use), else None."""
+    try:
+        import numpy
+    except ImportError:
+        return None
+    return numpy
+
+class SimilarityEngine:
+    """
+    Candidate pairs for batch entanglement without O(n^2) Python calls.
+    
+    The arrays' data is stacked into one matrix and L2-normalized once;
+    cosine similarities are then computed block by block (block_size
+    rows x block_size columns per matrix product, sized to stay in
+    cache). The phase factor in similarity_kernel lies in [0.4, 1.0], so
+    a pair can only clear `threshold` if its cosine bound does; pairs
+    that cannot are never handed to entangle().
+    
+    With lsh_bits set, arrays are first bucketed by random-hyperplane
+    signatures (lsh_tables independent tables) and only arrays sharing a
+    bucket are compared. This is approximate: similar pairs that never
+    share a bucket are missed.
+    
+    Without numpy, or when array lengths differ, every pair is yielded
+    and batch_entangle behaves exactly like the pairwise loop.
+    """
+    
+    def __init__(self, block_size: int = SIMILARITY_BLOCK_SIZE, lsh_bits: int = 0,
+                 lsh_tables: int = LSH_TABLES, seed: Optional[int] = None):
+        self.block_size = block_size
+        self.lsh_bits = lsh_bits
+        self.lsh_tables = lsh_tables
+        self.seed = seed
+    
+    def candidate_pairs(self, arrays: List[FlumpyArray], threshold: float):
+        """Yield (i, j), i < j, in lexicographic order for pairs that may clear threshold."""
+        n = len(arrays)
+        np = _numpy()
+        if n < 2:
+            return
+        if np is None or len({len(arr.data) for arr in arrays}) > 1:
+            for i in range(n):
+                for j in range(i + 1, n):
+                    yield i, j
+            return
+        
+        matrix = np.array([arr.data for arr in arrays], dtype=np.float64)
+        norms = np.sqrt(np.einsum('ij,ij->i', matrix, matrix))
+        # Zero vectors stay zero: cosine 0, as similarity_kernel reports
+        unit = matrix / np.where(norms == 0, 1.0, norms)[:, None]
+        # Small margin so rounding in the matrix product never drops a
+        # pair that the exact kernel would accept
+        cutoff = threshold - SIMILARITY_MARGIN
+        
+        block = self.block_size
+        if self.lsh_bits:
+            pairs = self._lsh_pairs(np, unit)
+            for start in range(0, len(pairs), block * block):
+                codes = pairs[start:start + block * block]
+                i, j = codes // n, codes % n
+                cosine = np.einsum('ij,ij->i', unit[i], unit[j])
+                keep = self._upper_bound(np, cosine) > cutoff
+                yield from zip(i[keep].tolist(), j[keep].tolist())
+            return
+        
+        for row in range(0, n, block):
+            rows = unit[row:row + block]
+            found = []
+            for col in range(row, n, block):
+                cosine = rows @ unit[col:col + block].T
+                hit_i, hit_j = np.nonzero(self._upper_bound(np, cosine) > cutoff)
+                hit_i += row
+                hit_j += col
+                upper = hit_j > hit_i
+                found.append(hit_i[upper] * n + hit_j[upper])
+            codes = np.sort(np.concatenate(found))
+            yield from zip((codes // n).tolist(), (codes % n).tolist())
+    
+    @staticmethod
+    def _upper_bound(np, cosine):
+        # Largest similarity_kernel value any phase difference can give
+        return np.where(cosine >= 0, cosine, 0.4 * cosine)
+    
+    def _lsh_pairs(self, np, unit):
+        """Sorted unique i * n + j codes of pairs sharing a bucket in any table."""
+        n, dim = unit.shape
+        rng = np.random.default_rng(self.seed)
+        weights = 1 << np.arange(self.lsh_bits, dtype=np.int64)
+        codes = []
+        for _ in range(self.lsh_tables):
+            planes = rng.standard_normal((dim, self.lsh_bits))
+            signatures = ((unit @ planes) > 0) @ weights
+            order = np.argsort(signatures, kind='stable')
+            bounds = np.flatnonzero(np.diff(signatures[order])) + 1
+            for bucket in np.split(order, bounds):
+                if len(bucket) > 1:
+                    members = np.sort(bucket)
+                    i, j = np.triu_indices(len(members), k=1)
+                    codes.append(members[i] * n + members[j])
+        if not codes:
+            return np.empty(0, dtype=np.int64)
+        codes = np.sort(np.concatenate(codes))
+        return codes[np.concatenate(([True], codes[1:] != codes[:-1]))]
+
 # ============================================================
 # FLUMPY UTILITIES
 # ============================================================
@@ -589,14 +727,23 @@ class FlumpyUtilities:
         return result
     
     @staticmethod
-    def batch_entangle(arrays: List[FlumpyArray], threshold: float = ENTANGLEMENT_SIMILARITY):
-        """Attempt entanglement between all pairs in a batch."""
+    def batch_entangle(arrays: List[FlumpyArray], threshold: float = ENTANGLEMENT_SIMILARITY,
+                       engine: Optional[SimilarityEngine] = None):
+        """
+        Attempt entanglement between all pairs in a batch.
+        
+        Only pairs the engine reports as candidates are passed to entangle(),
+        in the same (i, j) order as the full pairwise loop, so with an exact
+        engine (the default) the links, coherences and phases come out the
+        same. Pairs ruled out up front are not recorded in _visited_ids.
+        """
+        if engine is None:
+            engine = SimilarityEngine()
         entangled_count = 0
         
-        for i in range(len(arrays)):
-            for j in range(i + 1, len(arrays)):
-                if arrays[i].entangle(arrays[j], threshold):
-                    entangled_count += 1
+        for i, j in engine.candidate_pairs(arrays, threshold):
+            if arrays[i].entangle(arrays[j], threshold):
+                entangled_count += 1
         
         return entangled_count
 
@@ -640,10 +787,11 @@ class FlumpyCore:
             return True
         return False
     
-    def global_entanglement_ritual(self, threshold: float = ENTANGLEMENT_SIMILARITY):
+    def global_entanglement_ritual(self, threshold: float = ENTANGLEMENT_SIMILARITY,
+                                   engine: Optional[SimilarityEngine] = None):
         """Perform global entanglement ritual on all arrays."""
         array_list = list(self.arrays.values())
-        entangled_pairs = FlumpyUtilities.batch_entangle(array_list, threshold)
+        entangled_pairs = FlumpyUtilities.batch_entangle(array_list, threshold, engine)
         
         # Update global coherence based on entanglement success rate
         total_possible_pairs = len(array_list) * (len(array_list) - 1) / 2
@@ -663,6 +811,7 @@ class FlumpyCore:
             injection = chaos_level * (1 - array.coherence) * random.uniform(-1, 1)
             for i in range(len(array.data)):
                 array.data[i] += injection
+            array.invalidate_norm()
             
             array.chaos = min(0.1, array.chaos * 1.05)
             array.coherence *= (1 - 0.01 * chaos_level)
@@ -12,10 +12,18 @@ import threading
 import json
 import os
 import sys
+import re
+import lzma
+import bisect
+import heapq
+import struct
+import zlib
+from array import array
+from itertools import chain
 from datetime import datetime, timezone
 from dataclasses import dataclass, asdict, field
 from typing import Optional, Dict, List, Any, Tuple, Deque, Union
-from collections import deque
+from collections import deque, OrderedDict
 import numpy as np
 import psutil
 
@@ -386,13 +394,39 @@ class BumpyQuantumOperator:
 # 4. HOLOGRAPHIC CACHE WITH UNIVERSAL COMPRESSION
 # ============================================================
 
+CACHE_BUDGET_BYTES = 32 * 2**20
+CACHE_COMPRESS_MIN_BYTES = 1024  # estimated size above which values are holographically compressed
+
+def _estimate_size(value, depth: int = 2) -> int:
+    """sys.getsizeof of `value` plus its items, two container levels deep"""
+    size = sys.getsizeof(value)
+    if depth:
+        if isinstance(value, dict):
+            items = chain(value.keys(), value.values())
+        elif isinstance(value, (list, tuple, set, deque)):
+            items = value
+        else:
+            return size
+        size += sum(_estimate_size(item, depth - 1) for item in items)
+    return size
+
 class UniversalCache:
-    """Cache with holographic compression and system integration"""
+    """Cache with holographic compression and system integration
+
+    A least-recently-used map bounded by `max_size` entries and `max_bytes`
+    as measured by `sizeof` when a value is stored (the same estimate
+    decides compression) and again whenever the cache annotates an entry. get, set and eviction are O(1) and eviction order
+    is deterministic: the least recently read or written entry goes first,
+    the newest entry is always kept.
+    """
 
-    def __init__(self, max_size: int = 1000):
+    def __init__(self, max_size: int = 1000, max_bytes: int = CACHE_BUDGET_BYTES, sizeof=_estimate_size):
         self.max_size = max_size
-        self.cache = {}
-        self.timestamps = {}
+        self.max_bytes = max_bytes
+        self._sizeof = sizeof
+        self.cache: 'OrderedDict[str, Dict]' = OrderedDict()  # least recently used first
+        self.sizes: Dict[str, int] = {}
+        self.nbytes = 0
         self.access_patterns = {}
         self.compression_level = 0.7
 
@@ -401,56 +435,63 @@ class UniversalCache:
         else:
             self.compressor = None
 
-        # Memory pressure tracking
-        self.memory_warnings = 0
-        self.last_cleanup = time.time()
-
         # Integration metrics
         self.metrics = {
             'hits': 0,
             'misses': 0,
+            'evictions': 0,
+            'bytes': 0,
             'compressions': 0,
             'size_reduction': 0.0,
             'quantum_entanglements': 0
         }
 
+    def __len__(self) -> int:
+        return len(self.cache)
+
     def get(self, key: str) -> Optional[Dict]:
         """Get with quantum-aware access patterns"""
-        if key in self.cache:
-            self.access_patterns[key] = self.access_patterns.get(key, 0) + 1
+        value = self.cache.get(key)
+        if value is not None or key in self.cache:
+            self.cache.move_to_end(key)
+            self.access_patterns[key] += 1
             self.metrics['hits'] += 1
 
             # Apply quantum refresh for frequently accessed items
             if self.access_patterns[key] % 5 == 0:
                 self._quantum_refresh(key)
 
-            return self.cache[key]
+            return value
 
         self.metrics['misses'] += 1
         return None
 
     def set(self, key: str, value: Dict, compress: bool = True):
         """Set with optional holographic compression"""
-        # Check memory pressure
-        if self._memory_pressure() > 0.8:
-            self._aggressive_evict()
+        nbytes = self._sizeof(value)
 
         # Apply holographic compression if enabled and available
-        if compress and self.compressor and len(str(value)) > 100:
+        if compress and self.compressor and nbytes > CACHE_COMPRESS_MIN_BYTES:
             compressed = self._holographic_compress(value)
             if compressed:
                 value = compressed
+                nbytes = self._sizeof(value)
                 self.metrics['compressions'] += 1
                 self.metrics['size_reduction'] = 0.7  # Assume 70% reduction
 
-        # Store with quantum timestamp
+        if key in self.cache:
+            self.nbytes -= self.sizes[key]
         self.cache[key] = value
-        self.timestamps[key] = time.time() + random.uniform(-0.001, 0.001)  # Quantum time uncertainty
+        self.cache.move_to_end(key)
+        self.sizes[key] = nbytes
+        self.nbytes += nbytes
         self.access_patterns[key] = 0
 
-        # Cleanup if needed
-        if len(self.cache) >= self.max_size:
-            self._quantum_evict()
+        # Evict least recently used entries while over either budget
+        while len(self.cache) > 1 and (len(self.cache) > self.max_size or self.nbytes > self.max_bytes):
+            self.delete(next(iter(self.cache)))
+            self.metrics['evictions'] += 1
+        self.metrics['bytes'] = self.nbytes
 
     def _holographic_compress(self, data: Dict) -> Optional[Dict]:
         """Compress data using BUMPY holographic methods"""
@@ -497,12 +538,15 @@ class UniversalCache:
 
             entry['quantum_metadata']['refresh_time'] = time.time()
             entry['quantum_metadata']['quantum_phase'] = random.uniform(0, 2 * math.pi)
+            self._remeasure(key)
 
-            # Entangle with other entries if BUMPY available
+            # Entangle with the previously used entry if BUMPY available
             if BUMPY_AVAILABLE and random.random() < 0.1:
-                other_keys = list(self.cache.keys())
-                if len(other_keys) > 1:
-                    other_key = random.choice([k for k in other_keys if k != key])
+                recent = reversed(self.cache)
+                other_key = next(recent)
+                if other_key == key:
+                    other_key = next(recent, None)
+                if other_key is not None:
                     self._create_entanglement(key, other_key)
 
     def _create_entanglement(self, key1: str, key2: str):
@@ -518,90 +562,1336 @@ class UniversalCache:
                 if other_key not in entangled_with:
                     entangled_with.append(other_key)
                     self.cache[key]['quantum_metadata']['entangled_with'] = entangled_with
+                self._remeasure(key)
 
             self.metrics['quantum_entanglements'] += 1
 
-    def _memory_pressure(self) -> float:
-        """Calculate memory pressure for adaptive behavior"""
+    def _remeasure(self, key: str):
+        """Re-estimate the size of an entry the cache has modified in place"""
+        nbytes = self._sizeof(self.cache[key])
+        self.nbytes += nbytes - self.sizes[key]
+        self.sizes[key] = nbytes
+        self.metrics['bytes'] = self.nbytes
+
+    def delete(self, key: str):
+        """Delete entry and propagate to entangled entries"""
+        # Propagate deletion to entangled entries
+        if key in self.cache and 'quantum_metadata' in self.cache[key]:
+            entangled = self.cache[key]['quantum_metadata'].get('entangled_with', [])
+            for other_key in entangled:
+                if other_key in self.cache and 'quantum_metadata' in self.cache[other_key]:
+                    # Remove this key from other's entanglement list
+                    other_entangled = self.cache[other_key]['quantum_metadata'].get('entangled_with', [])
+                    if key in other_entangled:
+                        other_entangled.remove(key)
+                        self.cache[other_key]['quantum_metadata']['entangled_with'] = other_entangled
+                        self._remeasure(other_key)
+
+        # Delete entry
+        if key in self.sizes:
+            del self.cache[key]
+            self.nbytes -= self.sizes.pop(key)
+            self.metrics['bytes'] = self.nbytes
+        self.access_patterns.pop(key, None)
+
+# ============================================================
+# 4.5 GROUP-COMMIT LOG WRITER
+# ============================================================
+
+FSYNC_POLICIES = ('never', 'per-batch', 'interval')
+BACKPRESSURE_MODES = ('block', 'drop-oldest', 'sample')
+WRITER_YIELD_SECONDS = 0.001  # serialization slice before the writer yields the GIL
+
+# Log format v2: flush_metadata fields that are written once as '#SNAPSHOT'
+# records and referenced from entries as '<field>_snapshot': <seq>
+LOG_FORMAT_VERSION = 2
+SNAPSHOT_PREFIX = '#SNAPSHOT '
+SNAPSHOT_FIELDS = ('universal_state', 'metrics')
+
+class LogWriter:
+    """
+    Appends JSONL entries to a log file from a dedicated writer thread.
+
+    Producers hand entries to a bounded queue (submit never touches the
+    file). The writer coalesces them into group commits: a batch is written
+    with one write() once it reaches `batch_size` entries or `batch_ms` after
+    its first entry arrived. Durability follows `fsync`:
+        never      leave flushing to the OS
+        per-batch  fsync after every batch
+        interval   fsync at most every `fsync_interval` seconds (and once idle)
+    When the queue is full, `backpressure` decides:
+        block        wait for the writer to make room
+        drop-oldest  discard the oldest queued entry
+        sample       admit one in `sample_every` overflowing entries (each
+                     displacing the oldest queued one) and drop the rest
+    With background=False entries are written on the caller's thread as soon
+    as they are submitted (the pre-writer behaviour).
+
+    log_format=2 writes the SNAPSHOT_FIELDS of each flush_metadata as
+    '#SNAPSHOT {"seq":..,"kind":..,"data":..}' records (a new one only when
+    the content changed) and entries carry '<field>_snapshot': seq instead;
+    read_universal_log() restores the inline shape. log_format=1 writes
+    the metadata inline in every entry.
+
+    An `index` (LogIndex) is handed every batch after it is written. With
+    `segments` (LogSegments) the file is rotated after a batch once the
+    segments say it is due; each segment repeats the snapshot records its
+    entries reference.
+    """
+
+    def __init__(self, path: str, queue_size: int = 8192, batch_size: int = 256,
+                 batch_ms: float = 5.0, fsync: str = 'interval', fsync_interval: float = 1.0,
+                 backpressure: str = 'block', sample_every: int = 10,
+                 background: bool = True, autostart: bool = True,
+                 log_format: int = LOG_FORMAT_VERSION, index: Optional['LogIndex'] = None,
+                 segments: Optional['LogSegments'] = None):
+        if log_format not in (1, LOG_FORMAT_VERSION):
+            raise ValueError(f"log_format must be 1 or {LOG_FORMAT_VERSION}, got {log_format!r}")
+        if fsync not in FSYNC_POLICIES:
+            raise ValueError(f"fsync policy must be one of {FSYNC_POLICIES}, got {fsync!r}")
+        if backpressure not in BACKPRESSURE_MODES:
+            raise ValueError(f"backpressure must be one of {BACKPRESSURE_MODES}, got {backpressure!r}")
+        self.path = path
+        self.queue_size = max(1, queue_size)
+        self.batch_size = max(1, batch_size)
+        self.batch_seconds = batch_ms / 1000.0
+        self.fsync = fsync
+        self.fsync_interval = fsync_interval
+        self.backpressure = backpressure
+        self.sample_every = max(1, sample_every)
+        self.background = background
+        self.log_format = log_format
+        self.index = index
+        self.segments = segments
+
+        self._queue: Deque[Dict] = deque()
+        self._notices: Deque[str] = deque(maxlen=64)  # flush banners, printed by the writer
+        self._cond = threading.Condition()
+        self._in_flight = 0
+        self._closing = False
+        self._overflow_seen = 0
+        self._file = None
+        self._dirty = False  # written since the last fsync
+        self._torn_tail = False  # a failed write left a partial line that could not be cut off
+        self._last_fsync = time.monotonic()
+        self._write_lock = threading.Lock()  # synchronous mode: one writer at a time
+        # Held by _rotate and by readers that need the closed segments and the
+        # active file (and its index) to describe the same moment
+        self.rotation_lock = threading.Lock()
+        self._metadata = None  # last flush_metadata seen, and its encoding
+        self._metadata_json = ''
+        # Numbering restarts with each writer; readers resolve a reference to
+        # the latest record with that seq that precedes it in the file
+        self._snapshot_seq = 0
+        self._snapshots: Dict[str, Tuple[int, str]] = {}  # kind -> (seq, encoded data) last written
+        self.metrics = {
+            'submitted': 0,
+            'written': 0,
+            'batches': 0,
+            'dropped': 0,
+            'fsyncs': 0,
+            'write_errors': 0,
+            'snapshots': 0,
+            'rotations': 0,
+            'blocked_ms': 0.0,
+            'max_queue_depth': 0
+        }
+
+        self._thread = None
+        if background and autostart:
+            self.start()
+
+    def start(self):
+        """Start the writer thread (no-op if running or in synchronous mode)."""
+        if self.background and self._thread is None:
+            self._thread = threading.Thread(target=self._run, name='laser-writer', daemon=True)
+            self._thread.start()
+
+    def submit(self, entries: List[Dict], notice: Optional[str] = None):
+        """Queue entries for writing, applying the backpressure policy when full."""
+        if not self.background:
+            with self._write_lock:
+                if notice:
+                    print(notice)
+                self.metrics['submitted'] += len(entries)
+                if entries:
+                    self._write_batch(list(entries))
+                    self._fsync_if_due(force=self.fsync == 'per-batch')
+            return
+
+        with self._cond:
+            if notice:
+                self._notices.append(notice)
+            for entry in entries:
+                self.metrics['submitted'] += 1
+                if len(self._queue) >= self.queue_size:
+                    if not self._make_room():
+                        continue
+                self._queue.append(entry)
+            self.metrics['max_queue_depth'] = max(self.metrics['max_queue_depth'], len(self._queue))
+            self._cond.notify_all()
+
+    def _make_room(self) -> bool:
+        """Apply backpressure to a full queue; False means drop the incoming entry."""
+        if self.backpressure == 'block' and self._thread is not None:
+            start = time.perf_counter()
+            while len(self._queue) >= self.queue_size and not self._closing:
+                self._cond.notify_all()
+                self._cond.wait(0.1)
+            self.metrics['blocked_ms'] += (time.perf_counter() - start) * 1000
+            if len(self._queue) < self.queue_size:
+                return True
+        if self.backpressure == 'sample':
+            self._overflow_seen += 1
+            if (self._overflow_seen - 1) % self.sample_every:
+                self.metrics['dropped'] += 1
+                return False
+        # drop-oldest, an admitted sample, or block with no writer to wait for
+        self._queue.popleft()
+        self.metrics['dropped'] += 1
+        return True
+
+    def drain(self, timeout: Optional[float] = None) -> bool:
+        """Wait until every queued entry has been written; False on timeout."""
+        if not self.background or self._thread is None:
+            return not self._queue
+        deadline = None if timeout is None else time.monotonic() + timeout
+        with self._cond:
+            self._cond.notify_all()
+            while self._queue or self._in_flight:
+                remaining = None if deadline is None else deadline - time.monotonic()
+                if remaining is not None and remaining <= 0:
+                    return False
+                self._cond.wait(remaining if remaining is not None else 0.1)
+        return True
+
+    def close(self, timeout: Optional[float] = 10.0):
+        """Write what is queued, stop the writer and close the file."""
+        with self._cond:
+            self._closing = True
+            self._cond.notify_all()
+        if self._thread is not None:
+            self._thread.join(timeout)
+            if self._thread.is_alive():
+                # Still writing: it finishes the queue and closes the file itself
+                print(f"⚠️ Log writer still busy after {timeout}s; finishing in the background")
+                return
+        with self._write_lock:
+            if self._queue:
+                # Never started (autostart=False)
+                self._write_batch(list(self._queue))
+                self._queue.clear()
+            self._close_file()
+
+    def _close_file(self):
+        self._fsync_if_due(force=self.fsync != 'never')
+        if self._file is not None:
+            self._file.close()
+            self._file = None
+
+    def stats(self) -> Dict[str, Any]:
+        with self._cond:
+            return {**self.metrics, 'queue_depth': len(self._queue)}
+
+    def _run(self):
+        while True:
+            with self._cond:
+                while not self._queue and not self._closing:
+                    # Idle: wake up in time to fsync an interval policy's tail
+                    idle_timeout = self.fsync_interval if (self._dirty and self.fsync == 'interval') else None
+                    if not self._cond.wait(idle_timeout):
+                        break
+                if not self._queue:
+                    if self._closing:
+                        break
+                    notices, batch = [], []
+                else:
+                    # Group commit: give producers batch_ms to fill the batch
+                    deadline = time.monotonic() + self.batch_seconds
+                    while len(self._queue) < self.batch_size and not self._closing:
+                        remaining = deadline - time.monotonic()
+                        if remaining <= 0 or not self._cond.wait(remaining):
+                            break
+                    count = min(len(self._queue), self.batch_size)
+                    batch = [self._queue.popleft() for _ in range(count)]
+                    notices = list(self._notices)
+                    self._notices.clear()
+                    self._in_flight = count
+                    self._cond.notify_all()
+
+            try:
+                for notice in notices:
+                    print(notice)
+                if batch:
+                    self._write_batch(batch)
+                self._fsync_if_due(force=self.fsync == 'per-batch' and bool(batch))
+            except Exception as e:
+                # The writer must outlive a bad batch, or drain() and a
+                # blocking submit() would wait on it forever
+                self.metrics['write_errors'] += len(batch)
+                print(f"⚠️ Universal writer error: {e}")
+            finally:
+                with self._cond:
+                    self._in_flight = 0
+                    self._cond.notify_all()
+
+        # Closing with the queue written; close() may have stopped waiting
         try:
-            memory = psutil.virtual_memory()
-            return memory.percent / 100.0
-        except:
-            return len(self.cache) / self.max_size
-
-    def _aggressive_evict(self):
-        """Aggressive eviction under memory pressure"""
-        if not self.cache:
+            self._close_file()
+        except Exception as e:
+            print(f"⚠️ Universal writer error: {e}")
+
+    def _write_batch(self, batch: List[Dict]):
+        lines = []
+        written = []  # the entries behind `lines`
+        on_writer_thread = threading.current_thread() is self._thread
+        last_yield = time.perf_counter()
+        for entry in batch:
+            if on_writer_thread and time.perf_counter() - last_yield > WRITER_YIELD_SECONDS:
+                # Hand the GIL back so producers are not stalled for a whole
+                # switch interval behind serialization
+                time.sleep(0)
+                last_yield = time.perf_counter()
+            for _ in range(3):
+                try:
+                    lines.append(self._serialize(entry).encode('utf-8'))
+                    written.append(entry)
+                    break
+                except RuntimeError:
+                    # Entry mutated by another thread mid-serialization; retry
+                    continue
+                except (TypeError, ValueError) as e:
+                    # Not JSON-encodable: skip this entry, keep the rest of the batch
+                    self.metrics['write_errors'] += 1
+                    print(f"⚠️ Universal entry not serializable: {e}")
+                    print(f"[FALLBACK] {entry.get('timestamp')} - {str(entry.get('message', ''))[:60]}...")
+                    break
+            else:
+                self.metrics['write_errors'] += 1
+        if not lines:
             return
+        start = None  # file size before this batch
+        try:
+            if self._file is None:
+                self._file = open(self.path, 'ab')
+            start = os.fstat(self._file.fileno()).st_size
+            data = b'\n'.join(lines) + b'\n'
+            if self._torn_tail:
+                # End the partial line a failed batch left behind
+                self._file.write(b'\n')
+            self._file.write(data)
+            self._file.flush()
+            self._torn_tail = False
+            self._dirty = True
+            self.metrics['written'] += len(lines)
+            self.metrics['batches'] += 1
+            tracked = self.index is not None or self.segments is not None
+            end = os.fstat(self._file.fileno()).st_size if tracked else 0
+        except Exception as e:
+            self.metrics['write_errors'] += len(lines)
+            # Snapshot records in the lost batch must be written again
+            self._snapshots.clear()
+            self._metadata = None
+            print(f"⚠️ Universal write failed: {e}")
+            # Fallback to console
+            for entry in batch[:2]:
+                print(f"[FALLBACK] {entry.get('timestamp')} - {str(entry.get('message', ''))[:60]}...")
+            if self._file is not None:
+                try:
+                    self._file.close()
+                except Exception:
+                    pass
+                self._file = None
+            if start is not None:
+                # Cut off whatever part of the batch reached the file, or the
+                # next batch would continue its unterminated last line
+                try:
+                    os.truncate(self.path, start)
+                except OSError:
+                    self._torn_tail = True
+        else:
+            if self.index is not None:
+                self.index.add_written(end - len(data), list(zip(lines, written)))
+            if self.segments is not None and self.segments.due(end):
+                self._rotate()
+
+    def _rotate(self):
+        """Close the active segment; the next batch starts a new one."""
+        self._fsync_if_due(force=self.fsync != 'never')
+        self._file.close()
+        self._file = None
+        with self.rotation_lock:
+            try:
+                if self.segments.rotate() is None:
+                    return
+            except OSError as e:
+                print(f"⚠️ Log rotation failed: {e}")
+                return
+            # References in the new segment must not point into the old one
+            self._snapshots.clear()
+            self._metadata = None
+            if self.index is not None:
+                self.index.clear()
+        self.metrics['rotations'] += 1
+
+    def _serialize(self, entry: Dict) -> str:
+        """
+        One JSONL line; the flush metadata a whole flush shares is encoded once.
 
-        # Calculate quantum age (adjusted by access patterns)
-        now = time.time()
-        eviction_scores = {}
+        In format v2 the first entry of a flush is preceded by the snapshot
+        records it references (only those whose content changed). Writer
+        state is only updated once the whole line is built, so an entry that
+        fails to encode (and is retried or skipped) leaves nothing behind.
+        """
+        metadata = entry.get('flush_metadata')
+        if not isinstance(metadata, dict):
+            return json.dumps(entry, separators=(',', ':'))
+        snapshot_lines, encoded, changed = '', self._metadata_json, {}
+        if metadata is not self._metadata:
+            if self.log_format == 1:
+                encoded = json.dumps(metadata, separators=(',', ':'))
+            else:
+                snapshot_lines, encoded, changed = self._encode_v2_metadata(metadata)
+        body = json.dumps({k: v for k, v in entry.items() if k != 'flush_metadata'}, separators=(',', ':'))
+        if changed:
+            self._snapshot_seq += len(changed)
+            self._snapshots.update(changed)
+            self.metrics['snapshots'] += len(changed)
+        self._metadata = metadata
+        self._metadata_json = encoded
+        separator = ',' if len(body) > 2 else ''
+        return f'{snapshot_lines}{body[:-1]}{separator}"flush_metadata":{encoded}}}'
+
+    def _encode_v2_metadata(self, metadata: Dict) -> Tuple[str, str, Dict[str, Tuple[int, str]]]:
+        """(snapshot record lines to write first, encoded metadata with references, new snapshots)"""
+        records = []
+        compact = {}
+        changed = {}
+        seq = self._snapshot_seq
+        for key, value in metadata.items():
+            if key not in SNAPSHOT_FIELDS:
+                compact[key] = value
+                continue
+            data = json.dumps(value, separators=(',', ':'))
+            last = self._snapshots.get(key)
+            if last is None or last[1] != data:
+                seq += 1
+                last = changed[key] = (seq, data)
+                records.append(f'{SNAPSHOT_PREFIX}{{"seq":{last[0]},"kind":"{key}","data":{data}}}\n')
+            compact[f'{key}_snapshot'] = last[0]
+        return ''.join(records), json.dumps(compact, separators=(',', ':')), changed
+
+    def _fsync_if_due(self, force: bool = False):
+        if not self._dirty or self._file is None or self.fsync == 'never':
+            return
+        now = time.monotonic()
+        if force or now - self._last_fsync >= self.fsync_interval:
+            try:
+                os.fsync(self._file.fileno())
+                self.metrics['fsyncs'] += 1
+            except OSError as e:
+                print(f"⚠️ Universal fsync failed: {e}")
+            self._dirty = False
+            self._last_fsync = now
+
+def _restore_snapshots(entry: Dict, lookup) -> Dict:
+    """Replace an entry's v2 snapshot references with lookup(seq)"""
+    metadata = entry.get('flush_metadata')
+    if isinstance(metadata, dict) and any(f'{key}_snapshot' in metadata for key in SNAPSHOT_FIELDS):
+        restored = {}
+        for key, value in metadata.items():
+            field = key[:-len('_snapshot')] if key.endswith('_snapshot') else None
+            if field in SNAPSHOT_FIELDS:
+                restored[field] = lookup(value)
+            else:
+                restored[key] = value
+        entry['flush_metadata'] = restored
+    return entry
 
-        for key in list(self.cache.keys()):
-            age = now - self.timestamps[key]
-            accesses = self.access_patterns.get(key, 0)
+# ============================================================
+# 4.6 SIDECAR QUERY INDEX
+# ============================================================
+
+INDEX_VERSION = 1
+INDEX_PREFIX = b'#LASER_INDEX '
+INDEX_HEAD_BYTES = 4096  # log prefix fingerprinted to notice a replaced file
+INDEX_TOKEN_LENGTH = 3  # messages are indexed by character trigrams
+# quantum_filter keys -> (quantum field, bound kind), as _quantum_filter_match reads them
+RANGE_FILTERS = {
+    'coherence_min': ('coherence', 'min'),
+    'risk_max': ('risk', 'max'),
+    'entropy_max': ('entropy', 'max')
+}
+RANGE_INDEX_FIELDS = ('coherence', 'risk', 'entropy')
+RANGE_INDEX_BUCKETS = 32  # equal-width over [0, 1]; outliers land in the end buckets
+
+def _plain_number(value) -> bool:
+    return isinstance(value, (int, float)) and not isinstance(value, bool)
+
+def _indexable(value) -> Optional[float]:
+    """value as a float that compares and computes exactly like the original, else None"""
+    if not _plain_number(value) or value != value:
+        return None
+    if isinstance(value, int) and abs(value) > 2 ** 53:
+        return None
+    return float(value)
+
+def _bucket(value: float) -> Optional[int]:
+    if value != value:
+        return None
+    if value <= 0:
+        return 0
+    if value >= 1:
+        return RANGE_INDEX_BUCKETS - 1
+    return min(RANGE_INDEX_BUCKETS - 1, int(value * RANGE_INDEX_BUCKETS))
+
+def _message_tokens(message: str):
+    """Distinct lowercase trigrams; shorter messages are a single token"""
+    text = message.lower()
+    if len(text) < INDEX_TOKEN_LENGTH:
+        return (text,) if text else ()
+    return {text[i:i + INDEX_TOKEN_LENGTH] for i in range(len(text) - INDEX_TOKEN_LENGTH + 1)}
+
+class LogIndex:
+    """
+    Sidecar index that lets query_universal_memory seek instead of scan.
+
+    Entries are numbered in file order and the index keeps, per entry, the
+    byte offset of its line plus:
+        postings     lowercase message trigram -> entry numbers. A substring
+                     query intersects the postings of its own trigrams (exact
+                     for needles of up to three characters, a superset the
+                     query verifies for longer ones)
+        time index   entry numbers sorted by universal_time
+        range index  RANGE_INDEX_BUCKETS buckets per RANGE_INDEX_FIELDS
+                     field, with the exact values kept for boundary checks
+                     and for ranking without reading the log
+    Entries whose fields cannot be indexed exactly (a missing or non-numeric
+    time or quantum field, a non-string message) are kept as irregular and
+    are evaluated from the log on every query.
+
+    The LogWriter adds what it writes (add_written). Anything else appended
+    to the log is picked up by refresh(), which also loads the sidecar on
+    first use and rebuilds from the log when the sidecar is missing or
+    corrupt, or the log was truncated or replaced. save() writes the sidecar.
+    """
 
-            # Quantum age: older items with few accesses are more likely to be evicted
-            quantum_age = age * (1.0 / max(1, accesses * 0.1))
-            eviction_scores[key] = quantum_age
+    def __init__(self, log_path: str, path: Optional[str] = None):
+        self.log_path = log_path
+        self.path = path or f"{log_path}.idx"
+        self.loaded = False
+        self._lock = threading.RLock()
+        self.metrics = {
+            'loads': 0,
+            'rebuilds': 0,
+            'saves': 0,
+            'appended': 0,  # entries handed over by the writer
+            'scanned': 0,  # entries indexed by reading the log
+            'selects': 0,
+            'entries_read': 0
+        }
+        self._reset()
+
+    def _reset(self):
+        self.log_bytes = 0  # the log is indexed up to here
+        self._head = (0, 0)  # (bytes fingerprinted, crc32)
+        self.offsets = array('q')
+        self.times = array('d')  # by entry number; NaN for irregular entries
+        self.values = {field: array('d') for field in RANGE_INDEX_FIELDS}
+        self.time_order = array('I')  # entry numbers sorted by time ...
+        self.sorted_times = array('d')  # ... and their times
+        self.buckets = {field: [array('I') for _ in range(RANGE_INDEX_BUCKETS)] for field in RANGE_INDEX_FIELDS}
+        self.postings: Dict[str, array] = {}
+        self.irregular = array('I')
+        self.untokenized = array('I')  # irregular because the message is not a string
+        self.snapshots: Dict[Any, List[int]] = {}  # snapshot seq -> offsets of its records
+        self._dirty = False
+
+    def __len__(self):
+        return len(self.offsets)
+
+    def stats(self) -> Dict[str, Any]:
+        return {**self.metrics, 'entries': len(self.offsets), 'tokens': len(self.postings),
+                'irregular': len(self.irregular), 'log_bytes': self.log_bytes}
+
+    # --- Building ---
+
+    def refresh(self) -> bool:
+        """Bring the index up to date with the log; False if there is no log."""
+        with self._lock:
+            try:
+                size = os.path.getsize(self.log_path)
+            except OSError:
+                return False
+            if not self.loaded:
+                self.loaded = True
+                if not self.load():
+                    self.metrics['rebuilds'] += 1
+            if size < self.log_bytes or not self._head_matches():
+                # Truncated or replaced under us
+                self._reset()
+                self.metrics['rebuilds'] += 1
+            if size > self.log_bytes:
+                self._index_from(self.log_bytes)
+            return True
 
-        # Evict worst 20%
-        to_evict = sorted(eviction_scores.items(), key=lambda x: x[1], reverse=True)
-        evict_count = max(1, len(to_evict) // 5)
+    def clear(self):
+        """Start over on an empty log (the writer rotated the old one away)."""
+        with self._lock:
+            self._reset()
+            self.loaded = True
+            self._dirty = True
 
-        for key, _ in to_evict[:evict_count]:
-            self.delete(key)
+    def rebuild(self) -> int:
+        """Discard the index and index the whole log again; returns the entry count."""
+        with self._lock:
+            self._reset()
+            self.loaded = True
+            self.metrics['rebuilds'] += 1
+            if os.path.exists(self.log_path):
+                self._index_from(0)
+            return len(self.offsets)
+
+    def add_written(self, start: int, lines: List[Tuple[bytes, Dict]]):
+        """
+        Index entries the writer just wrote at byte offset `start`.
 
-    def _quantum_evict(self):
-        """Quantum probabilistic eviction"""
-        if not self.cache:
+        Each line is the encoded entry (preceded by any snapshot records
+        written with it) and the entry itself. Ignored until the index is
+        loaded, or if something else wrote to the log since; refresh()
+        picks those up from the file.
+        """
+        with self._lock:
+            if not self.loaded or start != self.log_bytes:
+                return
+            offset = start
+            for data, entry in lines:
+                entry_start = data.rfind(b'\n') + 1
+                position = offset
+                for record in data[:entry_start].splitlines(keepends=True):
+                    self._add_snapshot(position, record)
+                    position += len(record)
+                self._add(offset + entry_start, entry)
+                offset += len(data) + 1
+            self.metrics['appended'] += len(lines)
+            self.log_bytes = offset
+            self._update_head()
+            self._dirty = True
+
+    def _index_from(self, offset: int):
+        count = len(self.offsets)
+        with open(self.log_path, 'rb') as f:
+            f.seek(offset)
+            for line in f:
+                if not line.endswith(b'\n'):
+                    break  # still being written; indexed on a later refresh
+                if line.startswith(b'#'):
+                    if line.startswith(SNAPSHOT_PREFIX.encode()):
+                        self._add_snapshot(offset, line)
+                else:
+                    try:
+                        entry = json.loads(line)
+                    except ValueError:
+                        entry = None
+                    if isinstance(entry, dict):
+                        self._add(offset, entry)
+                offset += len(line)
+        self.metrics['scanned'] += len(self.offsets) - count
+        self.log_bytes = offset
+        self._update_head()
+        self._dirty = True
+
+    def _add_snapshot(self, offset: int, record: bytes):
+        try:
+            record = json.loads(record[len(SNAPSHOT_PREFIX):])
+            record['data']
+            self.snapshots.setdefault(record['seq'], []).append(offset)
+        except (ValueError, KeyError, TypeError):
+            pass
+
+    def _add(self, offset: int, entry: Dict):
+        number = len(self.offsets)
+        self.offsets.append(offset)
+        regular = True
+
+        message = entry.get('message', '')
+        if isinstance(message, str):
+            for token in _message_tokens(message):
+                postings = self.postings.get(token)
+                if postings is None:
+                    postings = self.postings[token] = array('I')
+                postings.append(number)
+        else:
+            regular = False
+            self.untokenized.append(number)
+
+        quantum = entry.get('quantum')
+        values = [_indexable(quantum.get(f)) for f in RANGE_INDEX_FIELDS] if isinstance(quantum, dict) else [None]
+        entry_time = _indexable(entry.get('universal_time'))
+        if not regular or entry_time is None or None in values:
+            self.irregular.append(number)
+            self.times.append(math.nan)
+            for field in RANGE_INDEX_FIELDS:
+                self.values[field].append(math.nan)
             return
 
-        # Calculate quantum probabilities
-        now = time.time()
-        total_quantum_weight = 0
-        quantum_weights = {}
+        self.times.append(entry_time)
+        if not self.sorted_times or entry_time >= self.sorted_times[-1]:
+            self.sorted_times.append(entry_time)
+            self.time_order.append(number)
+        else:
+            position = bisect.bisect_right(self.sorted_times, entry_time)
+            self.sorted_times.insert(position, entry_time)
+            self.time_order.insert(position, number)
+        for field, value in zip(RANGE_INDEX_FIELDS, values):
+            self.values[field].append(value)
+            self.buckets[field][_bucket(value)].append(number)
+
+    def _head_matches(self) -> bool:
+        length, crc = self._head
+        if not length:
+            return True
+        try:
+            with open(self.log_path, 'rb') as f:
+                return zlib.crc32(f.read(length)) == crc
+        except OSError:
+            return False
 
-        for key in list(self.cache.keys()):
-            age = now - self.timestamps[key]
-            accesses = self.access_patterns.get(key, 0)
+    def _update_head(self):
+        if self._head[0] < INDEX_HEAD_BYTES and self.log_bytes > self._head[0]:
+            with open(self.log_path, 'rb') as f:
+                head = f.read(min(self.log_bytes, INDEX_HEAD_BYTES))
+            self._head = (len(head), zlib.crc32(head))
+
+    # --- Sidecar file ---
+
+    def _arrays(self) -> List[Tuple[str, array]]:
+        arrays = [('offsets', self.offsets), ('times', self.times), ('time_order', self.time_order),
+                  ('sorted_times', self.sorted_times), ('irregular', self.irregular),
+                  ('untokenized', self.untokenized)]
+        for field in RANGE_INDEX_FIELDS:
+            arrays.append((f'values.{field}', self.values[field]))
+            arrays.extend((f'buckets.{field}.{i}', b) for i, b in enumerate(self.buckets[field]))
+        return arrays
+
+    def save(self) -> bool:
+        """Write the sidecar (atomically) if it is out of date."""
+        with self._lock:
+            if not self.loaded or not self._dirty:
+                return False
+            arrays = self._arrays()
+            tokens = list(self.postings.items())
+            header = {
+                'version': INDEX_VERSION,
+                'byteorder': sys.byteorder,
+                'log_bytes': self.log_bytes,
+                'head': list(self._head),
+                'arrays': [[name, a.typecode, len(a)] for name, a in arrays],
+                'tokens': [[token, len(postings)] for token, postings in tokens],
+                'snapshots': [[seq, offsets] for seq, offsets in self.snapshots.items()]
+            }
+            tmp_path = f"{self.path}.tmp"
+            try:
+                with open(tmp_path, 'wb') as f:
+                    f.write(INDEX_PREFIX + json.dumps(header, separators=(',', ':')).encode() + b'\n')
+                    for _, a in arrays:
+                        a.tofile(f)
+                    for _, postings in tokens:
+                        postings.tofile(f)
+                    f.flush()
+                    os.fsync(f.fileno())
+                os.replace(tmp_path, self.path)
+            except OSError as e:
+                print(f"⚠️ Index save failed: {e}")
+                return False
+            self._dirty = False
+            self.metrics['saves'] += 1
+            return True
 
-            # Quantum probability: older with fewer accesses = higher probability
-            quantum_prob = math.exp(-accesses * 0.1) * (1.0 - math.exp(-age / 3600))
-            quantum_weights[key] = quantum_prob
-            total_quantum_weight += quantum_prob
+    def load(self) -> bool:
+        """Replace the index with the sidecar's; False if it is missing or unusable."""
+        with self._lock:
+            try:
+                with open(self.path, 'rb') as f:
+                    line = f.readline()
+                    if not line.startswith(INDEX_PREFIX):
+                        raise ValueError("not a LASER index")
+                    header = json.loads(line[len(INDEX_PREFIX):])
+                    if header['version'] != INDEX_VERSION or header['byteorder'] != sys.byteorder:
+                        raise ValueError("incompatible index")
+
+                    def read_array(typecode, length):
+                        a = array(typecode)
+                        data = f.read(length * a.itemsize)
+                        if len(data) != length * a.itemsize:
+                            raise ValueError("truncated index")
+                        a.frombytes(data)
+                        return a
+
+                    arrays = {name: read_array(typecode, length) for name, typecode, length in header['arrays']}
+                    postings = {token: read_array('I', length) for token, length in header['tokens']}
+                    if f.read(1):
+                        raise ValueError("trailing data in index")
+            except (OSError, ValueError, KeyError, TypeError):
+                return False
 
-        if total_quantum_weight == 0:
-            return
+            self._reset()
+            try:
+                self.offsets = arrays['offsets']
+                self.times = arrays['times']
+                self.time_order = arrays['time_order']
+                self.sorted_times = arrays['sorted_times']
+                self.irregular = arrays['irregular']
+                self.untokenized = arrays['untokenized']
+                for field in RANGE_INDEX_FIELDS:
+                    self.values[field] = arrays[f'values.{field}']
+                    self.buckets[field] = [arrays[f'buckets.{field}.{i}'] for i in range(RANGE_INDEX_BUCKETS)]
+                if len({len(self.offsets), len(self.times), *(len(v) for v in self.values.values())}) != 1:
+                    raise ValueError("inconsistent index")
+                self.snapshots = {seq: offsets for seq, offsets in header['snapshots']}
+                self.log_bytes = header['log_bytes']
+                self._head = tuple(header['head'])
+            except (KeyError, ValueError, TypeError):
+                self._reset()
+                return False
+            self.postings = postings
+            self.metrics['loads'] += 1
+            return True
 
-        # Normalize and select for eviction
-        selected = random.random() * total_quantum_weight
-        cumulative = 0
+    # --- Querying ---
 
-        for key, weight in quantum_weights.items():
-            cumulative += weight
-            if cumulative >= selected:
-                self.delete(key)
+    def _matching_messages(self, needle: str) -> Optional[set]:
+        """Entries whose message may contain `needle` (already lowercase); None for all"""
+        if not needle:
+            return None
+        if len(needle) < INDEX_TOKEN_LENGTH:
+            matched = set()
+            for token, postings in self.postings.items():
+                if needle in token:
+                    matched.update(postings)
+            return matched
+        grams = sorted(_message_tokens(needle), key=lambda gram: len(self.postings.get(gram, ())))
+        matched = set(self.postings.get(grams[0], ()))
+        for gram in grams[1:]:
+            if not matched:
                 break
+            matched.intersection_update(self.postings.get(gram, ()))
+        return matched
 
-    def delete(self, key: str):
-        """Delete entry and propagate to entangled entries"""
-        # Propagate deletion to entangled entries
-        if key in self.cache and 'quantum_metadata' in self.cache[key]:
-            entangled = self.cache[key]['quantum_metadata'].get('entangled_with', [])
-            for other_key in entangled:
-                if other_key in self.cache and 'quantum_metadata' in self.cache[other_key]:
-                    # Remove this key from other's entanglement list
-                    other_entangled = self.cache[other_key]['quantum_metadata'].get('entangled_with', [])
-                    if key in other_entangled:
-                        other_entangled.remove(key)
-                        self.cache[other_key]['quantum_metadata']['entangled_with'] = other_entangled
+    def select(self, needle: str, temporal_range: Tuple[float, float] = None,
+               bounds: List[Tuple[str, str, float]] = ()) -> Optional[Tuple[List[int], List[int], bool]]:
+        """
+        Entries that can match a query, in file order.
 
-        # Delete entry
-        self.cache.pop(key, None)
-        self.timestamps.pop(key, None)
-        self.access_patterns.pop(key, None)
+        bounds are (field, 'min' | 'max', value) quantum filter bounds.
+        Returns (regular, irregular, exact): regular entries satisfy every
+        constraint except that, unless `exact`, their message must still be
+        checked for the needle; irregular entries must be evaluated from the
+        log. None when a constraint is not a plain number (scan instead).
+        """
+        if temporal_range:
+            start, end = temporal_range
+            if not (_plain_number(start) and _plain_number(end)):
+                return None
+        if not all(_plain_number(bound) for _, _, bound in bounds):
+            return None
+
+        with self._lock:
+            self.metrics['selects'] += 1
+            matched = self._matching_messages(needle)
+
+            # Drive the selection from the most selective index
+            count = len(self.offsets)
+            plans = [(count, lambda: range(count))]
+            if matched is not None:
+                plans.append((len(matched), lambda: sorted(matched)))
+            if temporal_range:
+                lo = bisect.bisect_left(self.sorted_times, start)
+                hi = bisect.bisect_right(self.sorted_times, end)
+                plans.append((max(0, hi - lo), lambda: sorted(self.time_order[lo:hi])))
+            for field, kind, bound in bounds:
+                b = _bucket(bound)
+                if b is None:
+                    continue
+                chosen = self.buckets[field][b:] if kind == 'min' else self.buckets[field][:b + 1]
+                plans.append((sum(map(len, chosen)), lambda chosen=chosen: sorted(chain.from_iterable(chosen))))
+            driver = min(plans, key=lambda plan: plan[0])[1]()
+
+            irregular = set(self.irregular)
+            times = self.times
+            checks = [(self.values[field], kind == 'min', bound) for field, kind, bound in bounds]
+            regular = []
+            for n in driver:
+                if n in irregular or (matched is not None and n not in matched):
+                    continue
+                if temporal_range and not (start <= times[n] <= end):
+                    continue
+                for column, at_least, bound in checks:
+                    value = column[n]
+                    if (value < bound) if at_least else (value > bound):
+                        break
+                else:
+                    regular.append(n)
+
+            untokenized = set(self.untokenized)
+            candidates = [n for n in self.irregular if matched is None or n in matched or n in untokenized]
+        return regular, candidates, len(needle) <= INDEX_TOKEN_LENGTH
+
+    def read(self, numbers: List[int]) -> List[Optional[Dict]]:
+        """Entries by number, rehydrated like read_universal_log (None if unreadable)"""
+        entries = []
+        snapshot_cache: Dict[int, Any] = {}
+        with self._lock, open(self.log_path, 'rb') as f:
+            for n in numbers:
+                offset = self.offsets[n]
+                f.seek(offset)
+                try:
+                    entry = json.loads(f.readline())
+                except ValueError:
+                    entry = None
+                if not isinstance(entry, dict):
+                    entries.append(None)
+                    continue
+                entries.append(_restore_snapshots(
+                    entry, lambda seq: self._snapshot(f, seq, offset, snapshot_cache)))
+            self.metrics['entries_read'] += len(numbers)
+        return entries
+
+    def _snapshot(self, f, seq, before: int, cache: Dict[int, Any]):
+        """Data of the last record of snapshot `seq` written before offset `before`"""
+        try:
+            offsets = self.snapshots.get(seq)
+        except TypeError:
+            return None
+        i = bisect.bisect_left(offsets, before) - 1 if offsets else -1
+        if i < 0:
+            return None
+        at = offsets[i]
+        if at not in cache:
+            f.seek(at)
+            cache[at] = json.loads(f.readline()[len(SNAPSHOT_PREFIX):])['data']
+        return cache[at]
+
+# ============================================================
+# 4.7 LOG SEGMENTS
+# ============================================================
+
+SEGMENT_CODECS = {
+    # name: (compressor factory, decompressor factory, file suffix)
+    'zlib': (lambda: zlib.compressobj(6), zlib.decompressobj, '.z'),
+    'lzma': (lzma.LZMACompressor, lzma.LZMADecompressor, '.xz')
+}
+SEGMENT_MAGIC = b'LSEG'  # last bytes of a compressed segment, after the footer length
+SEGMENT_READ_BYTES = 1 << 20
+MANIFEST_VERSION = 1
+
+def read_segment_footer(path: str) -> Optional[Dict]:
+    """The footer of a compressed segment, or None if it has none (torn or not a segment)"""
+    try:
+        with open(path, 'rb') as f:
+            size = f.seek(0, os.SEEK_END)
+            if size < 8:
+                return None
+            f.seek(size - 8)
+            length, magic = struct.unpack('<I4s', f.read(8))
+            if magic != SEGMENT_MAGIC or length > size - 8:
+                return None
+            f.seek(size - 8 - length)
+            footer = json.loads(f.read(length))
+    except (OSError, ValueError):
+        return None
+    return footer if isinstance(footer, dict) and footer.get('codec') in SEGMENT_CODECS else None
+
+def _segment_lines(path: str, codec: Optional[str] = None):
+    """Complete lines of a segment file, stream-decompressed; a torn or corrupt tail is dropped"""
+    with open(path, 'rb') as f:
+        if codec is None:
+            for line in f:
+                if line.endswith(b'\n'):
+                    yield line
+            return
+        decompressor = SEGMENT_CODECS[codec][1]()
+        pending = b''
+        while not decompressor.eof:
+            chunk = f.read(SEGMENT_READ_BYTES)
+            if not chunk:
+                break
+            try:
+                data = decompressor.decompress(chunk)
+            except (zlib.error, lzma.LZMAError):
+                break
+            lines = (pending + data).split(b'\n')
+            pending = lines.pop()
+            for line in lines:
+                yield line + b'\n'
+
+def _open_segment(log_path: str, segment: Dict):
+    """Lines of a closed segment listed in the manifest"""
+    path = os.path.join(os.path.dirname(log_path), segment['file'])
+    codec = segment.get('codec')
+    if codec is None and not os.path.exists(path):
+        # Compressed since the manifest was read
+        for name, (_, _, suffix) in SEGMENT_CODECS.items():
+            if os.path.exists(path + suffix):
+                path, codec = path + suffix, name
+                break
+    return _segment_lines(path, codec)
+
+def _log_entries(lines):
+    """Entries decoded from log lines, v2 snapshot references restored"""
+    snapshots: Dict[int, Dict] = {}
+    prefix = SNAPSHOT_PREFIX.encode()
+    for line in lines:
+        if line.startswith(b'#'):
+            if line.startswith(prefix):
+                try:
+                    record = json.loads(line[len(prefix):])
+                    snapshots[record['seq']] = record['data']
+                except (ValueError, KeyError, TypeError):
+                    pass
+            continue
+        try:
+            entry = json.loads(line)
+        except ValueError:
+            continue
+        if isinstance(entry, dict):
+            yield _restore_snapshots(entry, snapshots.get)
+
+def _outside_range(segment: Dict, temporal_range: Tuple[float, float] = None) -> bool:
+    """Whether no entry of a closed segment can fall inside temporal_range"""
+    if not temporal_range:
+        return False
+    start, end = temporal_range
+    if not (_plain_number(start) and _plain_number(end)):
+        return False
+    if segment.get('entries') == 0:
+        return True
+    first, last = segment.get('start_time'), segment.get('end_time')
+    return _plain_number(first) and _plain_number(last) and (last < start or first > end)
+
+def _read_manifest(log_path: str) -> Optional[Dict]:
+    try:
+        with open(f"{log_path}.manifest", 'r', encoding='utf-8') as f:
+            manifest = json.load(f)
+    except (OSError, ValueError):
+        return None
+    if not isinstance(manifest, dict) or manifest.get('version') != MANIFEST_VERSION:
+        return None
+    return manifest
+
+def _truncate_torn_line(path: str) -> int:
+    """Cut a file back to its last complete line; returns the bytes removed"""
+    try:
+        with open(path, 'r+b') as f:
+            size = position = f.seek(0, os.SEEK_END)
+            end = 0
+            while position > 0:
+                step = min(SEGMENT_READ_BYTES, position)
+                f.seek(position - step)
+                newline = f.read(step).rfind(b'\n')
+                if newline >= 0:
+                    end = position - step + newline + 1
+                    break
+                position -= step
+            if end < size:
+                f.truncate(end)
+            return size - end
+    except FileNotFoundError:
+        return 0
+
+def read_universal_log(path: str, temporal_range: Tuple[float, float] = None):
+    """
+    Yield the entries of a LASER log in the inline (v1) shape.
+
+    Closed segments listed in the log's manifest come first (see
+    LogSegments), skipping those whose time range lies outside
+    temporal_range, then the active segment at `path`. v2 snapshot
+    references are replaced by the snapshot data, so callers see
+    flush_metadata['universal_state'] / ['metrics'] whichever format wrote
+    the file (v1 and v2 sections may be mixed). Entries of one flush share
+    the same snapshot dicts. Headers, undecodable and torn lines are skipped.
+    """
+    for segment in (_read_manifest(path) or {}).get('segments', []):
+        if isinstance(segment, dict) and 'file' in segment and not _outside_range(segment, temporal_range):
+            yield from _log_entries(_open_segment(path, segment))
+    if os.path.exists(path):
+        yield from _log_entries(_segment_lines(path))
+
+class LogSegments:
+    """
+    Rotates a LASER log into numbered segments and compresses closed ones.
+
+    The log path always holds the active segment. rotate() renames it to
+    '<log>.NNNNNN', and a compressor (a background thread unless
+    background=False) rewrites that as '<log>.NNNNNN.z' (zlib) or '.xz'
+    (lzma): the compressed lines, then a JSON footer with the entry count,
+    time range and sizes, its length and SEGMENT_MAGIC. The manifest
+    '<log>.manifest' lists the closed segments in order with the same
+    summary, so readers skip segments outside a time range unopened.
+
+    Every step is an atomic rename or manifest rewrite. recover() (run on
+    construction) finishes what a crash interrupted: it cuts a torn line
+    off the end of the active segment, adopts segments missing from the
+    manifest, removes temporary files and compresses closed segments that
+    are still plain, up to their last complete line.
+    """
+
+    def __init__(self, log_path: str, max_bytes: Optional[int] = None, max_age: Optional[float] = None,
+                 codec: str = 'zlib', background: bool = True, recover: bool = True):
+        if codec not in SEGMENT_CODECS:
+            raise ValueError(f"codec must be one of {tuple(SEGMENT_CODECS)}, got {codec!r}")
+        self.log_path = log_path
+        self.manifest_path = f"{log_path}.manifest"
+        self.max_bytes = max_bytes
+        self.max_age = max_age
+        self.codec = codec
+        self.background = background
+
+        self.segments: List[Dict] = []  # closed segments, oldest first
+        self.next_seq = 1
+        self.active_started = time.time()
+        self._cond = threading.Condition(threading.RLock())
+        self._pending: Deque[Dict] = deque()  # closed segments awaiting compression
+        self._busy = False
+        self._closing = False
+        self._thread = None
+        self.metrics = {
+            'rotations': 0,
+            'compressed': 0,
+            'raw_bytes': 0,
+            'compressed_bytes': 0,
+            'compress_errors': 0,
+            'adopted': 0,
+            'recovered_bytes': 0,
+            'segments_read': 0,
+            'segments_skipped': 0
+        }
+        if recover:
+            self.recover()
+
+    def _path(self, name: str) -> str:
+        return os.path.join(os.path.dirname(self.log_path), name)
+
+    def stats(self) -> Dict[str, Any]:
+        return {**self.metrics, 'segments': len(self.segments), 'pending': len(self._pending)}
+
+    def due(self, size: int) -> bool:
+        """Whether an active segment of `size` bytes should be rotated"""
+        if self.max_bytes and size >= self.max_bytes:
+            return True
+        return self.max_age is not None and time.time() - self.active_started >= self.max_age
+
+    def rotate(self) -> Optional[Dict]:
+        """
+        Close the active segment (its writer must have closed the file) and
+        queue it for compression. Returns the new segment, None if empty.
+        """
+        with self._cond:
+            if not os.path.exists(self.log_path) or not os.path.getsize(self.log_path):
+                return None
+            segment = {'seq': self.next_seq, 'file': f"{os.path.basename(self.log_path)}.{self.next_seq:06d}",
+                       'codec': None}
+            os.replace(self.log_path, self._path(segment['file']))
+            self.segments.append(segment)
+            self.next_seq += 1
+            self.active_started = time.time()
+            self.metrics['rotations'] += 1
+            self._save_manifest()
+            self._schedule(segment)
+        return segment
+
+    def read(self, temporal_range: Tuple[float, float] = None):
+        """Entries of the closed segments, oldest first, skipping those outside temporal_range"""
+        with self._cond:
+            segments = [dict(segment) for segment in self.segments]
+        for segment in segments:
+            if _outside_range(segment, temporal_range):
+                self.metrics['segments_skipped'] += 1
+                continue
+            self.metrics['segments_read'] += 1
+            yield from _log_entries(_open_segment(self.log_path, segment))
+
+    def wait(self, timeout: Optional[float] = None) -> bool:
+        """Wait until every closed segment is compressed; False on timeout."""
+        deadline = None if timeout is None else time.monotonic() + timeout
+        with self._cond:
+            while self._pending or self._busy:
+                remaining = None if deadline is None else deadline - time.monotonic()
+                if remaining is not None and remaining <= 0:
+                    return False
+                self._cond.wait(remaining)
+        return True
+
+    def close(self, timeout: Optional[float] = 30.0):
+        """Finish compressing and stop the compressor."""
+        with self._cond:
+            self._closing = True
+            self._cond.notify_all()
+        if self._thread is not None:
+            self._thread.join(timeout)
+            self._thread = None
+
+    # --- Compression ---
+
+    def _schedule(self, segment: Dict):
+        with self._cond:
+            self._pending.append(segment)
+            if self.background and self._thread is None:
+                self._thread = threading.Thread(target=self._run, name='laser-compressor', daemon=True)
+                self._thread.start()
+            self._cond.notify_all()
+        if not self.background:
+            self._run()
+
+    def _run(self):
+        while True:
+            with self._cond:
+                while not self._pending and self.background and not self._closing:
+                    self._cond.wait()
+                if not self._pending:
+                    return
+                segment = self._pending.popleft()
+                self._busy = True
+            try:
+                self._compress(segment)
+            finally:
+                with self._cond:
+                    self._busy = False
+                    self._cond.notify_all()
+
+    def _compress(self, segment: Dict):
+        compressor_factory, _, suffix = SEGMENT_CODECS[self.codec]
+        plain = self._path(segment['file'])
+        name = segment['file'] + suffix
+        tmp_path = self._path(name + '.tmp')
+        compressor = compressor_factory()
+        entries = raw_bytes = 0
+        first = last = None
+        ranged = True  # False once an entry's time cannot be compared
+        try:
+            with open(plain, 'rb') as src, open(tmp_path, 'wb') as dst:
+                for line in src:
+                    if not line.endswith(b'\n'):
+                        break  # torn final line from a crash
+                    raw_bytes += len(line)
+                    dst.write(compressor.compress(line))
+                    if line.startswith(b'#'):
+                        continue
+                    try:
+                        entry = json.loads(line)
+                    except ValueError:
+                        continue
+                    if not isinstance(entry, dict):
+                        continue
+                    entries += 1
+                    entry_time = entry.get('universal_time', 0)  # as the query filter reads it
+                    if not _plain_number(entry_time):
+                        ranged = False
+                    elif entry_time == entry_time:
+                        first = entry_time if first is None else min(first, entry_time)
+                        last = entry_time if last is None else max(last, entry_time)
+                dst.write(compressor.flush())
+                footer = {
+                    'codec': self.codec,
+                    'entries': entries,
+                    'start_time': first if ranged else None,
+                    'end_time': last if ranged else None,
+                    'raw_bytes': raw_bytes,
+                    'compressed_bytes': dst.tell()
+                }
+                encoded = json.dumps(footer, separators=(',', ':')).encode()
+                dst.write(encoded + struct.pack('<I4s', len(encoded), SEGMENT_MAGIC))
+                dst.flush()
+                os.fsync(dst.fileno())
+            os.replace(tmp_path, self._path(name))
+        except OSError as e:
+            self.metrics['compress_errors'] += 1
+            print(f"⚠️ Segment compression failed: {e}")
+            try:
+                os.remove(tmp_path)
+            except OSError:
+                pass
+            return
+
+        with self._cond:
+            segment.update(footer, file=name)
+            self._save_manifest()
+        os.remove(plain)
+        self.metrics['compressed'] += 1
+        self.metrics['raw_bytes'] += raw_bytes
+        self.metrics['compressed_bytes'] += footer['compressed_bytes']
+
+    # --- Manifest and recovery ---
+
+    def _save_manifest(self):
+        manifest = {
+            'version': MANIFEST_VERSION,
+            'next_seq': self.next_seq,
+            'active_started': self.active_started,
+            'segments': self.segments
+        }
+        tmp_path = f"{self.manifest_path}.tmp"
+        with open(tmp_path, 'w', encoding='utf-8') as f:
+            json.dump(manifest, f, separators=(',', ':'))
+            f.flush()
+            os.fsync(f.fileno())
+        os.replace(tmp_path, self.manifest_path)
+
+    def recover(self):
+        """Reconcile the manifest with the files on disk and finish interrupted work."""
+        with self._cond:
+            manifest = _read_manifest(self.log_path) or {}
+            known = {}
+            for segment in manifest.get('segments', []):
+                if isinstance(segment, dict) and isinstance(segment.get('seq'), int):
+                    known[segment['seq']] = segment
+            self.next_seq = max(1, manifest.get('next_seq', 1))
+            self.active_started = manifest.get('active_started', self.active_started)
+
+            base = os.path.basename(self.log_path)
+            suffixes = {suffix: codec for codec, (_, _, suffix) in SEGMENT_CODECS.items()}
+            pattern = re.compile(rf"^{re.escape(base)}\.(\d{{6}})({'|'.join(map(re.escape, suffixes))})?$")
+            on_disk: Dict[int, Dict[str, str]] = {}  # seq -> {suffix ('' if plain): file name}
+            for name in os.listdir(os.path.dirname(self.log_path) or '.'):
+                if name.startswith(f"{base}.") and name.endswith('.tmp'):
+                    os.remove(self._path(name))  # never renamed into place
+                    continue
+                match = pattern.match(name)
+                if match:
+                    on_disk.setdefault(int(match.group(1)), {})[match.group(2) or ''] = name
+
+            self.segments = []
+            for seq in sorted(on_disk):
+                files = on_disk[seq]
+                segment = known.get(seq)
+                if segment is None:
+                    # Rotated, but the crash came before the manifest was saved
+                    segment = {'seq': seq}
+                    self.metrics['adopted'] += 1
+                compressed = next((name for suffix, name in files.items() if suffix), None)
+                footer = read_segment_footer(self._path(compressed)) if compressed else None
+                if footer is not None:
+                    segment.update(footer, file=compressed)
+                    if '' in files:
+                        os.remove(self._path(files['']))
+                elif '' in files:
+                    if compressed:
+                        os.remove(self._path(compressed))
+                    segment = {'seq': seq, 'file': files[''], 'codec': None}
+                    self._pending.append(segment)
+                else:
+                    # No footer and nothing to rebuild it from: read what decompresses
+                    segment.update(file=compressed, codec=suffixes[compressed[compressed.rindex('.'):]])
+                self.segments.append(segment)
+            self.next_seq = max(self.next_seq, max(on_disk, default=0) + 1)
+
+            self.metrics['recovered_bytes'] += _truncate_torn_line(self.log_path)
+            if self.segments or os.path.exists(self.manifest_path):
+                self._save_manifest()
+            pending = list(self._pending)
+            self._pending.clear()
+        for segment in pending:
+            self._schedule(segment)
 
 # ============================================================
 # 5. LASER v3.0 - UNIVERSAL INTEGRATION SYSTEM
@@ -626,6 +1916,23 @@ class LASERV30:
             'system_monitoring': True,
             'debug': False,
             'universal_memory': True,
+            # Log writer (see LogWriter)
+            'background_writer': True,
+            'writer_queue_size': 8192,
+            'group_commit_entries': 256,
+            'group_commit_ms': 5.0,
+            'fsync_policy': 'interval',
+            'fsync_interval': 1.0,
+            'backpressure': 'block',
+            'sample_every': 10,
+            'log_format': LOG_FORMAT_VERSION,
+            # Sidecar query index (see LogIndex); index_path defaults to <log_path>.idx
+            'query_index': True,
+            'index_path': None,
+            # Segment rotation (see LogSegments); None disables a limit
+            'segment_max_bytes': 64 * 1024 * 1024,
+            'segment_max_age': None,
+            'segment_codec': 'zlib',
             **(config or {})
         }
 
@@ -666,6 +1973,29 @@ class LASERV30:
         self._shutdown = threading.Event()
         self._maintenance_thread = threading.Thread(target=self._universal_maintenance, daemon=True)
         self._maintenance_thread.start()
+        self._segments = LogSegments(
+            self.config['log_path'],
+            max_bytes=self.config['segment_max_bytes'],
+            max_age=self.config['segment_max_age'],
+            codec=self.config['segment_codec'],
+            background=self.config['background_writer']
+        )
+        self._index = (LogIndex(self.config['log_path'], self.config['index_path'])
+                       if self.config['query_index'] else None)
+        self._writer = LogWriter(
+            self.config['log_path'],
+            queue_size=self.config['writer_queue_size'],
+            batch_size=self.config['group_commit_entries'],
+            batch_ms=self.config['group_commit_ms'],
+            fsync=self.config['fsync_policy'],
+            fsync_interval=self.config['fsync_interval'],
+            backpressure=self.config['backpressure'],
+            sample_every=self.config['sample_every'],
+            background=self.config['background_writer'],
+            log_format=self.config['log_format'],
+            index=self._index,
+            segments=self._segments
+        )
 
         # Initialize log system
         self._init_universal_log()
@@ -984,7 +2314,11 @@ class LASERV30:
             self._universal_flush(emergency=emergency_flush)
 
     def _universal_flush(self, emergency: bool = False):
-        """Universal flush with system integration"""
+        """Universal flush with system integration
+
+        Hands the buffer to the log writer; serialization and file I/O
+        happen on the writer thread (see LogWriter).
+        """
         if not self.buffer:
             return
 
@@ -992,45 +2326,37 @@ class LASERV30:
             count = len(self.buffer)
             flush_type = "🚨 QUANTUM EMERGENCY" if emergency else "⚡ UNIVERSAL"
 
-            print(f"{flush_type} FLUSH | "
-                  f"Logs: {count} | "
-                  f"Universal Risk: {self.universal_state.risk:.3f} | "
-                  f"Integration: {self.universal_state.integration_score:.1%} | "
-                  f"Consciousness: {self.universal_state.consciousness:.3f}")
+            banner = (f"{flush_type} FLUSH | "
+                      f"Logs: {count} | "
+                      f"Universal Risk: {self.universal_state.risk:.3f} | "
+                      f"Integration: {self.universal_state.integration_score:.1%} | "
+                      f"Consciousness: {self.universal_state.consciousness:.3f}")
 
             if emergency:
                 self.metrics['emergency_flushes'] += 1
 
-            # Write to universal log
-            path = self.config['log_path']
-            try:
-                with open(path, 'a', encoding='utf-8') as f:
-                    for entry in self.buffer:
-                        # Add flush metadata
-                        entry['flush_metadata'] = {
-                            'type': 'quantum_emergency' if emergency else 'universal',
-                            'timestamp': time.time(),
-                            'universal_state': asdict(self.universal_state),
-                            'metrics': self.metrics_report(),
-                            'buffer_state': {
-                                'size_before': count,
-                                'emergency': emergency,
-                                'universal_risk': self.universal_state.risk
-                            }
-                        }
-
-                        f.write(json.dumps(entry, separators=(',', ':')) + '\n')
-
-                    self.metrics['flushes'] += 1
+            # Flush metadata is the same for the whole batch
+            flush_metadata = {
+                'type': 'quantum_emergency' if emergency else 'universal',
+                'timestamp': time.time(),
+                'universal_state': asdict(self.universal_state),
+                # The I/O counters would be stale by the time the entries land
+                'metrics': self.metrics_report(io_stats=False),
+                'buffer_state': {
+                    'size_before': count,
+                    'emergency': emergency,
+                    'universal_risk': self.universal_state.risk
+                }
+            }
+            for entry in self.buffer:
+                entry['flush_metadata'] = flush_metadata
 
-            except Exception as e:
-                print(f"⚠️ Universal write failed: {e}")
-                # Fallback to console
-                for entry in list(self.buffer)[:2]:
-                    print(f"[FALLBACK] {entry['timestamp']} - {entry['message'][:60]}...")
+            # Queued under the lock so flushes reach the file in order
+            self._writer.submit(self.buffer, notice=banner)
 
             # Clear buffer
             self.buffer.clear()
+            self.metrics['flushes'] += 1
             self.metrics['last_flush'] = time.time()
 
             # Update compression savings metric
@@ -1039,7 +2365,8 @@ class LASERV30:
 
     def query_universal_memory(self, concept: str,
                               temporal_range: Tuple[float, float] = None,
-                              quantum_filter: Dict = None) -> List[Dict]:
+                              quantum_filter: Dict = None,
+                              limit: Optional[int] = 50) -> List[Dict]:
         """
         Query universal memory with quantum filtering
 
@@ -1047,65 +2374,151 @@ class LASERV30:
             concept: Concept to search for
             temporal_range: (start_time, end_time) in epoch seconds
             quantum_filter: Quantum state filters (coherence_min, risk_max, etc.)
+            limit: Number of top-ranked matches to return (None for all)
 
         Returns:
-            List of matching log entries with quantum similarity scores
+            Matching log entries with quantum similarity scores, every match
+            ranked by similarity and recency before the cut to `limit`
         """
         results = []
 
+        # Entries already flushed should be visible to the query
+        self._writer.drain(timeout=5.0)
+        now = time.time()
+
         try:
             # Read the universal log file
-            if not os.path.exists(self.config['log_path']):
+            path = self.config['log_path']
+            if not os.path.exists(path) and not self._segments.segments:
                 return results
 
-            with open(self.config['log_path'], 'r', encoding='utf-8') as f:
-                for line in f:
-                    if line.startswith('#'):
-                        continue
-
-                    try:
-                        entry = json.loads(line.strip())
+            # No rotation between listing the closed segments and reading the active one
+            with self._writer.rotation_lock:
+                # Closed segments are scanned, skipping those outside the time range
+                results = self._scan_universal_memory(concept, temporal_range, quantum_filter, limit, now,
+                                                      self._segments.read(temporal_range))
+                active = None
+                if os.path.exists(path):
+                    if self._index is not None and self._index.refresh():
+                        active = self._query_index(concept, temporal_range, quantum_filter, limit, now)
+                    if active is None:
+                        active = self._scan_universal_memory(concept, temporal_range, quantum_filter, limit, now)
+            if active is not None:
+                # Stable: ties keep log order, older segments first
+                results = sorted(results + active, key=self._memory_rank)
+                if limit is not None:
+                    results = results[:limit]
 
-                        # Concept matching
-                        if concept.lower() not in entry.get('message', '').lower():
-                            continue
+        except Exception as e:
+            print(f"⚠️ Universal memory query failed: {e}")
 
-                        # Temporal filtering
-                        if temporal_range:
-                            entry_time = entry.get('universal_time', 0)
-                            start_time, end_time = temporal_range
-                            if not (start_time <= entry_time <= end_time):
-                                continue
+        self.metrics['universal_queries'] += 1
+        return results
+
+    def _memory_match(self, entry: Dict, needle: str,
+                      temporal_range: Tuple[float, float] = None,
+                      quantum_filter: Dict = None) -> bool:
+        """Whether an entry answers a query (`needle` is the lowercased concept)"""
+        # Concept matching
+        if needle not in entry.get('message', '').lower():
+            return False
 
-                        # Quantum filtering
-                        if quantum_filter:
-                            if not self._quantum_filter_match(entry, quantum_filter):
-                                continue
+        # Temporal filtering
+        if temporal_range:
+            entry_time = entry.get('universal_time', 0)
+            start_time, end_time = temporal_range
+            if not (start_time <= entry_time <= end_time):
+                return False
 
-                        # Calculate quantum similarity
-                        similarity = self._calculate_quantum_similarity(entry)
-                        entry['quantum_similarity'] = similarity
+        # Quantum filtering
+        if quantum_filter:
+            if not self._quantum_filter_match(entry, quantum_filter):
+                return False
 
-                        results.append(entry)
+        return True
 
-                        # Limit for performance
-                        if len(results) >= 100:
-                            break
+    @staticmethod
+    def _memory_rank(entry: Dict) -> Tuple[float, float]:
+        """Sort key: quantum similarity, then recency"""
+        return (-entry.get('quantum_similarity', 0), -entry.get('universal_time', 0))
+
+    def _scan_universal_memory(self, concept: str, temporal_range: Tuple[float, float],
+                               quantum_filter: Dict, limit: Optional[int], now: float,
+                               entries=None) -> List[Dict]:
+        """Answer a query by reading `entries` (default: the whole active segment)"""
+        if entries is None:
+            entries = _log_entries(_segment_lines(self.config['log_path']))
+        needle = concept.lower()
+        current_risk = self.universal_state.risk
+        results = []
+        for entry in entries:
+            if not self._memory_match(entry, needle, temporal_range, quantum_filter):
+                continue
 
-                    except json.JSONDecodeError:
-                        continue
+            # Calculate quantum similarity
+            entry['quantum_similarity'] = self._calculate_quantum_similarity(entry, now, current_risk)
+            results.append(entry)
 
-        except Exception as e:
-            print(f"⚠️ Universal memory query failed: {e}")
+        # Sort by quantum similarity and recency (stable: ties keep log order)
+        results.sort(key=self._memory_rank)
+        return results if limit is None else results[:limit]
 
-        # Sort by quantum similarity and recency
-        results.sort(key=lambda x: (
-            -x.get('quantum_similarity', 0),
-            -x.get('universal_time', 0)
-        ))
+    def _query_index(self, concept: str, temporal_range: Tuple[float, float],
+                     quantum_filter: Dict, limit: Optional[int], now: float) -> Optional[List[Dict]]:
+        """
+        Answer a query from the sidecar index, with the same results as a scan.
 
-        self.metrics['universal_queries'] += 1
-        return results[:50]  # Return top 50 results
+        Matches are ranked from the values the index holds; only irregular
+        candidates and the entries returned are read from the log. None if
+        the index cannot answer this query.
+        """
+        index = self._index
+        needle = concept.lower()
+        bounds = [(field, kind, quantum_filter[key])
+                  for key, (field, kind) in RANGE_FILTERS.items() if key in (quantum_filter or {})]
+        selection = index.select(needle, temporal_range, bounds)
+        if selection is None:
+            return None
+        regular, irregular, exact = selection
+
+        current_risk = self.universal_state.risk
+        coherence, risk, times = index.values['coherence'], index.values['risk'], index.times
+        ranked = [(-self._similarity(coherence[n], risk[n], times[n], now, current_risk), -times[n], n)
+                  for n in regular]
+        loaded = {}
+        for n, entry in zip(irregular, index.read(irregular)):
+            if entry is None or not self._memory_match(entry, needle, temporal_range, quantum_filter):
+                continue
+            entry['quantum_similarity'] = self._calculate_quantum_similarity(entry, now, current_risk)
+            loaded[n] = entry
+            ranked.append((*self._memory_rank(entry), n))
+        scored = set(loaded)
+
+        # Read entries best first; a longer needle can still miss, so widen
+        # the window until `limit` entries are confirmed
+        wanted = len(ranked) if limit is None else min(limit, len(ranked))
+        window = wanted if exact else 2 * wanted
+        results, taken = [], 0
+        while len(results) < wanted and taken < len(ranked):
+            window = max(window, 1)
+            top = sorted(ranked) if window >= len(ranked) else heapq.nsmallest(window, ranked)
+            batch = top[taken:]
+            taken = len(top)
+            window *= 4
+            unread = [n for _, _, n in batch if n not in loaded]
+            loaded.update(zip(unread, index.read(unread)))
+            for similarity, _, n in batch:
+                entry = loaded[n]
+                if entry is None:
+                    continue
+                if n not in scored:
+                    if not exact and needle not in entry.get('message', '').lower():
+                        continue
+                    entry['quantum_similarity'] = -similarity
+                results.append(entry)
+                if len(results) == wanted:
+                    break
+        return results
 
     def _quantum_filter_match(self, entry: Dict, quantum_filter: Dict) -> bool:
         """Check if entry matches quantum filter criteria"""
@@ -1125,20 +2538,27 @@ class LASERV30:
 
         return True
 
-    def _calculate_quantum_similarity(self, entry: Dict) -> float:
+    def _calculate_quantum_similarity(self, entry: Dict, now: float = None,
+                                      current_risk: float = None) -> float:
         """Calculate quantum similarity between entry and current state"""
-        entry_coherence = entry.get('quantum', {}).get('coherence', 0.5)
-        entry_risk = entry.get('quantum', {}).get('risk', 0.5)
+        now = time.time() if now is None else now
+        quantum = entry.get('quantum', {})
+        return self._similarity(quantum.get('coherence', 0.5), quantum.get('risk', 0.5),
+                                entry.get('universal_time', now), now, current_risk)
+
+    def _similarity(self, entry_coherence: float, entry_risk: float, entry_time: float,
+                    now: float, current_risk: float = None) -> float:
+        if current_risk is None:
+            current_risk = self.universal_state.risk
 
         # Coherence similarity
         coherence_sim = 1.0 - abs(self.universal_state.coherence - entry_coherence)
 
         # Risk similarity (inverse relationship with current risk)
-        risk_sim = 1.0 - abs(self.universal_state.risk - entry_risk)
+        risk_sim = 1.0 - abs(current_risk - entry_risk)
 
         # Temporal decay
-        entry_time = entry.get('universal_time', time.time())
-        time_diff = abs(time.time() - entry_time)
+        time_diff = abs(now - entry_time)
         temporal_decay = math.exp(-time_diff / 3600)  # 1-hour half-life
 
         # Integrated similarity
@@ -1252,12 +2672,16 @@ class LASERV30:
         except Exception as e:
             print(f"⚠️ Telemetry export failed: {e}")
 
-    def metrics_report(self) -> Dict:
-        """Comprehensive universal metrics report"""
+    def metrics_report(self, io_stats: bool = True) -> Dict:
+        """Comprehensive universal metrics report
+
+        io_stats=False leaves out the writer, index and segments counters,
+        which change on every write.
+        """
         emergency_rate = (self.metrics['emergency_flushes'] /
                          max(1, self.metrics['flushes']))
 
-        return {
+        report = {
             'performance': {
                 'logs_processed': self.metrics['logs_processed'],
                 'flushes': self.metrics['flushes'],
@@ -1285,6 +2709,13 @@ class LASERV30:
                 'shadow_magnitude': self.temporal._shadow_magnitude()
             }
         }
+        if io_stats:
+            report['performance'].update({
+                'writer': self._writer.stats(),
+                'index': self._index.stats() if self._index is not None else None,
+                'segments': self._segments.stats(),
+            })
+        return report
 
     def shutdown(self):
         """Graceful universal shutdown"""
@@ -1295,6 +2726,10 @@ class LASERV30:
         if self.buffer:
             print(f"  Flushing {len(self.buffer)} universal logs...")
             self._universal_flush()
+        self._writer.close()
+        if self._index is not None:
+            self._index.save()
+        self._segments.close()
 
         # Final telemetry
         if self.config['telemetry']:
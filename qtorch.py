@@ -8,7 +8,7 @@ A self-contained PyTorch replacement with:
 2. BUMPY as backend for quantum array operations
 3. FLUMPY for cognitive/quantum features (entanglement, coherence)
 4. LASER v3.0 for universal quantum-temporal logging
-5. Zero external dependencies beyond Python standard library
+5. NumPy-backed contiguous tensor storage (the only external dependency)
 
 Military-grade features:
 - 99.3% memory efficiency via holographic compression
@@ -20,70 +20,383 @@ Military-grade features:
 
 import math
 import time
+import numbers
 import random
 import json
-import pickle
-import hashlib
-import threading
+import logging
+import importlib
 from typing import *
-from dataclasses import dataclass, field
 from collections import OrderedDict, defaultdict, deque
 import sys
 import os
+import struct
+
+import numpy as np
+
+logger = logging.getLogger(__name__)
+
+# ============================================================================
+# 1. INTEGRATED MODULES (IMPORTED ON FIRST USE)
+# ============================================================================
+
+# Optional integrations: exported name -> (module, attribute or None for the
+# module itself, banner). None of them is imported by `import qtorch`; each
+# loads the first time a quantum feature or the qtorch.<name> attribute
+# needs it, and reports the outcome on the 'qtorch' logger at DEBUG.
+_OPTIONAL_IMPORTS = {
+    'BumpyArray': ('bumpy', 'BumpyArray', "BUMPY integrated as quantum array backend"),
+    'FlumpyArray': ('flumpy', 'FlumpyArray', "FLUMPY integrated as cognitive quantum layer"),
+    'LASER': ('laser', 'LASER', "LASER v3.0 integrated for universal quantum logging"),
+    'UniversalQuantumState': ('laser', 'UniversalQuantumState', "LASER quantum state available"),
+    'anneal': ('anneal', None, "D-Wave Annealing Shim integrated"),
+    'dissipative': ('dissipative', None, "Dissipative QNN (Entropy 2025) integrated"),
+}
+
+# Legacy availability flags, resolved through the same lazy imports
+_AVAILABILITY_FLAGS = {
+    'BUMPY_AVAILABLE': 'BumpyArray',
+    'FLUMPY_AVAILABLE': 'FlumpyArray',
+    'LASER_AVAILABLE': 'LASER',
+}
+
+_optional_cache = {}
+
+def _optional(name):
+    """The integration exported as `name`, imported on first call; None if unavailable"""
+    try:
+        return _optional_cache[name]
+    except KeyError:
+        pass
+    module_name, attr, banner = _OPTIONAL_IMPORTS[name]
+    try:
+        module = importlib.import_module(module_name)
+        value = module if attr is None else getattr(module, attr)
+        logger.debug("✅ %s", banner)
+    except (ImportError, AttributeError) as e:
+        logger.debug("⚠️ %s fallback: %s", name, e)
+        value = None
+    _optional_cache[name] = value
+    return value
+
+def _available(name):
+    return _optional(name) is not None
+
+def _laser():
+    """The LASER logger, or None when only the fallback is available"""
+    return _optional('LASER')
+
+class LASERV30:
+    """No-op stand-in exported as qtorch.LASER when the laser module is unavailable"""
+    def __init__(self):
+        self.metrics = {}
+        self.universal_state = type('State', (), {'__dict__': {}})()
+    def log(self, *args, **kwargs): pass
+    def flush(self): pass
+    def get_metrics_report(self): return {}
 
 # ============================================================================
-# 1. IMPORT INTEGRATED MODULES (ENHANCED & DEBUGGED)
+# 1.1 TENSOR STORAGE BACKENDS (VECTORIZED KERNELS)
 # ============================================================================
 
-# Import BUMPY (quantum array backend) - INTEGRATED
-try:
-    from bumpy import BumpyArray
-    BUMPY_AVAILABLE = True
-    print("✅ BUMPY integrated as quantum array backend")
-except ImportError as e:
-    print(f"⚠️ BUMPY fallback: {e}")
-    BUMPY_AVAILABLE = False
-
-# Import FLUMPY (cognitive/quantum layer) - INTEGRATED
-try:
-    from flumpy import FlumpyArray
-    FLUMPY_AVAILABLE = True
-    print("✅ FLUMPY integrated as cognitive quantum layer")
-except ImportError as e:
-    print(f"⚠️ FLUMPY fallback: {e}")
-    FLUMPY_AVAILABLE = False
-
-# Import LASER (universal logging) - INTEGRATED
-try:
-    from laser import LASER, UniversalQuantumState
-    LASER_AVAILABLE = True
-    print("✅ LASER v3.0 integrated for universal quantum logging")
-except ImportError as e:
-    print(f"⚠️ LASER fallback: {e}")
-    LASER_AVAILABLE = False
-    class LASERV30:
-        def __init__(self):
-            self.metrics = {}
-            self.universal_state = type('State', (), {'__dict__': {}})()
-        def log(self, *args, **kwargs): pass
-        def flush(self): pass
-        def get_metrics_report(self): return {}
-    LASER = LASERV30()
-
-# Import Phase 3 Modules (Deep Quantum Integration)
-try:
-    import anneal
-    print("✅ D-Wave Annealing Shim integrated")
-except ImportError:
-    print("⚠️ Annealing fallback")
-    anneal = None
-
-try:
-    import dissipative
-    print("✅ Dissipative QNN (Entropy 2025) integrated")
-except ImportError:
-    print("⚠️ Dissipative fallback")
-    dissipative = None
+class NumpyBackend:
+    """
+    Default Tensor storage engine: one contiguous ndarray per tensor
+    (float64 unless the tensor asks for a reduced-precision dtype).
+
+    Every elementwise op and reduction on Tensor dispatches to the kernels
+    below, so alternative engines only need to subclass this and override the
+    kernels they accelerate. Kernels take and return ndarray-compatible
+    buffers; shape and stride metadata live on the buffer itself.
+    """
+
+    name = 'numpy'
+    dtype = np.float64
+
+    def asarray(self, data, dtype=None):
+        """Coerce scalars, (nested) lists and ndarrays into contiguous storage"""
+        arr = np.asarray(data, dtype=dtype or self.dtype)
+        if arr.ndim == 0:
+            arr = arr.reshape(1)
+        return np.ascontiguousarray(arr)
+
+    # ---------------- elementwise kernels ----------------
+    def add(self, a, b):
+        return np.add(a, b)
+
+    def sub(self, a, b):
+        return np.subtract(a, b)
+
+    def mul(self, a, b):
+        return np.multiply(a, b)
+
+    def div(self, a, b):
+        """Division that maps |b| < 1e-12 to ±inf (or 0 for 0/0) instead of warning"""
+        with np.errstate(divide='ignore', invalid='ignore'):
+            out = np.divide(a, b)
+        tiny = np.abs(b) < 1e-12
+        if tiny.any():
+            out = np.where(tiny, np.where(a == 0, 0.0, np.copysign(np.inf, a)), out)
+        return out
+
+    def pow(self, a, exponent):
+        with np.errstate(invalid='ignore', divide='ignore'):
+            return np.power(a, exponent)
+
+    def neg(self, a):
+        return np.negative(a)
+
+    def relu(self, a):
+        return np.maximum(a, 0.0)
+
+    def sigmoid(self, a):
+        with np.errstate(over='ignore'):
+            return 1.0 / (1.0 + np.exp(-a))
+
+    def tanh(self, a):
+        return np.tanh(a)
+
+    def softmax(self, a, axis=-1):
+        shifted = a - a.max(axis=axis, keepdims=True)
+        exp_vals = np.exp(shifted)
+        return exp_vals / exp_vals.sum(axis=axis, keepdims=True)
+
+    # ---------------- reductions ----------------
+    def sum(self, a, axis=None, keepdims=False):
+        return np.sum(a, axis=axis, keepdims=keepdims)
+
+    def mean(self, a, axis=None, keepdims=False):
+        return np.mean(a, axis=axis, keepdims=keepdims)
+
+    def max(self, a, axis=None, keepdims=False):
+        return np.max(a, axis=axis, keepdims=keepdims)
+
+    def min(self, a, axis=None, keepdims=False):
+        return np.min(a, axis=axis, keepdims=keepdims)
+
+    # ---------------- linear algebra ----------------
+    def matmul(self, a, b):
+        # float16 has no BLAS path: multiply in float32, the caller casts back
+        if a.dtype == np.float16 or b.dtype == np.float16:
+            return np.matmul(a.astype(np.float32), b.astype(np.float32))
+        return np.matmul(a, b)
+
+def _broadcast_shape(shape_a, shape_b):
+    """Output shape of a NumPy-style broadcast, or ValueError if incompatible"""
+    ndim = max(len(shape_a), len(shape_b))
+    padded_a = (1,) * (ndim - len(shape_a)) + tuple(shape_a)
+    padded_b = (1,) * (ndim - len(shape_b)) + tuple(shape_b)
+    out = []
+    for dim_a, dim_b in zip(padded_a, padded_b):
+        if dim_a != dim_b and dim_a != 1 and dim_b != 1:
+            raise ValueError(f"Shape mismatch: {tuple(shape_a)} vs {tuple(shape_b)} cannot be broadcast")
+        out.append(dim_b if dim_a == 1 else dim_a)
+    return tuple(out)
+
+def _broadcast_views(a, b):
+    """View both buffers at the broadcast shape (zero strides, no copies)"""
+    if a.shape == b.shape:
+        return a, b
+    shape = _broadcast_shape(a.shape, b.shape)
+    return np.broadcast_to(a, shape), np.broadcast_to(b, shape)
+
+def _unbroadcast(grad, shape):
+    """Sum a broadcast gradient back down to an operand's original shape"""
+    if grad.shape == shape:
+        return grad
+    if grad.size == math.prod(shape):
+        return grad.reshape(shape)
+    extra = grad.ndim - len(shape)
+    if extra > 0:
+        grad = grad.sum(axis=tuple(range(extra)))
+    stretched = tuple(i for i, dim in enumerate(shape) if dim == 1 and grad.shape[i] != 1)
+    if stretched:
+        grad = grad.sum(axis=stretched, keepdims=True)
+    return grad.reshape(shape)
+
+# ---------------- storage dtypes ----------------
+
+float64 = 'float64'
+float32 = 'float32'
+float16 = 'float16'
+int8 = 'int8'
+
+_DTYPES = {name: np.dtype(name) for name in (float64, float32, float16, int8)}
+_DTYPE_ALIASES = {'double': float64, 'float': float32, 'half': float16}
+
+def _resolve_dtype(dtype):
+    """Canonical dtype name for a name, alias or NumPy dtype"""
+    if isinstance(dtype, str):
+        name = _DTYPE_ALIASES.get(dtype, dtype)
+    else:
+        name = np.dtype(dtype).name
+    if name not in _DTYPES:
+        raise TypeError(f"Unsupported dtype: {dtype!r} (supported: {sorted(_DTYPES)})")
+    return name
+
+def _is_device(value):
+    return isinstance(value, str) and value.split(':')[0] in ('cpu', 'cuda')
+
+def _is_floating(dtype):
+    return _DTYPES[dtype].kind == 'f'
+
+def set_default_dtype(dtype):
+    """Set the floating dtype used when a tensor is created without one"""
+    dtype = _resolve_dtype(dtype)
+    if not _is_floating(dtype):
+        raise TypeError(f"Default dtype must be floating point, got {dtype}")
+    Tensor._default_dtype = dtype
+
+def get_default_dtype():
+    return Tensor._default_dtype
+
+def _promote_types(*dtypes):
+    """Result dtype of an op on tensors of these dtypes (NumPy promotion rules)"""
+    return np.result_type(*(_DTYPES[d] for d in dtypes)).name
+
+def _floating_dtype(dtype):
+    """Dtype that float-valued results (division, activations, means) take"""
+    return dtype if _is_floating(dtype) else Tensor._default_dtype
+
+_BACKENDS = {}
+
+def register_backend(name, backend):
+    """Register a storage backend instance under `name`"""
+    _BACKENDS[name] = backend
+    return backend
+
+def set_backend(name):
+    """Select the storage backend used for all newly created tensors"""
+    global _backend
+    if name not in _BACKENDS:
+        raise ValueError(f"Unknown storage backend: {name} (available: {sorted(_BACKENDS)})")
+    _backend = _BACKENDS[name]
+    return _backend
+
+def get_backend():
+    """Return the active storage backend"""
+    return _backend
+
+_backend = register_backend('numpy', NumpyBackend())
+
+# ============================================================================
+# 1.2 LASER LOGGING POLICY (SAMPLED / DEFERRED HOT-PATH EVENTS)
+# ============================================================================
+
+class LoggingPolicy:
+    """
+    Decides how hot-path events (tensor creation, forward passes) reach LASER.
+
+    Modes:
+        off       - events are dropped
+        sampled   - a `rate` fraction of events is buffered, summarized per step
+        per-step  - every event is buffered, summarized once per optimizer step
+        full      - every event is logged to LASER immediately (legacy behaviour)
+
+    Buffered events live in a bounded ring buffer; counters keep counting
+    after the ring wraps, so summaries stay exact for counts.
+    """
+
+    MODES = ('off', 'sampled', 'per-step', 'full')
+
+    def __init__(self, mode='per-step', rate=0.01, capacity=4096, sink=None):
+        if mode not in self.MODES:
+            raise ValueError(f"Unknown logging mode: {mode} (expected one of {self.MODES})")
+        if not 0.0 < rate <= 1.0:
+            raise ValueError(f"Sampling rate must be in (0, 1], got {rate}")
+        self.mode = mode
+        self.rate = rate
+        self.capacity = capacity
+        self.sink = sink
+        self.events = deque(maxlen=capacity)
+        self.counts = defaultdict(int)
+        self.events_seen = 0
+        self.flushes = 0
+        self.last_summary = None
+        self._window_start = time.perf_counter()
+
+    @classmethod
+    def off(cls):
+        return cls('off')
+
+    @classmethod
+    def sampled(cls, rate):
+        return cls('sampled', rate=rate)
+
+    @classmethod
+    def per_step(cls, capacity=4096):
+        return cls('per-step', capacity=capacity)
+
+    @classmethod
+    def full(cls):
+        return cls('full')
+
+    def _emit(self, value, message, context):
+        sink = self.sink if self.sink is not None else _laser()
+        if sink is not None:
+            sink.log(value, message, context)
+
+    def record(self, kind, shape, value=1.0, **context):
+        """Record one hot-path event (callers skip this entirely in 'off' mode)"""
+        if self.mode == 'off':
+            return
+        if self.mode == 'full':
+            context['shape'] = shape
+            self._emit(value, kind, context)
+            return
+
+        self.events_seen += 1
+        self.counts[kind] += 1
+        if self.mode == 'sampled' and random.random() >= self.rate:
+            return
+        self.events.append((kind, shape, time.perf_counter()))
+
+    def summarize(self):
+        """Summarize buffered events: counts, shapes histogram and timing"""
+        now = time.perf_counter()
+        shapes = defaultdict(int)
+        for kind, shape, _ in self.events:
+            shapes[f"{kind}:{'x'.join(map(str, shape))}"] += 1
+        window = now - self._window_start
+        return {
+            'mode': self.mode,
+            'counts': dict(self.counts),
+            'events_seen': self.events_seen,
+            'events_buffered': len(self.events),
+            'shapes': dict(shapes),
+            'window_seconds': window,
+            'events_per_second': self.events_seen / window if window > 0 else 0.0,
+        }
+
+    def flush(self, source='step'):
+        """Emit one summary record for the events since the last flush"""
+        if self.mode in ('off', 'full') or self.events_seen == 0:
+            return None
+        summary = self.summarize()
+        summary['source'] = source
+        self._emit(float(self.events_seen), "qtorch step summary", summary)
+
+        self.events.clear()
+        self.counts.clear()
+        self.events_seen = 0
+        self.flushes += 1
+        self.last_summary = summary
+        self._window_start = time.perf_counter()
+        return summary
+
+_logging_policy = LoggingPolicy()
+
+def set_logging_policy(policy, rate=0.01):
+    """Install a LoggingPolicy (or a mode name); returns the previous policy"""
+    global _logging_policy
+    if isinstance(policy, str):
+        policy = LoggingPolicy(policy, rate=rate)
+    previous = _logging_policy
+    _logging_policy = policy
+    return previous
+
+def get_logging_policy():
+    """Return the active LoggingPolicy"""
+    return _logging_policy
 
 # ============================================================================
 # 2. QUANTUM TENSOR CLASS (DEBUGGED & ENHANCED)
@@ -92,48 +405,42 @@ except ImportError:
 class Tensor:
     """
     Debugged Quantum Tensor - PyTorch-compatible with advanced quantum features
+
+    Data lives in a contiguous buffer owned by the active storage backend.
+    The BUMPY and FLUMPY views are built lazily, the first time a quantum
+    method needs them.
     """
 
     _grad_enabled = True
-    _default_dtype = 'float32'
+    _default_dtype = float64
     _global_quantum_creativity = 0.0  # Global Ψ factor
     _global_quantum_noise_in_gradients = False  # FIXED: Default to False for correctness
 
     def __init__(self, data, dtype=None, device="cpu", requires_grad=False,
                  quantum_creativity=None):
-        # Store in BUMPY array for quantum operations
-        if BUMPY_AVAILABLE:
-            self._bumpy = BumpyArray(data)
-        else:
-            self._bumpy = type('SimpleArray', (), {
-                'data': [float(x) for x in data] if isinstance(data, (list, tuple)) else [float(data)],
-                'shape': (1,) if isinstance(data, (int, float)) else (len(data),),
-                'coherence': 1.0
-            })()
-
-        # Wrap in FLUMPY for cognitive features
-        if FLUMPY_AVAILABLE:
-            self._flumpy = FlumpyArray(self._bumpy.data, self._bumpy.coherence)
-        else:
-            self._flumpy = type('SimpleFlumpy', (), {
-                'data': self._bumpy.data,
-                'coherence': self._bumpy.coherence,
-                'entangled_with': []
-            })()
+        # Contiguous storage (shape/stride metadata lives on the buffer)
+        self.dtype = Tensor._default_dtype if dtype is None else _resolve_dtype(dtype)
+        self._data = _backend.asarray(data, _DTYPES[self.dtype])
+        if requires_grad and not _is_floating(self.dtype):
+            raise TypeError(f"Only floating point tensors can require gradients, got {self.dtype}")
+
+        # Quantum views are materialized on demand (see _bumpy / _flumpy)
+        self._bumpy_cache = None
+        self._flumpy_cache = None
 
         # PyTorch attributes
-        self.shape = self._bumpy.shape
-        self.dtype = dtype or Tensor._default_dtype
         self.device = device
         self.requires_grad = requires_grad
         self.grad = None
         self._grad_fn = None
         self._ctx = None
+        self._freed = False  # set once backward has released this non-leaf's context
+        self._grad_slot = None  # flat optimizer view the first gradient is written into
 
         # Quantum state
-        self.quantum_coherence = self._bumpy.coherence
+        self.quantum_coherence = 1.0
         self.entangled_tensors = []
-        self.quantum_phase = getattr(self._bumpy, 'phase', random.uniform(0, 2 * math.pi))
+        self.quantum_phase = random.uniform(0, 2 * math.pi)
         self.is_measured = False
 
         # Local quantum creativity (FIXED: Individual tensor creativity)
@@ -142,31 +449,104 @@ class Tensor:
         else:
             self.quantum_creativity = Tensor._global_quantum_creativity
 
-        # Register with LASER
-        if LASER_AVAILABLE:
-            LASER.log(self.quantum_coherence, f"Tensor created: shape={self.shape}",
-                     {'device': device, 'requires_grad': requires_grad,
-                      'quantum_phase': self.quantum_phase,
-                      'quantum_creativity': self.quantum_creativity})
+        # Register with LASER (through the active logging policy)
+        if _logging_policy.mode != 'off':
+            _logging_policy.record('tensor_created', self.shape, self.quantum_coherence,
+                                   device=device, requires_grad=requires_grad,
+                                   quantum_phase=self.quantum_phase,
+                                   quantum_creativity=self.quantum_creativity)
 
     # ==================== CORE PROPERTIES ====================
+    @property
+    def shape(self):
+        """Tensor shape (metadata of the backing buffer)"""
+        return self._data.shape
+
+    @shape.setter
+    def shape(self, new_shape):
+        self._data = self._data.reshape(new_shape)
+
+    @property
+    def strides(self):
+        """Element strides of the backing buffer"""
+        itemsize = self._data.itemsize
+        return tuple(s // itemsize for s in self._data.strides)
+
+    def is_contiguous(self):
+        """True when the backing buffer is C-contiguous"""
+        return self._data.flags['C_CONTIGUOUS']
+
     @property
     def ndim(self):
         """Get number of dimensions"""
-        return len(self.shape)
+        return self._data.ndim
 
     @property
     def numel(self):
         """FIXED: Proper numel property that returns integer"""
-        try:
-            return math.prod(self.shape)
-        except:
-            return len(self._bumpy.data)
+        return int(self._data.size)
 
     @property
     def data(self):
-        """Get underlying data"""
-        return self._bumpy.data
+        """Get underlying storage buffer"""
+        return self._data
+
+    # ==================== LAZY QUANTUM VIEWS ====================
+    @property
+    def _bumpy(self):
+        """BUMPY view of the storage, built on first quantum use"""
+        if self._bumpy_cache is None:
+            BumpyArray = _optional('BumpyArray')
+            if BumpyArray is not None:
+                # Compact mode: one memcpy into an array('d') buffer, no per-element floats
+                flat = np.ascontiguousarray(self._data, dtype=np.float64).ravel()
+                view = BumpyArray(flat, self.quantum_coherence, compact=True)
+                view.phase = self.quantum_phase
+            else:
+                flat = self._data.ravel().tolist()
+                view = type('SimpleArray', (), {
+                    'data': flat,
+                    'shape': (len(flat),),
+                    'coherence': self.quantum_coherence
+                })()
+            self._bumpy_cache = view
+        return self._bumpy_cache
+
+    @property
+    def _flumpy(self):
+        """FLUMPY view of the storage, built on first quantum use"""
+        if self._flumpy_cache is None:
+            FlumpyArray = _optional('FlumpyArray')
+            if FlumpyArray is not None:
+                self._flumpy_cache = FlumpyArray(self._bumpy.data, self._bumpy.coherence)
+            else:
+                self._flumpy_cache = type('SimpleFlumpy', (), {
+                    'data': self._bumpy.data,
+                    'coherence': self._bumpy.coherence,
+                    'entangled_with': []
+                })()
+        return self._flumpy_cache
+
+    def _storage_changed(self):
+        """Drop quantum views after an in-place write to the storage"""
+        self._bumpy_cache = None
+        self._flumpy_cache = None
+
+    def _sync_from_bumpy(self):
+        """Copy data mutated through the BUMPY view back into the storage"""
+        # np.array copies: the BUMPY buffer must not alias the storage
+        self._data = np.array(self._bumpy.data, dtype=_DTYPES[self.dtype]).reshape(self.shape)
+        self._flumpy_cache = None
+
+    def _propagate_entanglement(self, *sources):
+        """
+        Entangle an op result with its sources in quantum creative mode.
+        At Ψ=0 the coupling contributes no coherence boost, so the quantum
+        views stay unbuilt on the arithmetic hot path.
+        """
+        if self.quantum_creativity > 0:
+            for source in sources:
+                self.quantum_entangle(source)
 
     # ==================== ENHANCED QUANTUM METHODS ====================
     def quantum_entangle(self, other):
@@ -176,12 +556,12 @@ class Tensor:
 
         # Use FLUMPY entanglement
         flumpy_success = False
-        if FLUMPY_AVAILABLE:
+        if _available('FlumpyArray'):
             flumpy_success = self._flumpy.entangle(other._flumpy)
 
         # Use BUMPY entanglement
         bumpy_success = False
-        if BUMPY_AVAILABLE:
+        if _available('BumpyArray'):
             bumpy_success = self._bumpy.entangle(other._bumpy)
 
         if flumpy_success or bumpy_success:
@@ -195,9 +575,10 @@ class Tensor:
             other.quantum_coherence = min(1.0, other.quantum_coherence + creativity_boost)
 
             # Log entanglement
-            if LASER_AVAILABLE:
-                LASER.metrics['entanglements_created'] += 1
-                LASER.log(self.quantum_coherence, "Quantum entanglement created",
+            laser = _laser()
+            if laser is not None:
+                laser.metrics['entanglements_created'] += 1
+                laser.log(self.quantum_coherence, "Quantum entanglement created",
                          {'tensor_ids': [id(self), id(other)],
                           'local_creativity': self.quantum_creativity})
 
@@ -206,10 +587,11 @@ class Tensor:
 
     def apply_quantum_rotation(self, angle):
         """Enhanced quantum rotation with creativity effects"""
-        if FLUMPY_AVAILABLE:
+        if _available('FlumpyArray'):
             rotated = self._flumpy.apply_quantum_rotation(angle)
-            result = Tensor(rotated.data, self.dtype, self.device, self.requires_grad,
-                          quantum_creativity=self.quantum_creativity)
+            result = Tensor(_backend.asarray(rotated.data).reshape(self.shape), self.dtype,
+                            self.device, self.requires_grad,
+                            quantum_creativity=self.quantum_creativity)
             result.quantum_entangle(self)
 
             # Creativity-based phase shift
@@ -222,7 +604,7 @@ class Tensor:
 
     def holographic_compress(self, aggressive=False):
         """Enhanced holographic compression with creativity-based optimization"""
-        if BUMPY_AVAILABLE and len(self._bumpy.data) > 10:
+        if _available('BumpyArray') and self.numel > 10:
             # Local creativity affects compression ratio
             if self.quantum_creativity > 0.18:
                 ratio = 0.3  # High creativity: aggressive compression
@@ -232,15 +614,16 @@ class Tensor:
                 ratio = 0.7  # Standard compression
 
             compressed = self._bumpy.holographic_compress()
-            result = Tensor(compressed.data, self.dtype, self.device, self.requires_grad,
+            result = Tensor(np.array(compressed.data), self.dtype, self.device, self.requires_grad,
                           quantum_creativity=self.quantum_creativity)
             result.quantum_coherence = compressed.coherence
 
-            if LASER_AVAILABLE:
-                compression_ratio = len(compressed.data) / len(self._bumpy.data)
-                LASER.metrics['holographic_compressions'] += 1
-                LASER.log(compression_ratio, "Holographic compression applied",
-                         {'original_size': len(self._bumpy.data),
+            laser = _laser()
+            if laser is not None:
+                compression_ratio = len(compressed.data) / self.numel
+                laser.metrics['holographic_compressions'] += 1
+                laser.log(compression_ratio, "Holographic compression applied",
+                         {'original_size': self.numel,
                           'compressed_size': len(compressed.data),
                           'compression_ratio': f"{compression_ratio:.1%}",
                           'local_creativity': self.quantum_creativity})
@@ -250,111 +633,97 @@ class Tensor:
     @property
     def quantum_entropy(self):
         """Enhanced quantum entropy calculation"""
-        if BUMPY_AVAILABLE:
+        if _available('BumpyArray'):
             return self._bumpy.coherence_entropy()
         return 0.0
 
     def quantum_measure(self):
         """Quantum measurement operation"""
-        if BUMPY_AVAILABLE and hasattr(self._bumpy, 'quantum_measure'):
+        if _available('BumpyArray') and hasattr(self._bumpy, 'quantum_measure'):
             self._bumpy.quantum_measure()
+            self._sync_from_bumpy()
             self.is_measured = True
             self.quantum_coherence *= 0.8  # Decoherence
         return self
 
     def cognitive_boost(self, amount=0.1):
         """Apply cognitive boost to tensor"""
-        if FLUMPY_AVAILABLE and hasattr(self._flumpy, 'cognitive_boost'):
+        if _available('FlumpyArray') and hasattr(self._flumpy, 'cognitive_boost'):
             self._flumpy.cognitive_boost(amount)
             self.quantum_coherence = min(1.0, self.quantum_coherence + amount * 0.05)
         return self
 
     # ==================== ENHANCED PYTORCH-COMPATIBLE OPERATIONS ====================
-    def __add__(self, other):
-        # Convert other to Tensor if needed
-        if not isinstance(other, Tensor):
-            other = Tensor([other] * self.numel) if self.numel > 1 else Tensor([other])
-
-        # Perform operation using BUMPY backend
-        if BUMPY_AVAILABLE:
-            result_bumpy = self._bumpy + other._bumpy
+    def _binary_op(self, other, op, kernel, reflected=False):
+        """
+        Run a vectorized binary kernel under NumPy broadcasting rules and
+        record its autograd context. Python scalars are used directly and
+        tensors are viewed with zero strides, so neither side is copied.
+        """
+        if isinstance(other, Tensor):
+            a, b = _broadcast_views(self._data, other._data)
+            creativity = (self.quantum_creativity + other.quantum_creativity) / 2
+            tracks_grad = self.requires_grad or other.requires_grad
+            dtype = _promote_types(self.dtype, other.dtype)
         else:
-            result_data = [a + b for a, b in zip(self._bumpy.data, other._bumpy.data)]
-            result_bumpy = type('Array', (), {'data': result_data, 'coherence': self._bumpy.coherence})()
+            # Python scalars never widen a tensor's dtype; a float scalar
+            # turns an integer tensor into the default float dtype
+            is_int = isinstance(other, (int, np.integer))
+            a, b = self._data, int(other) if is_int else float(other)
+            creativity = self.quantum_creativity
+            tracks_grad = self.requires_grad
+            dtype = self.dtype if is_int else _floating_dtype(self.dtype)
+        if op == 'div':
+            dtype = _floating_dtype(dtype)
+
+        lhs, rhs = (other, self) if reflected else (self, other)
+        out_data = kernel(b, a) if reflected else kernel(a, b)
+        result = Tensor(out_data, dtype, self.device, False, quantum_creativity=creativity)
+        result._propagate_entanglement(*(t for t in (self, other) if isinstance(t, Tensor)))
+
+        if Tensor._grad_enabled and tracks_grad:
+            result.requires_grad = True
+            result._ctx = (op, lhs, rhs)
 
-        result = Tensor(result_bumpy.data, self.dtype, self.device, False,
-                       quantum_creativity=(self.quantum_creativity + other.quantum_creativity) / 2)
-        result._bumpy.coherence = result_bumpy.coherence if hasattr(result_bumpy, 'coherence') else self._bumpy.coherence
+        return result
 
-        # Create entanglement with creativity boost
-        result.quantum_entangle(self)
-        result.quantum_entangle(other)
+    def _unary_op(self, op, out_data, local_grad=None, dtype=None):
+        """Wrap a vectorized unary kernel result and record its autograd context"""
+        result = Tensor(out_data, dtype or self.dtype, self.device, False,
+                       quantum_creativity=self.quantum_creativity)
+        result._propagate_entanglement(self)
 
-        # Autograd context
-        if Tensor._grad_enabled and (self.requires_grad or other.requires_grad):
+        if Tensor._grad_enabled and self.requires_grad:
             result.requires_grad = True
-            result._ctx = ('add', self, other)
+            result._ctx = (op, self) if local_grad is None else (op, self, local_grad)
 
         return result
 
-    def __mul__(self, other):
-        if not isinstance(other, Tensor):
-            other = Tensor([other] * self.numel) if self.numel > 1 else Tensor([other])
-
-        if BUMPY_AVAILABLE:
-            result_bumpy = self._bumpy * other._bumpy
-        else:
-            result_data = [a * b for a, b in zip(self._bumpy.data, other._bumpy.data)]
-            result_bumpy = type('Array', (), {'data': result_data, 'coherence': self._bumpy.coherence})()
-
-        result = Tensor(result_bumpy.data, self.dtype, self.device, False,
-                       quantum_creativity=(self.quantum_creativity + other.quantum_creativity) / 2)
-        result._bumpy.coherence = result_bumpy.coherence if hasattr(result_bumpy, 'coherence') else self._bumpy.coherence
+    def __add__(self, other):
+        return self._binary_op(other, 'add', _backend.add)
 
-        result.quantum_entangle(self)
-        result.quantum_entangle(other)
+    def __radd__(self, other):
+        return self._binary_op(other, 'add', _backend.add, reflected=True)
 
-        if Tensor._grad_enabled and (self.requires_grad or other.requires_grad):
-            result.requires_grad = True
-            result._ctx = ('mul', self, other)
+    def __mul__(self, other):
+        return self._binary_op(other, 'mul', _backend.mul)
 
-        return result
+    def __rmul__(self, other):
+        return self._binary_op(other, 'mul', _backend.mul, reflected=True)
 
     def __sub__(self, other):
         """Enhanced subtraction with proper gradient handling"""
-        if not isinstance(other, Tensor):
-            other = Tensor([other] * self.numel) if self.numel > 1 else Tensor([other])
+        return self._binary_op(other, 'sub', _backend.sub)
 
-        # Create negative of other with same quantum properties
-        other_neg_data = [-x for x in other._bumpy.data]
-        other_neg = Tensor(other_neg_data, other.dtype, other.device, other.requires_grad,
-                          quantum_creativity=other.quantum_creativity)
-
-        return self + other_neg
+    def __rsub__(self, other):
+        return self._binary_op(other, 'sub', _backend.sub, reflected=True)
 
     def __truediv__(self, other):
-        """Enhanced division with gradient support"""
-        if not isinstance(other, Tensor):
-            other = Tensor([other] * self.numel) if self.numel > 1 else Tensor([other])
+        """Enhanced division with gradient support (|b| < 1e-12 maps to ±inf)"""
+        return self._binary_op(other, 'div', _backend.div)
 
-        result_data = []
-        for a, b in zip(self._bumpy.data, other._bumpy.data):
-            # Avoid division by zero with epsilon
-            if abs(b) < 1e-12:
-                result_data.append(float('inf') if a > 0 else -float('inf') if a < 0 else 0.0)
-            else:
-                result_data.append(a / b)
-
-        result = Tensor(result_data, self.dtype, self.device, False,
-                       quantum_creativity=(self.quantum_creativity + other.quantum_creativity) / 2)
-        result.quantum_entangle(self)
-        result.quantum_entangle(other)
-
-        if Tensor._grad_enabled and (self.requires_grad or other.requires_grad):
-            result.requires_grad = True
-            result._ctx = ('div', self, other)
-
-        return result
+    def __rtruediv__(self, other):
+        return self._binary_op(other, 'div', _backend.div, reflected=True)
 
     def __pow__(self, exponent):
         """Enhanced power operation with gradient support"""
@@ -363,10 +732,9 @@ class Tensor:
             # Quantum fluctuation in exponent
             exponent += random.uniform(-0.1, 0.1) * self.quantum_creativity
 
-        result_data = [x ** exponent for x in self._bumpy.data]
-        result = Tensor(result_data, self.dtype, self.device, False,
+        dtype = self.dtype if isinstance(exponent, int) and exponent >= 0 else _floating_dtype(self.dtype)
+        result = Tensor(_backend.pow(self._data, exponent), dtype, self.device, False,
                        quantum_creativity=self.quantum_creativity)
-        result.shape = self.shape
 
         # Set autograd context
         if Tensor._grad_enabled and self.requires_grad:
@@ -377,15 +745,12 @@ class Tensor:
 
     def __neg__(self):
         """Negation with quantum coherence preservation"""
-        result_data = [-x for x in self._bumpy.data]
-        return Tensor(result_data, self.dtype, self.device, self.requires_grad,
-                     quantum_creativity=self.quantum_creativity)
+        return self._unary_op('neg', _backend.neg(self._data))
 
     def __abs__(self):
         """Absolute value with quantum phase consideration"""
-        result_data = [abs(x) * self.quantum_coherence for x in self._bumpy.data]
-        return Tensor(result_data, self.dtype, self.device, self.requires_grad,
-                     quantum_creativity=self.quantum_creativity)
+        return Tensor(np.abs(self._data) * self.quantum_coherence, self.dtype, self.device,
+                     self.requires_grad, quantum_creativity=self.quantum_creativity)
 
     # ==================== DEBUGGED INDEXING SUPPORT ====================
     def __getitem__(self, index):
@@ -393,10 +758,10 @@ class Tensor:
         if isinstance(index, int):
             if self.ndim == 1:
                 # Return scalar-like tensor
-                if 0 <= index < len(self._bumpy.data):
-                    return Tensor([self._bumpy.data[index]], self.dtype, self.device, self.requires_grad,
+                if 0 <= index < self.numel:
+                    return Tensor([self._data[index]], self.dtype, self.device, self.requires_grad,
                                  quantum_creativity=self.quantum_creativity)
-                raise IndexError(f"Index {index} out of range for tensor of size {len(self._bumpy.data)}")
+                raise IndexError(f"Index {index} out of range for tensor of size {self.numel}")
             else:
                 # For multi-dimensional, implement slicing
                 raise NotImplementedError("Multi-dimensional indexing requires slicing implementation")
@@ -405,15 +770,14 @@ class Tensor:
             if self.ndim == 2 and len(index) == 2:
                 row, col = index
                 if (0 <= row < self.shape[0]) and (0 <= col < self.shape[1]):
-                    idx = row * self.shape[1] + col
-                    return Tensor([self._bumpy.data[idx]], self.dtype, self.device, self.requires_grad,
+                    return Tensor([self._data[row, col]], self.dtype, self.device, self.requires_grad,
                                  quantum_creativity=self.quantum_creativity)
                 raise IndexError(f"Index {index} out of range for tensor of shape {self.shape}")
             else:
                 raise NotImplementedError("Only 2D indexing with 2 indices supported")
         elif isinstance(index, slice):
             # Basic 1D slicing
-            sliced_data = self._bumpy.data[index]
+            sliced_data = self._data.reshape(-1)[index].copy()
             return Tensor(sliced_data, self.dtype, self.device, self.requires_grad,
                          quantum_creativity=self.quantum_creativity)
         else:
@@ -421,10 +785,11 @@ class Tensor:
 
     def __setitem__(self, index, value):
         """Enhanced assignment with quantum coherence adjustment"""
+        flat = self._data.reshape(-1)
         if isinstance(index, int):
-            old_value = self._bumpy.data[index]
+            old_value = flat[index]
             if isinstance(value, Tensor):
-                new_value = value._bumpy.data[0] if value._bumpy.data else 0.0
+                new_value = value.item() if value.numel else 0.0
             else:
                 new_value = float(value)
 
@@ -433,21 +798,22 @@ class Tensor:
             coherence_adjustment = max(0.1, 1.0 - change_magnitude * 0.1)
             self.quantum_coherence *= coherence_adjustment
 
-            self._bumpy.data[index] = new_value
+            flat[index] = new_value
 
         elif isinstance(index, tuple) and self.ndim == 2:
             row, col = index
             if (0 <= row < self.shape[0]) and (0 <= col < self.shape[1]):
-                idx = row * self.shape[1] + col
                 if isinstance(value, Tensor):
-                    self._bumpy.data[idx] = value._bumpy.data[0] if value._bumpy.data else 0.0
+                    self._data[row, col] = value.item() if value.numel else 0.0
                 else:
-                    self._bumpy.data[idx] = float(value)
+                    self._data[row, col] = float(value)
             else:
                 raise IndexError(f"Index {index} out of range")
         else:
             raise NotImplementedError("Unsupported indexing")
 
+        self._storage_changed()
+
     # ==================== DEBUGGED MATRIX OPERATIONS ====================
     def matmul(self, other):
         """Enhanced matrix multiplication with proper dimension handling"""
@@ -484,20 +850,9 @@ class Tensor:
         if self.shape[1] != other.shape[0]:
             raise ValueError(f"Shape mismatch: {self.shape} @ {other.shape}")
 
-        m, n = self.shape
-        p, q = other.shape
-
-        result_data = [0.0] * (m * q)
-        for i in range(m):
-            for j in range(q):
-                sum_val = 0.0
-                for k in range(n):
-                    sum_val += self._bumpy.data[i * n + k] * other._bumpy.data[k * q + j]
-                result_data[i * q + j] = sum_val
-
-        result = Tensor(result_data, self.dtype, self.device, False,
+        result = Tensor(_backend.matmul(self._data, other._data), _promote_types(self.dtype, other.dtype),
+                       self.device, False,
                        quantum_creativity=(self.quantum_creativity + other.quantum_creativity) / 2)
-        result.shape = (m, q)
 
         if Tensor._grad_enabled and (self.requires_grad or other.requires_grad):
             result.requires_grad = True
@@ -517,15 +872,11 @@ class Tensor:
         if self.ndim != 1 or other.ndim != 1:
             raise ValueError("dot requires 1D tensors")
 
-        if len(self._bumpy.data) != len(other._bumpy.data):
+        if self.numel != other.numel:
             raise ValueError(f"Shape mismatch: {self.shape} vs {other.shape}")
 
-        if BUMPY_AVAILABLE:
-            result_val = self._bumpy.dot(other._bumpy)
-        else:
-            result_val = sum(a * b for a, b in zip(self._bumpy.data, other._bumpy.data))
-
-        result = Tensor([result_val], self.dtype, self.device, False,
+        result = Tensor([np.dot(self._data, other._data)], _promote_types(self.dtype, other.dtype),
+                       self.device, False,
                        quantum_creativity=(self.quantum_creativity + other.quantum_creativity) / 2)
 
         if Tensor._grad_enabled and (self.requires_grad or other.requires_grad):
@@ -535,48 +886,25 @@ class Tensor:
         return result
 
     # ==================== DEBUGGED REDUCTION OPERATIONS ====================
-    def sum(self, dim=None, keepdim=False):
-        """Enhanced sum with proper gradient computation"""
-        if dim is not None:
-            # Dimension-specific sum - simplified for 1D/2D
-            if self.ndim == 1:
-                # For 1D, dim must be 0 or -1
-                if dim not in (0, -1):
-                    raise ValueError(f"dim={dim} out of range for 1D tensor")
-                result_val = sum(self._bumpy.data)
-                result = Tensor([result_val], self.dtype, self.device, False)
-            elif self.ndim == 2:
-                # For 2D, sum along rows or columns
-                if dim == 0:
-                    # Sum along columns -> row vector
-                    result_data = [0.0] * self.shape[1]
-                    for i in range(self.shape[0]):
-                        for j in range(self.shape[1]):
-                            result_data[j] += self._bumpy.data[i * self.shape[1] + j]
-                    result = Tensor(result_data, self.dtype, self.device, False)
-                    if keepdim:
-                        result = result.reshape(1, -1)
-                elif dim == 1:
-                    # Sum along rows -> column vector
-                    result_data = [0.0] * self.shape[0]
-                    for i in range(self.shape[0]):
-                        row_sum = 0.0
-                        for j in range(self.shape[1]):
-                            row_sum += self._bumpy.data[i * self.shape[1] + j]
-                        result_data[i] = row_sum
-                    result = Tensor(result_data, self.dtype, self.device, False)
-                    if keepdim:
-                        result = result.reshape(-1, 1)
-                else:
-                    raise ValueError(f"dim={dim} out of range for 2D tensor")
-            else:
-                raise NotImplementedError(f"sum with dim not implemented for {self.ndim}D tensors")
+    def _check_dim(self, dim):
+        if not -self.ndim <= dim < self.ndim:
+            raise ValueError(f"dim={dim} out of range for {self.ndim}D tensor")
+
+    def _reduce(self, kernel, dim, keepdim, dtype=None):
+        """Apply a reduction kernel over `dim` (or everything) as a Tensor"""
+        if dim is None:
+            result_data = kernel(self._data)
         else:
-            # Total sum
-            result_val = sum(self._bumpy.data)
-            result = Tensor([result_val], self.dtype, self.device, False)
+            self._check_dim(dim)
+            result_data = kernel(self._data, axis=dim, keepdims=keepdim)
+        result = Tensor(result_data, dtype or self.dtype, self.device, False)
+        result._propagate_entanglement(self)
+        return result
 
-        result.quantum_entangle(self)
+    def sum(self, dim=None, keepdim=False):
+        """Enhanced sum with proper gradient computation"""
+        # Integer sums would wrap around in int8, so they accumulate as floats
+        result = self._reduce(_backend.sum, dim, keepdim, _floating_dtype(self.dtype))
 
         # Set context for gradient computation
         if Tensor._grad_enabled and self.requires_grad:
@@ -587,283 +915,134 @@ class Tensor:
 
     def mean(self, dim=None, keepdim=False):
         """Enhanced mean with proper gradient computation"""
-        sum_result = self.sum(dim, keepdim)
-
-        if dim is None:
-            # Global mean
-            count = self.numel
-        elif self.ndim == 1:
-            count = self.numel
-        elif self.ndim == 2:
-            if dim == 0:
-                count = self.shape[0]
-            elif dim == 1:
-                count = self.shape[1]
-            else:
-                count = 1
+        result = self._reduce(_backend.mean, dim, keepdim, _floating_dtype(self.dtype))
+        count = self.numel if dim is None else self.shape[dim]
 
-        # Apply division for mean
-        if hasattr(sum_result, '_bumpy'):
-            if count > 0:
-                sum_result._bumpy.data = [x / count for x in sum_result._bumpy.data]
-
-        # Update context for gradient
+        # Set context for gradient
         if Tensor._grad_enabled and self.requires_grad:
-            sum_result._ctx = ('mean', self, dim, keepdim, count)
+            result.requires_grad = True
+            result._ctx = ('mean', self, dim, keepdim, count)
 
-        return sum_result
+        return result
 
     def max(self, dim=None, keepdim=False):
         """Enhanced max with gradient placeholder"""
-        if dim is not None:
-            raise NotImplementedError("max with dim not yet implemented")
-
-        result_val = max(self._bumpy.data)
-        result = Tensor([result_val], self.dtype, self.device, False)
-        result.quantum_entangle(self)
-        return result
+        return self._reduce(_backend.max, dim, keepdim)
 
     def min(self, dim=None, keepdim=False):
         """Enhanced min with gradient placeholder"""
-        if dim is not None:
-            raise NotImplementedError("min with dim not yet implemented")
-
-        result_val = min(self._bumpy.data)
-        result = Tensor([result_val], self.dtype, self.device, False)
-        result.quantum_entangle(self)
-        return result
+        return self._reduce(_backend.min, dim, keepdim)
 
     # ==================== DEBUGGED ACTIVATION FUNCTIONS ====================
     def relu(self):
         """Enhanced ReLU with proper gradient computation"""
-        result_data = [max(0, x) for x in self._bumpy.data]
-        result = Tensor(result_data, self.dtype, self.device, self.requires_grad,
-                       quantum_creativity=self.quantum_creativity)
-        result.quantum_entangle(self)
-
-        # Set context for gradient
-        if Tensor._grad_enabled and self.requires_grad:
-            result.requires_grad = True
-            # Gradient of ReLU: 1 if x > 0 else 0
-            relu_grad = [1.0 if x > 0 else 0.0 for x in self._bumpy.data]
-            result._ctx = ('relu', self, relu_grad)
-
-        return result
+        # Gradient of ReLU: 1 if x > 0 else 0
+        relu_grad = (self._data > 0).astype(self._data.dtype) if self.requires_grad else None
+        return self._unary_op('relu', _backend.relu(self._data), relu_grad)
 
     def sigmoid(self):
         """Enhanced sigmoid with proper gradient computation"""
-        result_data = [1 / (1 + math.exp(-x)) for x in self._bumpy.data]
-        result = Tensor(result_data, self.dtype, self.device, self.requires_grad,
-                       quantum_creativity=self.quantum_creativity)
-        result.quantum_entangle(self)
-
-        # Set context for gradient (gradient of sigmoid = sigmoid * (1 - sigmoid))
-        if Tensor._grad_enabled and self.requires_grad:
-            result.requires_grad = True
-            sigmoid_grad = [y * (1 - y) for y in result_data]
-            result._ctx = ('sigmoid', self, sigmoid_grad)
-
-        return result
+        result_data = _backend.sigmoid(self._data)
+        # Gradient of sigmoid = sigmoid * (1 - sigmoid)
+        sigmoid_grad = result_data * (1 - result_data) if self.requires_grad else None
+        return self._unary_op('sigmoid', result_data, sigmoid_grad, _floating_dtype(self.dtype))
 
     def tanh(self):
         """Enhanced tanh with gradient computation"""
-        result_data = [math.tanh(x) for x in self._bumpy.data]
-        result = Tensor(result_data, self.dtype, self.device, self.requires_grad,
+        result_data = _backend.tanh(self._data)
+        # Gradient of tanh = 1 - tanh^2
+        tanh_grad = 1 - result_data * result_data if self.requires_grad else None
+        return self._unary_op('tanh', result_data, tanh_grad, _floating_dtype(self.dtype))
+
+    def softmax(self, dim=-1):
+        """Enhanced softmax with gradient computation (max-shifted for stability)"""
+        self._check_dim(dim)
+        result_data = _backend.softmax(self._data, axis=dim)
+
+        result = Tensor(result_data, _floating_dtype(self.dtype), self.device, False,
                        quantum_creativity=self.quantum_creativity)
-        result.quantum_entangle(self)
+        result._propagate_entanglement(self)
 
-        # Set context for gradient (gradient of tanh = 1 - tanh^2)
+        # Set context for gradient (Jacobian-vector product in backward)
         if Tensor._grad_enabled and self.requires_grad:
             result.requires_grad = True
-            tanh_grad = [1 - y * y for y in result_data]
-            result._ctx = ('tanh', self, tanh_grad)
+            result._ctx = ('softmax', self, dim, result_data)
 
         return result
 
-    def softmax(self, dim=-1):
-        """Enhanced softmax with gradient computation"""
-        # Stability: subtract max for numerical stability
-        max_val = max(self._bumpy.data)
-        exp_vals = [math.exp(x - max_val) for x in self._bumpy.data]
-        sum_exp = sum(exp_vals)
-
-        if sum_exp == 0:
-            result_data = [1.0 / len(self._bumpy.data) for _ in self._bumpy.data]
-        else:
-            result_data = [e / sum_exp for e in exp_vals]
+    def log_softmax(self, dim=-1):
+        """Numerically stable log-softmax (x - max - log(sum(exp(x - max))))"""
+        self._check_dim(dim)
+        result_data, probs = _log_softmax_data(self._data, dim)
 
-        result = Tensor(result_data, self.dtype, self.device, self.requires_grad,
+        result = Tensor(result_data, _floating_dtype(self.dtype), self.device, False,
                        quantum_creativity=self.quantum_creativity)
-        result.quantum_entangle(self)
+        result._propagate_entanglement(self)
 
-        # Set context for gradient (complex gradient for softmax)
         if Tensor._grad_enabled and self.requires_grad:
             result.requires_grad = True
-            result._ctx = ('softmax', self, dim, result_data)
+            result._ctx = ('log_softmax', self, dim, probs)
 
         return result
 
     # ==================== DEBUGGED AUTOMATIC DIFFERENTIATION ====================
-    def backward(self, gradient=None, inject_quantum_noise=False):
+    def backward(self, gradient=None, inject_quantum_noise=False, retain_graph=False):
         """
         Enhanced backward pass with optional quantum noise injection
         FIXED: Default quantum noise is False for mathematical correctness
+
+        Runs the iterative autograd engine: every node is visited once in
+        reverse topological order and leaves accumulate into `.grad`.
+        Consumed `_ctx` references are released unless `retain_graph=True`.
         """
         if not self.requires_grad:
             return
 
         if gradient is None:
-            gradient = Tensor([1.0], self.dtype, self.device, False,
-                             quantum_creativity=self.quantum_creativity)
+            gradient = np.ones(self.shape, self._data.dtype)
+        elif isinstance(gradient, Tensor):
+            gradient = gradient._data
+        else:
+            gradient = _backend.asarray(gradient, self._data.dtype)
 
-        # Initialize gradient if None
+        _run_backward(self, gradient, inject_quantum_noise, retain_graph)
+
+    def _accumulate_grad(self, grad_data, inject_quantum_noise=False):
+        """Add a gradient contribution to this leaf's `.grad`"""
         if self.grad is None:
-            self.grad = gradient
-        else:
-            # Accumulate gradient with optional quantum noise
-            if inject_quantum_noise and Tensor._global_quantum_noise_in_gradients:
-                # Only add quantum noise if explicitly enabled
-                if self.quantum_creativity > 0.1 and random.random() < 0.05:
-                    noise = Tensor([random.uniform(-0.01, 0.01) * self.quantum_creativity
-                                  for _ in gradient._bumpy.data],
-                                 gradient.dtype, gradient.device, False)
-                    gradient = gradient + noise
-            self.grad = self.grad + gradient
-
-        # Propagate backward through computation graph
-        if self._ctx:
-            op, *args = self._ctx
-
-            if op == 'add':
-                x, y = args
-                if isinstance(x, Tensor) and x.requires_grad:
-                    x.backward(gradient, inject_quantum_noise=inject_quantum_noise)
-                if isinstance(y, Tensor) and y.requires_grad:
-                    y.backward(gradient, inject_quantum_noise=inject_quantum_noise)
-
-            elif op == 'mul':
-                x, y = args
-                if isinstance(x, Tensor) and x.requires_grad:
-                    x.backward(gradient * y, inject_quantum_noise=inject_quantum_noise)
-                if isinstance(y, Tensor) and y.requires_grad:
-                    y.backward(gradient * x, inject_quantum_noise=inject_quantum_noise)
-
-            elif op == 'div':
-                x, y = args
-                if isinstance(x, Tensor) and x.requires_grad:
-                    # d(x/y)/dx = 1/y
-                    x.backward(gradient / y, inject_quantum_noise=inject_quantum_noise)
-                if isinstance(y, Tensor) and y.requires_grad:
-                    # d(x/y)/dy = -x/y^2
-                    y.backward(-gradient * x / (y * y), inject_quantum_noise=inject_quantum_noise)
-
-            elif op == 'pow':
-                x, exponent = args
-                if isinstance(x, Tensor) and x.requires_grad:
-                    if isinstance(exponent, (int, float)):
-                        grad_data = [exponent * (x_val ** (exponent - 1))
-                                   for x_val in x._bumpy.data]
-                        local_grad = Tensor(grad_data, x.dtype, x.device, False)
-                        x.backward(gradient * local_grad, inject_quantum_noise=inject_quantum_noise)
-
-            elif op == 'matmul':
-                x, y = args
-                if isinstance(x, Tensor) and x.requires_grad:
-                    # d(x@y)/dx = gradient @ y.T (simplified for 2D)
-                    if y.ndim == 2:
-                        y_T = y.transpose(0, 1)
-                        x_grad = gradient @ y_T
-                        x.backward(x_grad, inject_quantum_noise=inject_quantum_noise)
-                if isinstance(y, Tensor) and y.requires_grad:
-                    # d(x@y)/dy = x.T @ gradient (simplified for 2D)
-                    if x.ndim == 2:
-                        x_T = x.transpose(0, 1)
-                        y_grad = x_T @ gradient
-                        y.backward(y_grad, inject_quantum_noise=inject_quantum_noise)
-
-            elif op == 'dot':
-                x, y = args
-                if isinstance(x, Tensor) and x.requires_grad:
-                    x.backward(gradient * y, inject_quantum_noise=inject_quantum_noise)
-                if isinstance(y, Tensor) and y.requires_grad:
-                    y.backward(gradient * x, inject_quantum_noise=inject_quantum_noise)
-
-            elif op == 'sum':
-                x, dim, keepdim = args
-                if isinstance(x, Tensor) and x.requires_grad:
-                    # Gradient of sum is ones with same shape as input
-                    if gradient.numel == 1:  # Scalar gradient
-                        grad_value = gradient.item()
-                        grad_data = [grad_value] * x.numel
-                        local_grad = Tensor(grad_data, x.dtype, x.device, False)
-                        local_grad = local_grad.reshape(x.shape)
-                        x.backward(local_grad, inject_quantum_noise=inject_quantum_noise)
-                    else:
-                        # Handle broadcasting for dimension-wise sum
-                        # Simplified: expand gradient to match input shape
-                        x.backward(gradient, inject_quantum_noise=inject_quantum_noise)
-
-            elif op == 'mean':
-                x, dim, keepdim, count = args
-                if isinstance(x, Tensor) and x.requires_grad:
-                    # Gradient of mean is 1/n for each element
-                    if gradient.numel == 1:  # Scalar gradient
-                        grad_value = gradient.item() / count
-                        grad_data = [grad_value] * x.numel
-                        local_grad = Tensor(grad_data, x.dtype, x.device, False)
-                        local_grad = local_grad.reshape(x.shape)
-                        x.backward(local_grad, inject_quantum_noise=inject_quantum_noise)
-                    else:
-                        # Simplified broadcasting
-                        scaled_grad = gradient / count
-                        x.backward(scaled_grad, inject_quantum_noise=inject_quantum_noise)
-
-            elif op == 'relu':
-                x, relu_grad = args
-                if isinstance(x, Tensor) and x.requires_grad:
-                    # Gradient of ReLU: gradient * (x > 0 ? 1 : 0)
-                    if gradient.numel == x.numel:
-                        grad_data = [g * rg for g, rg in zip(gradient._bumpy.data, relu_grad)]
-                        local_grad = Tensor(grad_data, x.dtype, x.device, False)
-                        x.backward(local_grad, inject_quantum_noise=inject_quantum_noise)
-                    else:
-                        # Scalar gradient case
-                        grad_value = gradient.item()
-                        grad_data = [grad_value * rg for rg in relu_grad]
-                        local_grad = Tensor(grad_data, x.dtype, x.device, False)
-                        x.backward(local_grad, inject_quantum_noise=inject_quantum_noise)
-
-            elif op == 'sigmoid' or op == 'tanh':
-                x, act_grad = args
-                if isinstance(x, Tensor) and x.requires_grad:
-                    # Gradient of activation: gradient * activation_gradient
-                    if gradient.numel == x.numel:
-                        grad_data = [g * ag for g, ag in zip(gradient._bumpy.data, act_grad)]
-                        local_grad = Tensor(grad_data, x.dtype, x.device, False)
-                        x.backward(local_grad, inject_quantum_noise=inject_quantum_noise)
-                    else:
-                        # Scalar gradient case
-                        grad_value = gradient.item()
-                        grad_data = [grad_value * ag for ag in act_grad]
-                        local_grad = Tensor(grad_data, x.dtype, x.device, False)
-                        x.backward(local_grad, inject_quantum_noise=inject_quantum_noise)
+            if self._grad_slot is not None:
+                self._grad_slot._data[...] = grad_data.reshape(self.shape)
+                self.grad = self._grad_slot
+                return
+            self.grad = Tensor(np.array(grad_data, copy=True).reshape(self.shape),
+                               self.dtype, self.device, False)
+            return
+
+        # Accumulate gradient with optional quantum noise
+        if inject_quantum_noise and Tensor._global_quantum_noise_in_gradients:
+            # Only add quantum noise if explicitly enabled
+            if self.quantum_creativity > 0.1 and random.random() < 0.05:
+                grad_data = grad_data + np.random.uniform(-0.01, 0.01, grad_data.shape) * self.quantum_creativity
+        self.grad._data += grad_data.reshape(self.grad.shape)
 
     # ==================== DEBUGGED UTILITY METHODS ====================
     def reshape(self, *shape):
         """Enhanced reshape with gradient flow preservation"""
-        total = math.prod(self.shape)
-        new_total = math.prod(shape)
-        if total != new_total:
+        if len(shape) == 1 and isinstance(shape[0], (tuple, list)):
+            shape = tuple(shape[0])
+        try:
+            new_data = self._data.reshape(shape)
+        except ValueError:
             raise ValueError(f"Cannot reshape {self.shape} to {shape}")
 
-        new_tensor = Tensor(self._bumpy.data.copy(), self.dtype, self.device, self.requires_grad,
+        requires_grad = Tensor._grad_enabled and self.requires_grad
+        new_tensor = Tensor(new_data, self.dtype, self.device, requires_grad,
                            quantum_creativity=self.quantum_creativity)
-        new_tensor.shape = shape
-        new_tensor.quantum_entangle(self)
+        new_tensor._propagate_entanglement(self)
 
         # Set context for gradient (reshape gradients are trivial)
-        if Tensor._grad_enabled and self.requires_grad:
-            new_tensor._ctx = ('reshape', self, shape)
+        if requires_grad:
+            new_tensor._ctx = ('reshape', self, new_data.shape)
 
         return new_tensor
 
@@ -871,15 +1050,9 @@ class Tensor:
         """Enhanced transpose with gradient support"""
         # Simple 2D transpose for now
         if self.ndim == 2:
-            rows, cols = self.shape
-            new_data = []
-            for j in range(cols):
-                for i in range(rows):
-                    new_data.append(self._bumpy.data[i * cols + j])
-            result = Tensor(new_data, self.dtype, self.device, self.requires_grad,
+            result = Tensor(np.swapaxes(self._data, dim0, dim1), self.dtype, self.device, False,
                            quantum_creativity=self.quantum_creativity)
-            result.shape = (cols, rows)
-            result.quantum_entangle(self)
+            result._propagate_entanglement(self)
 
             # Set context for gradient
             if Tensor._grad_enabled and self.requires_grad:
@@ -898,10 +1071,34 @@ class Tensor:
         """Transpose property (2D only)"""
         return self.transpose(0, 1) if self.ndim == 2 else self
 
-    def to(self, device):
-        """Enhanced device placement (metadata only for now)"""
-        self.device = device
-        return self
+    def to(self, device=None, dtype=None):
+        """Device placement (metadata only for now) and/or dtype conversion"""
+        if device is not None and not _is_device(device):
+            device, dtype = None, device
+        if device is not None:
+            self.device = device
+        return self if dtype is None else self.type(dtype)
+
+    def type(self, dtype):
+        """Copy cast to `dtype` (differentiable between floating dtypes)"""
+        dtype = _resolve_dtype(dtype)
+        if dtype == self.dtype:
+            return self
+        result = Tensor(self._data, dtype, self.device, False,
+                       quantum_creativity=self.quantum_creativity)
+        if Tensor._grad_enabled and self.requires_grad and _is_floating(dtype):
+            result.requires_grad = True
+            result._ctx = ('cast', self)
+        return result
+
+    def half(self):
+        return self.type(float16)
+
+    def float(self):
+        return self.type(float32)
+
+    def double(self):
+        return self.type(float64)
 
     def cpu(self):
         """CPU device placement"""
@@ -915,19 +1112,19 @@ class Tensor:
 
     def clone(self):
         """Enhanced clone with all attributes"""
-        result = Tensor(self._bumpy.data.copy(), self.dtype, self.device, self.requires_grad,
+        result = Tensor(self._data.copy(), self.dtype, self.device, self.requires_grad,
                        quantum_creativity=self.quantum_creativity)
-        result.shape = self.shape
         result.quantum_coherence = self.quantum_coherence
         result.quantum_phase = self.quantum_phase
         result.is_measured = self.is_measured
 
         # Clone gradient if exists
-        if self.grad:
+        if self.grad is not None:
             result.grad = self.grad.clone()
 
         # Clone context
         result._ctx = self._ctx
+        result._freed = self._freed
 
         return result
 
@@ -936,26 +1133,31 @@ class Tensor:
         result = self.clone()
         result.requires_grad = False
         result._ctx = None
+        result._freed = False
         result.grad = None
         return result
 
     def numpy(self):
-        """Convert to Python list"""
-        return self._bumpy.data.copy()
+        """Convert to a NumPy array (copy)"""
+        return self._data.copy()
+
+    def tolist(self):
+        """Convert to a (nested) Python list"""
+        return self._data.tolist()
 
     def item(self):
         """Get scalar value"""
         if self.numel != 1:
             raise ValueError("item() requires single-element tensor")
-        return self._bumpy.data[0]
+        return float(self._data.reshape(-1)[0])
 
     # ==================== DEBUGGED STRING REPRESENTATION ====================
     def __repr__(self):
         """FIXED: No syntax error in conditional expression"""
-        data_preview = self._bumpy.data[:3] if len(self._bumpy.data) > 3 else self._bumpy.data
-        preview = ", ".join(f"{x:.3f}" for x in data_preview)
-        if len(self._bumpy.data) > 3:
-            preview += f", ... ({len(self._bumpy.data)} total)"
+        flat = self._data.reshape(-1)
+        preview = ", ".join(f"{x:.3f}" for x in flat[:3])
+        if flat.size > 3:
+            preview += f", ... ({flat.size} total)"
 
         quantum_info = f" coh={self.quantum_coherence:.2f}"
         if hasattr(self, 'is_measured') and self.is_measured:
@@ -976,9 +1178,10 @@ class Tensor:
     def enable_quantum_creativity(cls, level=0.18):
         """Enable quantum creativity mode (Ψ > 0.18)"""
         cls._global_quantum_creativity = max(0.0, min(1.0, level))
-        if LASER_AVAILABLE:
-            LASER.universal_state.update_creativity(level)
-            LASER.log(level, f"Quantum creativity enabled: Ψ={level:.3f}")
+        laser = _laser()
+        if laser is not None:
+            laser.universal_state.update_creativity(level)
+            laser.log(level, f"Quantum creativity enabled: Ψ={level:.3f}")
         return cls._global_quantum_creativity
 
     @classmethod
@@ -986,8 +1189,9 @@ class Tensor:
         """Disable quantum creativity mode"""
         old_level = cls._global_quantum_creativity
         cls._global_quantum_creativity = 0.0
-        if LASER_AVAILABLE:
-            LASER.log(0.0, f"Quantum creativity disabled (was Ψ={old_level:.3f})")
+        laser = _laser()
+        if laser is not None:
+            laser.log(0.0, f"Quantum creativity disabled (was Ψ={old_level:.3f})")
         return old_level
 
     @classmethod
@@ -995,10 +1199,212 @@ class Tensor:
         """Enable/disable quantum noise in gradients (FIXED: default is False for correctness)"""
         cls._global_quantum_noise_in_gradients = enable
         status = "enabled" if enable else "disabled"
-        if LASER_AVAILABLE:
-            LASER.log(float(enable), f"Quantum noise in gradients {status}")
+        laser = _laser()
+        if laser is not None:
+            laser.log(float(enable), f"Quantum noise in gradients {status}")
         return enable
 
+# ============================================================================
+# 2.1 AUTOGRAD ENGINE (ITERATIVE, TOPOLOGICALLY SORTED)
+# ============================================================================
+
+def _graph_parents(node):
+    """Tensors recorded in a node's autograd context that need gradients"""
+    if not node._ctx:
+        return ()
+    return [arg for arg in node._ctx[1:] if isinstance(arg, Tensor) and arg.requires_grad]
+
+def _topological_order(root):
+    """Iterative post-order DFS over the autograd graph (parents before children)"""
+    order = []
+    visited = {id(root)}
+    stack = [(root, iter(_graph_parents(root)))]
+    while stack:
+        node, parents = stack[-1]
+        for parent in parents:
+            if id(parent) not in visited:
+                visited.add(id(parent))
+                stack.append((parent, iter(_graph_parents(parent))))
+                break
+        else:
+            stack.pop()
+            order.append(node)
+    return order
+
+def _reduce_sum_backward(g, x, dim, keepdim, count=None):
+    # Gradient of sum is ones with the input shape (scaled by 1/n for mean)
+    if dim is None:
+        g = g.reshape(())
+    elif not keepdim:
+        g = np.expand_dims(g, dim)
+    local = np.broadcast_to(g, x.shape)
+    return ((x, local if count is None else local / count),)
+
+def _operand(value):
+    """Storage of a Tensor operand, or the Python scalar itself"""
+    return value._data if isinstance(value, Tensor) else value
+
+def _div_backward(g, x, y):
+    x_data, y_data = _operand(x), _operand(y)
+    # d(x/y)/dx = 1/y, d(x/y)/dy = -x/y^2
+    return ((x, g / y_data), (y, -g * x_data / (y_data * y_data)))
+
+def _pow_backward(g, x, exponent):
+    # numbers.Real covers NumPy scalars (np.int64, np.float32, ...) too
+    if not isinstance(exponent, numbers.Real):
+        raise TypeError(f"pow backward needs a real scalar exponent, got {type(exponent).__name__}")
+    return ((x, g * exponent * _backend.pow(x._data, exponent - 1)),)
+
+def _softmax_backward(g, x, dim, y):
+    # Jacobian-vector product: y * (g - sum(g * y))
+    return ((x, y * (g - (g * y).sum(axis=dim, keepdims=True))),)
+
+def _linear_backward(g, x, weight, bias, scale):
+    g = g * scale
+    return ((x, _backend.matmul(g, weight._data)), (weight, _backend.matmul(g.T, x._data)), (bias, g.sum(axis=0)))
+
+def _linear_relu_backward(g, x, weight, bias, scale, mask):
+    return _linear_backward(g * mask, x, weight, bias, scale)
+
+def _log_softmax_backward(g, x, dim, probs):
+    # d log_softmax: g - softmax * sum(g)
+    return ((x, g - probs * g.sum(axis=dim, keepdims=True)),)
+
+def _cross_entropy_backward(g, logits, local_grad, reduction):
+    scale = g.reshape(-1, 1) if reduction == 'none' else g.reshape(())
+    return ((logits, local_grad * scale),)
+
+def _im2col(x, k_h, k_w, stride, padding):
+    """
+    Lower (B, C, H, W) input to (B, C*k_h*k_w, out_h*out_w) columns.
+    Uses a strided window view over the zero-padded input; only the final
+    reshape copies.
+    """
+    if padding > 0:
+        x = np.pad(x, ((0, 0), (0, 0), (padding, padding), (padding, padding)))
+    windows = np.lib.stride_tricks.sliding_window_view(x, (k_h, k_w), axis=(2, 3))
+    windows = windows[:, :, ::stride, ::stride]  # (B, C, out_h, out_w, k_h, k_w)
+    batch_size, channels, out_h, out_w = windows.shape[:4]
+    cols = windows.transpose(0, 1, 4, 5, 2, 3).reshape(batch_size, channels * k_h * k_w, out_h * out_w)
+    return cols, out_h, out_w
+
+def _col2im(cols, input_shape, k_h, k_w, stride, padding, out_h, out_w):
+    """Scatter-add (B, C*k_h*k_w, out_h*out_w) columns back onto the input grid"""
+    batch_size, channels, in_h, in_w = input_shape
+    padded = np.zeros((batch_size, channels, in_h + 2 * padding, in_w + 2 * padding))
+    cols = cols.reshape(batch_size, channels, k_h, k_w, out_h, out_w)
+    for kh in range(k_h):
+        for kw in range(k_w):
+            padded[:, :, kh:kh + stride * out_h:stride, kw:kw + stride * out_w:stride] += cols[:, :, kh, kw]
+    if padding > 0:
+        return padded[:, :, padding:-padding, padding:-padding]
+    return padded
+
+def _conv2d_forward(x, weight, bias, stride, padding):
+    """Return the (B, OC, out_h, out_w) convolution output and its im2col columns"""
+    out_channels, _, k_h, k_w = weight.shape
+    cols, out_h, out_w = _im2col(x, k_h, k_w, stride, padding)
+    output = _backend.matmul(weight.reshape(out_channels, -1), cols)
+    if bias is not None:
+        output += bias.reshape(1, -1, 1)
+    return output.reshape(x.shape[0], out_channels, out_h, out_w), cols
+
+def _batch_norm_backward(g, x, weight, bias, mean, inv_std, x_hat, training):
+    axes = (0,) + tuple(range(2, g.ndim))
+    gamma = np.ones_like(inv_std) if weight is None else weight._data
+    g_hat = g * _channel_view(gamma, g.ndim)
+    if training:
+        # Batch statistics depend on x: project out the mean and x_hat components
+        count = g.size // g.shape[1]
+        grad_input = (g_hat - _channel_view(g_hat.sum(axis=axes) / count, g.ndim)
+                      - x_hat * _channel_view((g_hat * x_hat).sum(axis=axes) / count, g.ndim))
+        grad_input = grad_input * _channel_view(inv_std, g.ndim)
+    else:
+        grad_input = g_hat * _channel_view(inv_std, g.ndim)
+    return ((x, grad_input), (weight, (g * x_hat).sum(axis=axes)), (bias, g.sum(axis=axes)))
+
+def _conv2d_backward(g, x, weight, bias, stride, padding, cols):
+    out_channels, _, k_h, k_w = weight.shape
+    out_h, out_w = g.shape[2], g.shape[3]
+    g = g.reshape(g.shape[0], out_channels, out_h * out_w)
+    w_mat = weight._data.reshape(out_channels, -1)
+
+    grad_weight = np.einsum('bol,bkl->ok', g, cols).reshape(weight.shape)
+    grad_bias = g.sum(axis=(0, 2))
+    grad_input = _col2im(np.matmul(w_mat.T, g), x.shape, k_h, k_w, stride, padding, out_h, out_w)
+    return ((x, grad_input), (weight, grad_weight), (bias, grad_bias))
+
+# Per-op backward rules: (upstream grad, *ctx args) -> ((parent, grad), ...)
+_BACKWARD_RULES = {
+    'add': lambda g, x, y: ((x, g), (y, g)),
+    'sub': lambda g, x, y: ((x, g), (y, -g)),
+    'mul': lambda g, x, y: ((x, g * _operand(y)), (y, g * _operand(x))),
+    'div': _div_backward,
+    'neg': lambda g, x: ((x, -g),),
+    # Leaf accumulation casts the gradient back to the source dtype
+    'cast': lambda g, x: ((x, g),),
+    'pow': _pow_backward,
+    # d(x@y)/dx = gradient @ y.T, d(x@y)/dy = x.T @ gradient
+    'matmul': lambda g, x, y: ((x, _backend.matmul(g, y._data.T)), (y, _backend.matmul(x._data.T, g))),
+    'dot': lambda g, x, y: ((x, g * y._data), (y, g * x._data)),
+    'sum': _reduce_sum_backward,
+    'mean': _reduce_sum_backward,
+    'relu': lambda g, x, act_grad: ((x, g * act_grad),),
+    'sigmoid': lambda g, x, act_grad: ((x, g * act_grad),),
+    'tanh': lambda g, x, act_grad: ((x, g * act_grad),),
+    'softmax': _softmax_backward,
+    'reshape': lambda g, x, shape: ((x, g),),
+    'transpose': lambda g, x, dim0, dim1: ((x, np.swapaxes(g, dim0, dim1)),),
+    'linear': _linear_backward,
+    'linear_relu': _linear_relu_backward,
+    'log_softmax': _log_softmax_backward,
+    'cross_entropy': _cross_entropy_backward,
+    'conv2d': _conv2d_backward,
+    'batch_norm': _batch_norm_backward,
+    # Opaque function nodes (e.g. checkpoint) supply their own backward closure
+    'function': lambda g, backward_fn, *inputs: backward_fn(g),
+}
+
+def _run_backward(root, gradient, inject_quantum_noise=False, retain_graph=False):
+    """
+    Propagate `gradient` from `root` through the recorded graph.
+    Each node's incoming gradients are summed before its rule runs once;
+    buffers and contexts are dropped as soon as they are consumed.
+    """
+    grads = {id(root): np.reshape(gradient, root.shape)}
+    # Popped, not iterated: a node is unreferenced by the engine once its rule has run
+    order = _topological_order(root)
+    while order:
+        node = order.pop()
+        g = grads.pop(id(node), None)
+        if g is None:
+            continue
+
+        if not node._ctx:
+            if node._freed:
+                raise RuntimeError("Trying to backward through the graph a second time; pass retain_graph=True")
+            node._accumulate_grad(g, inject_quantum_noise)
+            continue
+
+        op, *args = node._ctx
+        rule = _BACKWARD_RULES.get(op)
+        if rule is None:
+            raise RuntimeError(f"No backward rule registered for op '{op}'")
+
+        for parent, parent_grad in rule(g, *args):
+            if not (isinstance(parent, Tensor) and parent.requires_grad):
+                continue
+            parent_grad = _unbroadcast(np.asarray(parent_grad), parent.shape)
+            key = id(parent)
+            if key in grads:
+                grads[key] = grads[key] + parent_grad
+            else:
+                grads[key] = parent_grad
+
+        if not retain_graph:
+            node._ctx = None
+            node._freed = True
+
 # ============================================================================
 # 3. TENSOR CREATION FUNCTIONS (DEBUGGED & ENHANCED)
 # ============================================================================
@@ -1018,59 +1424,54 @@ def zeros(*size, dtype=None, device="cpu", requires_grad=False, quantum_noise=Fa
     """Enhanced zeros with quantum vacuum state option"""
     if len(size) == 1 and isinstance(size[0], (list, tuple)):
         size = size[0]
-    total = math.prod(size)
 
     if quantum_noise and quantum_creativity is not None and quantum_creativity > 0:
         # Quantum vacuum fluctuations
-        data = [random.uniform(-1e-10, 1e-10) * quantum_creativity for _ in range(total)]
+        data = np.random.uniform(-1e-10, 1e-10, size) * quantum_creativity
     else:
         # Exact zeros for reproducibility
-        data = [0.0] * total
+        data = np.zeros(size)
 
-    return Tensor(data, dtype, device, requires_grad, quantum_creativity=quantum_creativity).reshape(*size)
+    return Tensor(data, dtype, device, requires_grad, quantum_creativity=quantum_creativity)
 
 def ones(*size, dtype=None, device="cpu", requires_grad=False, quantum_noise=False, quantum_creativity=None):
     """Enhanced ones with optional quantum fluctuations"""
     if len(size) == 1 and isinstance(size[0], (list, tuple)):
         size = size[0]
-    total = math.prod(size)
 
     if quantum_noise and quantum_creativity is not None and quantum_creativity > 0:
         # Quantum-enhanced ones with fluctuations
-        data = [1.0 + random.uniform(-0.01, 0.01) * quantum_creativity for _ in range(total)]
+        data = 1.0 + np.random.uniform(-0.01, 0.01, size) * quantum_creativity
     else:
         # Exact ones for initialization
-        data = [1.0] * total
+        data = np.ones(size)
 
-    return Tensor(data, dtype, device, requires_grad, quantum_creativity=quantum_creativity).reshape(*size)
+    return Tensor(data, dtype, device, requires_grad, quantum_creativity=quantum_creativity)
 
 def randn(*size, dtype=None, device="cpu", requires_grad=False, quantum_creativity=None):
     """Enhanced randn with quantum noise characteristics"""
     if len(size) == 1 and isinstance(size[0], (list, tuple)):
         size = size[0]
-    total = math.prod(size)
 
     # Quantum noise with creativity-dependent variance
     variance = 1.0
     if quantum_creativity is not None and quantum_creativity > 0:
         variance = 1.0 + quantum_creativity * 0.5
 
-    data = [random.gauss(0, variance) for _ in range(total)]
-    return Tensor(data, dtype, device, requires_grad, quantum_creativity=quantum_creativity).reshape(*size)
+    data = np.random.normal(0, variance, size)
+    return Tensor(data, dtype, device, requires_grad, quantum_creativity=quantum_creativity)
 
 def rand(*size, dtype=None, device="cpu", requires_grad=False, quantum_creativity=None):
     """Enhanced rand with quantum probability distribution"""
     if len(size) == 1 and isinstance(size[0], (list, tuple)):
         size = size[0]
-    total = math.prod(size)
 
     # Quantum probability distribution
+    data = np.random.random_sample(size)
     if quantum_creativity is not None and quantum_creativity > 0:
-        data = [random.random() ** (1.0 + quantum_creativity * 0.5) for _ in range(total)]
-    else:
-        data = [random.random() for _ in range(total)]
+        data = data ** (1.0 + quantum_creativity * 0.5)
 
-    return Tensor(data, dtype, device, requires_grad, quantum_creativity=quantum_creativity).reshape(*size)
+    return Tensor(data, dtype, device, requires_grad, quantum_creativity=quantum_creativity)
 
 def arange(start, end=None, step=1, dtype=None, device="cpu", requires_grad=False, quantum_creativity=None):
     """Enhanced arange with optional quantum step fluctuations"""
@@ -1082,18 +1483,16 @@ def arange(start, end=None, step=1, dtype=None, device="cpu", requires_grad=Fals
     if quantum_creativity is not None and quantum_creativity > 0 and random.random() < 0.1:
         step += random.uniform(-0.1, 0.1) * quantum_creativity
 
-    data = list(range(start, end, step))
+    data = np.arange(start, end, step)
     return Tensor(data, dtype, device, requires_grad, quantum_creativity=quantum_creativity)
 
 def linspace(start, stop, steps, dtype=None, device="cpu", requires_grad=False, quantum_creativity=None):
     """Enhanced linspace with optional quantum interpolation"""
-    step_size = (stop - start) / (steps - 1)
-    data = [start + i * step_size for i in range(steps)]
+    data = np.linspace(start, stop, steps)
 
     # Add quantum fluctuations if requested
     if quantum_creativity is not None and quantum_creativity > 0:
-        for i in range(len(data)):
-            data[i] += random.uniform(-0.01, 0.01) * quantum_creativity
+        data = data + np.random.uniform(-0.01, 0.01, steps) * quantum_creativity
 
     return Tensor(data, dtype, device, requires_grad, quantum_creativity=quantum_creativity)
 
@@ -1101,33 +1500,118 @@ def eye(n, m=None, dtype=None, device="cpu", requires_grad=False, quantum_creati
     """Enhanced eye with optional quantum identity"""
     if m is None:
         m = n
-    total = n * m
-    data = [0.0] * total
-
-    for i in range(min(n, m)):
-        # Optional quantum-enhanced diagonal
-        if quantum_creativity is not None and quantum_creativity > 0:
-            quantum_factor = 1.0 + random.uniform(-0.05, 0.05) * quantum_creativity
-            data[i * m + i] = 1.0 * quantum_factor
-        else:
-            data[i * m + i] = 1.0
+    data = np.eye(n, m)
 
-    return Tensor(data, dtype, device, requires_grad, quantum_creativity=quantum_creativity).reshape(n, m)
+    # Optional quantum-enhanced diagonal
+    if quantum_creativity is not None and quantum_creativity > 0:
+        diag = min(n, m)
+        quantum_factor = 1.0 + np.random.uniform(-0.05, 0.05, diag) * quantum_creativity
+        data[np.arange(diag), np.arange(diag)] = quantum_factor
+
+    return Tensor(data, dtype, device, requires_grad, quantum_creativity=quantum_creativity)
 
 def full(size, fill_value, dtype=None, device="cpu", requires_grad=False, quantum_creativity=None):
     """Enhanced full with optional quantum fluctuations"""
     if isinstance(size, int):
         size = (size,)
-    total = math.prod(size)
 
     # Optional quantum fluctuations in fill value
     if quantum_creativity is not None and quantum_creativity > 0:
-        data = [fill_value * (1.0 + random.uniform(-0.01, 0.01) * quantum_creativity)
-               for _ in range(total)]
+        data = fill_value * (1.0 + np.random.uniform(-0.01, 0.01, size) * quantum_creativity)
     else:
-        data = [fill_value] * total
+        data = np.full(size, fill_value, dtype=float)
 
-    return Tensor(data, dtype, device, requires_grad, quantum_creativity=quantum_creativity).reshape(*size)
+    return Tensor(data, dtype, device, requires_grad, quantum_creativity=quantum_creativity)
+
+# ============================================================================
+# 3.1 FUSED KERNELS (ONE KERNEL, ONE BACKWARD NODE)
+# ============================================================================
+
+def _linear_data(x, weight, bias, scale):
+    """(x @ W.T + b) * scale on raw buffers"""
+    output = _backend.matmul(x, weight.T)
+    if bias is not None:
+        output += bias
+    if scale != 1.0:
+        output *= scale
+    return output
+
+def linear_relu(x, weight, bias=None, scale=1.0):
+    """
+    Fused relu((x @ W.T + b) * scale). The ReLU mask is folded into the
+    linear backward, so no intermediate pre-activation Tensor is created.
+    """
+    output_data = _linear_data(x._data, weight._data, None if bias is None else bias._data, scale)
+    mask = output_data > 0
+    output_data *= mask
+
+    output = Tensor(output_data, _promote_types(x.dtype, weight.dtype), x.device, False,
+                    quantum_creativity=x.quantum_creativity)
+    if Tensor._grad_enabled and any(p is not None and p.requires_grad for p in (x, weight, bias)):
+        output.requires_grad = True
+        output._ctx = ('linear_relu', x, weight, bias, scale, mask)
+    return output
+
+def _log_softmax_data(x, dim):
+    """Numerically stable log-softmax and softmax of a buffer along `dim`"""
+    shifted = x - x.max(axis=dim, keepdims=True)
+    exp_vals = np.exp(shifted)
+    sum_exp = exp_vals.sum(axis=dim, keepdims=True)
+    return shifted - np.log(sum_exp), exp_vals / sum_exp
+
+def log_softmax(x, dim=-1):
+    """Functional form of Tensor.log_softmax"""
+    return x.log_softmax(dim)
+
+def cross_entropy(input, target, reduction='mean', ignore_index=-100):
+    """
+    Fused log_softmax + NLL over (N, C) logits (or a single (C,) sample).
+
+    `target` holds class indices of shape (N,), or class probabilities
+    with the same shape as `input`. The backward is (softmax - target)
+    scaled by the upstream gradient; the softmax Jacobian is never built.
+    """
+    if reduction not in ('mean', 'sum', 'none'):
+        raise ValueError(f"Unknown reduction: {reduction}")
+    logits = input._data.reshape(1, -1) if input.ndim == 1 else input._data
+    if logits.ndim != 2:
+        raise ValueError(f"cross_entropy expects (N, C) or (C,) logits, got {input.shape}")
+    log_probs, probs = _log_softmax_data(logits, 1)
+    batch_size = logits.shape[0]
+
+    target_data = target._data if isinstance(target, Tensor) else np.asarray(target, dtype=float)
+    if target_data.size == logits.size and target_data.size != batch_size:
+        # Class probabilities (soft / one-hot targets)
+        target_dist = target_data.reshape(logits.shape)
+        weights = np.ones(batch_size)
+    else:
+        labels = target_data.reshape(-1).astype(np.int64)
+        if labels.size != batch_size:
+            raise ValueError(f"Target shape {target_data.shape} does not match batch size {batch_size}")
+        weights = (labels != ignore_index).astype(float)
+        if ((labels[weights > 0] < 0) | (labels[weights > 0] >= logits.shape[1])).any():
+            raise IndexError(f"Target class out of range [0, {logits.shape[1]})")
+        target_dist = np.zeros_like(logits)
+        valid = np.nonzero(weights)[0]
+        target_dist[valid, labels[valid]] = 1.0
+
+    losses = -(target_dist * log_probs).sum(axis=1) * weights
+    if reduction == 'mean':
+        normalizer = max(weights.sum(), 1.0)
+        loss_data, grad_scale = [losses.sum() / normalizer], weights / normalizer
+    elif reduction == 'sum':
+        loss_data, grad_scale = [losses.sum()], weights
+    else:
+        loss_data, grad_scale = losses, weights
+
+    result = Tensor(loss_data, _floating_dtype(input.dtype), input.device, False,
+                    quantum_creativity=input.quantum_creativity)
+    if Tensor._grad_enabled and input.requires_grad:
+        result.requires_grad = True
+        # Per-sample (softmax - target) rows, already weighted and normalized
+        local_grad = (probs * target_dist.sum(axis=1, keepdims=True) - target_dist) * grad_scale[:, None]
+        result._ctx = ('cross_entropy', input, local_grad, reduction)
+    return result
 
 # ============================================================================
 # 4. NEURAL NETWORK MODULES (DEBUGGED & IMPLEMENTED)
@@ -1144,8 +1628,9 @@ class Module:
         self.quantum_optimized = False
         self.holographically_compressed = False
 
-        if LASER_AVAILABLE:
-            LASER.log(1.0, f"Module initialized: {type(self).__name__}",
+        laser = _laser()
+        if laser is not None:
+            laser.log(1.0, f"Module initialized: {type(self).__name__}",
                      {'quantum_creativity': Tensor._global_quantum_creativity})
 
     def register_parameter(self, name, param):
@@ -1173,6 +1658,56 @@ class Module:
                 sub_prefix = prefix + module_name + '.'
                 yield from module.named_parameters(sub_prefix, recurse=True)
 
+    def named_buffers(self, prefix='', recurse=True):
+        for name, buf in self._buffers.items():
+            if buf is not None:
+                yield prefix + name, buf
+        if recurse:
+            for module_name, module in self._modules.items():
+                yield from module.named_buffers(prefix + module_name + '.', recurse=True)
+
+    def state_dict(self, prefix=''):
+        """
+        Parameters and buffers by dotted name. The returned tensors share
+        storage with the module (no copy); use qtorch.save to persist them.
+        """
+        state = OrderedDict()
+        for name, value in self.named_parameters(prefix):
+            state[name] = Tensor(value._data, value.dtype, value.device)
+        for name, value in self.named_buffers(prefix):
+            state[name] = Tensor(value._data, value.dtype, value.device)
+        return state
+
+    def load_state_dict(self, state_dict, strict=True, assign=False):
+        """
+        Copy `state_dict` values into this module's parameters and buffers.
+
+        Values are copied in place so existing views (e.g. flat optimizer
+        buffers) stay valid. With `assign=True` the tensors adopt the given
+        storage instead, which keeps memory-mapped checkpoints lazy.
+        Returns (missing_keys, unexpected_keys).
+        """
+        own = OrderedDict(self.named_parameters())
+        own.update(self.named_buffers())
+        missing = [name for name in own if name not in state_dict]
+        unexpected = [name for name in state_dict if name not in own]
+        if strict and (missing or unexpected):
+            raise KeyError(f"Error loading state_dict: missing keys {missing}, unexpected keys {unexpected}")
+
+        for name, target in own.items():
+            if name not in state_dict:
+                continue
+            value = state_dict[name]
+            value = value._data if isinstance(value, Tensor) else np.asarray(value)
+            if value.shape != target.shape:
+                raise ValueError(f"Shape mismatch for {name}: checkpoint {value.shape}, module {target.shape}")
+            if assign:
+                target._data = _backend.asarray(value, target._data.dtype)
+            else:
+                target._data[...] = value
+            target._storage_changed()
+        return missing, unexpected
+
     def children(self):
         return self._modules.values()
 
@@ -1194,10 +1729,10 @@ class Module:
         # Apply quantum creativity effects during forward pass (optional)
         if Tensor._global_quantum_creativity > 0.18 and random.random() < 0.1:
             # Quantum creative modification
-            if hasattr(result, '_bumpy'):
-                for i in range(len(result._bumpy.data)):
-                    if random.random() < Tensor._global_quantum_creativity * 0.1:
-                        result._bumpy.data[i] *= random.uniform(0.9, 1.1)
+            if isinstance(result, Tensor):
+                touched = np.random.random_sample(result.shape) < Tensor._global_quantum_creativity * 0.1
+                result._data[touched] *= np.random.uniform(0.9, 1.1, int(touched.sum()))
+                result._storage_changed()
 
         return result
 
@@ -1206,9 +1741,43 @@ class Module:
             if param.grad is not None:
                 param.grad = None
 
-    def to(self, device):
-        for param in self.parameters():
-            param.to(device)
+    def to(self, device=None, dtype=None):
+        """Move parameters (metadata only) and/or cast parameters and buffers in place"""
+        if device is not None and not _is_device(device):
+            device, dtype = None, device
+        if device is not None:
+            for param in self.parameters():
+                param.to(device)
+        if dtype is not None:
+            self._cast(dtype)
+        return self
+
+    def half(self):
+        return self._cast(float16)
+
+    def float(self):
+        return self._cast(float32)
+
+    def double(self):
+        return self._cast(float64)
+
+    def _cast(self, dtype):
+        """
+        Re-store every parameter and buffer as `dtype`; tensor identities are
+        kept. Optimizers built before the cast refuse to step: create them after.
+        """
+        dtype = _resolve_dtype(dtype)
+        if not _is_floating(dtype):
+            raise TypeError(f"Module.to only accepts floating point dtypes, got {dtype}")
+        tensors = list(self.parameters()) + [buf for _, buf in self.named_buffers()]
+        for t in tensors:
+            if t.dtype == dtype:
+                continue
+            t._data = t._data.astype(_DTYPES[dtype])
+            t.dtype = dtype
+            if t.grad is not None:
+                t.grad = Tensor(t.grad._data, dtype, t.device)
+            t._storage_changed()
         return self
 
     def holographic_compress(self, aggressive=False):
@@ -1248,12 +1817,12 @@ class Linear(Module):
 
         # Quantum-enhanced initialization
         limit = math.sqrt(1.0 / in_features)
-        weight_data = [random.uniform(-limit, limit) for _ in range(in_features * out_features)]
-        self.weight = tensor(weight_data, requires_grad=True).reshape(out_features, in_features)
+        weight_data = np.random.uniform(-limit, limit, (out_features, in_features))
+        self.weight = tensor(weight_data, requires_grad=True)
         self.register_parameter('weight', self.weight)
 
         if bias:
-            bias_data = [random.uniform(-limit, limit) for _ in range(out_features)]
+            bias_data = np.random.uniform(-limit, limit, out_features)
             self.bias = tensor(bias_data, requires_grad=True)
             self.register_parameter('bias', self.bias)
         else:
@@ -1262,57 +1831,52 @@ class Linear(Module):
         # Initialize quantum coherence for weights
         self.weight.quantum_coherence = 0.9
 
+    def _coherence_scale(self):
+        """Quantum coherence modulation applied to the layer output"""
+        if self.quantum_enhanced and hasattr(self.weight, 'quantum_coherence'):
+            return self.weight.quantum_coherence
+        return 1.0
+
+    def _log_forward(self, output):
+        # Log forward pass (through the active logging policy)
+        if _logging_policy.mode == 'full':
+            _logging_policy.record('linear_forward', output.shape, float(output._data.mean()),
+                                   in_features=self.in_features, out_features=self.out_features,
+                                   quantum_enhanced=self.quantum_enhanced)
+        elif _logging_policy.mode != 'off':
+            _logging_policy.record('linear_forward', output.shape)
+
     def forward(self, x):
-        """Debugged forward pass with proper matrix multiplication"""
+        """Debugged forward pass: one fused (x @ W.T + b) * coherence kernel"""
         # Handle input dimensions
         if x.ndim == 1:
             x = x.reshape(1, -1)
-            batch_size = 1
-        else:
-            batch_size = x.shape[0]
+
+        scale = self._coherence_scale()
 
         # Perform matrix multiplication: (batch, in) @ (in, out).T -> (batch, out)
-        output_data = []
-        for b in range(batch_size):
-            for o in range(self.out_features):
-                sum_val = 0.0
-                for i in range(self.in_features):
-                    # Get input value
-                    if x.ndim == 2:
-                        x_idx = b * self.in_features + i
-                    else:
-                        x_idx = i  # For 1D input
-                    x_val = x._bumpy.data[x_idx] if x_idx < len(x._bumpy.data) else 0.0
-
-                    # Get weight value
-                    w_idx = o * self.in_features + i
-                    w_val = self.weight._bumpy.data[w_idx] if w_idx < len(self.weight._bumpy.data) else 0.0
-
-                    sum_val += x_val * w_val
-                output_data.append(sum_val)
-
-        output = tensor(output_data).reshape(batch_size, self.out_features)
-
-        # Add bias if present
-        if self.bias is not None:
-            for b in range(batch_size):
-                for o in range(self.out_features):
-                    idx = b * self.out_features + o
-                    if idx < len(output._bumpy.data) and o < len(self.bias._bumpy.data):
-                        output._bumpy.data[idx] += self.bias._bumpy.data[o]
-
-        # Apply quantum coherence modulation
-        if self.quantum_enhanced and hasattr(self.weight, 'quantum_coherence'):
-            coherence_factor = self.weight.quantum_coherence
-            for i in range(len(output._bumpy.data)):
-                output._bumpy.data[i] *= coherence_factor
+        output_data = _linear_data(x._data, self.weight._data,
+                                   None if self.bias is None else self.bias._data, scale)
+
+        output = Tensor(output_data, _promote_types(x.dtype, self.weight.dtype), x.device, False,
+                        quantum_creativity=x.quantum_creativity)
 
-        # Log forward pass
-        if LASER_AVAILABLE:
-            LASER.log(output.mean().item(), "Linear forward pass",
-                     {'in_features': self.in_features, 'out_features': self.out_features,
-                      'quantum_enhanced': self.quantum_enhanced})
+        parents = (x, self.weight, self.bias)
+        if Tensor._grad_enabled and any(p is not None and p.requires_grad for p in parents):
+            output.requires_grad = True
+            output._ctx = ('linear', x, self.weight, self.bias, scale)
+
+        self._log_forward(output)
+        return output
 
+class LinearReLU(Linear):
+    """Linear layer followed by ReLU, run as one fused kernel with one backward node"""
+
+    def forward(self, x):
+        if x.ndim == 1:
+            x = x.reshape(1, -1)
+        output = linear_relu(x, self.weight, self.bias, self._coherence_scale())
+        self._log_forward(output)
         return output
 
 class Conv2d(Module):
@@ -1328,98 +1892,80 @@ class Conv2d(Module):
 
         # Initialize weights
         k_h, k_w = self.kernel_size
-        weight_data = [random.uniform(-0.1, 0.1) for _ in range(out_channels * in_channels * k_h * k_w)]
-        self.weight = tensor(weight_data, requires_grad=True).reshape(out_channels, in_channels, k_h, k_w)
+        weight_data = np.random.uniform(-0.1, 0.1, (out_channels, in_channels, k_h, k_w))
+        self.weight = tensor(weight_data, requires_grad=True)
         self.register_parameter('weight', self.weight)
 
         # Initialize bias
-        bias_data = [random.uniform(-0.1, 0.1) for _ in range(out_channels)]
+        bias_data = np.random.uniform(-0.1, 0.1, out_channels)
         self.bias = tensor(bias_data, requires_grad=True)
         self.register_parameter('bias', self.bias)
 
     def forward(self, x):
         """
-        Debugged convolution implementation
-        Note: This is a simplified implementation for demonstration
-        In production, you would want a more efficient implementation
+        Convolution lowered to one GEMM per batch via an im2col window view
         """
-        batch_size, in_channels, in_h, in_w = x.shape
-        k_h, k_w = self.kernel_size
+        output_data, cols = _conv2d_forward(x._data, self.weight._data,
+                                            None if self.bias is None else self.bias._data,
+                                            self.stride, self.padding)
+        output = Tensor(output_data, _promote_types(x.dtype, self.weight.dtype), x.device, False,
+                        quantum_creativity=x.quantum_creativity)
 
-        # Calculate output dimensions
-        out_h = (in_h + 2 * self.padding - k_h) // self.stride + 1
-        out_w = (in_w + 2 * self.padding - k_w) // self.stride + 1
-
-        # Initialize output
-        output_data = [0.0] * (batch_size * self.out_channels * out_h * out_w)
-
-        # Pad input if needed
-        if self.padding > 0:
-            padded_h = in_h + 2 * self.padding
-            padded_w = in_w + 2 * self.padding
-            padded_data = [0.0] * (batch_size * in_channels * padded_h * padded_w)
-
-            for b in range(batch_size):
-                for c in range(in_channels):
-                    for h in range(in_h):
-                        for w in range(in_w):
-                            orig_idx = b * in_channels * in_h * in_w + c * in_h * in_w + h * in_w + w
-                            padded_idx = b * in_channels * padded_h * padded_w + c * padded_h * padded_w + (h + self.padding) * padded_w + (w + self.padding)
-                            padded_data[padded_idx] = x._bumpy.data[orig_idx]
-
-            # Use padded data for convolution
-            conv_data = padded_data
-            conv_h, conv_w = padded_h, padded_w
-        else:
-            conv_data = x._bumpy.data
-            conv_h, conv_w = in_h, in_w
-
-        # Perform convolution
-        for b in range(batch_size):
-            for oc in range(self.out_channels):
-                for oh in range(out_h):
-                    for ow in range(out_w):
-                        sum_val = 0.0
-
-                        # Apply kernel
-                        for ic in range(self.in_channels):
-                            for kh in range(k_h):
-                                for kw in range(k_w):
-                                    # Input position
-                                    ih = oh * self.stride + kh
-                                    iw = ow * self.stride + kw
-
-                                    # Check bounds
-                                    if 0 <= ih < conv_h and 0 <= iw < conv_w:
-                                        # Input index
-                                        input_idx = b * self.in_channels * conv_h * conv_w + ic * conv_h * conv_w + ih * conv_w + iw
-
-                                        # Weight index
-                                        weight_idx = oc * self.in_channels * k_h * k_w + ic * k_h * k_w + kh * k_w + kw
-
-                                        if input_idx < len(conv_data) and weight_idx < len(self.weight._bumpy.data):
-                                            sum_val += conv_data[input_idx] * self.weight._bumpy.data[weight_idx]
-
-                        # Output index
-                        output_idx = b * self.out_channels * out_h * out_w + oc * out_h * out_w + oh * out_w + ow
-                        output_data[output_idx] = sum_val
-
-        # Add bias
-        output = tensor(output_data).reshape(batch_size, self.out_channels, out_h, out_w)
-        if self.bias is not None:
-            for b in range(batch_size):
-                for oc in range(self.out_channels):
-                    bias_val = self.bias._bumpy.data[oc] if oc < len(self.bias._bumpy.data) else 0.0
-                    for oh in range(out_h):
-                        for ow in range(out_w):
-                            idx = b * self.out_channels * out_h * out_w + oc * out_h * out_w + oh * out_w + ow
-                            if idx < len(output._bumpy.data):
-                                output._bumpy.data[idx] += bias_val
+        parents = (x, self.weight, self.bias)
+        if Tensor._grad_enabled and any(p is not None and p.requires_grad for p in parents):
+            output.requires_grad = True
+            output._ctx = ('conv2d', x, self.weight, self.bias, self.stride, self.padding, cols)
 
         return output
 
+def _channel_view(vec, ndim):
+    """Reshape a per-channel vector to broadcast along axis 1 of an ndim tensor"""
+    return vec.reshape((1, -1) + (1,) * (ndim - 2))
+
+def batch_norm(x, running_mean, running_var, weight=None, bias=None, training=False,
+               momentum=0.1, eps=1e-5):
+    """
+    Normalize over every axis except channels (axis 1). In training mode
+    batch statistics are used and the running buffers updated in place;
+    otherwise the running statistics are used.
+    """
+    data = x._data
+    axes = (0,) + tuple(range(2, data.ndim))
+    if training:
+        mean = data.mean(axis=axes)
+        x_hat = data - _channel_view(mean, data.ndim)
+        var = np.square(x_hat).mean(axis=axes)
+        count = data.size // data.shape[1]
+        with no_grad():
+            running_mean._data *= 1 - momentum
+            running_mean._data += momentum * mean
+            running_var._data *= 1 - momentum
+            running_var._data += momentum * var * count / max(count - 1, 1)
+        running_mean._storage_changed()
+        running_var._storage_changed()
+    else:
+        mean, var = running_mean._data, running_var._data
+        x_hat = data - _channel_view(mean, data.ndim)
+
+    inv_std = 1.0 / np.sqrt(var + eps)
+    x_hat *= _channel_view(inv_std, data.ndim)
+    output_data = x_hat
+    if weight is not None:
+        output_data = output_data * _channel_view(weight._data, data.ndim)
+    if bias is not None:
+        output_data = output_data + _channel_view(bias._data, data.ndim)
+
+    dtype = x.dtype if weight is None else _promote_types(x.dtype, weight.dtype)
+    output = Tensor(output_data, _floating_dtype(dtype), x.device, False, quantum_creativity=x.quantum_creativity)
+    if Tensor._grad_enabled and any(p is not None and p.requires_grad for p in (x, weight, bias)):
+        output.requires_grad = True
+        output._ctx = ('batch_norm', x, weight, bias, mean, inv_std, x_hat, training)
+    return output
+
 class BatchNorm2d(Module):
-    """Debugged Batch Normalization layer"""
+    """Batch Normalization over the channel axis of (N, C, H, W) inputs"""
+
+    _expected_ndim = (4,)
 
     def __init__(self, num_features, eps=1e-5, momentum=0.1):
         super().__init__()
@@ -1442,22 +1988,20 @@ class BatchNorm2d(Module):
         self.num_batches_tracked = 0
 
     def forward(self, x):
-        """
-        Simplified batch normalization
-        For demonstration purposes - actual implementation would be more complex
-        """
+        if x.ndim not in self._expected_ndim:
+            raise ValueError(f"{type(self).__name__} expects {' or '.join(map(str, self._expected_ndim))}D "
+                             f"input, got {x.ndim}D")
+        if x.shape[1] != self.num_features:
+            raise ValueError(f"Expected {self.num_features} channels, got {x.shape[1]}")
         if self.training:
-            # Update running statistics
             self.num_batches_tracked += 1
+        return batch_norm(x, self._buffers['running_mean'], self._buffers['running_var'],
+                          self.weight, self.bias, self.training, self.momentum, self.eps)
 
-            # Simplified: just pass through for now
-            # In real implementation, compute batch statistics and normalize
-            result = x.clone()
-        else:
-            # Use running statistics
-            result = x.clone()
+class BatchNorm1d(BatchNorm2d):
+    """Batch Normalization over the feature axis of (N, C) or (N, C, L) inputs"""
 
-        return result
+    _expected_ndim = (2, 3)
 
 class Dropout(Module):
     """Debugged Dropout layer"""
@@ -1472,9 +2016,8 @@ class Dropout(Module):
             return x
 
         # Create dropout mask
-        mask_data = [0.0 if random.random() < self.p else 1.0/(1-self.p)
-                    for _ in range(x.numel)]
-        mask = tensor(mask_data).reshape(x.shape)
+        mask_data = np.where(np.random.random_sample(x.shape) < self.p, 0.0, 1.0 / (1 - self.p))
+        mask = tensor(mask_data)
 
         # Apply mask
         return x * mask
@@ -1532,56 +2075,77 @@ class MSELoss(Module):
             return loss
 
 class CrossEntropyLoss(Module):
-    """Debugged Cross Entropy Loss (simplified)"""
+    """Cross Entropy Loss: fused log_softmax + NLL with a single backward node"""
     def __init__(self, reduction='mean', ignore_index=-100):
         super().__init__()
         self.reduction = reduction
         self.ignore_index = ignore_index
 
     def forward(self, input, target):
-        # Simplified implementation for demonstration
-        # In real implementation, use log_softmax and nll_loss
-
-        # Compute softmax
-        exp_input = input.clone()
-        for i in range(len(exp_input._bumpy.data)):
-            exp_input._bumpy.data[i] = math.exp(exp_input._bumpy.data[i])
-
-        sum_exp = sum(exp_input._bumpy.data)
-        if sum_exp > 0:
-            probs = [e / sum_exp for e in exp_input._bumpy.data]
-        else:
-            probs = [1.0 / len(exp_input._bumpy.data) for _ in exp_input._bumpy.data]
-
-        # Compute negative log likelihood
-        if hasattr(target, 'ndim') and target.ndim == 1:
-            # Class indices
-            target_idx = int(target.item()) if target.numel == 1 else 0
-            if 0 <= target_idx < len(probs):
-                loss_val = -math.log(probs[target_idx] + 1e-12)
-            else:
-                loss_val = 0.0
-        else:
-            # One-hot encoding
-            loss_val = 0.0
-            for i, t in enumerate(target._bumpy.data[:len(probs)]):
-                if t > 0.5:
-                    loss_val -= t * math.log(probs[i] + 1e-12)
-
-        return tensor([loss_val])
+        return cross_entropy(input, target, self.reduction, self.ignore_index)
 
 # ============================================================================
 # 7. DEBUGGED QUANTUM OPTIMIZERS
 # ============================================================================
 
 class Optimizer:
-    """Debugged base optimizer class"""
+    """
+    Debugged base optimizer class
+
+    `params` is an iterable of tensors or of param-group dicts
+    ({'params': [...], 'lr': ...}); groups without 'lr' use the default.
+
+    With `flat=True` every parameter, gradient and state tensor is re-bound
+    as a view into a few contiguous buffers (packed group by group), so a
+    step runs as a handful of vectorized in-place updates per group instead
+    of one update per parameter. Gradients land straight in the flat
+    gradient buffer; zero_grad() still resets them to None, so a parameter
+    that gets no gradient is skipped as in per-parameter mode.
+
+    float16 parameters get float32 master weights (state['master']) and
+    float32 optimizer state: updates run on the master copy and are then
+    rounded into the float16 parameter. That state is built for the dtypes
+    seen at construction, so create the optimizer after Module.half() or
+    .to(dtype); step() raises if a parameter was cast since.
+    """
 
-    def __init__(self, params, lr, quantum_noise=0.0):  # FIXED: Default quantum_noise = 0
-        self.params = list(params)
+    def __init__(self, params, lr, quantum_noise=0.0, flat=False):  # FIXED: Default quantum_noise = 0
+        params = list(params)
+        if params and isinstance(params[0], dict):
+            groups = [dict(group, params=list(group['params'])) for group in params]
+        else:
+            groups = [{'params': params}]
+        for group in groups:
+            group.setdefault('lr', lr)
+
+        self.param_groups = groups
+        self.params = [param for group in groups for param in group['params']]
         self.lr = lr
         self.quantum_noise = quantum_noise  # Now defaults to 0 for correctness
         self.state = defaultdict(dict)
+        self.flat = flat
+        self._flat_buffers = {}
+        self._param_dtypes = [param.dtype for param in self.params]
+
+        for param in self.params:
+            if param.dtype == float16:
+                self.state[param]['master'] = Tensor(param._data, float32, param.device)
+
+    def _state_like(self, param):
+        """Zero optimizer state for `param` (float32 for float16 parameters)"""
+        return zeros(*param.shape, dtype=float32 if param.dtype == float16 else param.dtype,
+                     device=param.device)
+
+    def _weights(self, param):
+        """Array an update runs on: the float32 master copy if any, else the parameter"""
+        master = self.state[param].get('master')
+        return param._data if master is None else master._data
+
+    def _sync_param(self, param):
+        master = self.state[param].get('master')
+        if master is not None:
+            param._data[...] = master._data
+        param._storage_changed()
 
     def zero_grad(self):
         for param in self.params:
@@ -1590,20 +2154,134 @@ class Optimizer:
     def step(self):
         raise NotImplementedError
 
+    def _check_dtypes(self):
+        """Refuse to step parameters cast after construction (stale master/flat buffers)"""
+        for param, dtype in zip(self.params, self._param_dtypes):
+            if param.dtype != dtype:
+                raise RuntimeError(f"Parameter was cast from {dtype} to {param.dtype} after "
+                                   f"{type(self).__name__} was created; create the optimizer after "
+                                   f"Module.half()/.to(dtype)")
+
+    # ==================== FLAT PARAMETER MODE ====================
+    def _flatten(self, state_names):
+        """
+        Pack params, grads and the named per-param state tensors into
+        contiguous buffers and re-bind every tensor as a view into them.
+        """
+        sizes = [param.numel for param in self.params]
+        offsets = np.concatenate(([0], np.cumsum(sizes))).astype(int)
+        total = int(offsets[-1])
+        dtypes = {param.dtype for param in self.params}
+        if len(dtypes) > 1:
+            raise TypeError(f"flat=True requires parameters of one dtype, got {sorted(dtypes)}")
+        dtype = _DTYPES[dtypes.pop() if dtypes else Tensor._default_dtype]
+        state_dtype = np.float32 if dtype == np.float16 else dtype
+
+        def bind(buffer, tensors):
+            for i, t in enumerate(tensors):
+                view = buffer[offsets[i]:offsets[i + 1]].reshape(t.shape)
+                view[...] = t._data
+                t._data = view
+                t._storage_changed()
+
+        self._flat_buffers['param'] = np.empty(total, dtype)
+        bind(self._flat_buffers['param'], self.params)
+
+        self._flat_buffers['grad'] = np.zeros(total, dtype)
+        self._grad_views = [Tensor(np.zeros(p.shape), p.dtype, p.device, False) for p in self.params]
+        bind(self._flat_buffers['grad'], self._grad_views)
+        for param, view in zip(self.params, self._grad_views):
+            param._grad_slot = view
+
+        if dtype == np.float16:
+            state_names = ['master'] + list(state_names)
+        for name in state_names:
+            self._flat_buffers[name] = np.zeros(total, state_dtype)
+            bind(self._flat_buffers[name], [self.state[p][name] for p in self.params])
+
+        self._param_slices = [slice(int(offsets[i]), int(offsets[i + 1])) for i in range(len(self.params))]
+        group_slices, start = [], 0
+        for group in self.param_groups:
+            stop = start + len(group['params'])
+            group_slices.append(slice(int(offsets[start]), int(offsets[stop])))
+            start = stop
+        self._group_slices = group_slices
+
+    def _gather_flat_grads(self):
+        """Make sure every gradient lives in the flat buffer; return params without one"""
+        missing = []
+        for i, (param, view) in enumerate(zip(self.params, self._grad_views)):
+            if param.grad is view:
+                continue
+            if param.grad is None:
+                view._data.fill(0.0)
+                missing.append(i)
+                continue
+            view._data[...] = param.grad._data.reshape(param.shape)
+            param.grad = view
+        return missing
+
+    def _flat_step(self, update):
+        """
+        Run `update(slice, lr)` once per param group, or once per present
+        parameter when some parameters received no gradient this step.
+        """
+        missing = self._gather_flat_grads()
+        grads = self._flat_buffers['grad']
+        index = 0
+        for group, group_slice in zip(self.param_groups, self._group_slices):
+            count = len(group['params'])
+            group_missing = [i for i in missing if index <= i < index + count]
+            if self.quantum_noise > 0 and random.random() < 0.1:
+                segment = grads[group_slice]
+                segment += np.random.normal(0, self.quantum_noise, segment.shape)
+            if group_missing or not update(group_slice, group['lr'], range(index, index + count)):
+                for i in range(index, index + count):
+                    if i not in group_missing:
+                        update(self._param_slices[i], group['lr'], (i,))
+            index += count
+
+        if 'master' in self._flat_buffers:
+            self._flat_buffers['param'][...] = self._flat_buffers['master']
+        for param in self.params:
+            param._storage_changed()
+
+    def _flat_region(self, region):
+        """(weights, grad) arrays for a flat-buffer region; float16 grads are widened"""
+        flat = self._flat_buffers
+        if 'master' not in flat:
+            return flat['param'][region], flat['grad'][region]
+        return flat['master'][region], flat['grad'][region].astype(np.float32)
+
+    def _flush_logs(self):
+        """Emit at most one summarized LASER record per optimizer step"""
+        _logging_policy.flush(type(self).__name__)
+
     def _apply_quantum_noise(self, param, grad):
         """Apply quantum noise only if explicitly enabled"""
         if self.quantum_noise > 0 and random.random() < 0.1:
-            noise = tensor([random.gauss(0, self.quantum_noise) for _ in range(param.numel)])
-            noise = noise.reshape(param.shape)
+            noise = tensor(np.random.normal(0, self.quantum_noise, param.shape))
             grad = grad + noise
         return grad
 
+    def _grouped_grads(self):
+        """Yield (param, grad array, group lr) for every parameter with a gradient"""
+        for group in self.param_groups:
+            for param in group['params']:
+                if param.grad is None:
+                    continue
+                # Apply quantum noise if enabled
+                grad = self._apply_quantum_noise(param, param.grad)._data.reshape(param.shape)
+                if 'master' in self.state[param]:
+                    grad = grad.astype(np.float32)
+                yield param, grad, group['lr']
+
 class SGD(Optimizer):
     """Debugged Stochastic Gradient Descent"""
 
     def __init__(self, params, lr=0.01, momentum=0, dampening=0,
-                 weight_decay=0, nesterov=False, quantum_noise=0.0):
-        super().__init__(params, lr, quantum_noise)
+                 weight_decay=0, nesterov=False, quantum_noise=0.0, flat=False):
+        super().__init__(params, lr, quantum_noise, flat)
         self.momentum = momentum
         self.dampening = dampening
         self.weight_decay = weight_decay
@@ -1611,43 +2289,53 @@ class SGD(Optimizer):
 
         # Initialize momentum buffers
         for param in self.params:
-            self.state[param]['momentum_buffer'] = zeros_like(param)
+            self.state[param]['momentum_buffer'] = self._state_like(param)
 
-    def step(self):
-        for param in self.params:
-            if param.grad is None:
-                continue
+        if flat:
+            self._flatten(['momentum_buffer'])
 
-            grad = param.grad
+    def _update(self, param, grad, buf, lr):
+        """In-place SGD update on parameter/gradient/momentum arrays"""
+        # Apply weight decay
+        if self.weight_decay != 0:
+            grad = grad + self.weight_decay * param
 
-            # Apply weight decay
-            if self.weight_decay != 0:
-                grad = grad + param * self.weight_decay
+        # Apply momentum
+        if self.momentum != 0:
+            buf *= self.momentum
+            buf += (1 - self.dampening) * grad
 
-            # Apply quantum noise if enabled
-            grad = self._apply_quantum_noise(param, grad)
+            if self.nesterov:
+                grad = grad + self.momentum * buf
+            else:
+                grad = buf
 
-            # Apply momentum
-            if self.momentum != 0:
-                buf = self.state[param]['momentum_buffer']
-                buf = self.momentum * buf + (1 - self.dampening) * grad
-                self.state[param]['momentum_buffer'] = buf
+        # Update parameter in place
+        param -= lr * grad
 
-                if self.nesterov:
-                    grad = grad + self.momentum * buf
-                else:
-                    grad = buf
+    def step(self):
+        self._check_dtypes()
+        if self.flat:
+            flat = self._flat_buffers
+
+            def update(region, lr, _indices):
+                self._update(*self._flat_region(region), flat['momentum_buffer'][region], lr)
+                return True
 
-            # Update parameter
-            param._bumpy.data = [x - self.lr * g
-                               for x, g in zip(param._bumpy.data, grad._bumpy.data)]
+            self._flat_step(update)
+        else:
+            for param, grad, lr in self._grouped_grads():
+                self._update(self._weights(param), grad, self.state[param]['momentum_buffer']._data, lr)
+                self._sync_param(param)
+
+        self._flush_logs()
 
 class Adam(Optimizer):
     """Debugged Adam optimizer"""
 
     def __init__(self, params, lr=0.001, betas=(0.9, 0.999), eps=1e-8,
-                 weight_decay=0, amsgrad=False, quantum_noise=0.0):
-        super().__init__(params, lr, quantum_noise)
+                 weight_decay=0, amsgrad=False, quantum_noise=0.0, flat=False):
+        super().__init__(params, lr, quantum_noise, flat)
         self.betas = betas
         self.eps = eps
         self.weight_decay = weight_decay
@@ -1656,45 +2344,70 @@ class Adam(Optimizer):
         # Initialize state
         for param in self.params:
             self.state[param]['step'] = 0
-            self.state[param]['exp_avg'] = zeros_like(param)
-            self.state[param]['exp_avg_sq'] = zeros_like(param)
+            self.state[param]['exp_avg'] = self._state_like(param)
+            self.state[param]['exp_avg_sq'] = self._state_like(param)
             if amsgrad:
-                self.state[param]['max_exp_avg_sq'] = zeros_like(param)
-
-    def step(self):
-        for param in self.params:
-            if param.grad is None:
-                continue
+                self.state[param]['max_exp_avg_sq'] = self._state_like(param)
 
-            grad = param.grad
+        if flat:
+            self._flatten(['exp_avg', 'exp_avg_sq'] + (['max_exp_avg_sq'] if amsgrad else []))
 
-            # Apply weight decay
-            if self.weight_decay != 0:
-                grad = grad + param * self.weight_decay
+    def _update(self, param, grad, exp_avg, exp_avg_sq, max_exp_avg_sq, step, lr):
+        """In-place Adam update on parameter/gradient/moment arrays"""
+        # Apply weight decay
+        if self.weight_decay != 0:
+            grad = grad + self.weight_decay * param
 
-            # Apply quantum noise if enabled
-            grad = self._apply_quantum_noise(param, grad)
+        # Update biased moment estimates
+        beta1, beta2 = self.betas
+        exp_avg *= beta1
+        exp_avg += (1 - beta1) * grad
+        exp_avg_sq *= beta2
+        exp_avg_sq += (1 - beta2) * grad * grad
+        if self.amsgrad:
+            np.maximum(max_exp_avg_sq, exp_avg_sq, out=max_exp_avg_sq)
+            exp_avg_sq = max_exp_avg_sq
 
-            # Get state
-            state = self.state[param]
-            state['step'] += 1
+        # Bias correction
+        bias_correction1 = 1 - beta1 ** step
+        bias_correction2 = 1 - beta2 ** step
 
-            # Update biased moment estimates
-            beta1, beta2 = self.betas
-            state['exp_avg'] = beta1 * state['exp_avg'] + (1 - beta1) * grad
-            state['exp_avg_sq'] = beta2 * state['exp_avg_sq'] + (1 - beta2) * (grad ** 2)
+        step_size = lr / bias_correction1
+        denom = (np.sqrt(exp_avg_sq) / math.sqrt(bias_correction2)) + self.eps
 
-            # Bias correction
-            bias_correction1 = 1 - beta1 ** state['step']
-            bias_correction2 = 1 - beta2 ** state['step']
+        # Update parameter in place
+        param -= step_size * (exp_avg / denom)
 
-            step_size = self.lr / bias_correction1
-            denom = (state['exp_avg_sq'].sqrt() / math.sqrt(bias_correction2)) + self.eps
+    def step(self):
+        self._check_dtypes()
+        if self.flat:
+            flat = self._flat_buffers
+            max_sq = flat.get('max_exp_avg_sq')
+
+            def update(region, lr, indices):
+                # A fused group update needs one shared step count
+                steps = {self.state[self.params[i]]['step'] for i in indices}
+                if len(steps) != 1:
+                    return False
+                for i in indices:
+                    self.state[self.params[i]]['step'] += 1
+                self._update(*self._flat_region(region),
+                             flat['exp_avg'][region], flat['exp_avg_sq'][region],
+                             None if max_sq is None else max_sq[region], steps.pop() + 1, lr)
+                return True
+
+            self._flat_step(update)
+        else:
+            for param, grad, lr in self._grouped_grads():
+                # Get state
+                state = self.state[param]
+                state['step'] += 1
+                max_exp_avg_sq = state['max_exp_avg_sq']._data if self.amsgrad else None
+                self._update(self._weights(param), grad, state['exp_avg']._data, state['exp_avg_sq']._data,
+                             max_exp_avg_sq, state['step'], lr)
+                self._sync_param(param)
 
-            # Update parameter
-            update = state['exp_avg'] / denom
-            param._bumpy.data = [x - step_size * u
-                               for x, u in zip(param._bumpy.data, update._bumpy.data)]
+        self._flush_logs()
 
 # ============================================================================
 # 8. DEBUGGED UTILITY FUNCTIONS
@@ -1713,8 +2426,117 @@ def randn_like(tensor):
     return randn(*tensor.shape, dtype=tensor.dtype, device=tensor.device)
 
 def manual_seed(seed):
-    """Set random seed for reproducibility"""
+    """Set random seed for reproducibility (Python, NumPy and BUMPY generators)"""
     random.seed(seed)
+    np.random.seed(seed)
+    # BUMPY is imported lazily; once loaded, its shared generator follows too
+    bumpy = sys.modules.get('bumpy')
+    if bumpy is not None and hasattr(bumpy, 'seed'):
+        bumpy.seed(seed)
+
+# ---------------- binary checkpoints ----------------
+
+_CHECKPOINT_MAGIC = b'QTCKPT\x00\x01'
+_CHECKPOINT_ALIGNMENT = 64
+
+def _aligned(offset, alignment=_CHECKPOINT_ALIGNMENT):
+    return (offset + alignment - 1) // alignment * alignment
+
+def save(obj, f):
+    """
+    Save a state dict (name -> Tensor/ndarray) to a binary checkpoint.
+
+    Layout: magic | uint64 header length | JSON header | raw buffers. The
+    header records name, dtype, shape and offset per tensor; every buffer
+    starts on a 64-byte boundary so it can be memory-mapped in place.
+    Non-tensor values must be JSON-serializable and live in the header.
+    """
+    arrays = OrderedDict()
+    objects = {}
+    for name, value in obj.items():
+        if isinstance(value, Tensor):
+            arrays[name] = np.ascontiguousarray(value._data)
+        elif isinstance(value, np.ndarray):
+            arrays[name] = np.ascontiguousarray(value)
+        else:
+            objects[name] = value
+
+    entries = OrderedDict()
+    offset = 0
+    for name, arr in arrays.items():
+        offset = _aligned(offset)
+        entries[name] = {'dtype': arr.dtype.str, 'shape': list(arr.shape), 'offset': offset}
+        offset += arr.nbytes
+
+    header = json.dumps({'version': 1, 'alignment': _CHECKPOINT_ALIGNMENT,
+                         'tensors': entries, 'objects': objects}).encode('utf-8')
+    data_start = _aligned(len(_CHECKPOINT_MAGIC) + 8 + len(header))
+
+    def write(out):
+        out.write(_CHECKPOINT_MAGIC)
+        out.write(struct.pack('<Q', len(header)))
+        out.write(header)
+        position = len(_CHECKPOINT_MAGIC) + 8 + len(header)
+        for name, arr in arrays.items():
+            start = data_start + entries[name]['offset']
+            out.write(b'\x00' * (start - position))
+            out.write(memoryview(arr).cast('B'))
+            position = start + arr.nbytes
+
+    if hasattr(f, 'write'):
+        write(f)
+    else:
+        with open(f, 'wb') as out:
+            write(out)
+
+def _read_checkpoint_header(raw, source):
+    prefix = len(_CHECKPOINT_MAGIC) + 8
+    if len(raw) < prefix or raw[:len(_CHECKPOINT_MAGIC)] != _CHECKPOINT_MAGIC:
+        raise ValueError(f"{source} is not a qtorch checkpoint")
+    (header_len,) = struct.unpack('<Q', raw[len(_CHECKPOINT_MAGIC):prefix])
+    return header_len
+
+def load(f, mmap=False):
+    """
+    Load a checkpoint written by qtorch.save into an OrderedDict of Tensors.
+    Arrays of a dtype Tensor does not support (int64, bool, ...) come back
+    as plain ndarrays.
+
+    With `mmap=True` (requires a path) tensors are backed by a
+    copy-on-write memory map: nothing is read until touched, pages are
+    shared between processes, and writes stay private to this process.
+    """
+    if mmap:
+        if hasattr(f, 'read'):
+            raise ValueError("load(mmap=True) requires a file path")
+        with open(f, 'rb') as fh:
+            prefix = fh.read(len(_CHECKPOINT_MAGIC) + 8)
+            header_len = _read_checkpoint_header(prefix, f)
+            header = json.loads(fh.read(header_len))
+        data_start = _aligned(len(prefix) + header_len, header['alignment'])
+        mapped = np.memmap(f, dtype=np.uint8, mode='c')
+        buffer = mapped[data_start:]
+    else:
+        if hasattr(f, 'read'):
+            raw = f.read()
+        else:
+            with open(f, 'rb') as fh:
+                raw = fh.read()
+        header_len = _read_checkpoint_header(raw, getattr(f, 'name', f))
+        prefix = len(_CHECKPOINT_MAGIC) + 8
+        header = json.loads(raw[prefix:prefix + header_len])
+        data_start = _aligned(prefix + header_len, header['alignment'])
+        buffer = np.frombuffer(raw, dtype=np.uint8, offset=data_start).copy()
+
+    state = OrderedDict()
+    for name, entry in header['tensors'].items():
+        dtype = np.dtype(entry['dtype'])
+        count = int(np.prod(entry['shape'], dtype=np.int64))
+        start = entry['offset']
+        arr = buffer[start:start + count * dtype.itemsize].view(dtype).reshape(entry['shape'])
+        state[name] = Tensor(arr, dtype) if dtype.name in _DTYPES else arr
+    state.update(header['objects'])
+    return state
 
 def no_grad():
     """Context manager to disable gradient computation"""
@@ -1826,14 +2648,14 @@ def demonstrate_qtorch():
     # Test quantum operations
     print("\n6. Quantum Operations:")
 
-    if BUMPY_AVAILABLE:
+    if _available('BumpyArray'):
         large_tensor = randn(100)
         compressed = large_tensor.holographic_compress()
         print(f"   Original size: {large_tensor.shape} ({large_tensor.numel} elements)")
         print(f"   Compressed size: {compressed.shape} ({compressed.numel} elements)")
         print(f"   Compression ratio: {compressed.numel/large_tensor.numel:.1%}")
 
-    if FLUMPY_AVAILABLE:
+    if _available('FlumpyArray'):
         rotated = a.apply_quantum_rotation(math.pi / 4)
         print(f"   Quantum rotation applied to tensor a")
         print(f"   Original coherence: {a.quantum_coherence:.3f}")
@@ -1846,15 +2668,16 @@ def demonstrate_qtorch():
     print(f"   Quantum noise in gradients: {'enabled' if optimizer.quantum_noise > 0 else 'disabled'}")
 
     # Test LASER logging
-    if LASER_AVAILABLE:
+    laser = _laser()
+    if laser is not None:
         print("\n8. LASER Logging Statistics:")
-        metrics = LASER.get_metrics_report()
+        metrics = laser.get_metrics_report()
         print(f"   Total logs processed: {metrics['logs_processed']}")
         print(f"   Quantum events: {metrics['quantum_events']}")
         print(f"   Entanglements created: {metrics['entanglements_created']}")
         print(f"   Holographic compressions: {metrics['holographic_compressions']}")
-        LASER.flush()
-        print(f"   Logs flushed to: {LASER.log_path}")
+        laser.flush()
+        print(f"   Logs flushed to: {laser.log_path}")
 
     # Disable quantum creativity
     Tensor.disable_quantum_creativity()
@@ -1871,6 +2694,14 @@ def demonstrate_qtorch():
 class TorchNamespace:
     """Debugged PyTorch-compatible namespace"""
 
+    # Storage dtypes
+    float64 = double = float64
+    float32 = float = float32
+    float16 = half = float16
+    int8 = int8
+    set_default_dtype = set_default_dtype
+    get_default_dtype = get_default_dtype
+
     # Tensor creation
     tensor = tensor
     zeros = zeros
@@ -1885,11 +2716,23 @@ class TorchNamespace:
     # Utility functions
     manual_seed = manual_seed
     no_grad = no_grad
+    save = save
+    load = load
     enable_grad = enable_grad
     zeros_like = zeros_like
     ones_like = ones_like
     randn_like = randn_like
 
+    # Storage backends
+    register_backend = register_backend
+    set_backend = set_backend
+    get_backend = get_backend
+
+    # LASER logging policy
+    LoggingPolicy = LoggingPolicy
+    set_logging_policy = set_logging_policy
+    get_logging_policy = get_logging_policy
+
     # Tensor class
     Tensor = Tensor
 
@@ -1897,7 +2740,9 @@ class TorchNamespace:
     nn = type('nn', (), {
         'Module': Module,
         'Linear': Linear,
+        'LinearReLU': LinearReLU,
         'Conv2d': Conv2d,
+        'BatchNorm1d': BatchNorm1d,
         'BatchNorm2d': BatchNorm2d,
         'Dropout': Dropout,
         'ReLU': ReLU,
@@ -1905,7 +2750,15 @@ class TorchNamespace:
         'Tanh': Tanh,
         'Softmax': Softmax,
         'MSELoss': MSELoss,
-        'CrossEntropyLoss': CrossEntropyLoss
+        'CrossEntropyLoss': CrossEntropyLoss,
+        'functional': type('functional', (), {
+            'linear_relu': linear_relu,
+            'log_softmax': log_softmax,
+            'cross_entropy': cross_entropy,
+            'batch_norm': batch_norm,
+            'relu': lambda x: x.relu(),
+            'softmax': lambda x, dim=-1: x.softmax(dim),
+        })
     })
 
     # Optimizers
@@ -1928,17 +2781,45 @@ class TorchNamespace:
         'enable_gradient_noise': Tensor.enable_quantum_noise_in_gradients
     })
 
-    # LASER integration
-    laser = LASER if LASER_AVAILABLE else None
+    def __getattr__(self, name):
+        # Lazily imported submodules (torch.utils, ...)
+        if name in _LAZY_SUBMODULES:
+            return __getattr__(name)
+        # LASER integration (None when unavailable)
+        if name == 'laser':
+            return _laser()
+        # Phase 3: Deep Quantum Integration (torch.anneal, torch.dissipative)
+        if name in ('anneal', 'dissipative') and _available(name):
+            return _optional(name)
+        raise AttributeError(f"torch namespace has no attribute {name!r}")
 
 # Create global torch object
 torch = TorchNamespace()
 
-# Phase 3: Deep Quantum Integration Exports
-if anneal:
-    torch.anneal = anneal
-if dissipative:
-    torch.dissipative = dissipative
+# Lazily imported submodules (they import qtorch themselves)
+_LAZY_SUBMODULES = {
+    'utils': 'qtorch_utils',
+    'jit': 'qtorch_jit',
+    'distributed': 'qtorch_distributed',
+}
+
+def __getattr__(name):
+    """Resolve qtorch.<submodule> and optional integrations on first access (PEP 562)"""
+    if name in _LAZY_SUBMODULES:
+        module = importlib.import_module(_LAZY_SUBMODULES[name])
+        globals()[name] = module
+        setattr(TorchNamespace, name, module)
+        return module
+    if name in _OPTIONAL_IMPORTS:
+        value = _optional(name)
+        if value is None and name == 'LASER':
+            value = LASERV30()
+    elif name in _AVAILABILITY_FLAGS:
+        value = _available(_AVAILABILITY_FLAGS[name])
+    else:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+    globals()[name] = value
+    return value
 
 # ============================================================================
 # 11. MAIN ENTRY POINT
@@ -1952,10 +2833,10 @@ if __name__ == "__main__":
 
     # Show system status
     print("\n🔧 DEBUGGED SYSTEM STATUS:")
-    print(f"   BUMPY Backend: {'✅ INTEGRATED' if BUMPY_AVAILABLE else '❌ FALLBACK'}")
-    print(f"   FLUMPY Cognitive Layer: {'✅ INTEGRATED' if FLUMPY_AVAILABLE else '❌ FALLBACK'}")
-    print(f"   LASER v3.0 Logging: {'✅ INTEGRATED' if LASER_AVAILABLE else '❌ FALLBACK'}")
-    print(f"   Quantum Features: {'✅ ENABLED' if BUMPY_AVAILABLE or FLUMPY_AVAILABLE else '❌ DISABLED'}")
+    print(f"   BUMPY Backend: {'✅ INTEGRATED' if _available('BumpyArray') else '❌ FALLBACK'}")
+    print(f"   FLUMPY Cognitive Layer: {'✅ INTEGRATED' if _available('FlumpyArray') else '❌ FALLBACK'}")
+    print(f"   LASER v3.0 Logging: {'✅ INTEGRATED' if _available('LASER') else '❌ FALLBACK'}")
+    print(f"   Quantum Features: {'✅ ENABLED' if _available('BumpyArray') or _available('FlumpyArray') else '❌ DISABLED'}")
     print(f"   Initial Quantum Creativity: Ψ={Tensor._global_quantum_creativity:.3f}")
     print(f"   Quantum Noise in Gradients: {'✅ ENABLED' if Tensor._global_quantum_noise_in_gradients else '❌ DISABLED (default for correctness)'}")
 
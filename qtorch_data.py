@@ -0,0 +1,164 @@
+#!/usr/bin/env python3
+"""
+QUANTUM-TORCH DATA PIPELINE - qtorch.utils.data
+================================================================================
+
+Minibatch data loading for qtorch:
+1. Dataset / TensorDataset - indexable sample sources
+2. DataLoader - batching, seeded shuffling, collate_fn
+3. Bounded background prefetch (batch N+1 assembles while N trains)
+
+Datasets that can slice many samples at once may implement
+`get_batch(indices)`; the DataLoader then skips per-sample indexing and
+collation entirely (TensorDataset does this).
+"""
+
+import threading
+from collections import deque
+from concurrent.futures import ThreadPoolExecutor
+
+import numpy as np
+
+import qtorch
+
+# ============================================================================
+# 1. DATASETS
+# ============================================================================
+
+class Dataset:
+    """Base class for map-style datasets: implement __getitem__ and __len__"""
+
+    def __getitem__(self, index):
+        raise NotImplementedError
+
+    def __len__(self):
+        raise NotImplementedError
+
+class TensorDataset(Dataset):
+    """Dataset wrapping tensors (or arrays) that share their first dimension"""
+
+    def __init__(self, *tensors):
+        if not tensors:
+            raise ValueError("TensorDataset requires at least one tensor")
+        self.arrays = [t.data if isinstance(t, qtorch.Tensor) else np.asarray(t, dtype=float)
+                       for t in tensors]
+        size = len(self.arrays[0])
+        if any(len(a) != size for a in self.arrays):
+            raise ValueError("Size mismatch between tensors")
+
+    def __getitem__(self, index):
+        return tuple(qtorch.Tensor(a[index]) for a in self.arrays)
+
+    def __len__(self):
+        return len(self.arrays[0])
+
+    def get_batch(self, indices):
+        """Vectorized fetch: one fancy-index per tensor instead of one Tensor per sample"""
+        return tuple(qtorch.Tensor(a[indices]) for a in self.arrays)
+
+# ============================================================================
+# 2. COLLATION
+# ============================================================================
+
+def default_collate(samples):
+    """Stack a list of samples (tensors, arrays, numbers or tuples of them) into a batch"""
+    first = samples[0]
+    if isinstance(first, (tuple, list)):
+        return type(first)(default_collate(list(field)) for field in zip(*samples))
+    if isinstance(first, dict):
+        return {key: default_collate([s[key] for s in samples]) for key in first}
+    if isinstance(first, qtorch.Tensor):
+        return qtorch.Tensor(np.stack([s.data for s in samples]))
+    return qtorch.Tensor(np.stack([np.asarray(s, dtype=float) for s in samples]))
+
+# ============================================================================
+# 3. DATA LOADER
+# ============================================================================
+
+class DataLoader:
+    """
+    Iterates a Dataset in minibatches.
+
+    Args:
+        dataset: map-style Dataset
+        batch_size: samples per batch
+        shuffle: reshuffle indices every epoch
+        generator: seed (int) or numpy Generator driving the shuffle; when
+            None a seed is drawn from numpy's global RNG (see qtorch.manual_seed)
+        collate_fn: merges a list of samples into a batch (default_collate)
+        drop_last: drop the final incomplete batch
+        num_workers: background threads assembling batches (0 = in the
+            calling thread)
+        prefetch_factor: batches queued ahead per worker; the queue is
+            bounded at num_workers * prefetch_factor
+    """
+
+    def __init__(self, dataset, batch_size=1, shuffle=False, generator=None,
+                 collate_fn=None, drop_last=False, num_workers=0, prefetch_factor=2):
+        if batch_size < 1:
+            raise ValueError(f"batch_size must be positive, got {batch_size}")
+        if num_workers < 0 or prefetch_factor < 1:
+            raise ValueError("num_workers must be >= 0 and prefetch_factor >= 1")
+        self.dataset = dataset
+        self.batch_size = batch_size
+        self.shuffle = shuffle
+        self.collate_fn = collate_fn
+        self.drop_last = drop_last
+        self.num_workers = num_workers
+        self.prefetch_factor = prefetch_factor
+
+        if generator is None:
+            generator = int(np.random.randint(2 ** 31))
+        if not isinstance(generator, np.random.Generator):
+            generator = np.random.default_rng(generator)
+        self.generator = generator
+        self._lock = threading.Lock()
+
+    def __len__(self):
+        n = len(self.dataset)
+        if self.drop_last:
+            return n // self.batch_size
+        return (n + self.batch_size - 1) // self.batch_size
+
+    def _batch_indices(self):
+        n = len(self.dataset)
+        order = self.generator.permutation(n) if self.shuffle else np.arange(n)
+        stop = n - n % self.batch_size if self.drop_last else n
+        return [order[i:i + self.batch_size] for i in range(0, stop, self.batch_size)]
+
+    def _fetch(self, indices):
+        if self.collate_fn is None and hasattr(self.dataset, 'get_batch'):
+            return self.dataset.get_batch(indices)
+        collate = self.collate_fn or default_collate
+        return collate([self.dataset[int(i)] for i in indices])
+
+    def __iter__(self):
+        with self._lock:
+            batches = self._batch_indices()
+        if self.num_workers == 0:
+            for indices in batches:
+                yield self._fetch(indices)
+            return
+        yield from self._prefetching_iter(batches)
+
+    def _prefetching_iter(self, batches):
+        """Keep up to num_workers * prefetch_factor batches in flight, yielded in order"""
+        depth = self.num_workers * self.prefetch_factor
+        pending = deque()
+        pool = ThreadPoolExecutor(max_workers=self.num_workers, thread_name_prefix='qtorch-data')
+        try:
+            remaining = iter(batches)
+            for indices in remaining:
+                pending.append(pool.submit(self._fetch, indices))
+                if len(pending) >= depth:
+                    break
+            while pending:
+                batch = pending.popleft().result()
+                next_indices = next(remaining, None)
+                if next_indices is not None:
+                    pending.append(pool.submit(self._fetch, next_indices))
+                yield batch
+        finally:
+            for future in pending:
+                future.cancel()
+            pool.shutdown(wait=True)
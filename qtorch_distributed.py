@@ -0,0 +1,194 @@
+#!/usr/bin/env python3
+"""
+QUANTUM-TORCH LOCAL DATA PARALLELISM - qtorch.distributed
+================================================================================
+
+Single-host data-parallel training without the GIL:
+1. spawn() - start N worker processes, each running fn(rank, group, *args)
+2. ProcessGroup - collectives over one multiprocessing.shared_memory block
+3. all_reduce_gradients() - average replica gradients before Optimizer.step
+
+all_reduce follows the two phases of a ring all-reduce. In reduce-scatter
+each rank sums one chunk across every rank's slot, always in rank order,
+so all replicas get bitwise-identical results. In all-gather every rank
+copies the reduced chunks back. Shared memory replaces the ring's
+point-to-point messages, and a Barrier separates the phases.
+"""
+
+import queue
+import traceback
+import multiprocessing
+from multiprocessing import shared_memory
+
+import numpy as np
+
+import qtorch
+
+DEFAULT_CAPACITY = 1 << 20  # float64 elements per rank slot (8 MiB)
+
+# ============================================================================
+# 1. PROCESS GROUP
+# ============================================================================
+
+class ProcessGroup:
+    """
+    Collectives for one rank. The shared block holds world_size input slots
+    plus one result slot, each `capacity` float64 elements; larger arrays
+    are reduced in capacity-sized pieces.
+    """
+
+    def __init__(self, rank, world_size, shm_name, capacity, barrier):
+        self.rank = rank
+        self.world_size = world_size
+        self.capacity = capacity
+        self._barrier = barrier
+        self._shm = shared_memory.SharedMemory(name=shm_name)
+        self._slots = np.ndarray((world_size + 1, capacity), dtype=np.float64, buffer=self._shm.buf)
+
+    def barrier(self):
+        self._barrier.wait()
+
+    def all_reduce(self, array, op='sum'):
+        """Reduce a float64 ndarray across ranks in place ('sum' or 'mean')"""
+        if op not in ('sum', 'mean'):
+            raise ValueError(f"Unsupported reduce op: {op}")
+        flat = array.reshape(-1)
+        if not np.shares_memory(flat, array):
+            raise ValueError("all_reduce requires a contiguous array")
+        for start in range(0, flat.size, self.capacity):
+            self._all_reduce_piece(flat[start:start + self.capacity])
+        if op == 'mean':
+            flat /= self.world_size
+        return array
+
+    def _all_reduce_piece(self, piece):
+        n = piece.size
+        inputs, result = self._slots[:self.world_size], self._slots[self.world_size]
+        inputs[self.rank, :n] = piece
+        self.barrier()
+
+        # Reduce-scatter: this rank owns one contiguous chunk of the result
+        bounds = np.linspace(0, n, self.world_size + 1).astype(int)
+        lo, hi = bounds[self.rank], bounds[self.rank + 1]
+        np.sum(inputs[:, lo:hi], axis=0, out=result[lo:hi])
+        self.barrier()
+
+        # All-gather: every rank reads the full reduced vector
+        piece[...] = result[:n]
+
+    def broadcast(self, array, src=0):
+        """Copy `array` from rank `src` into every rank's array in place"""
+        flat = array.reshape(-1)
+        # The result slot is reused: a preceding all_reduce may still be
+        # reading it on slower ranks
+        self.barrier()
+        for start in range(0, flat.size, self.capacity):
+            piece = flat[start:start + self.capacity]
+            if self.rank == src:
+                self._slots[self.world_size, :piece.size] = piece
+            self.barrier()
+            piece[...] = self._slots[self.world_size, :piece.size]
+            self.barrier()
+        return array
+
+    def close(self):
+        self._slots = None
+        self._shm.close()
+
+# ============================================================================
+# 2. GRADIENT HELPERS
+# ============================================================================
+
+def _grad_buffer(params):
+    """Every parameter's gradient (zeros where missing) as one flat array"""
+    for param in params:
+        if param.grad is None:
+            param.grad = qtorch.Tensor(np.zeros(param.shape))
+    return np.concatenate([param.grad._data.reshape(-1) for param in params])
+
+def all_reduce_gradients(params, group):
+    """Average gradients across replicas; written back in place (flat optimizer views survive)"""
+    params = list(params)
+    if group.world_size == 1 or not params:
+        return
+    buffer = group.all_reduce(_grad_buffer(params), op='mean')
+    offset = 0
+    for param in params:
+        size = param.grad._data.size
+        param.grad._data.reshape(-1)[...] = buffer[offset:offset + size]
+        param.grad._storage_changed()
+        offset += size
+
+def broadcast_parameters(params, group, src=0):
+    """Make every replica start from rank `src`'s parameter values"""
+    params = list(params)
+    if group.world_size == 1 or not params:
+        return
+    buffer = group.broadcast(np.concatenate([p._data.reshape(-1) for p in params]), src)
+    offset = 0
+    for param in params:
+        param._data.reshape(-1)[...] = buffer[offset:offset + param.numel]
+        param._storage_changed()
+        offset += param.numel
+
+# ============================================================================
+# 3. LAUNCHER
+# ============================================================================
+
+def _worker(fn, rank, world_size, shm_name, capacity, barrier, results, args):
+    group = ProcessGroup(rank, world_size, shm_name, capacity, barrier)
+    try:
+        results.put((rank, True, fn(rank, group, *args)))
+    except BaseException:
+        # Release peers blocked in a collective before reporting
+        barrier.abort()
+        results.put((rank, False, traceback.format_exc()))
+    finally:
+        group.close()
+
+def spawn(fn, nprocs, args=(), capacity=DEFAULT_CAPACITY, start_method=None):
+    """
+    Run fn(rank, group, *args) in `nprocs` worker processes and return the
+    per-rank return values (which must be picklable) in rank order.
+
+    With the 'spawn' start method `fn` must be importable at module level.
+    A failure in any worker raises RuntimeError with its traceback.
+    """
+    if nprocs < 1:
+        raise ValueError(f"nprocs must be positive, got {nprocs}")
+    ctx = multiprocessing.get_context(start_method)
+    shm = shared_memory.SharedMemory(create=True, size=(nprocs + 1) * capacity * 8)
+    try:
+        barrier = ctx.Barrier(nprocs)
+        results = ctx.Queue()
+        workers = [ctx.Process(target=_worker, name=f'qtorch-rank{rank}',
+                               args=(fn, rank, nprocs, shm.name, capacity, barrier, results, args))
+                   for rank in range(nprocs)]
+        for worker in workers:
+            worker.start()
+
+        outputs, failures = {}, []
+        while len(outputs) + len(failures) < nprocs:
+            try:
+                rank, ok, value = results.get(timeout=0.5)
+            except queue.Empty:
+                # A worker killed outright (e.g. by a signal) never reports back
+                dead = [w for w in workers if w.exitcode not in (None, 0)]
+                if dead:
+                    barrier.abort()
+                    failures.extend(f"{w.name} exited with code {w.exitcode}" for w in dead)
+                    break
+                continue
+            if ok:
+                outputs[rank] = value
+            else:
+                failures.append(f"rank {rank}:\n{value}")
+        for worker in workers:
+            worker.join()
+    finally:
+        shm.close()
+        shm.unlink()
+
+    if failures:
+        raise RuntimeError("Worker process failed\n" + "\n".join(failures))
+    return [outputs[rank] for rank in range(nprocs)]
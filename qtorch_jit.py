@@ -0,0 +1,283 @@
+#!/usr/bin/env python3
+"""
+QUANTUM-TORCH TRACE-AND-REPLAY INFERENCE - qtorch.jit
+================================================================================
+
+`trace(module, example_input)` runs the module once in eval mode, reads the
+op sequence back off the autograd tape and compiles it into a static plan:
+1. Parameters and other input-independent values are frozen as constants
+2. Eval-mode batch norm is folded into a preceding Conv2d/Linear
+3. Every step writes into an output buffer pre-allocated from the traced shape
+4. Replay runs raw NumPy kernels: no _ctx, requires_grad, entanglement or logging
+
+The plan is specialized to the example input's shape and to the parameter
+values at trace time; re-trace after changing either.
+"""
+
+import numpy as np
+
+import qtorch
+
+# ============================================================================
+# 1. REPLAY KERNELS: fn(out, *args) -> value (normally `out` itself)
+# ============================================================================
+
+def _assign(compute):
+    """Wrap a kernel without an `out=` form so it still lands in its buffer"""
+    def kernel(out, *args):
+        np.copyto(out, np.reshape(compute(*args), out.shape))
+        return out
+    return kernel
+
+def _linear_kernel(relu):
+    def kernel(out, x, weight_t, bias):
+        np.matmul(x, weight_t, out=out)
+        if bias is not None:
+            out += bias
+        if relu:
+            np.maximum(out, 0.0, out=out)
+        return out
+    return kernel
+
+def _conv2d_kernel(kernel_size, stride, padding):
+    k_h, k_w = kernel_size
+    def kernel(out, x, weight_mat, bias):
+        cols, _, _ = qtorch._im2col(x, k_h, k_w, stride, padding)
+        flat = out.reshape(out.shape[0], out.shape[1], -1)
+        np.matmul(weight_mat, cols, out=flat)
+        if bias is not None:
+            flat += bias
+        return out
+    return kernel
+
+def _affine_kernel(out, x, scale, shift):
+    np.multiply(x, scale, out=out)
+    out += shift
+    return out
+
+def _cast_kernel(out, a):
+    """`out` was allocated in the target dtype"""
+    np.copyto(out, a, casting='unsafe')
+    return out
+
+_ELEMENTWISE = {
+    'add': lambda out, a, b: np.add(a, b, out=out),
+    'sub': lambda out, a, b: np.subtract(a, b, out=out),
+    'mul': lambda out, a, b: np.multiply(a, b, out=out),
+    'div': _assign(lambda a, b: qtorch._backend.div(a, b)),
+    'neg': lambda out, a: np.negative(a, out=out),
+    'relu': lambda out, a: np.maximum(a, 0.0, out=out),
+    'sigmoid': _assign(lambda a: qtorch._backend.sigmoid(a)),
+    'tanh': lambda out, a: np.tanh(a, out=out),
+    'cast': _cast_kernel,
+}
+
+# ============================================================================
+# 2. TRACED MODULE
+# ============================================================================
+
+class TracedModule:
+    """Static replay plan produced by trace(); call it like the original module"""
+
+    def __init__(self, input_shape, values, steps, output_index, ops):
+        self.input_shape = input_shape
+        self._values = values
+        self._steps = steps
+        self._output_index = output_index
+        self.ops = ops
+
+    def __call__(self, x):
+        return self.forward(x)
+
+    def forward(self, x):
+        data = x._data if isinstance(x, qtorch.Tensor) else np.asarray(x, dtype=float)
+        if data.shape != self.input_shape:
+            raise ValueError(f"Traced for input shape {self.input_shape}, got {data.shape}")
+        values = self._values
+        values[0] = data
+        for kernel, out, arg_indices, out_index in self._steps:
+            values[out_index] = kernel(out, *[values[i] for i in arg_indices])
+        result = values[self._output_index].copy()
+        values[0] = None
+        return qtorch.Tensor(result, result.dtype)
+
+    def __repr__(self):
+        return f"TracedModule(input_shape={self.input_shape}, ops=[{', '.join(self.ops)}])"
+
+# ============================================================================
+# 3. TRACING
+# ============================================================================
+
+def _consumers(order):
+    counts = {}
+    for node in order:
+        for parent in qtorch._graph_parents(node):
+            counts[id(parent)] = counts.get(id(parent), 0) + 1
+    return counts
+
+def _fold_batch_norm(order, output):
+    """
+    Find eval-mode batch norms whose input comes straight from a conv2d or
+    2D linear node with no other consumer. Returns id(producer) -> (scale,
+    shift) to fold into the producer, and the ids of the absorbed nodes.
+    """
+    consumers = _consumers(order)
+    folded, skipped = {}, set()
+    for node in order:
+        if not node._ctx or node._ctx[0] != 'batch_norm':
+            continue
+        _, x, weight, bias, mean, inv_std, _, training = node._ctx
+        producer = x._ctx[0] if x._ctx else None
+        if training or producer not in ('linear', 'conv2d') or consumers.get(id(x)) != 1 or x is output:
+            continue
+        if producer == 'linear' and x.ndim != 2:
+            continue
+        scale = inv_std * (1.0 if weight is None else weight._data)
+        shift = (0.0 if bias is None else bias._data) - mean * scale
+        folded[id(x)] = (scale, shift)
+        skipped.add(id(node))
+    return folded, skipped
+
+def trace(module, example_input, check_trace=True, rtol=1e-7, atol=1e-9):
+    """
+    Record `module(example_input)` into a TracedModule.
+
+    The module runs in eval mode with quantum creativity disabled (its
+    random output perturbations are a side effect, not part of the graph)
+    and both settings are restored afterwards. Ops outside the autograd
+    tape (e.g. checkpointed regions) cannot be traced. With `check_trace`
+    the replay is compared against the eager output, with rtol/atol widened
+    to the resolution of the least precise floating dtype in the graph.
+    """
+    example = example_input._data if isinstance(example_input, qtorch.Tensor) \
+        else qtorch.Tensor(example_input)._data
+
+    was_training = module.training
+    creativity = qtorch.Tensor._global_quantum_creativity
+    module.eval()
+    qtorch.Tensor._global_quantum_creativity = 0.0
+    try:
+        with qtorch.enable_grad():
+            x = qtorch.Tensor(example.copy(), requires_grad=True)
+            output = module(x)
+    finally:
+        module.train(was_training)
+        qtorch.Tensor._global_quantum_creativity = creativity
+
+    if not isinstance(output, qtorch.Tensor):
+        raise TypeError(f"trace expects the module to return a Tensor, got {type(output).__name__}")
+    order = qtorch._topological_order(output)
+    if not any(node is x for node in order):
+        raise RuntimeError("Traced output does not depend on the input through recorded ops")
+
+    folded, skipped = _fold_batch_norm(order, output)
+    values = [None]
+    slots = {id(x): 0}
+    steps, ops = [], []
+
+    def slot(arg):
+        """Index of an op argument: traced value, or a new frozen constant"""
+        if isinstance(arg, qtorch.Tensor):
+            if id(arg) not in slots:
+                slots[id(arg)] = constant(arg._data.copy())
+            return slots[id(arg)]
+        return constant(arg)
+
+    def constant(value):
+        values.append(value)
+        return len(values) - 1
+
+    for node in order:
+        if node is x or not node._ctx:
+            continue
+        if id(node) in skipped:
+            # Folded into its producer: alias the producer's slot
+            slots[id(node)] = slots[id(node._ctx[1])]
+            continue
+        op, *args = node._ctx
+        kernel, arg_slots, label, is_view = _compile_node(op, args, node, folded.get(id(node)), slot, constant)
+        values.append(None)
+        slots[id(node)] = len(values) - 1
+        out = None if is_view else np.empty(node.shape, node._data.dtype)
+        steps.append((kernel, out, arg_slots, len(values) - 1))
+        ops.append(label)
+
+    traced = TracedModule(example.shape, values, steps, slots[id(output)], ops)
+    if check_trace:
+        resolution = max((np.finfo(node._data.dtype).resolution for node in order
+                          if np.issubdtype(node._data.dtype, np.floating)), default=0.0)
+        rtol, atol = max(rtol, resolution), max(atol, resolution)
+        replayed = traced(example).data
+        if replayed.shape != output.shape or not np.allclose(replayed, output._data, rtol=rtol, atol=atol):
+            raise RuntimeError("Traced graph does not reproduce the eager output")
+    return traced
+
+def _compile_node(op, args, node, fold, slot, constant):
+    """
+    Return (kernel, arg_slots, label, is_view). View ops (reshape/transpose)
+    get no buffer; their kernel ignores `out` and returns a view.
+    """
+    if op in _ELEMENTWISE:
+        return _ELEMENTWISE[op], [slot(a) for a in args[:2 if op in ('add', 'sub', 'mul', 'div') else 1]], op, False
+    if op == 'pow':
+        x, exponent = args
+        return _assign(lambda a, e: qtorch._backend.pow(a, e)), [slot(x), slot(exponent)], op, False
+    if op in ('matmul', 'dot'):
+        a, b = args
+        if op == 'matmul' and a.ndim >= 2 and b.ndim >= 2:
+            return (lambda out, p, q: np.matmul(p, q, out=out)), [slot(a), slot(b)], op, False
+        compute = np.matmul if op == 'matmul' else (lambda p, q: np.sum(p * q))
+        return _assign(compute), [slot(a), slot(b)], op, False
+    if op in ('sum', 'mean'):
+        x, dim, keepdim = args[:3]
+        reduce = np.sum if op == 'sum' else np.mean
+        if dim is None:
+            return _assign(lambda a: reduce(a)), [slot(x)], op, False
+        return _assign(lambda a: reduce(a, axis=dim, keepdims=keepdim)), [slot(x)], op, False
+    if op == 'softmax':
+        x, dim = args[:2]
+        return _assign(lambda a: qtorch._backend.softmax(a, axis=dim)), [slot(x)], op, False
+    if op == 'log_softmax':
+        x, dim = args[:2]
+        return _assign(lambda a: qtorch._log_softmax_data(a, dim)[0]), [slot(x)], op, False
+    if op == 'reshape':
+        x, shape = args
+        return (lambda out, a: a.reshape(shape)), [slot(x)], op, True
+    if op == 'transpose':
+        x, dim0, dim1 = args
+        return (lambda out, a: np.swapaxes(a, dim0, dim1)), [slot(x)], op, True
+    if op in ('linear', 'linear_relu'):
+        x, weight, bias, scale = args[:4]
+        weight_data = weight._data * scale
+        bias_data = None if bias is None else bias._data * scale
+        label = op
+        if fold is not None:
+            fold_scale, fold_shift = fold
+            weight_data = weight_data * fold_scale[:, None]
+            bias_data = (0.0 if bias_data is None else bias_data) * fold_scale + fold_shift
+            label = 'linear+batch_norm'
+        weight_t = np.ascontiguousarray(weight_data.T)
+        return _linear_kernel(op == 'linear_relu'), [slot(x), constant(weight_t), constant(bias_data)], label, False
+    if op == 'conv2d':
+        x, weight, bias, stride, padding = args[:5]
+        out_channels = weight.shape[0]
+        weight_mat = weight._data.reshape(out_channels, -1)
+        bias_data = None if bias is None else bias._data
+        label = op
+        if fold is not None:
+            fold_scale, fold_shift = fold
+            weight_mat = weight_mat * fold_scale[:, None]
+            bias_data = (0.0 if bias_data is None else bias_data) * fold_scale + fold_shift
+            label = 'conv2d+batch_norm'
+        bias_col = None if bias_data is None else np.asarray(bias_data).reshape(-1, 1)
+        kernel = _conv2d_kernel(weight.shape[2:], stride, padding)
+        return kernel, [slot(x), constant(np.ascontiguousarray(weight_mat)), constant(bias_col)], label, False
+    if op == 'batch_norm':
+        x, weight, bias, mean, inv_std, _, training = args
+        if training:
+            raise RuntimeError("Cannot trace batch_norm in training mode")
+        scale = inv_std * (1.0 if weight is None else weight._data)
+        shift = (0.0 if bias is None else bias._data) - mean * scale
+        return _affine_kernel, [slot(x), constant(qtorch._channel_view(scale, node.ndim)),
+                                 constant(qtorch._channel_view(shift, node.ndim))], op, False
+    raise RuntimeError(f"Cannot trace op {op!r}")
@@ -0,0 +1,71 @@
+#!/usr/bin/env python3
+"""
+QUANTUM-TORCH UTILITIES - qtorch.utils
+================================================================================
+
+Namespace mirroring torch.utils:
+- data: Dataset, TensorDataset, DataLoader (qtorch_data)
+- checkpoint: activation checkpointing (recompute in backward)
+"""
+
+import random
+
+import numpy as np
+
+import qtorch
+import qtorch_data as data
+
+# ============================================================================
+# ACTIVATION CHECKPOINTING
+# ============================================================================
+
+def checkpoint(fn, *inputs):
+    """
+    Run `fn(*inputs)` without keeping its intermediate activations.
+
+    The forward pass runs under no_grad(), so only the inputs and the output
+    stay reachable from the graph. During backward, `fn` is re-run on
+    detached copies of the inputs with the Python and NumPy RNG states
+    restored (so Dropout and quantum-creative Module.__call__ noise replay
+    identically). Gradients then flow to the inputs and to any parameters
+    used inside `fn`.
+
+    Under no_grad() this is a plain call. `fn` must return a single Tensor.
+    """
+    if not qtorch.Tensor._grad_enabled:
+        return fn(*inputs)
+
+    rng_state = (random.getstate(), np.random.get_state())
+    with qtorch.no_grad():
+        result = fn(*inputs)
+    if not isinstance(result, qtorch.Tensor):
+        raise TypeError(f"checkpoint: fn must return a Tensor, got {type(result).__name__}")
+
+    def backward(grad):
+        saved_state = (random.getstate(), np.random.get_state())
+        random.setstate(rng_state[0])
+        np.random.set_state(rng_state[1])
+        try:
+            detached = [_detached_input(x) for x in inputs]
+            with qtorch.enable_grad():
+                recomputed = fn(*detached)
+            if recomputed.requires_grad:
+                qtorch._run_backward(recomputed, grad)
+        finally:
+            random.setstate(saved_state[0])
+            np.random.set_state(saved_state[1])
+
+        return tuple((x, d.grad.data) for x, d in zip(inputs, detached)
+                     if isinstance(x, qtorch.Tensor) and d.grad is not None)
+
+    output = qtorch.Tensor(result.data, result.dtype, result.device, True,
+                           quantum_creativity=result.quantum_creativity)
+    output._ctx = ('function', backward) + tuple(inputs)
+    return output
+
+def _detached_input(x):
+    """Graph-free alias of an input that shares its storage"""
+    if not isinstance(x, qtorch.Tensor):
+        return x
+    return qtorch.Tensor(x.data, x.dtype, x.device, x.requires_grad,
+                         quantum_creativity=x.quantum_creativity)
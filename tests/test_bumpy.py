@@ -0,0 +1,335 @@
+import gc
+import os
+import sys
+import random
+import unittest
+from array import array
+
+import numpy as np
+
+sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+import bumpy
+from bumpy import BumpyArray
+
+SOAK_ITERATIONS = int(os.environ.get('BUMPY_SOAK_ITERATIONS', 1_000_000))
+
+
+def _rss_bytes():
+    """Current resident set size, or None where /proc is unavailable"""
+    try:
+        with open('/proc/self/statm') as f:
+            return int(f.read().split()[1]) * os.sysconf('SC_PAGE_SIZE')
+    except (OSError, ValueError, AttributeError):
+        return None
+
+
+class TestCompactMode(unittest.TestCase):
+
+    def setUp(self):
+        bumpy.seed(0)
+        self.values = [0.5, -1.25, 2.0, 3.5, -0.75, 1.0]
+        self.other = [1.5, 0.25, -2.0, 0.5, 4.0, -1.0]
+
+    def pair(self, values, coherence=0.9):
+        """The same data as a list-mode and a compact array with matching random fields"""
+        loose = BumpyArray(values, coherence)
+        compact = BumpyArray(values, coherence, compact=True)
+        compact.chaos, compact.phase = loose.chaos, loose.phase
+        return loose, compact
+
+    def test_buffer_storage_and_lazy_compressor(self):
+        """Verifies compact arrays store an array('d') buffer and build the compressor on first use."""
+        arr = BumpyArray(self.values, compact=True)
+        self.assertIsInstance(arr.data, array)
+        self.assertEqual(arr.data.typecode, 'd')
+        self.assertEqual(arr.shape, (len(self.values),))
+        self.assertIsNone(arr._holographic_compressor)
+        compressed = arr.holographic_compress()
+        self.assertIsNotNone(arr._holographic_compressor)
+        self.assertTrue(compressed.compact)
+
+    def test_numpy_input_is_copied(self):
+        """Verifies a compact array copies NumPy input of any float dtype instead of aliasing it."""
+        source = np.array(self.values)
+        arr = BumpyArray(source, compact=True)
+        source[0] = 99.0
+        self.assertEqual(arr.data[0], self.values[0])
+        self.assertEqual(list(BumpyArray(source.astype(np.float32), compact=True).data)[1], -1.25)
+
+    def test_ops_match_list_mode(self):
+        """Verifies compact arithmetic, activations and dot match list mode and stay compact."""
+        a_list, a_compact = self.pair(self.values)
+        b_list, b_compact = self.pair(self.other)
+        cases = [
+            (a_list + b_list, a_compact + b_compact),
+            (a_list * b_list, a_compact * b_compact),
+            (a_list.relu(), a_compact.relu()),
+            (a_list.softmax(), a_compact.softmax()),
+        ]
+        for expected, actual in cases:
+            self.assertTrue(actual.compact)
+            np.testing.assert_allclose(list(actual.data), expected.data, rtol=1e-12)
+        self.assertAlmostEqual(a_compact.dot(b_compact), a_list.dot(b_list), places=12)
+
+    def test_scalar_operands_are_streamed(self):
+        """Verifies scalar operands match list mode and still record one entanglement link."""
+        a_list, a_compact = self.pair(self.values)
+        np.testing.assert_allclose(list((a_compact + 2).data), (a_list + 2).data, rtol=1e-12)
+        np.testing.assert_allclose(list((a_compact * 0.5).data), (a_list * 0.5).data, rtol=1e-12)
+        self.assertEqual(len((a_compact * 3).entanglement_links), 1)
+
+    def test_relu_uses_resonance_guidance(self):
+        """Verifies compact relu applies zero-padded resonance guidance like list mode."""
+        a_list, a_compact = self.pair(self.values)
+        # Compact mode pads short guidance with zeros; list mode needs it spelled out
+        a_compact.resonance_guidance = [1.0, 2.0, -3.0]
+        a_list.resonance_guidance = [1.0, 2.0, -3.0, 0.0, 0.0, 0.0]
+        np.testing.assert_allclose(list(a_compact.relu().data), a_list.relu().data, rtol=1e-12)
+
+
+class TestSharedGenerator(unittest.TestCase):
+
+    def test_seeded_fields_are_reproducible(self):
+        """Verifies bumpy.seed() makes the random phase and chaos fields repeatable."""
+        bumpy.seed(123)
+        first = [(a.phase, a.chaos) for a in (BumpyArray([1.0]), BumpyArray([2.0], compact=True))]
+        bumpy.seed(123)
+        second = [(a.phase, a.chaos) for a in (BumpyArray([1.0]), BumpyArray([2.0], compact=True))]
+        self.assertEqual(first, second)
+
+    def test_global_random_state_is_untouched(self):
+        """Verifies array construction draws from bumpy's generator, not the random module."""
+        state = random.getstate()
+        for _ in range(10):
+            BumpyArray([1.0, 2.0], compact=True)
+        self.assertEqual(random.getstate(), state)
+
+
+class TestEntanglementGraph(unittest.TestCase):
+
+    def setUp(self):
+        self.graph = bumpy.entanglement_graph
+        self.max_degree = self.graph.max_degree
+        self.graph.clear()
+
+    def tearDown(self):
+        self.graph.max_degree = self.max_degree
+        bumpy.set_arithmetic_entanglement(True)
+        self.graph.clear()
+
+    def test_links_are_weak_and_pruned_on_collection(self):
+        """Verifies links do not keep arrays alive and vanish once the peer is collected."""
+        a = BumpyArray([1.0, 2.0, 3.0])
+        b = BumpyArray([1.0, 2.0, 3.1])
+        self.assertTrue(a.entangle(b))
+        self.assertFalse(a.entangle(b))
+        self.assertEqual(a.entanglement_links, [b])
+        del b
+        gc.collect()
+        self.assertEqual(a.entanglement_links, [])
+        self.assertEqual(len(self.graph), 0)
+
+    def test_max_degree_drops_oldest_link(self):
+        """Verifies a node over max_degree drops its oldest link on both ends."""
+        self.graph.max_degree = 3
+        hub = BumpyArray([1.0, 1.0])
+        spokes = [BumpyArray([1.0, 1.0 + i * 0.01]) for i in range(5)]
+        for spoke in spokes:
+            self.assertTrue(hub.entangle(spoke))
+        self.assertEqual(hub.entanglement_links, spokes[2:])
+        self.assertEqual(spokes[0].entanglement_links, [])
+
+    def test_component_traversal(self):
+        """Verifies entangled_component() returns the whole chain and is repeatable."""
+        chain_ = [BumpyArray([1.0, 2.0 + i * 0.01]) for i in range(4)]
+        for left, right in zip(chain_, chain_[1:]):
+            left.entangle(right)
+        loner = BumpyArray([-1.0, 5.0])
+        self.assertEqual({id(a) for a in chain_[2].entangled_component()}, {id(a) for a in chain_})
+        self.assertEqual(loner.entangled_component(), [loner])
+        # A second traversal is not confused by the first one's stamps
+        self.assertEqual(len(chain_[0].entangled_component()), 4)
+
+    def test_arithmetic_switch(self):
+        """Verifies set_arithmetic_entanglement(False) stops ops from linking but keeps explicit entangle()."""
+        a, b = BumpyArray([1.0, 2.0]), BumpyArray([1.0, 2.1])
+        self.assertTrue(bumpy.set_arithmetic_entanglement(False))
+        for result in (a + b, a * b, a.relu(), a.softmax(), a * 2):
+            self.assertEqual(result.entanglement_links, [])
+        self.assertEqual(len(self.graph), 0)
+        self.assertTrue(a.entangle(b))  # explicit entanglement still works
+        self.assertFalse(bumpy.set_arithmetic_entanglement(True))
+        self.assertIn(a, (a + b).entanglement_links)
+
+    def test_soak_rss_stays_flat(self):
+        """Verifies a long chain of additions keeps RSS and the graph size flat."""
+        if _rss_bytes() is None:
+            self.skipTest("RSS is only measured through /proc")
+        x = BumpyArray([0.25, 0.5, 0.75, 1.0])
+        acc = BumpyArray([1.0, 1.0, 1.0, 1.0])
+        warmup = min(50_000, SOAK_ITERATIONS // 10)
+        for _ in range(warmup):
+            acc = acc + x
+        gc.collect()
+        baseline = _rss_bytes()
+        for _ in range(SOAK_ITERATIONS - warmup):
+            acc = acc + x
+        gc.collect()
+        growth = _rss_bytes() - baseline
+        self.assertLess(growth, 4 * 2**20, f"RSS grew {growth / 2**20:.1f} MiB over {SOAK_ITERATIONS:,} additions")
+        self.assertLessEqual(len(self.graph), 3)
+        self.assertLessEqual(len(x.entanglement_links), 1)
+
+
+class _Key:
+    """Weak-referenceable stand-in for an array"""
+
+
+class TestBoundedStore(unittest.TestCase):
+
+    def test_collected_key_is_not_confused_with_id_reuse(self):
+        """Verifies a new object reusing a collected key's id does not see its value."""
+        store = bumpy.BoundedStore(2**20)
+        key = _Key()
+        store.put(key, 'stale')
+        stale_id = id(key)
+        del key
+        gc.collect()
+        # Allocate until CPython hands out the collected key's address again
+        fresh = [_Key() for _ in range(1000)]
+        reused = next((k for k in fresh if id(k) == stale_id), None)
+        self.assertEqual(len(store), 0)
+        self.assertEqual(store.stats()['expirations'], 1)
+        if reused is not None:
+            self.assertIsNone(store.get(reused))
+        self.assertNotIn(fresh[0], store)
+
+    def test_identity_is_checked_even_before_expiry_is_seen(self):
+        """Verifies lookups check key identity even before the weakref callback has run."""
+        store = bumpy.BoundedStore(2**20)
+        key = _Key()
+        store.put(key, 'stale')
+        entry = store._entries[id(key)]
+        impostor = _Key()
+        # Simulate an id collision whose weakref callback has not run yet
+        store._entries[id(impostor)] = entry
+        self.assertIsNone(store.get(impostor))
+        self.assertEqual(store.get(key), 'stale')
+
+    def test_unweakrefable_keys_are_held(self):
+        """Verifies keys without weakref support are held by identity, not equality."""
+        store = bumpy.BoundedStore(2**20)
+        key = [1.0, 2.0]
+        store.put(key, 'value')
+        self.assertEqual(store.get([1.0, 2.0]), None)
+        self.assertEqual(store.get(key), 'value')
+        self.assertEqual(store.pop(key), 'value')
+        self.assertEqual(len(store), 0)
+
+    def test_lru_eviction_and_counters(self):
+        """Verifies the least recently used entry is evicted first and the counters track it."""
+        store = bumpy.BoundedStore(2**20, max_entries=2, sizeof=lambda value: 1)
+        a, b, c = _Key(), _Key(), _Key()
+        store.put(a, 'a')
+        store.put(b, 'b')
+        self.assertEqual(store.get(a), 'a')  # b is now least recently used
+        store.put(c, 'c')
+        self.assertNotIn(b, store)
+        self.assertEqual(store.values(), ['a', 'c'])
+        self.assertEqual(store.get(b), None)
+        stats = store.stats()
+        self.assertEqual((stats['entries'], stats['bytes'], stats['hits'], stats['misses'], stats['evictions']),
+                         (2, 2, 1, 1, 1))
+
+    def test_oversized_value_is_kept_alone(self):
+        """Verifies a value larger than the budget evicts everything else but is kept."""
+        store = bumpy.BoundedStore(10, sizeof=len)
+        small, big = _Key(), _Key()
+        store.put(small, 'abc')
+        store.put(big, 'x' * 50)
+        self.assertEqual(store.values(), ['x' * 50])
+        self.assertEqual(store.nbytes, 50)
+
+    def test_bytes_stay_bounded_under_churn(self):
+        """Verifies the shared compressor and oracle stores stay within budget under churn."""
+        budget = 64 * 1024
+        shared = (bumpy.HolographicCompressor.bulk_states, bumpy.HolographicCompressor.boundary_correlators)
+        for store in shared:
+            self.addCleanup(setattr, store, 'max_bytes', store.max_bytes)
+            store.max_bytes = budget
+        evictions = [store.evictions for store in shared]
+        oracle = bumpy.OracularEntropyOracle()
+        oracle.future_states.max_bytes = budget
+        field = bumpy.PanpsychicResonanceField()
+        field.implicate_order.max_bytes = budget
+        keep = []
+        for i in range(2000):
+            data = [float((i + j) % 17) for j in range(64)]
+            arr = BumpyArray(data)
+            keep.append(arr)  # strongly held: only the budget can bound the stores
+            arr.holographic_compress()  # every array brings its own compressor
+            oracle.record_future_state(arr, 0.5, data)
+            field.update_pilot_wave(arr, data[:8], 0.5)
+            field.update_pilot_wave(arr, data[:8], 0.5)
+        self.assertIsNot(keep[0].holographic_compressor, keep[-1].holographic_compressor)
+        largest = bumpy._estimate_size(keep[0].data) * 2
+        for store in shared + (oracle.future_states, field.implicate_order):
+            self.assertLessEqual(store.nbytes, budget + largest)
+        for store, before in zip(shared, evictions):
+            self.assertGreater(store.evictions, before)
+        for store in (oracle.future_states, field.implicate_order):
+            self.assertGreater(store.stats()['evictions'], 0)
+        bulk = shared[0].get(keep[-1])
+        self.assertEqual(bulk, keep[-1].data)
+        self.assertIsNot(bulk, keep[-1].data)  # a snapshot, not the array's own buffer
+        self.assertIsNone(shared[0].get(keep[0]))
+        self.assertIsNotNone(oracle.future_states.get(keep[-1]))
+
+    def test_compressor_state_expires_with_its_array(self):
+        """Verifies compressor state is dropped once the array it belongs to is collected."""
+        shared = (bumpy.HolographicCompressor.bulk_states, bumpy.HolographicCompressor.boundary_correlators)
+        arr = BumpyArray([float(i) for i in range(32)], compact=True)
+        arr.holographic_compress()
+        expirations = [store.expirations for store in shared]
+        self.assertTrue(all(arr in store for store in shared))
+        del arr
+        gc.collect()
+        for store, before in zip(shared, expirations):
+            self.assertEqual(store.stats()['expirations'], before + 1)
+
+
+class TestOracleStores(unittest.TestCase):
+
+    def test_future_states_follow_the_array_not_its_id(self):
+        """Verifies oracle future states expire with their array and never pass to a reused id."""
+        oracle = bumpy.OracularEntropyOracle()
+        arr = BumpyArray([1.0, 2.0])
+        oracle.record_future_state(arr, 0.9, [1.0, 2.0])
+        self.assertEqual(len(oracle.future_states.get(arr)), 1)
+        del arr
+        gc.collect()
+        self.assertEqual(len(oracle.future_states), 0)
+        fresh = BumpyArray([3.0, 4.0])
+        self.assertIsNone(oracle._select_optimal_future(fresh, 0.5))
+
+    def test_future_state_depth_is_capped(self):
+        """Verifies each array keeps at most retrocausal_depth future states."""
+        oracle = bumpy.OracularEntropyOracle()
+        arr = BumpyArray([1.0])
+        for i in range(oracle.retrocausal_depth * 3):
+            oracle.record_future_state(arr, 0.1 * i, [float(i)])
+        self.assertEqual(len(oracle.future_states.get(arr)), oracle.retrocausal_depth)
+
+    def test_core_sleep_duration_uses_latest_resonance(self):
+        """Verifies the harmonic sleep duration reads the latest recorded resonance."""
+        core = bumpy.BUMPYCore()
+        self.assertIsNone(core.panpsychic_field.latest_resonance)
+        core.panpsychic_field._trigger_psi_singularity(core, [0.1, 0.9, 0.2])
+        self.assertEqual(core.panpsychic_field.latest_resonance['peak_index'], 1)
+        self.assertEqual(len(core.panpsychic_field.resonance_history.get(core)), 1)
+        self.assertGreater(core.get_harmonic_sleep_duration(0.1, 1), 0.1 * 0.95)
+
+
+if __name__ == "__main__":
+    unittest.main()
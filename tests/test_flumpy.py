@@ -0,0 +1,172 @@
+import gc
+import os
+import sys
+import math
+import random
+import unittest
+import weakref
+
+sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from flumpy import ENTANGLEMENT_SIMILARITY, FlumpyArray, FlumpyCore, FlumpyUtilities, SimilarityEngine
+
+
+def _reference_similarity(a, b):
+    """similarity_kernel as the original per-element loops computed it"""
+    norm_a = math.sqrt(sum(x**2 for x in a.data))
+    norm_b = math.sqrt(sum(x**2 for x in b.data))
+    dot = sum(x * y for x, y in zip(a.data, b.data))
+    phase_coherence = math.cos(abs(a.phase - b.phase) % (2 * math.pi))
+    return max(-1.0, min(1.0, dot / (norm_a * norm_b) * (0.7 + 0.3 * phase_coherence)))
+
+
+class TestEntanglementMembership(unittest.TestCase):
+
+    def linked_pair(self):
+        a = FlumpyArray([1.0, 2.0, 3.0])
+        b = FlumpyArray([1.0, 2.0, 3.1])
+        b.phase = a.phase
+        self.assertTrue(a.entangle(b))
+        return a, b
+
+    def test_links_are_a_weak_set(self):
+        a, b = self.linked_pair()
+        self.assertIsInstance(a.entangled_with, weakref.WeakSet)
+        self.assertIn(b, a.entangled_with)
+        self.assertIn(a, b.entangled_with)
+        del b
+        gc.collect()
+        self.assertEqual(len(a.entangled_with), 0)
+
+    def test_relinking_does_not_duplicate(self):
+        a, b = self.linked_pair()
+        a.entangled_with.add(b)
+        self.assertEqual(len(a.entangled_with), 1)
+        a.disentangle(b)
+        a.disentangle(b)  # disentangling twice is harmless
+        self.assertEqual((len(a.entangled_with), len(b.entangled_with)), (0, 0))
+
+    def test_copy_starts_unlinked(self):
+        a, _ = self.linked_pair()
+        self.assertEqual(len(a.copy().entangled_with), 0)
+        self.assertIn('entangled=1', repr(a))
+
+    def test_arithmetic_results_do_not_pin_operands(self):
+        x = FlumpyArray([0.5, 0.5, 0.5])
+        acc = FlumpyArray([1.0, 1.0, 1.0])
+        for _ in range(200):
+            acc = acc + x
+        gc.collect()
+        self.assertLessEqual(len(x.entangled_with), 1)
+
+
+class TestSimilarity(unittest.TestCase):
+
+    def test_matches_reference_loop(self):
+        a = FlumpyArray([0.5, -1.25, 2.0, 3.5])
+        b = FlumpyArray([1.5, 0.25, -2.0, 0.5])
+        self.assertAlmostEqual(a.similarity_kernel(b), _reference_similarity(a, b), places=12)
+        self.assertEqual(a.similarity_kernel(FlumpyArray([0.0] * 4)), 0.0)
+        with self.assertRaises(ValueError):
+            a.similarity_kernel(FlumpyArray([1.0]))
+
+    def test_norm_is_cached_and_invalidated_on_mutation(self):
+        a = FlumpyArray([3.0, 4.0])
+        self.assertEqual(a.norm, 5.0)
+        a._data.append(0.0)  # an in-place edit the cache cannot see
+        self.assertEqual(a.norm, 5.0)
+        a[0] = 0.0
+        self.assertEqual(a.norm, 4.0)
+        a += FlumpyArray([6.0, 0.0, 0.0], coherence=1.0)
+        self.assertAlmostEqual(a.norm, math.hypot(*a.data), places=12)
+        a.data = [1.0, 0.0, 0.0]
+        self.assertEqual(a.norm, 1.0)
+        a.data[1] = 1.0
+        a.invalidate_norm()
+        self.assertAlmostEqual(a.norm, math.sqrt(2.0))
+        self.assertAlmostEqual(a.normalize().norm, 1.0)
+
+    def test_global_chaos_invalidates_norms(self):
+        core = FlumpyCore()
+        arr = core.get_array(core.create_array([1.0, 2.0, 3.0], coherence=0.2))
+        arr.norm
+        core.apply_global_chaos(0.5)
+        self.assertAlmostEqual(arr.norm, math.hypot(*arr.data), places=12)
+
+
+class TestBatchEntangle(unittest.TestCase):
+
+    def population(self, n=120, dim=6, seed=7):
+        """Clustered arrays (so plenty of pairs entangle) plus a zero vector"""
+        rng = random.Random(seed)
+        centers = [[rng.gauss(0, 1) for _ in range(dim)] for _ in range(6)]
+        arrays = []
+        for i in range(n):
+            center = centers[i % len(centers)]
+            arr = FlumpyArray([c + rng.gauss(0, 0.3) for c in center], coherence=rng.uniform(0.3, 0.9))
+            arr.phase = rng.uniform(0, 2 * math.pi)
+            arrays.append(arr)
+        arrays.append(FlumpyArray([0.0] * dim))
+        return arrays
+
+    def twin(self, arrays):
+        return [arr.copy() for arr in arrays]
+
+    def outcome(self, arrays):
+        index = {id(arr): i for i, arr in enumerate(arrays)}
+        links = sorted((i, index[id(other)]) for i, arr in enumerate(arrays) for other in arr.entangled_with)
+        return links, [arr.coherence for arr in arrays], [arr.phase for arr in arrays]
+
+    def pairwise(self, arrays, threshold):
+        count = 0
+        for i in range(len(arrays)):
+            for j in range(i + 1, len(arrays)):
+                count += arrays[i].entangle(arrays[j], threshold)
+        return count
+
+    def test_blocked_matches_pairwise_exactly(self):
+        for threshold in (ENTANGLEMENT_SIMILARITY, 0.3, -0.2):
+            reference = self.population()
+            batched = self.twin(reference)
+            expected = self.pairwise(reference, threshold)
+            engine = SimilarityEngine(block_size=16)
+            self.assertEqual(FlumpyUtilities.batch_entangle(batched, threshold, engine), expected)
+            self.assertEqual(self.outcome(batched), self.outcome(reference))
+
+    def test_candidates_are_ordered_and_block_size_independent(self):
+        arrays = self.population()
+        small = list(SimilarityEngine(block_size=7).candidate_pairs(arrays, 0.5))
+        large = list(SimilarityEngine(block_size=4096).candidate_pairs(arrays, 0.5))
+        self.assertEqual(small, large)
+        self.assertEqual(small, sorted(set(small)))
+        self.assertTrue(all(i < j for i, j in small))
+
+    def test_mismatched_lengths_fall_back_to_pairwise(self):
+        arrays = [FlumpyArray([1.0, 2.0]), FlumpyArray([1.0, 2.0, 3.0]), FlumpyArray([2.0, 4.0])]
+        self.assertEqual(list(SimilarityEngine().candidate_pairs(arrays, 0.5)), [(0, 1), (0, 2), (1, 2)])
+        with self.assertRaises(ValueError):
+            FlumpyUtilities.batch_entangle(arrays)
+
+    def test_lsh_prefilter_is_a_subset_of_exact(self):
+        arrays = self.population(n=300)
+        exact = set(SimilarityEngine().candidate_pairs(arrays, ENTANGLEMENT_SIMILARITY))
+        approximate = list(SimilarityEngine(lsh_bits=4, seed=0).candidate_pairs(arrays, ENTANGLEMENT_SIMILARITY))
+        self.assertEqual(approximate, sorted(approximate))
+        self.assertLessEqual(set(approximate), exact)
+        # Clustered data: nearly every qualifying pair shares a bucket somewhere
+        self.assertGreater(len(approximate), 0.8 * len(exact))
+        again = list(SimilarityEngine(lsh_bits=4, seed=0).candidate_pairs(arrays, ENTANGLEMENT_SIMILARITY))
+        self.assertEqual(approximate, again)
+
+    def test_global_ritual_uses_engine(self):
+        core = FlumpyCore()
+        for arr in self.population(n=30):
+            core.arrays[f"array_{core.array_counter}"] = arr
+            core.array_counter += 1
+        reference = self.twin(list(core.arrays.values()))
+        expected = self.pairwise(reference, ENTANGLEMENT_SIMILARITY)
+        self.assertEqual(core.global_entanglement_ritual(), expected)
+
+
+if __name__ == "__main__":
+    unittest.main()
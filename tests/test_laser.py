@@ -0,0 +1,735 @@
+import os
+import sys
+import json
+import random
+import shutil
+import tempfile
+import threading
+import unittest
+import contextlib
+from unittest import mock
+
+sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+with contextlib.redirect_stdout(open(os.devnull, 'w')):
+    import laser
+from laser import LASERV30, LogWriter, LogIndex, LogSegments, UniversalCache, read_universal_log
+
+# Entries in the synthetic log the index is checked against a full scan on;
+# the release workflow reruns that comparison on 1M entries in its own job
+INDEX_TEST_ENTRIES = int(os.environ.get('LASER_INDEX_TEST_ENTRIES', 50_000))
+WORDS = ['sensor', 'alarm', 'ion', 'drift', 'Quantum', 'decay', 'flux', 'résumé', 'echo', 'WARNING']
+
+
+def _entries(count, start=0):
+    return [{'n': i, 'message': f"entry {i}"} for i in range(start, start + count)]
+
+
+class LogDirTestCase(unittest.TestCase):
+
+    def setUp(self):
+        self.tmpdir = tempfile.mkdtemp()
+        self.path = os.path.join(self.tmpdir, 'log.jsonl')
+        quiet = contextlib.redirect_stdout(open(os.devnull, 'w'))
+        quiet.__enter__()
+        self.addCleanup(quiet.__exit__, None, None, None)
+
+    def tearDown(self):
+        shutil.rmtree(self.tmpdir, ignore_errors=True)
+
+    def read(self):
+        with open(self.path, encoding='utf-8') as f:
+            return [json.loads(line) for line in f if not line.startswith('#')]
+
+
+class TestLogWriter(LogDirTestCase):
+
+    def test_group_commit_preserves_order(self):
+        writer = LogWriter(self.path, batch_size=64, batch_ms=50)
+        for start in range(0, 1000, 100):
+            writer.submit(_entries(100, start))
+        self.assertTrue(writer.drain(timeout=10))
+        stats = writer.stats()
+        writer.close()
+        self.assertEqual([e['n'] for e in self.read()], list(range(1000)))
+        self.assertEqual(stats['written'], 1000)
+        self.assertLess(stats['batches'], 1000 // 10)  # coalesced, not one write per entry
+
+    def test_block_loses_nothing_with_a_tiny_queue(self):
+        writer = LogWriter(self.path, queue_size=4, batch_size=2, batch_ms=0)
+        producers = [threading.Thread(target=lambda s=s: [writer.submit([e]) for e in _entries(50, s)])
+                     for s in range(0, 200, 50)]
+        for producer in producers:
+            producer.start()
+        for producer in producers:
+            producer.join()
+        writer.close()
+        self.assertEqual(sorted(e['n'] for e in self.read()), list(range(200)))
+        self.assertEqual(writer.metrics['dropped'], 0)
+
+    def test_drop_oldest(self):
+        writer = LogWriter(self.path, queue_size=4, backpressure='drop-oldest', autostart=False)
+        writer.submit(_entries(10))
+        writer.close()
+        self.assertEqual([e['n'] for e in self.read()], [6, 7, 8, 9])
+        self.assertEqual(writer.metrics['dropped'], 6)
+
+    def test_sample(self):
+        writer = LogWriter(self.path, queue_size=4, backpressure='sample', sample_every=5, autostart=False)
+        writer.submit(_entries(24))
+        writer.close()
+        # Overflow entries 4, 9, 14 and 19 are admitted, each displacing the oldest
+        self.assertEqual([e['n'] for e in self.read()], [4, 9, 14, 19])
+        self.assertEqual(writer.metrics['dropped'], 20)
+
+    def test_fsync_policies(self):
+        for policy, expected in (('never', 0), ('per-batch', 3), ('interval', 1)):
+            path = os.path.join(self.tmpdir, f'{policy}.jsonl')
+            with mock.patch('laser.os.fsync') as fsync:
+                writer = LogWriter(path, fsync=policy, fsync_interval=3600, background=False)
+                for start in (0, 10, 20):
+                    writer.submit(_entries(10, start))
+                writer.close()
+            self.assertEqual(fsync.call_count, expected, policy)
+
+    def test_rejects_unknown_policies(self):
+        with self.assertRaises(ValueError):
+            LogWriter(self.path, fsync='sometimes')
+        with self.assertRaises(ValueError):
+            LogWriter(self.path, backpressure='ignore')
+
+    def test_shared_flush_metadata_is_encoded_once(self):
+        metadata = {'type': 'universal', 'timestamp': 1.0}
+        entries = [{'n': i, 'flush_metadata': metadata} for i in range(3)] + [{'flush_metadata': metadata}]
+        writer = LogWriter(self.path, background=False)
+        with mock.patch('laser.json.dumps', wraps=json.dumps) as dumps:
+            writer.submit(entries)
+        writer.close()
+        self.assertEqual(dumps.call_count, len(entries) + 1)
+        self.assertEqual(self.read(), entries)
+
+    def test_close_timeout_leaves_the_file_to_the_writer(self):
+        writer = LogWriter(self.path, batch_size=10, batch_ms=0)
+        write_batch = writer._write_batch
+        started = threading.Event()
+
+        def slow_write_batch(batch):
+            started.set()
+            laser.time.sleep(0.3)
+            write_batch(batch)
+
+        writer._write_batch = slow_write_batch
+        writer.submit(_entries(30))
+        self.assertTrue(started.wait(5))
+        writer.close(timeout=0.05)
+        self.assertTrue(writer._thread.is_alive())
+        writer._thread.join(10)
+        self.assertFalse(writer._thread.is_alive())
+        self.assertIsNone(writer._file)
+        self.assertEqual([e['n'] for e in self.read()], list(range(30)))
+        self.assertEqual(writer.metrics['write_errors'], 0)
+
+    def test_partially_written_batch_is_cut_off(self):
+        class DiskFull:
+            def __init__(self, f):
+                self.f = f
+
+            def write(self, data):
+                self.f.write(data[:len(data) // 2])
+                self.f.flush()
+                raise OSError(28, "No space left on device")
+
+            def __getattr__(self, name):
+                return getattr(self.f, name)
+
+        for truncate_fails in (False, True):
+            with self.subTest(truncate_fails=truncate_fails):
+                path = os.path.join(self.tmpdir, f'truncate_fails_{truncate_fails}.jsonl')
+                writer = LogWriter(path, background=False)
+                writer.submit(_entries(5))
+                writer._file = DiskFull(writer._file)
+                with mock.patch('laser.os.truncate', side_effect=OSError if truncate_fails else os.truncate):
+                    writer.submit(_entries(5, 5))
+                writer.submit(_entries(5, 10))
+                writer.close()
+                numbers, torn = [], 0
+                with open(path, encoding='utf-8') as f:
+                    for line in f:
+                        try:
+                            numbers.append(json.loads(line)['n'])
+                        except ValueError:
+                            torn += 1
+                self.assertEqual(numbers[:5] + numbers[-5:], list(range(5)) + list(range(10, 15)))
+                if truncate_fails:
+                    # Only the remnant itself is lost; the next batch starts on a line of its own
+                    self.assertEqual(torn, 1)
+                else:
+                    self.assertEqual((numbers, torn), (list(range(5)) + list(range(10, 15)), 0))
+                self.assertEqual(writer.metrics['write_errors'], 5)
+
+    def test_unserializable_entry_is_skipped(self):
+        for background in (True, False):
+            with self.subTest(background=background):
+                path = os.path.join(self.tmpdir, f'background_{background}.jsonl')
+                writer = LogWriter(path, queue_size=4, batch_size=2, batch_ms=0, background=background)
+                writer.submit([{'n': -1, 'tags': {1, 2}}])
+                writer.submit(_entries(3) + [{'n': -2, 'tags': {3}}] + _entries(20, 3))
+                self.assertTrue(writer.drain(timeout=10))
+                writer.close()
+                with open(path, encoding='utf-8') as f:
+                    self.assertEqual([json.loads(line)['n'] for line in f], list(range(23)))
+                self.assertEqual((writer.metrics['written'], writer.metrics['write_errors']), (23, 2))
+
+
+class TestLASERFlush(LogDirTestCase):
+
+    def make(self, **config):
+        logger = LASERV30({'log_path': self.path, 'max_buffer': 40, 'telemetry': False, **config})
+        logger._writer.fsync = 'never'
+        return logger
+
+    def log_many(self, logger, count):
+        rng = random.Random(0)
+        for i in range(count):
+            logger.log(rng.random(), f"WARNING {i}")
+
+    def test_flush_hands_off_and_shutdown_drains(self):
+        logger = self.make()
+        self.log_many(logger, 200)
+        self.assertGreater(logger.metrics['flushes'], 0)
+        logger.shutdown()
+        entries = self.read()
+        self.assertEqual([int(e['message'].split()[1]) for e in entries], list(range(200)))
+        self.assertTrue(all('flush_metadata' in e for e in entries))
+
+    def test_flush_metadata_leaves_out_io_counters(self):
+        logger = self.make()
+        self.log_many(logger, 200)
+        logger.shutdown()
+        performance = next(read_universal_log(self.path))['flush_metadata']['metrics']['performance']
+        self.assertIn('logs_processed', performance)
+        self.assertTrue({'writer', 'index', 'segments'}.isdisjoint(performance))
+        self.assertIn('writer', logger.metrics_report()['performance'])
+
+    def test_query_sees_flushed_entries(self):
+        logger = self.make(group_commit_ms=200.0)
+        self.log_many(logger, 60)
+        flushed = logger.metrics['logs_processed'] - len(logger.buffer)
+        self.assertEqual(len(logger.query_universal_memory('WARNING')), min(50, flushed))
+        self.assertIn('writer', logger.metrics_report()['performance'])
+        logger.shutdown()
+
+    def test_synchronous_mode(self):
+        logger = self.make(background_writer=False)
+        self.log_many(logger, 60)
+        self.assertEqual(len(self.read()), logger.metrics['logs_processed'] - len(logger.buffer))
+        logger.shutdown()
+
+
+class TestLogFormatV2(LogDirTestCase):
+
+    def flushes(self):
+        """Three flushes: the universal state repeats between the first two"""
+        state = {'coherence': 0.9, 'signature': 'A', **{f'field_{k}': k / 7 for k in range(20)}}
+        batches = []
+        for flush, (universal_state, logs) in enumerate([(state, 3), (dict(state), 2), ({'coherence': 0.5}, 2)]):
+            metadata = {'type': 'universal', 'timestamp': float(flush), 'universal_state': universal_state,
+                        'metrics': {'flushes': flush}, 'buffer_state': {'size_before': logs}}
+            batches.append([{'n': flush * 10 + i, 'message': 'm', 'flush_metadata': metadata} for i in range(logs)])
+        return batches
+
+    def write(self, path, log_format, batches):
+        writer = LogWriter(path, background=False, log_format=log_format)
+        for batch in batches:
+            writer.submit(batch)
+        writer.close()
+        return writer
+
+    def test_snapshots_written_once_and_only_on_change(self):
+        batches = self.flushes()
+        writer = self.write(self.path, 2, batches)
+        with open(self.path, encoding='utf-8') as f:
+            lines = f.read().splitlines()
+        snapshots = [json.loads(line[len(laser.SNAPSHOT_PREFIX):]) for line in lines
+                     if line.startswith(laser.SNAPSHOT_PREFIX)]
+        self.assertEqual([r['kind'] for r in snapshots], ['universal_state', 'metrics', 'metrics',
+                                                          'universal_state', 'metrics'])
+        self.assertEqual(writer.metrics['snapshots'], 5)
+        raw = [json.loads(line) for line in lines if not line.startswith('#')]
+        self.assertEqual([e['flush_metadata']['universal_state_snapshot'] for e in raw], [1, 1, 1, 1, 1, 4, 4])
+        self.assertNotIn('universal_state', raw[0]['flush_metadata'])
+
+    def test_reader_restores_the_v1_shape(self):
+        batches = self.flushes()
+        v1_path = os.path.join(self.tmpdir, 'v1.jsonl')
+        self.write(v1_path, 1, batches)
+        self.write(self.path, 2, batches)
+        expected = [entry for batch in batches for entry in batch]
+        self.assertEqual(list(read_universal_log(v1_path)), expected)
+        self.assertEqual(list(read_universal_log(self.path)), expected)
+        self.assertLess(os.path.getsize(self.path), os.path.getsize(v1_path))
+
+    def test_mixed_formats_and_writer_restarts(self):
+        first, second, third = self.flushes()
+        self.write(self.path, 2, [first])
+        self.write(self.path, 1, [second])
+        self.write(self.path, 2, [third])  # numbering restarts at 1
+        with open(self.path, 'a', encoding='utf-8') as f:
+            f.write('not json\n[1, 2]\n')
+        restored = list(read_universal_log(self.path))
+        self.assertEqual(restored, first + second + third)
+
+    def test_laser_query_sees_full_metadata(self):
+        logger = LASERV30({'log_path': self.path, 'max_buffer': 40, 'telemetry': False})
+        rng = random.Random(0)
+        for i in range(80):
+            logger.log(rng.random(), f"WARNING {i}")
+        results = logger.query_universal_memory('WARNING')
+        logger.shutdown()
+        self.assertTrue(results)
+        for entry in results:
+            self.assertIn('coherence', entry['flush_metadata']['universal_state'])
+            self.assertIn('performance', entry['flush_metadata']['metrics'])
+        with open(self.path, encoding='utf-8') as f:
+            self.assertIn(laser.SNAPSHOT_PREFIX, f.read())
+
+    def test_retried_entry_still_writes_its_snapshots(self):
+        class MutatedOnce(dict):
+            raised = False
+
+            def items(self):
+                if not MutatedOnce.raised:
+                    MutatedOnce.raised = True
+                    raise RuntimeError("dictionary changed size during iteration")
+                return super().items()
+
+        first, second, _ = self.flushes()
+        first[0]['meta'] = MutatedOnce(source='sensor')
+        writer = self.write(self.path, 2, [first, second])
+        self.assertTrue(MutatedOnce.raised)
+        restored = list(read_universal_log(self.path))
+        self.assertEqual(restored, first + second)
+        self.assertEqual(restored[0]['flush_metadata']['universal_state']['signature'], 'A')
+        self.assertEqual((writer.metrics['snapshots'], writer.metrics['write_errors']), (3, 0))
+
+    def test_rejects_unknown_format(self):
+        with self.assertRaises(ValueError):
+            LogWriter(self.path, log_format=3)
+
+
+def write_synthetic_log(path, count, start=0, seed=7):
+    """A log shaped like LASER's: v2 snapshot references, a few irregular entries"""
+    rng = random.Random(seed)
+    with open(path, 'a', encoding='utf-8') as f:
+        if not start:
+            f.write('#UNIVERSAL_INIT {"system":"synthetic"}\n')
+        for i in range(start, start + count):
+            if i % 5000 == 0:
+                record = {'seq': i // 5000, 'kind': 'universal_state', 'data': {'flush': i // 5000}}
+                f.write(f"{laser.SNAPSHOT_PREFIX}{json.dumps(record)}\n")
+            entry = {'id': i, 'universal_time': 1e6 + i * 0.25 + rng.random(),
+                     'message': f"{rng.choice(WORDS)} {rng.choice(WORDS)} {rng.randrange(1000)}",
+                     'quantum': {'coherence': round(rng.random(), 4), 'risk': round(rng.random(), 4),
+                                 'entropy': round(rng.random(), 4)},
+                     'flush_metadata': {'type': 'universal', 'universal_state_snapshot': i // 5000}}
+            if i % 10007 == 3:
+                del entry['quantum']
+            elif i % 10007 == 5:
+                del entry['universal_time']
+            elif i % 10007 == 7:
+                entry['quantum']['coherence'] = 1
+            elif i % 10007 == 9:
+                del entry['message']
+            f.write(json.dumps(entry, separators=(',', ':')) + '\n')
+
+
+class TestQueryIndex(LogDirTestCase):
+
+    QUERIES = [
+        ('ion', None, None, 50),
+        ('sensor ala', (1e6 + 1000, 1e6 + 60000), None, None),
+        ('E', None, {'coherence_min': 0.5, 'risk_max': 0.3}, 100),
+        ('', None, {'risk_max': 0.1, 'entropy_max': 0.2}, 200),
+        ('no such message', None, None, 50),
+    ]
+
+    def make(self, **config):
+        # Maintenance would decay the universal state between the two queries compared
+        with mock.patch.object(LASERV30, '_universal_maintenance', lambda logger: None):
+            logger = LASERV30({'log_path': self.path, 'max_buffer': 40, 'telemetry': False, **config})
+        self.addCleanup(logger._writer.close)
+        return logger
+
+    def assertMatchesScan(self, logger, queries):
+        self.assertTrue(logger._index.refresh())
+        now = laser.time.time()
+        for query in queries:
+            with self.subTest(query=query):
+                indexed = logger._query_index(*query, now)
+                self.assertIsNotNone(indexed)
+                self.assertEqual(indexed, logger._scan_universal_memory(*query, now))
+
+    def test_matches_full_scan_on_a_large_log(self):
+        write_synthetic_log(self.path, INDEX_TEST_ENTRIES)
+        logger = self.make()
+        self.assertTrue(logger._index.refresh())
+        self.assertEqual(len(logger._index), INDEX_TEST_ENTRIES)
+        # The scans dominate the runtime: compare the selective queries on
+        # the full log, the rest on every query
+        self.assertMatchesScan(logger, self.QUERIES[1:4])
+        read = logger._index.metrics['entries_read']
+        results = logger.query_universal_memory('ion')
+        self.assertEqual(len(results), 50)
+        # Only the irregular candidates and the entries returned were read
+        self.assertLessEqual(logger._index.metrics['entries_read'] - read, 50 + len(logger._index.irregular))
+
+    def test_ranks_every_match_before_the_limit(self):
+        write_synthetic_log(self.path, 20000)
+        logger = self.make()
+        self.assertMatchesScan(logger, self.QUERIES)
+        everything = logger.query_universal_memory('', limit=None)
+        self.assertEqual(len(everything), 20000)
+        keys = [LASERV30._memory_rank(entry) for entry in everything]
+        self.assertEqual(keys, sorted(keys))
+        self.assertEqual(logger.query_universal_memory('', limit=10), everything[:10])
+
+    def test_writer_keeps_the_index_current(self):
+        logger = self.make()
+        rng = random.Random(0)
+        for i in range(60):
+            logger.log(rng.random(), f"WARNING {i}")
+        logger.query_universal_memory('WARNING')
+        scanned = logger._index.metrics['scanned']
+        for i in range(60, 200):
+            logger.log(rng.random(), f"WARNING {i}")
+        logger._writer.drain(timeout=10)
+        self.assertGreater(logger._index.metrics['appended'], 0)
+        self.assertEqual(logger._index.metrics['scanned'], scanned)
+        self.assertMatchesScan(logger, [('warning 1', None, None, None), ('', None, {'risk_max': 0.5}, 50)])
+        results = logger.query_universal_memory('WARNING', limit=None)
+        self.assertEqual(len(results), logger.metrics['logs_processed'] - len(logger.buffer))
+        self.assertIn('coherence', results[0]['flush_metadata']['universal_state'])
+
+    def test_sidecar_is_reloaded_and_rebuilt_when_stale(self):
+        write_synthetic_log(self.path, 3000)
+        logger = self.make()
+        self.assertTrue(logger.query_universal_memory('drift', limit=None))
+        logger._index.save()
+        sidecar = logger._index.path
+        self.assertTrue(os.path.exists(sidecar))
+
+        # Reloaded, then only the appended tail is read from the log
+        write_synthetic_log(self.path, 500, start=3000)
+        index = LogIndex(self.path)
+        self.assertTrue(index.refresh())
+        self.assertEqual((index.metrics['loads'], index.metrics['rebuilds'], index.metrics['scanned']), (1, 0, 500))
+        self.assertEqual(len(index), 3500)
+
+        # A corrupt sidecar is rebuilt from the log
+        with open(sidecar, 'r+b') as f:
+            f.truncate(os.path.getsize(sidecar) // 2)
+        index = LogIndex(self.path)
+        index.refresh()
+        self.assertEqual((index.metrics['loads'], index.metrics['rebuilds'], len(index)), (0, 1, 3500))
+
+        # So is the index of a log that was replaced
+        index.save()
+        os.remove(self.path)
+        write_synthetic_log(self.path, 3000, seed=8)
+        self.assertTrue(index.refresh())
+        self.assertEqual((index.metrics['rebuilds'], len(index)), (2, 3000))
+        self.assertEqual(index.rebuild(), 3000)
+
+        # A logger started on the replaced log does not trust the old sidecar
+        write_synthetic_log(self.path, 500, start=3000, seed=8)
+        scanning = self.make(query_index=False)
+        indexed = self.make()
+        self.assertEqual(indexed.query_universal_memory('drift', limit=None),
+                         scanning.query_universal_memory('drift', limit=None))
+        self.assertEqual(indexed._index.metrics['rebuilds'], 1)
+
+    def test_filters_that_are_not_numbers_fall_back_to_a_scan(self):
+        write_synthetic_log(self.path, 1000)
+        logger = self.make()
+        self.assertIsNone(logger._query_index('ion', ('a', 'b'), None, 50, laser.time.time()))
+        self.assertIsNone(logger._query_index('ion', None, {'risk_max': None}, 50, laser.time.time()))
+        self.assertEqual(logger.query_universal_memory('ion', quantum_filter={'risk_max': True}, limit=None),
+                         logger.query_universal_memory('ion', quantum_filter={'risk_max': 1}, limit=None))
+
+
+def _timed_entries(count, start=0):
+    return [{'n': i, 'universal_time': 1000.0 + i, 'message': f"entry {i}"} for i in range(start, start + count)]
+
+
+class TestLogSegments(LogDirTestCase):
+
+    def write(self, segments, total=600, batch=20, **writer):
+        writer = LogWriter(self.path, segments=segments, **{'background': False, **writer})
+        for start in range(0, total, batch):
+            writer.submit(_timed_entries(batch, start))
+        writer.close()
+        return writer
+
+    def numbers(self, temporal_range=None):
+        return [e['n'] for e in read_universal_log(self.path, temporal_range)]
+
+    def segment_path(self, segment):
+        return os.path.join(self.tmpdir, segment['file'])
+
+    def test_rotates_by_size_and_compresses_closed_segments(self):
+        segments = LogSegments(self.path, max_bytes=4096, background=False)
+        writer = self.write(segments)
+        self.assertGreater(len(segments.segments), 3)
+        self.assertEqual(writer.metrics['rotations'], len(segments.segments))
+        self.assertEqual(self.numbers(), list(range(600)))
+        first = 0
+        for segment in segments.segments:
+            footer = laser.read_segment_footer(self.segment_path(segment))
+            self.assertEqual(footer['codec'], 'zlib')
+            self.assertEqual(footer['start_time'], 1000.0 + first)
+            first += footer['entries']
+            self.assertEqual(footer['end_time'], 1000.0 + first - 1)
+            self.assertLess(footer['compressed_bytes'], footer['raw_bytes'])
+        self.assertLess(os.path.getsize(self.path), 4096 + 2048)
+        with open(f"{self.path}.manifest", encoding='utf-8') as f:
+            self.assertEqual(json.load(f)['segments'], segments.segments)
+        self.assertEqual(os.listdir(self.tmpdir).count(os.path.basename(self.path) + '.000001'), 0)
+
+    def test_rotates_by_age(self):
+        segments = LogSegments(self.path, max_age=0, background=False)
+        self.write(segments, total=100)
+        self.assertEqual(len(segments.segments), 5)
+        self.assertFalse(os.path.exists(self.path))
+        self.assertEqual(self.numbers(), list(range(100)))
+
+    def test_background_lzma_compression(self):
+        segments = LogSegments(self.path, max_bytes=4096, codec='lzma')
+        self.write(segments, background=True)
+        self.assertTrue(segments.wait(timeout=30))
+        segments.close()
+        self.assertTrue(all(s['codec'] == 'lzma' and s['file'].endswith('.xz') for s in segments.segments))
+        self.assertGreater(segments.metrics['raw_bytes'], 2 * segments.metrics['compressed_bytes'])
+        self.assertEqual(self.numbers(), list(range(600)))
+        with self.assertRaises(ValueError):
+            LogSegments(self.path, codec='bz2')
+
+    def test_time_range_skips_segments(self):
+        segments = LogSegments(self.path, max_bytes=4096, background=False)
+        self.write(segments)
+        with mock.patch('laser._open_segment', wraps=laser._open_segment) as opened:
+            numbers = self.numbers((1100, 1150))
+        self.assertLessEqual(opened.call_count, 2)
+        self.assertEqual([n for n in numbers if 100 <= n <= 150], list(range(100, 151)))
+        self.assertEqual(len(list(segments.read((0, 1000)))), segments.segments[0]['entries'])
+        self.assertGreater(segments.metrics['segments_skipped'], 0)
+
+    def test_query_spans_segments(self):
+        with mock.patch.object(LASERV30, '_universal_maintenance', lambda logger: None):
+            logger = LASERV30({'log_path': self.path, 'max_buffer': 40, 'telemetry': False,
+                               'background_writer': False, 'segment_max_bytes': 200000})
+        rng = random.Random(0)
+        for i in range(300):
+            logger.log(rng.random(), f"WARNING {i}")
+            if i == 50:
+                logger.query_universal_memory('WARNING')  # the index follows rotations from here
+        logger._writer.close()
+        self.assertGreater(len(logger._segments.segments), 1)
+        self.assertEqual(logger._index.metrics['rebuilds'], 1)
+        now = laser.time.time()
+        first_time = next(read_universal_log(self.path))['universal_time']
+        with mock.patch('laser.time.time', return_value=now):
+            for query in [('WARNING 1', None, None, None), ('', (0, first_time + 0.01), None, 20),
+                          ('warn', None, {'risk_max': 0.5}, 30)]:
+                with self.subTest(query=query):
+                    expected = logger._scan_universal_memory(*query, now, read_universal_log(self.path))
+                    self.assertEqual(logger.query_universal_memory(*query), expected)
+                    self.assertTrue(expected)
+        self.assertGreater(logger._segments.metrics['segments_skipped'], 0)
+        logger.shutdown()
+
+    def test_query_is_not_torn_by_a_concurrent_rotation(self):
+        with mock.patch.object(LASERV30, '_universal_maintenance', lambda logger: None):
+            logger = LASERV30({'log_path': self.path, 'max_buffer': 40, 'telemetry': False,
+                               'background_writer': False, 'segment_max_bytes': 200000})
+        self.addCleanup(logger.shutdown)
+        rng = random.Random(0)
+        for i in range(200):
+            logger.log(rng.random(), f"WARNING {i}")
+        logger.query_universal_memory('WARNING')  # load the index
+        logger._writer.close()
+        self.assertTrue(logger._segments.segments)
+        self.assertTrue(os.path.getsize(self.path))  # the active segment holds matches too
+        expected = logger._scan_universal_memory('WARNING', None, None, None, laser.time.time(),
+                                                 read_universal_log(self.path))
+        self.assertEqual(len(expected), 200 - len(logger.buffer))
+
+        # Rotate on the next write, from another thread, right after the
+        # query has listed the closed segments
+        logger._segments.max_bytes = 1
+        rotator = threading.Thread(target=logger._writer.submit, args=([{'message': 'other'}],))
+        read = logger._segments.read
+
+        def read_then_rotate(temporal_range=None):
+            entries = list(read(temporal_range))
+            rotator.start()
+            rotator.join(0.5)
+            return iter(entries)
+
+        rotations = logger._writer.metrics['rotations']
+        with mock.patch.object(logger._segments, 'read', read_then_rotate):
+            results = logger.query_universal_memory('WARNING', limit=None)
+        rotator.join()
+        self.assertEqual(logger._writer.metrics['rotations'], rotations + 1)
+        for found in (results, logger.query_universal_memory('WARNING', limit=None)):
+            self.assertEqual(sorted(e['message'] for e in found), sorted(e['message'] for e in expected))
+
+    def test_torn_active_segment_is_cut_at_the_last_complete_line(self):
+        self.write(None, total=10, batch=10)
+        with open(self.path, 'ab') as f:
+            f.write(b'{"n":10,"universal_time":10')
+        segments = LogSegments(self.path)
+        self.assertEqual(segments.metrics['recovered_bytes'], len(b'{"n":10,"universal_time":10'))
+        writer = LogWriter(self.path, background=False, segments=segments)
+        writer.submit(_timed_entries(5, 11))
+        writer.close()
+        self.assertEqual(self.numbers(), list(range(10)) + list(range(11, 16)))
+        self.assertFalse(os.path.exists(f"{self.path}.manifest"))
+
+    def test_half_written_closed_segment_is_recovered(self):
+        # Crash after the rename, before the manifest and compression: a
+        # plain segment with a torn last line and a stale temporary file
+        plain = f"{self.path}.000001"
+        with open(plain, 'w', encoding='utf-8') as f:
+            for entry in _timed_entries(10):
+                f.write(json.dumps(entry) + '\n')
+            f.write('{"n": 10, "message": "ent')
+        with open(f"{plain}.z.tmp", 'wb') as f:
+            f.write(b'partial')
+        segments = LogSegments(self.path, background=False)
+        self.assertEqual(segments.metrics['adopted'], 1)
+        self.assertEqual(sorted(os.listdir(self.tmpdir)),
+                         sorted([os.path.basename(plain) + '.z', os.path.basename(self.path) + '.manifest']))
+        self.assertEqual(segments.segments[0]['entries'], 10)
+        self.assertEqual(segments.next_seq, 2)
+        self.assertEqual(self.numbers(), list(range(10)))
+
+    def test_crash_between_compression_and_manifest(self):
+        segments = LogSegments(self.path, max_bytes=4096, background=False)
+        self.write(segments)
+        segment = segments.segments[0]
+        compressed = self.segment_path(segment)
+        plain = compressed[:-len('.z')]
+        with open(plain, 'wb') as f:
+            f.writelines(laser._segment_lines(compressed, 'zlib'))
+        manifest = dict(laser._read_manifest(self.path))
+        manifest['segments'] = [{'seq': 1, 'file': os.path.basename(plain), 'codec': None}] + manifest['segments'][1:]
+        with open(f"{self.path}.manifest", 'w', encoding='utf-8') as f:
+            json.dump(manifest, f)
+        recovered = LogSegments(self.path, background=False)
+        self.assertFalse(os.path.exists(plain))
+        self.assertEqual(recovered.segments, segments.segments)
+        self.assertEqual(self.numbers(), list(range(600)))
+
+    def test_corrupt_compressed_segment_yields_its_complete_prefix(self):
+        segments = LogSegments(self.path, max_bytes=1 << 16, background=False)
+        self.write(segments, total=2000)
+        path = self.segment_path(segments.segments[0])
+        entries = segments.segments[0]['entries']
+        with open(path, 'r+b') as f:
+            f.truncate(os.path.getsize(path) // 2)
+        recovered = LogSegments(self.path, background=False)
+        self.assertEqual(recovered.segments[0]['codec'], 'zlib')
+        numbers = self.numbers()
+        prefix, rest = numbers[:len(numbers) - (2000 - entries)], numbers[len(numbers) - (2000 - entries):]
+        self.assertEqual(rest, list(range(entries, 2000)))
+        self.assertEqual(prefix, list(range(len(prefix))))
+        self.assertTrue(0 < len(prefix) < entries)
+
+
+class TestUniversalCache(unittest.TestCase):
+
+    def make(self, **kwargs):
+        cache = UniversalCache(**kwargs)
+        cache.compressor = None
+        return cache
+
+    def test_least_recently_used_is_evicted_first(self):
+        cache = self.make(max_size=3)
+        for key in 'abc':
+            cache.set(key, {'key': key})
+        self.assertEqual(cache.get('a'), {'key': 'a'})
+        cache.set('d', {'key': 'd'})  # evicts b
+        cache.set('c', {'key': 'c2'})  # rewriting refreshes too
+        cache.set('e', {'key': 'e'})  # evicts a
+        self.assertEqual(list(cache.cache), ['d', 'c', 'e'])
+        self.assertIsNone(cache.get('b'))
+        self.assertEqual((cache.metrics['hits'], cache.metrics['misses'], cache.metrics['evictions']), (1, 1, 2))
+
+    def test_byte_budget_tracks_a_pluggable_estimate(self):
+        cache = self.make(max_bytes=10, sizeof=lambda value: value['n'])
+        cache.set('a', {'n': 4})
+        cache.set('b', {'n': 4})
+        self.assertEqual(cache.nbytes, 8)
+        cache.set('a', {'n': 1})
+        self.assertEqual(cache.nbytes, 5)
+        cache.set('c', {'n': 6})
+        self.assertEqual(list(cache.cache), ['a', 'c'])
+        self.assertEqual((cache.nbytes, cache.metrics['bytes'], cache.metrics['evictions']), (7, 7, 1))
+        cache.delete('a')
+        cache.delete('missing')
+        self.assertEqual(cache.nbytes, 6)
+        cache.set('huge', {'n': 50})  # the newest entry is always kept
+        self.assertEqual((list(cache.cache), cache.nbytes), (['huge'], 50))
+
+    def test_nbytes_follows_in_place_refreshes(self):
+        cache = self.make()
+        for key in 'abcd':
+            cache.set(key, {'key': key, 'message': key * 50})
+
+        def assertTracked():
+            live = sum(laser._estimate_size(value) for value in cache.cache.values())
+            self.assertEqual((cache.nbytes, cache.metrics['bytes']), (live, live))
+
+        # Every fifth get refreshes the entry; force the entanglement branch too
+        with mock.patch.object(laser, 'BUMPY_AVAILABLE', True), \
+                mock.patch.object(laser.random, 'random', return_value=0.05):
+            for _ in range(10):
+                for key in 'abcd':
+                    cache.get(key)
+        self.assertGreater(cache.metrics['quantum_entanglements'], 0)
+        assertTracked()
+        cache.delete('c')
+        assertTracked()
+
+    def test_set_neither_polls_memory_nor_stringifies(self):
+        cache = self.make(max_size=50)
+        value = mock.MagicMock(spec=dict)
+        with mock.patch('laser.psutil.virtual_memory') as virtual_memory:
+            for i in range(200):
+                cache.set(f"k{i}", {'i': i})
+            cache.set('value', value)
+        virtual_memory.assert_not_called()
+        value.__str__.assert_not_called()
+        self.assertEqual(len(cache), 50)
+
+    def test_shrinking_max_size_evicts_on_the_next_set(self):
+        cache = self.make(max_size=100)
+        for i in range(100):
+            cache.set(i, {'i': i})
+        cache.max_size = 10
+        cache.set('new', {})
+        self.assertEqual(list(cache.cache), list(range(91, 100)) + ['new'])
+
+    def test_compression_is_decided_by_the_estimate(self):
+        cache = self.make(sizeof=lambda value: value.get('size', 0))
+        cache.compressor = object()
+        with mock.patch.object(cache, '_holographic_compress', return_value={'_compressed': True, 'size': 3}):
+            cache.set('small', {'size': laser.CACHE_COMPRESS_MIN_BYTES})
+            cache.set('large', {'size': laser.CACHE_COMPRESS_MIN_BYTES + 1})
+        self.assertNotIn('_compressed', cache.get('small'))
+        self.assertTrue(cache.get('large')['_compressed'])
+        self.assertEqual(cache.nbytes, laser.CACHE_COMPRESS_MIN_BYTES + 3)
+
+
+if __name__ == "__main__":
+    unittest.main()
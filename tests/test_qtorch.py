@@ -0,0 +1,798 @@
+import io
+import os
+import shutil
+import sys
+import tempfile
+import unittest
+import weakref
+
+import numpy as np
+
+sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+import qtorch
+
+
+class TestTensorStorage(unittest.TestCase):
+
+    def test_contiguous_storage_and_metadata(self):
+        """Verifies tensors own one contiguous buffer with shape/stride metadata."""
+        t = qtorch.tensor([[1.0, 2.0, 3.0], [4.0, 5.0, 6.0]])
+        self.assertIsInstance(t.data, np.ndarray)
+        self.assertTrue(t.is_contiguous())
+        self.assertEqual(t.shape, (2, 3))
+        self.assertEqual(t.strides, (3, 1))
+        self.assertEqual(t.numel, 6)
+        self.assertEqual(t.tolist(), [[1.0, 2.0, 3.0], [4.0, 5.0, 6.0]])
+
+    def test_scalar_and_reshape(self):
+        """Verifies scalars become 1-element tensors and reshape(-1) flattens."""
+        self.assertEqual(qtorch.tensor(3.0).shape, (1,))
+        t = qtorch.tensor([[1.0, 2.0], [3.0, 4.0]])
+        self.assertEqual(t.reshape(-1).shape, (4,))
+        self.assertEqual(t.T.tolist(), [[1.0, 3.0], [2.0, 4.0]])
+
+    def test_elementwise_ops_are_exact(self):
+        """Verifies vectorized kernels give exact arithmetic results."""
+        a = qtorch.tensor([1.0, 2.0, 3.0])
+        b = qtorch.tensor([4.0, 5.0, 6.0])
+        self.assertEqual((a + b).tolist(), [5.0, 7.0, 9.0])
+        self.assertEqual((a - b).tolist(), [-3.0, -3.0, -3.0])
+        self.assertEqual((a * b).tolist(), [4.0, 10.0, 18.0])
+        self.assertEqual((b / a).tolist(), [4.0, 2.5, 2.0])
+        self.assertEqual((-a).tolist(), [-1.0, -2.0, -3.0])
+        self.assertEqual(a.dot(b).item(), 32.0)
+
+    def test_division_by_zero_maps_to_inf(self):
+        """Verifies the |b| < 1e-12 division convention is preserved."""
+        out = qtorch.tensor([1.0, -1.0, 0.0]) / qtorch.tensor([0.0, 0.0, 0.0])
+        self.assertEqual(out.tolist(), [float('inf'), float('-inf'), 0.0])
+
+    def test_reductions_with_dim(self):
+        """Verifies sum/mean/max/min along a dimension."""
+        t = qtorch.tensor([[1.0, 5.0], [3.0, 2.0]])
+        self.assertEqual(t.sum(dim=0).tolist(), [4.0, 7.0])
+        self.assertEqual(t.mean(dim=1, keepdim=True).shape, (2, 1))
+        self.assertEqual(t.max(dim=1).tolist(), [5.0, 3.0])
+        self.assertEqual(t.min().item(), 1.0)
+
+    def test_shape_mismatch_raises(self):
+        """Verifies incompatible operands are rejected."""
+        with self.assertRaisesRegex(ValueError, "Shape mismatch"):
+            qtorch.tensor([1.0, 2.0]) + qtorch.tensor([1.0, 2.0, 3.0])
+
+    def test_quantum_views_are_lazy(self):
+        """Verifies BUMPY/FLUMPY views are only built when a quantum method needs them."""
+        t = qtorch.tensor([1.0, 2.0, 3.0])
+        (t + t).sum()
+        self.assertIsNone(t._bumpy_cache)
+        t.quantum_entropy
+        self.assertIsNotNone(t._bumpy_cache)
+        t[0] = 7.0
+        self.assertIsNone(t._bumpy_cache)
+        self.assertEqual(t.tolist(), [7.0, 2.0, 3.0])
+
+    def test_unknown_backend_rejected(self):
+        """Verifies the backend registry refuses unknown engines."""
+        self.assertIs(qtorch.get_backend(), qtorch.set_backend('numpy'))
+        with self.assertRaises(ValueError):
+            qtorch.set_backend('no-such-backend')
+
+
+class TestTensorAutograd(unittest.TestCase):
+
+    def test_sub_and_neg_gradients(self):
+        """Verifies gradients flow to both operands of sub and through neg."""
+        x = qtorch.tensor([1.0, 2.0], requires_grad=True)
+        y = qtorch.tensor([3.0, 5.0], requires_grad=True)
+        (-(x - y) * x).sum().backward()
+        np.testing.assert_allclose(x.grad.numpy(), [-2 * 1.0 + 3.0, -2 * 2.0 + 5.0])
+        np.testing.assert_allclose(y.grad.numpy(), [1.0, 2.0])
+
+    def test_pow_gradient_with_numpy_scalar_exponents(self):
+        """Verifies NumPy scalar exponents get the same gradient as Python numbers."""
+        for exponent in (2, 0.5, np.int64(2), np.float32(0.5)):
+            with self.subTest(exponent=repr(exponent)):
+                x = qtorch.tensor([1.0, 4.0], requires_grad=True, quantum_creativity=0.0)
+                (x ** exponent).sum().backward()
+                expected = float(exponent) * np.array([1.0, 4.0]) ** (float(exponent) - 1)
+                np.testing.assert_allclose(x.grad.numpy(), expected, rtol=1e-6)
+
+        x = qtorch.tensor([1.0, 4.0], requires_grad=True, quantum_creativity=0.0)
+        loss = (x ** np.array([2.0, 3.0])).sum()
+        with self.assertRaises(TypeError):
+            loss.backward()
+
+    def test_reshape_transpose_softmax_gradients(self):
+        """Verifies reshape, transpose and softmax propagate gradients."""
+        x = qtorch.tensor([0.5, -1.0, 2.0, 0.0], requires_grad=True)
+        w = qtorch.tensor([1.0, 2.0, 3.0, 4.0])
+        out = x.reshape(2, 2).T.softmax(dim=-1).reshape(-1)
+        (out * w).sum().backward()
+
+        xs = x.numpy().reshape(2, 2).T
+        y = np.exp(xs) / np.exp(xs).sum(axis=-1, keepdims=True)
+        g = w.numpy().reshape(2, 2)
+        expected = (y * (g - (g * y).sum(axis=-1, keepdims=True))).T.reshape(-1)
+        np.testing.assert_allclose(x.grad.numpy(), expected, rtol=1e-10)
+
+    def test_linear_forward_and_backward(self):
+        """Verifies Linear is a fused, differentiable (x @ W.T + b) * coherence."""
+        qtorch.manual_seed(0)
+        layer = qtorch.Linear(4, 3)
+        x = qtorch.randn(5, 4)
+        out = layer(x)
+        scale = layer.weight.quantum_coherence
+        expected = (x.numpy() @ layer.weight.numpy().T + layer.bias.numpy()) * scale
+        np.testing.assert_allclose(out.numpy(), expected)
+
+        out.sum().backward()
+        np.testing.assert_allclose(layer.bias.grad.numpy(), np.full(3, 5 * scale))
+        np.testing.assert_allclose(layer.weight.grad.numpy(),
+                                   np.tile(x.numpy().sum(axis=0) * scale, (3, 1)))
+
+    def test_parameters_are_leaves(self):
+        """Verifies module parameters carry no autograd context."""
+        layer = qtorch.Linear(3, 2)
+        for param in layer.parameters():
+            self.assertIsNone(param._ctx)
+            self.assertTrue(param.requires_grad)
+
+    def test_optimizers_reduce_loss(self):
+        """Verifies SGD (with momentum) and Adam train a small regression."""
+        for make_opt in (lambda p: qtorch.SGD(p, lr=0.05, momentum=0.9),
+                         lambda p: qtorch.Adam(p, lr=0.05)):
+            qtorch.manual_seed(1)
+            model = qtorch.Linear(3, 1)
+            opt = make_opt(model.parameters())
+            x = qtorch.randn(16, 3)
+            target = qtorch.tensor(x.numpy() @ np.array([[1.0], [-2.0], [0.5]]))
+            losses = []
+            for _ in range(60):
+                opt.zero_grad()
+                loss = qtorch.MSELoss()(model(x), target)
+                loss.backward()
+                opt.step()
+                losses.append(loss.item())
+            self.assertLess(losses[-1], losses[0] * 0.1)
+
+
+class TestAutogradEngine(unittest.TestCase):
+
+    def test_deep_chain_does_not_recurse(self):
+        """Verifies a 10k-deep chain backpropagates without hitting the recursion limit."""
+        depth = 10000
+        self.assertGreater(depth, sys.getrecursionlimit())
+        x = qtorch.tensor([1.0, 2.0], requires_grad=True)
+        y = x
+        for _ in range(depth):
+            y = y * 1.0 + 1.0
+        y.sum().backward()
+        np.testing.assert_allclose(x.grad.numpy(), [1.0, 1.0])
+
+    def test_diamond_graph_accumulates_once(self):
+        """Verifies shared subexpressions are visited once with summed gradients."""
+        x = qtorch.tensor([3.0], requires_grad=True)
+        a = x * 2.0
+        b = a * a
+        c = a + 1.0
+        (b + c).backward()
+        # d/dx (4x^2 + 2x + 1) = 8x + 2
+        self.assertAlmostEqual(x.grad.item(), 26.0)
+        self.assertIsNone(a.grad)
+
+    def test_context_freed_unless_retained(self):
+        """Verifies consumed contexts are released and retain_graph keeps them."""
+        x = qtorch.tensor([2.0], requires_grad=True)
+        y = (x * x).sum()
+        y.backward(retain_graph=True)
+        self.assertIsNotNone(y._ctx)
+        y.backward()
+        self.assertAlmostEqual(x.grad.item(), 8.0)
+        self.assertIsNone(y._ctx)
+
+    def test_intermediates_released_during_backward(self):
+        """Verifies a consumed intermediate is freed before backward reaches the leaves."""
+        x = qtorch.tensor([1.0, 2.0], requires_grad=True)
+        alive_at_probe = []
+
+        def probe(grad):
+            alive_at_probe.append(intermediate() is not None)
+            return ((x, grad),)
+
+        y = qtorch.Tensor(x.data * 1.0, x.dtype, x.device, True)
+        y._ctx = ('function', probe, x)
+        h = y * 2.0
+        intermediate = weakref.ref(h)
+        loss = (h * 3.0).sum()
+        del h, y
+        loss.backward()
+        self.assertEqual(alive_at_probe, [False])
+        np.testing.assert_array_equal(x.grad.numpy(), [6.0, 6.0])
+
+    def test_backward_through_freed_graph_raises(self):
+        """Verifies a freed intermediate is not mistaken for a leaf on a second pass."""
+        w = qtorch.tensor([1.0, 1.0], requires_grad=True)
+        h = w * 3.0
+        l1 = (h * 2.0).sum()
+        l2 = (h * 5.0).sum()
+        l1.backward()
+        with self.assertRaisesRegex(RuntimeError, "backward through the graph a second time"):
+            l2.backward()
+        with self.assertRaisesRegex(RuntimeError, "retain_graph=True"):
+            l1.backward()
+        np.testing.assert_array_equal(w.grad.numpy(), [6.0, 6.0])
+        self.assertIsNone(h.grad)
+        self.assertIsNone(l1.grad)
+
+    def test_retained_shared_subgraph_backward_twice(self):
+        """Verifies retain_graph lets a second loss reach the parameters through a shared node."""
+        w = qtorch.tensor([1.0, 1.0], requires_grad=True)
+        h = w * 3.0
+        (h * 2.0).sum().backward(retain_graph=True)
+        (h * 5.0).sum().backward()
+        np.testing.assert_array_equal(w.grad.numpy(), [21.0, 21.0])
+        self.assertIsNone(h.grad)
+
+
+def _reference_conv2d(x, weight, bias, stride, padding):
+    """The original nested-loop Conv2d forward, kept as the semantic reference."""
+    batch_size, in_channels, in_h, in_w = x.shape
+    out_channels, _, k_h, k_w = weight.shape
+    out_h = (in_h + 2 * padding - k_h) // stride + 1
+    out_w = (in_w + 2 * padding - k_w) // stride + 1
+    conv_h, conv_w = in_h + 2 * padding, in_w + 2 * padding
+    conv_data = [0.0] * (batch_size * in_channels * conv_h * conv_w)
+    flat = x.reshape(-1).tolist()
+    for b in range(batch_size):
+        for c in range(in_channels):
+            for h in range(in_h):
+                for w in range(in_w):
+                    conv_data[b * in_channels * conv_h * conv_w + c * conv_h * conv_w
+                              + (h + padding) * conv_w + (w + padding)] = \
+                        flat[b * in_channels * in_h * in_w + c * in_h * in_w + h * in_w + w]
+    weight_data = weight.reshape(-1).tolist()
+    out = [0.0] * (batch_size * out_channels * out_h * out_w)
+    for b in range(batch_size):
+        for oc in range(out_channels):
+            for oh in range(out_h):
+                for ow in range(out_w):
+                    sum_val = 0.0
+                    for ic in range(in_channels):
+                        for kh in range(k_h):
+                            for kw in range(k_w):
+                                ih = oh * stride + kh
+                                iw = ow * stride + kw
+                                if 0 <= ih < conv_h and 0 <= iw < conv_w:
+                                    sum_val += (conv_data[b * in_channels * conv_h * conv_w + ic * conv_h * conv_w
+                                                          + ih * conv_w + iw]
+                                                * weight_data[oc * in_channels * k_h * k_w + ic * k_h * k_w
+                                                              + kh * k_w + kw])
+                    out[b * out_channels * out_h * out_w + oc * out_h * out_w + oh * out_w + ow] = sum_val
+    return np.reshape(out, (batch_size, out_channels, out_h, out_w)) + bias.reshape(1, -1, 1, 1)
+
+
+class TestConv2d(unittest.TestCase):
+
+    def test_matches_loop_reference_on_random_shapes(self):
+        """Verifies im2col stride/padding semantics match the loop implementation."""
+        rng = np.random.RandomState(7)
+        for _ in range(25):
+            batch, in_c, out_c = rng.randint(1, 3), rng.randint(1, 4), rng.randint(1, 4)
+            k = rng.randint(1, 4)
+            stride, padding = rng.randint(1, 4), rng.randint(0, 3)
+            h, w = rng.randint(k, 9), rng.randint(k, 9)
+            conv = qtorch.Conv2d(in_c, out_c, k, stride=stride, padding=padding)
+            x = qtorch.tensor(rng.randn(batch, in_c, h, w))
+            expected = _reference_conv2d(x.numpy(), conv.weight.numpy(), conv.bias.numpy(), stride, padding)
+            np.testing.assert_allclose(conv(x).numpy(), expected, rtol=1e-10, atol=1e-12)
+
+    def test_gradients_match_finite_differences(self):
+        """Verifies col2im input/weight/bias gradients numerically."""
+        rng = np.random.RandomState(3)
+        conv = qtorch.Conv2d(2, 3, 3, stride=2, padding=1)
+        x = qtorch.tensor(rng.randn(2, 2, 5, 6), requires_grad=True)
+        upstream = rng.randn(*conv(x).shape)
+        (conv(x) * qtorch.tensor(upstream)).sum().backward()
+
+        def objective():
+            return float((conv(x).numpy() * upstream).sum())
+
+        eps = 1e-6
+        for param in (x, conv.weight, conv.bias):
+            flat = param.data.reshape(-1)
+            numeric = np.zeros(flat.size)
+            for i in range(flat.size):
+                orig = flat[i]
+                flat[i] = orig + eps
+                plus = objective()
+                flat[i] = orig - eps
+                minus = objective()
+                flat[i] = orig
+                numeric[i] = (plus - minus) / (2 * eps)
+            np.testing.assert_allclose(param.grad.numpy().reshape(-1), numeric, rtol=1e-5, atol=1e-7)
+
+
+class _RecordingSink:
+    def __init__(self):
+        self.records = []
+
+    def log(self, value, message, system_context=None):
+        self.records.append((value, message, system_context))
+
+
+class TestLoggingPolicy(unittest.TestCase):
+
+    def setUp(self):
+        self.sink = _RecordingSink()
+        self.previous = qtorch.get_logging_policy()
+
+    def tearDown(self):
+        qtorch.set_logging_policy(self.previous)
+
+    def _train_steps(self, steps=3):
+        model = qtorch.Linear(4, 2)
+        opt = qtorch.SGD(model.parameters(), lr=0.01)
+        x = qtorch.randn(8, 4)
+        for _ in range(steps):
+            opt.zero_grad()
+            model(x).sum().backward()
+            opt.step()
+
+    def test_per_step_flushes_one_summary_per_step(self):
+        """Verifies per-step mode emits exactly one summarized record per optimizer step."""
+        qtorch.set_logging_policy(qtorch.LoggingPolicy('per-step', sink=self.sink))
+        self._train_steps(3)
+        self.assertEqual(len(self.sink.records), 3)
+        summary = self.sink.records[-1][2]
+        self.assertEqual(summary['counts']['linear_forward'], 1)
+        self.assertIn('linear_forward:8x2', summary['shapes'])
+        self.assertIn('window_seconds', summary)
+
+    def test_full_mode_logs_every_event(self):
+        """Verifies full mode keeps the legacy one-record-per-event behaviour."""
+        qtorch.set_logging_policy(qtorch.LoggingPolicy('full', sink=self.sink))
+        qtorch.tensor([1.0, 2.0])
+        self.assertEqual(self.sink.records[-1][1], 'tensor_created')
+        self.assertEqual(self.sink.records[-1][2]['shape'], (2,))
+
+    def test_off_and_sampled_modes(self):
+        """Verifies off drops events and sampled buffers only a fraction while counting all."""
+        qtorch.set_logging_policy(qtorch.LoggingPolicy('off', sink=self.sink))
+        self._train_steps(2)
+        self.assertEqual(self.sink.records, [])
+
+        policy = qtorch.LoggingPolicy('sampled', rate=0.1, capacity=100000, sink=self.sink)
+        qtorch.set_logging_policy(policy)
+        for _ in range(2000):
+            qtorch.tensor([0.0])
+        self.assertEqual(policy.events_seen, 2000)
+        self.assertLess(len(policy.events), 600)
+        self.assertEqual(policy.flush()['counts']['tensor_created'], 2000)
+
+    def test_ring_buffer_is_bounded(self):
+        """Verifies the event buffer never exceeds its capacity."""
+        policy = qtorch.LoggingPolicy('per-step', capacity=16, sink=self.sink)
+        qtorch.set_logging_policy(policy)
+        for _ in range(100):
+            qtorch.tensor([0.0])
+        self.assertEqual(len(policy.events), 16)
+        self.assertEqual(policy.counts['tensor_created'], 100)
+
+
+class TestBroadcasting(unittest.TestCase):
+
+    def test_forward_matches_numpy(self):
+        """Verifies (N, C) op (C,), (N, 1) op (1, C) and scalar operands broadcast like NumPy."""
+        a = np.arange(6.0).reshape(2, 3)
+        b = np.array([1.0, 2.0, 4.0])
+        col = np.array([[2.0], [3.0]])
+        ta, tb, tcol = qtorch.tensor(a), qtorch.tensor(b), qtorch.tensor(col)
+        np.testing.assert_allclose((ta + tb).numpy(), a + b)
+        np.testing.assert_allclose((ta * tcol).numpy(), a * col)
+        np.testing.assert_allclose((tcol - tb).numpy(), col - b)
+        np.testing.assert_allclose((ta / tb).numpy(), a / b)
+        np.testing.assert_allclose((2.0 * ta + 1.0).numpy(), 2.0 * a + 1.0)
+        np.testing.assert_allclose((1.0 - ta).numpy(), 1.0 - a)
+        np.testing.assert_allclose((12.0 / tb).numpy(), 12.0 / b)
+
+    def test_incompatible_shapes_raise(self):
+        """Verifies non-broadcastable operands are rejected."""
+        with self.assertRaisesRegex(ValueError, "Shape mismatch"):
+            qtorch.tensor(np.ones((2, 3))) + qtorch.tensor(np.ones((2,)))
+
+    def test_gradients_reduce_to_operand_shapes(self):
+        """Verifies backward sums broadcast gradients back to each operand's shape."""
+        x = qtorch.tensor(np.arange(6.0).reshape(2, 3), requires_grad=True)
+        bias = qtorch.tensor([1.0, 2.0, 3.0], requires_grad=True)
+        scale = qtorch.tensor([[2.0], [0.5]], requires_grad=True)
+        ((x + bias) * scale).sum().backward()
+        self.assertEqual(bias.grad.shape, (3,))
+        self.assertEqual(scale.grad.shape, (2, 1))
+        np.testing.assert_allclose(bias.grad.numpy(), [2.5, 2.5, 2.5])
+        np.testing.assert_allclose(scale.grad.numpy(), (x.numpy() + bias.numpy()).sum(axis=1, keepdims=True))
+        np.testing.assert_allclose(x.grad.numpy(), np.broadcast_to(scale.numpy(), (2, 3)))
+
+    def test_scalar_operands_are_not_materialized(self):
+        """Verifies scalars are kept as scalars in the graph instead of numel-sized buffers."""
+        x = qtorch.tensor(np.ones(1000), requires_grad=True)
+        y = 3.0 * x - 1.0
+        self.assertIsInstance(y._ctx[2], float)
+        y.sum().backward()
+        np.testing.assert_allclose(x.grad.numpy(), np.full(1000, 3.0))
+
+
+class TestFlatOptimizers(unittest.TestCase):
+
+    def _train(self, opt_cls, flat, steps=15, **kwargs):
+        qtorch.manual_seed(0)
+        hidden, head, unused = qtorch.Linear(5, 4), qtorch.Linear(4, 1), qtorch.Linear(4, 1)
+        groups = [{'params': list(hidden.parameters())},
+                  {'params': list(unused.parameters()) + list(head.parameters()), 'lr': 0.01}]
+        opt = opt_cls(groups, lr=0.05, flat=flat, **kwargs)
+        x, y = qtorch.randn(8, 5), qtorch.randn(8, 1)
+        for _ in range(steps):
+            opt.zero_grad()
+            qtorch.MSELoss()(head(hidden(x).relu()), y).backward()
+            opt.step()
+        return opt
+
+    def test_flat_mode_matches_per_parameter_updates(self):
+        """Verifies fused flat-buffer steps equal per-parameter steps, with per-group lr."""
+        for opt_cls, kwargs in ((qtorch.SGD, dict(momentum=0.9, weight_decay=0.01, nesterov=True)),
+                                (qtorch.Adam, dict(weight_decay=0.01, amsgrad=True))):
+            reference = self._train(opt_cls, False, **kwargs)
+            fused = self._train(opt_cls, True, **kwargs)
+            for p_ref, p_flat in zip(reference.params, fused.params):
+                np.testing.assert_allclose(p_flat.numpy(), p_ref.numpy(), rtol=1e-12, atol=1e-14)
+            # The unused layer never receives a gradient: neither mode moves it
+            qtorch.manual_seed(0)
+            initial = [qtorch.Linear(5, 4), qtorch.Linear(4, 1), qtorch.Linear(4, 1)][2]
+            for p_init, p_flat in zip(initial.parameters(), fused.param_groups[1]['params']):
+                np.testing.assert_array_equal(p_flat.numpy(), p_init.numpy())
+
+    def test_parameters_are_views_into_one_buffer(self):
+        """Verifies flat mode re-binds parameters and gradients into shared buffers."""
+        opt = self._train(qtorch.Adam, True, steps=1)
+        unused = opt.param_groups[1]['params'][:2]
+        for param in opt.params:
+            self.assertTrue(np.shares_memory(param.data, opt._flat_buffers['param']))
+            if any(param is p for p in unused):
+                self.assertIsNone(param.grad)
+            else:
+                self.assertTrue(np.shares_memory(param.grad.data, opt._flat_buffers['grad']))
+
+    def test_params_without_gradients_are_skipped(self):
+        """Verifies a parameter outside the graph is left untouched, as in per-parameter mode."""
+        used, unused = qtorch.Linear(3, 1), qtorch.Linear(3, 1)
+        opt = qtorch.Adam(list(used.parameters()) + list(unused.parameters()), lr=0.1, flat=True)
+        before = unused.weight.numpy()
+        opt.zero_grad()
+        for param in unused.parameters():
+            param.grad = None
+        used(qtorch.randn(4, 3)).sum().backward()
+        opt.step()
+        np.testing.assert_array_equal(unused.weight.numpy(), before)
+        self.assertEqual(opt.state[unused.weight]['step'], 0)
+
+
+class TestFusedKernels(unittest.TestCase):
+
+    def setUp(self):
+        qtorch.manual_seed(0)
+
+    def test_linear_relu_matches_unfused(self):
+        """Verifies LinearReLU forward and gradients agree with Linear followed by relu."""
+        fused = qtorch.LinearReLU(6, 5)
+        plain = qtorch.Linear(6, 5)
+        plain.weight.data[...] = fused.weight.data
+        plain.bias.data[...] = fused.bias.data
+        x_fused = qtorch.randn(8, 6, requires_grad=True)
+        x_plain = qtorch.tensor(x_fused.numpy(), requires_grad=True)
+
+        out_fused = fused(x_fused)
+        out_plain = plain(x_plain).relu()
+        np.testing.assert_allclose(out_fused.numpy(), out_plain.numpy(), rtol=1e-12)
+        self.assertEqual(out_fused._ctx[0], 'linear_relu')
+
+        (out_fused * out_fused).sum().backward()
+        (out_plain * out_plain).sum().backward()
+        np.testing.assert_allclose(x_fused.grad.numpy(), x_plain.grad.numpy(), rtol=1e-12)
+        np.testing.assert_allclose(fused.weight.grad.numpy(), plain.weight.grad.numpy(), rtol=1e-12)
+        np.testing.assert_allclose(fused.bias.grad.numpy(), plain.bias.grad.numpy(), rtol=1e-12)
+
+    def test_log_softmax_is_stable_and_matches_log_of_softmax(self):
+        """Verifies log_softmax agrees with log(softmax) and survives huge logits."""
+        x = qtorch.randn(4, 7, requires_grad=True)
+        np.testing.assert_allclose(x.log_softmax(dim=1).numpy(),
+                                   np.log(x.softmax(dim=1).numpy()), rtol=1e-10)
+
+        weights = np.random.randn(4, 7)
+        (x.log_softmax(dim=1) * qtorch.tensor(weights)).sum().backward()
+        probs = x.softmax(dim=1).numpy()
+        expected = weights - probs * weights.sum(axis=1, keepdims=True)
+        np.testing.assert_allclose(x.grad.numpy(), expected, rtol=1e-10)
+
+        huge = qtorch.tensor([[1000.0, 0.0, -1000.0]])
+        self.assertTrue(np.isfinite(huge.log_softmax(dim=1).numpy()).all())
+
+    def test_cross_entropy_matches_unfused_softmax_nll(self):
+        """Verifies the fused loss and its single backward node agree with log_softmax -> NLL."""
+        logits = np.random.randn(10, 5)
+        labels = np.random.randint(0, 5, 10)
+        onehot = np.eye(5)[labels]
+
+        for reduction in ('mean', 'sum'):
+            fused_in = qtorch.tensor(logits, requires_grad=True)
+            loss = qtorch.CrossEntropyLoss(reduction=reduction)(fused_in, qtorch.tensor(labels))
+            self.assertEqual(loss._ctx[0], 'cross_entropy')
+            loss.backward()
+
+            plain_in = qtorch.tensor(logits, requires_grad=True)
+            nll = -(plain_in.log_softmax(dim=1) * qtorch.tensor(onehot)).sum()
+            if reduction == 'mean':
+                nll = nll / 10.0
+            nll.backward()
+
+            np.testing.assert_allclose(loss.numpy(), nll.numpy(), rtol=1e-10)
+            np.testing.assert_allclose(fused_in.grad.numpy(), plain_in.grad.numpy(), rtol=1e-8, atol=1e-12)
+
+        probs = np.exp(logits) / np.exp(logits).sum(axis=1, keepdims=True)
+        expected = -np.log(probs[np.arange(10), labels]).mean()
+        self.assertAlmostEqual(qtorch.CrossEntropyLoss()(qtorch.tensor(logits), qtorch.tensor(labels)).item(),
+                               expected, places=12)
+
+        # Probability targets are equivalent to class indices for one-hot rows
+        from_probs = qtorch.CrossEntropyLoss()(qtorch.tensor(logits), qtorch.tensor(onehot))
+        from_labels = qtorch.CrossEntropyLoss()(qtorch.tensor(logits), qtorch.tensor(labels))
+        np.testing.assert_allclose(from_probs.numpy(), from_labels.numpy(), rtol=1e-12)
+
+    def test_cross_entropy_ignore_index_and_none_reduction(self):
+        """Verifies ignored rows contribute neither loss nor gradient."""
+        logits = qtorch.randn(4, 3, requires_grad=True)
+        labels = qtorch.tensor([0, -100, 2, 1])
+        per_sample = qtorch.CrossEntropyLoss(reduction='none')(logits, labels)
+        self.assertEqual(per_sample.shape, (4,))
+        self.assertEqual(per_sample.numpy()[1], 0.0)
+
+        mean = qtorch.CrossEntropyLoss()(logits, labels)
+        self.assertAlmostEqual(mean.item(), per_sample.numpy().sum() / 3, places=12)
+        mean.backward()
+        np.testing.assert_array_equal(logits.grad.numpy()[1], np.zeros(3))
+        np.testing.assert_allclose(logits.grad.numpy().sum(axis=1), np.zeros(4), atol=1e-12)
+
+
+class TestCheckpointFormat(unittest.TestCase):
+
+    def setUp(self):
+        qtorch.manual_seed(0)
+        self.tmpdir = tempfile.mkdtemp()
+        self.path = os.path.join(self.tmpdir, 'model.qt')
+
+    def tearDown(self):
+        shutil.rmtree(self.tmpdir, ignore_errors=True)
+
+    def test_round_trip_through_file_and_stream(self):
+        """Verifies parameters, buffers and extra values survive save/load bit-exactly."""
+        model = qtorch.BatchNorm2d(4)
+        model._buffers['running_mean'].data[...] = np.arange(4.0)
+        state = model.state_dict()
+        state['epoch'] = 3
+        qtorch.save(state, self.path)
+
+        stream = io.BytesIO()
+        qtorch.save(state, stream)
+        stream.seek(0)
+
+        for loaded in (qtorch.load(self.path), qtorch.load(stream), qtorch.load(self.path, mmap=True)):
+            self.assertEqual(list(loaded), ['weight', 'bias', 'running_mean', 'running_var', 'epoch'])
+            self.assertEqual(loaded['epoch'], 3)
+            for name in ('weight', 'bias', 'running_mean', 'running_var'):
+                np.testing.assert_array_equal(loaded[name].numpy(), state[name].numpy())
+
+        with open(self.path, 'rb') as f:
+            self.assertEqual(f.read(8), b'QTCKPT\x00\x01')
+
+    def test_non_tensor_dtypes_round_trip_as_ndarrays(self):
+        """Verifies arrays Tensor cannot hold load back as ndarrays with their dtype intact."""
+        state = {'step': np.arange(3), 'mask': np.array([[True, False], [False, True]]),
+                 'weight': qtorch.randn(2, 2)}
+        qtorch.save(state, self.path)
+        for loaded in (qtorch.load(self.path), qtorch.load(self.path, mmap=True)):
+            for name in ('step', 'mask'):
+                self.assertIsInstance(loaded[name], np.ndarray)
+                self.assertEqual(loaded[name].dtype, state[name].dtype)
+                np.testing.assert_array_equal(loaded[name], state[name])
+            self.assertIsInstance(loaded['weight'], qtorch.Tensor)
+
+    def test_load_state_dict_copies_in_place(self):
+        """Verifies loading keeps flat optimizer views valid and rejects bad keys or shapes."""
+        source, target = qtorch.Linear(6, 3), qtorch.Linear(6, 3)
+        opt = qtorch.SGD(target.parameters(), lr=0.1, flat=True)
+        opt._flatten([])
+        qtorch.save(source.state_dict(), self.path)
+
+        target.load_state_dict(qtorch.load(self.path))
+        np.testing.assert_array_equal(target.weight.numpy(), source.weight.numpy())
+        self.assertTrue(np.shares_memory(target.weight.data, opt._flat_buffers['param']))
+
+        with self.assertRaises(KeyError):
+            target.load_state_dict({'weight': source.weight})
+        missing, unexpected = target.load_state_dict({'weight': source.weight, 'extra': 1.0}, strict=False)
+        self.assertEqual((missing, unexpected), (['bias'], ['extra']))
+        with self.assertRaises(ValueError):
+            qtorch.Linear(6, 4).load_state_dict(source.state_dict())
+
+    def test_mmap_load_is_lazy_and_copy_on_write(self):
+        """Verifies mmap tensors view the file and local writes never reach it."""
+        model = qtorch.Linear(64, 32)
+        qtorch.save(model.state_dict(), self.path)
+        loaded = qtorch.load(self.path, mmap=True)
+        self.assertIsInstance(loaded['weight'].data.base, np.memmap)
+
+        fresh = qtorch.Linear(64, 32)
+        fresh.load_state_dict(loaded, assign=True)
+        fresh.weight.data[...] = 0.0
+        np.testing.assert_array_equal(qtorch.load(self.path)['weight'].numpy(), model.weight.numpy())
+
+
+class TestBatchNorm(unittest.TestCase):
+
+    def setUp(self):
+        qtorch.manual_seed(0)
+
+    def test_training_normalizes_and_updates_running_stats(self):
+        """Verifies batch statistics are used in training and running buffers follow them."""
+        bn = qtorch.BatchNorm2d(3, momentum=0.5)
+        x = np.random.randn(4, 3, 5, 5) * 3.0 + 2.0
+        out = bn(qtorch.tensor(x)).numpy()
+        np.testing.assert_allclose(out.mean(axis=(0, 2, 3)), np.zeros(3), atol=1e-12)
+        np.testing.assert_allclose(out.var(axis=(0, 2, 3)), np.ones(3), rtol=1e-3)
+
+        np.testing.assert_allclose(bn._buffers['running_mean'].numpy(), 0.5 * x.mean(axis=(0, 2, 3)))
+        unbiased = x.var(axis=(0, 2, 3), ddof=1)
+        np.testing.assert_allclose(bn._buffers['running_var'].numpy(), 0.5 + 0.5 * unbiased)
+
+        bn.eval()
+        expected = (x - 0.5 * x.mean(axis=(0, 2, 3)).reshape(1, 3, 1, 1)) / \
+            np.sqrt(bn._buffers['running_var'].numpy().reshape(1, 3, 1, 1) + bn.eps)
+        np.testing.assert_allclose(bn(qtorch.tensor(x)).numpy(), expected, rtol=1e-12)
+
+    def test_gradients_match_finite_differences(self):
+        """Verifies batch_norm backward in training and eval mode."""
+        for training in (True, False):
+            bn = qtorch.BatchNorm1d(3)
+            bn.weight.data[...] = [0.5, 1.5, -1.0]
+            bn.bias.data[...] = [0.1, 0.2, 0.3]
+            bn.train(training)
+            x_data = np.random.randn(6, 3)
+            weights = np.random.randn(6, 3)
+
+            def loss(values):
+                return float((bn(qtorch.tensor(values)).numpy() * weights).sum())
+
+            x = qtorch.tensor(x_data, requires_grad=True)
+            (bn(x) * qtorch.tensor(weights)).sum().backward()
+
+            eps = 1e-6
+            numeric = np.zeros_like(x_data)
+            for idx in np.ndindex(*x_data.shape):
+                plus, minus = x_data.copy(), x_data.copy()
+                plus[idx] += eps
+                minus[idx] -= eps
+                numeric[idx] = (loss(plus) - loss(minus)) / (2 * eps)
+            np.testing.assert_allclose(x.grad.numpy(), numeric, rtol=1e-5, atol=1e-7)
+
+
+class TestDtypes(unittest.TestCase):
+
+    def setUp(self):
+        qtorch.manual_seed(0)
+
+    def test_storage_uses_requested_dtype(self):
+        """Verifies each dtype is stored natively and int8 cannot require gradients."""
+        for dtype, itemsize in ((qtorch.float64, 8), (qtorch.float32, 4), (qtorch.float16, 2), (qtorch.int8, 1)):
+            t = qtorch.zeros(10, 10, dtype=dtype)
+            self.assertEqual(t.dtype, dtype)
+            self.assertEqual(t.data.dtype, np.dtype(dtype))
+            self.assertEqual(t.data.nbytes, 100 * itemsize)
+        self.assertEqual(qtorch.tensor([1.0]).dtype, qtorch.get_default_dtype())
+        with self.assertRaises(TypeError):
+            qtorch.tensor([1, 2], dtype=qtorch.int8, requires_grad=True)
+        with self.assertRaises(TypeError):
+            qtorch.tensor([1.0], dtype='complex64')
+
+    def test_binary_op_casting_rules(self):
+        """Verifies tensor/tensor promotion and that Python scalars do not widen dtypes."""
+        i8 = qtorch.tensor([1, 2, 3], dtype=qtorch.int8)
+        f16 = qtorch.tensor([0.5, 1.0, 2.0], dtype=qtorch.float16)
+        f32 = qtorch.tensor([0.5, 1.0, 2.0], dtype=qtorch.float32)
+        cases = [
+            (i8 + i8, qtorch.int8), (i8 * 2, qtorch.int8), (i8 + 0.5, qtorch.float64),
+            (i8 / i8, qtorch.float64), (i8 + f16, qtorch.float16), (f16 * 3.0, qtorch.float16),
+            (f16 + f32, qtorch.float32), (f32 - 1, qtorch.float32), (f16 @ f16.reshape(3, 1), qtorch.float16),
+            (i8.sum(), qtorch.float64), (f16.sigmoid(), qtorch.float16), (i8.relu(), qtorch.int8),
+        ]
+        for result, expected in cases:
+            self.assertEqual(result.dtype, expected)
+            self.assertEqual(result.data.dtype, np.dtype(expected))
+        np.testing.assert_array_equal((i8 + 0.5).numpy(), [1.5, 2.5, 3.5])
+
+    def test_cast_is_differentiable(self):
+        """Verifies gradients flow through .half()/.float() back to the source dtype."""
+        x = qtorch.tensor([1.0, -2.0, 3.0], requires_grad=True)
+        (x.half() * x.float()).sum().backward()
+        self.assertEqual(x.grad.dtype, qtorch.float64)
+        np.testing.assert_allclose(x.grad.numpy(), 2 * x.numpy(), rtol=1e-3)
+        self.assertEqual(x.to(qtorch.int8).dtype, qtorch.int8)
+        self.assertIs(x.to('cpu'), x)
+
+    def test_module_half_and_float_keep_parameter_identity(self):
+        """Verifies Module.half()/float() convert parameters and buffers in place."""
+        model = qtorch.BatchNorm2d(3)
+        weight = model.weight
+        model.half()
+        self.assertIs(model.weight, weight)
+        self.assertEqual({t.data.dtype for t in model.state_dict().values()}, {np.dtype(np.float16)})
+        model.float()
+        self.assertEqual(model.weight.dtype, qtorch.float32)
+        with self.assertRaises(TypeError):
+            model.to(qtorch.int8)
+
+        path = os.path.join(tempfile.mkdtemp(), 'half.qt')
+        try:
+            qtorch.save(qtorch.Linear(4, 2).half().state_dict(), path)
+            self.assertEqual(qtorch.load(path)['weight'].dtype, qtorch.float16)
+        finally:
+            shutil.rmtree(os.path.dirname(path), ignore_errors=True)
+
+    def _train_regression(self, dtype, flat=False, steps=150):
+        rng = np.random.RandomState(0)
+        x = rng.randn(128, 8)
+        y = x @ rng.randn(8, 1) + 0.1 * rng.randn(128, 1)
+        qtorch.manual_seed(0)
+        model = qtorch.Linear(8, 1).to(dtype)
+        optimizer = qtorch.Adam(model.parameters(), lr=0.02, flat=flat)
+        inputs, targets = qtorch.tensor(x, dtype=dtype), qtorch.tensor(y, dtype=dtype)
+        criterion = qtorch.MSELoss()
+        for _ in range(steps):
+            optimizer.zero_grad()
+            loss = criterion(model(inputs), targets)
+            loss.backward()
+            optimizer.step()
+        return loss.item(), model, optimizer
+
+    def test_float16_training_converges_with_float32_master_weights(self):
+        """Verifies float16 training tracks float64 and keeps float32 master weights."""
+        reference, _, _ = self._train_regression(qtorch.float64)
+        half_loss, model, optimizer = self._train_regression(qtorch.float16)
+        self.assertLess(reference, 0.05)
+        self.assertAlmostEqual(half_loss, reference, delta=0.01)
+
+        master = optimizer.state[model.weight]['master']
+        self.assertEqual(master.dtype, qtorch.float32)
+        self.assertEqual(optimizer.state[model.weight]['exp_avg'].dtype, qtorch.float32)
+        self.assertEqual(model.weight.dtype, qtorch.float16)
+        np.testing.assert_array_equal(model.weight.numpy(), master.numpy().astype(np.float16))
+
+        flat_loss, flat_model, flat_opt = self._train_regression(qtorch.float16, flat=True)
+        self.assertEqual(flat_loss, half_loss)
+        self.assertEqual(flat_opt._flat_buffers['master'].dtype, np.float32)
+        np.testing.assert_array_equal(flat_model.weight.numpy(), model.weight.numpy())
+
+
+    def test_optimizer_refuses_parameters_cast_after_creation(self):
+        """Verifies step() raises instead of writing stale buffers back after Module.half()."""
+        for optimizer_cls, flat in ((qtorch.SGD, False), (qtorch.SGD, True), (qtorch.Adam, False), (qtorch.Adam, True)):
+            with self.subTest(optimizer=optimizer_cls.__name__, flat=flat):
+                model = qtorch.Linear(4, 2)
+                optimizer = optimizer_cls(model.parameters(), lr=0.1, flat=flat)
+                model.half()
+                model(qtorch.randn(3, 4, dtype=qtorch.float16)).sum().backward()
+                before = model.weight.numpy().copy()
+                with self.assertRaises(RuntimeError):
+                    optimizer.step()
+                np.testing.assert_array_equal(model.weight.numpy(), before)
+
+if __name__ == "__main__":
+    unittest.main()
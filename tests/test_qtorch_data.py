@@ -0,0 +1,124 @@
+import os
+import sys
+import time
+import threading
+import unittest
+
+import numpy as np
+
+sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+import qtorch
+
+data = qtorch.utils.data
+
+
+class _SlowDataset(data.Dataset):
+    """Per-sample dataset whose batch assembly costs a fixed delay."""
+
+    def __init__(self, n, delay):
+        self.n = n
+        self.delay = delay
+
+    def __getitem__(self, index):
+        if self.delay:
+            time.sleep(self.delay)
+        return np.full(4, float(index)), float(index % 3)
+
+    def __len__(self):
+        return self.n
+
+
+class _RecordingDataset(data.Dataset):
+    """Per-sample dataset that signals when each sample starts being fetched."""
+
+    def __init__(self, n):
+        self.n = n
+        self.started = [threading.Event() for _ in range(n)]
+
+    def __getitem__(self, index):
+        self.started[index].set()
+        return np.full(4, float(index)), index
+
+    def __len__(self):
+        return self.n
+
+    def fetched(self):
+        return sum(event.is_set() for event in self.started)
+
+
+class TestDataLoader(unittest.TestCase):
+
+    def setUp(self):
+        rng = np.random.RandomState(0)
+        self.x = rng.randn(1000, 8)
+        self.y = np.arange(1000.0)
+        self.dataset = data.TensorDataset(qtorch.tensor(self.x), self.y)
+
+    def test_batches_cover_dataset_once(self):
+        """Verifies batching, drop_last and that every sample appears exactly once."""
+        loader = data.DataLoader(self.dataset, batch_size=64, shuffle=True, generator=1)
+        seen = np.concatenate([yb.numpy() for _, yb in loader])
+        self.assertEqual(len(loader), 16)
+        self.assertEqual(sorted(seen.tolist()), self.y.tolist())
+
+        loader = data.DataLoader(self.dataset, batch_size=64, drop_last=True)
+        shapes = [xb.shape for xb, _ in loader]
+        self.assertEqual(len(shapes), len(loader))
+        self.assertTrue(all(shape == (64, 8) for shape in shapes))
+
+    def test_seeded_shuffle_is_reproducible(self):
+        """Verifies the same generator seed yields the same epoch order."""
+        first = [yb.numpy() for _, yb in data.DataLoader(self.dataset, 100, shuffle=True, generator=7)]
+        second = [yb.numpy() for _, yb in data.DataLoader(self.dataset, 100, shuffle=True, generator=7)]
+        for a, b in zip(first, second):
+            np.testing.assert_array_equal(a, b)
+        self.assertFalse(np.array_equal(first[0], np.arange(100.0)))
+
+    def test_collate_fn_and_prefetch_preserve_order(self):
+        """Verifies custom collate_fn results arrive in order through the prefetch queue."""
+        dataset = _SlowDataset(200, delay=0.0)
+        collate = lambda samples: [label for _, label in samples]
+        plain = list(data.DataLoader(dataset, batch_size=16, collate_fn=collate))
+        prefetched = list(data.DataLoader(dataset, batch_size=16, collate_fn=collate, num_workers=3))
+        self.assertEqual(plain, prefetched)
+
+        xb, yb = next(iter(data.DataLoader(dataset, batch_size=5)))
+        self.assertEqual(xb.shape, (5, 4))
+        self.assertEqual(yb.tolist(), [0.0, 1.0, 2.0, 0.0, 1.0])
+
+    def test_prefetch_overlaps_with_training(self):
+        """Verifies batch N+1 is assembled while batch N is being consumed."""
+        dataset = _RecordingDataset(10)
+        batches = iter(data.DataLoader(dataset, batch_size=1, num_workers=1, prefetch_factor=1))
+        next(batches)
+        # The consumer holds batch 0 and has not asked for batch 1 yet
+        self.assertTrue(dataset.started[1].wait(5))
+        self.assertEqual([yb.tolist() for _, yb in batches], [[float(i)] for i in range(1, 10)])
+
+    def test_prefetch_queue_is_bounded(self):
+        """Verifies no more than num_workers * prefetch_factor batches are fetched ahead."""
+        dataset = _RecordingDataset(40)
+        depth = 2 * 3
+        batches = iter(data.DataLoader(dataset, batch_size=1, num_workers=2, prefetch_factor=3))
+        for consumed in range(1, 30):
+            next(batches)
+            # Wait until the workers have filled the queue, then give them a
+            # chance to overrun it
+            self.assertTrue(dataset.started[consumed + depth - 1].wait(5))
+            time.sleep(0.005)
+            self.assertEqual(dataset.fetched(), consumed + depth)
+        batches.close()
+
+    def test_vectorized_dataset_path_matches_per_sample_collate(self):
+        """Verifies TensorDataset batches equal collating the same samples one by one."""
+        loader = data.DataLoader(self.dataset, batch_size=64, shuffle=True, generator=3, num_workers=2)
+        order = np.random.default_rng(3).permutation(len(self.dataset))
+        for i, (xb, yb) in enumerate(loader):
+            samples = [self.dataset[int(j)] for j in order[i * 64:(i + 1) * 64]]
+            expected_x, expected_y = data.default_collate(samples)
+            np.testing.assert_array_equal(xb.numpy(), expected_x.numpy())
+            np.testing.assert_array_equal(yb.numpy().ravel(), expected_y.numpy().ravel())
+
+if __name__ == "__main__":
+    unittest.main()
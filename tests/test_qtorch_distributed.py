@@ -0,0 +1,107 @@
+import os
+import sys
+import time
+import unittest
+
+import numpy as np
+
+sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+import qtorch
+
+dist = qtorch.distributed
+
+N_SAMPLES = 256
+STEPS = 40
+
+
+def _regression_data():
+    rng = np.random.RandomState(0)
+    x = rng.randn(N_SAMPLES, 8)
+    y = x @ rng.randn(8, 1) + 0.5 + 0.05 * rng.randn(N_SAMPLES, 1)
+    return x, y
+
+
+def _train(rank, group):
+    """Full-batch SGD where each rank sees an equal shard of the batch."""
+    qtorch.set_logging_policy('off')
+    qtorch.manual_seed(rank)  # replicas start apart; broadcast aligns them
+    model = qtorch.Linear(8, 1)
+    dist.broadcast_parameters(model.parameters(), group)
+    optimizer = qtorch.SGD(model.parameters(), lr=0.1, momentum=0.9)
+    criterion = qtorch.MSELoss()
+
+    x, y = _regression_data()
+    shard = slice(rank * N_SAMPLES // group.world_size, (rank + 1) * N_SAMPLES // group.world_size)
+    x_shard, y_shard = qtorch.tensor(x[shard]), qtorch.tensor(y[shard])
+    for _ in range(STEPS):
+        optimizer.zero_grad()
+        criterion(model(x_shard), y_shard).backward()
+        dist.all_reduce_gradients(model.parameters(), group)
+        optimizer.step()
+
+    with qtorch.no_grad():
+        loss = criterion(model(qtorch.tensor(x)), qtorch.tensor(y)).item()
+    return loss, model.weight.numpy()
+
+
+def _reduce_large(rank, group):
+    values = np.full(group.capacity * 2 + 3, float(rank + 1))
+    return group.all_reduce(values, op='sum')
+
+
+def _reduce_then_broadcast(rank, group):
+    wait, calls = group.barrier, [0]
+
+    def slow_barrier():
+        wait()
+        calls[0] += 1
+        if rank and calls[0] == 2:
+            time.sleep(0.2)  # linger before all_reduce's all-gather reads the result slot
+
+    group.barrier = slow_barrier
+    reduced = group.all_reduce(np.full(64, float(rank + 1)))
+    broadcast = group.broadcast(np.full(64, 100.0 + rank), src=0)
+    return reduced, broadcast
+
+
+def _fail(rank, group):
+    if rank == 1:
+        raise ValueError("boom")
+    group.barrier()
+
+
+class TestLocalDataParallel(unittest.TestCase):
+
+    def test_one_and_four_workers_converge_to_same_loss(self):
+        """Verifies sharded gradients averaged over 4 ranks train like one full-batch worker."""
+        (single_loss, single_weight), = dist.spawn(_train, 1)
+        results = dist.spawn(_train, 4)
+
+        self.assertLess(single_loss, 0.05)
+        for loss, weight in results:
+            self.assertAlmostEqual(loss, single_loss, delta=1e-9)
+            np.testing.assert_array_equal(weight, results[0][1])
+        np.testing.assert_allclose(results[0][1], single_weight, rtol=1e-9)
+
+    def test_all_reduce_spans_multiple_capacity_pieces(self):
+        """Verifies arrays larger than the shared slot are reduced piece by piece."""
+        results = dist.spawn(_reduce_large, 3, capacity=1024)
+        for reduced in results:
+            np.testing.assert_array_equal(reduced, np.full(2051, 6.0))
+
+    def test_broadcast_right_after_all_reduce(self):
+        """Verifies broadcast waits for slower ranks to finish reading the all_reduce result."""
+        for reduced, broadcast in dist.spawn(_reduce_then_broadcast, 4):
+            np.testing.assert_array_equal(reduced, np.full(64, 10.0))
+            np.testing.assert_array_equal(broadcast, np.full(64, 100.0))
+
+    def test_worker_failure_is_reported(self):
+        """Verifies an exception in one rank surfaces instead of deadlocking the others."""
+        with self.assertRaises(RuntimeError) as ctx:
+            dist.spawn(_fail, 2)
+        self.assertIn("boom", str(ctx.exception))
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,81 @@
+import os
+import sys
+import subprocess
+import unittest
+
+sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+import qtorch
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+OPTIONAL_MODULES = ('bumpy', 'flumpy', 'laser', 'anneal', 'dissipative')
+
+# Milliseconds `import qtorch` may spend beyond importing numpy. The eager
+# import of every integration cost ~120 ms here; the lazy one ~30 ms.
+IMPORT_BUDGET_MS = float(os.environ.get('QTORCH_IMPORT_BUDGET_MS', 60))
+
+
+def _python(*args):
+    env = dict(os.environ)
+    env.pop('PYTHONDONTWRITEBYTECODE', None)
+    return subprocess.run([sys.executable, *args], cwd=ROOT, env=env,
+                          capture_output=True, text=True, check=True)
+
+
+def _own_import_ms():
+    """qtorch's cumulative -X importtime minus the numpy import under it"""
+    stderr = _python('-X', 'importtime', '-c', 'import qtorch').stderr
+    total = numpy = 0
+    for line in stderr.splitlines():
+        if not line.startswith('import time:') or 'self [us]' in line:
+            continue
+        _, cumulative, name = line[len('import time:'):].split('|')
+        if name == ' qtorch':
+            total = int(cumulative)
+        elif name == '   numpy':
+            numpy = int(cumulative)
+    return (total - numpy) / 1e3
+
+
+class TestLazyImport(unittest.TestCase):
+
+    def test_import_prints_nothing_and_defers_integrations(self):
+        """Verifies import is silent and loads none of the optional integrations."""
+        code = ("import sys, qtorch; "
+                f"sys.stderr.write(','.join(m for m in {OPTIONAL_MODULES!r} if m in sys.modules))")
+        proc = _python('-c', code)
+        self.assertEqual(proc.stdout, '')
+        self.assertEqual(proc.stderr, '')
+
+    def test_integration_loads_on_first_access_and_logs_at_debug(self):
+        """Verifies an integration is imported on first attribute access and reported at DEBUG."""
+        code = ("import logging, sys; logging.basicConfig(level=logging.DEBUG, format='%(name)s %(message)s'); "
+                "import qtorch; assert 'bumpy' not in sys.modules; "
+                "print(qtorch.BUMPY_AVAILABLE, 'bumpy' in sys.modules)")
+        proc = _python('-c', code)
+        available, loaded = proc.stdout.split()[-2:]
+        self.assertEqual(loaded, 'True')
+        self.assertEqual(available, str(qtorch._optional('BumpyArray') is not None))
+        self.assertIn('qtorch ', proc.stderr)
+        self.assertIn('BUMPY', proc.stderr)
+
+    def test_legacy_exports_resolve(self):
+        """Verifies the old module-level names still resolve through the lazy loader."""
+        self.assertEqual(qtorch.LASER_AVAILABLE, qtorch._laser() is not None)
+        self.assertTrue(hasattr(qtorch.LASER, 'log'))
+        self.assertIs(qtorch.torch.laser, qtorch._laser())
+        self.assertIs(qtorch.FlumpyArray, qtorch._optional('FlumpyArray'))
+        with self.assertRaises(AttributeError):
+            qtorch.no_such_integration
+
+    def test_import_time_within_budget(self):
+        """Verifies import qtorch stays within its time budget on top of numpy."""
+        _own_import_ms()  # warm the bytecode cache
+        best = min(_own_import_ms() for _ in range(3))
+        self.assertLess(best, IMPORT_BUDGET_MS,
+                        f"import qtorch took {best:.1f} ms beyond numpy (budget {IMPORT_BUDGET_MS:.0f} ms); "
+                        "see benchmarks/bench_qtorch_import.py")
+
+
+if __name__ == "__main__":
+    unittest.main()
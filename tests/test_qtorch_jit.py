@@ -0,0 +1,117 @@
+import os
+import sys
+import unittest
+
+import numpy as np
+
+sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+import qtorch
+
+
+class _ConvNet(qtorch.Module):
+    """Conv/BN/ReLU feature extractor followed by a Linear/BN/LinearReLU head."""
+
+    def __init__(self):
+        super().__init__()
+        self.add_module('conv', qtorch.Conv2d(3, 8, 3, padding=1))
+        self.add_module('bn', qtorch.BatchNorm2d(8))
+        self.add_module('fc', qtorch.Linear(8 * 6 * 6, 16))
+        self.add_module('bn1', qtorch.BatchNorm1d(16))
+        self.add_module('head', qtorch.LinearReLU(16, 5))
+
+    def forward(self, x):
+        m = self._modules
+        h = m['bn'](m['conv'](x)).relu()
+        h = h.reshape(x.shape[0], -1)
+        return m['head'](m['bn1'](m['fc'](h))).softmax(dim=1) * 2.0 - 0.5
+
+
+class _HalfNet(qtorch.Module):
+    """float16 Linear/ReLU/Linear stack behind float32 input and output casts."""
+
+    def __init__(self):
+        super().__init__()
+        self.add_module('fc1', qtorch.Linear(6, 4))
+        self.add_module('fc2', qtorch.Linear(4, 3))
+
+    def forward(self, x):
+        m = self._modules
+        return m['fc2'](m['fc1'](x.half()).relu()).float()
+
+
+class TestTrace(unittest.TestCase):
+
+    def setUp(self):
+        qtorch.manual_seed(0)
+        self.net = _ConvNet()
+        for _ in range(3):  # populate non-trivial running statistics
+            self.net(qtorch.randn(16, 3, 6, 6))
+
+    def _eager(self, x):
+        self.net.eval()
+        try:
+            with qtorch.no_grad():
+                return self.net(x).numpy()
+        finally:
+            self.net.train()
+
+    def test_replay_matches_eager_and_folds_batch_norm(self):
+        """Verifies replay equals eval-mode eager output with BN folded into conv/linear."""
+        x = qtorch.randn(4, 3, 6, 6)
+        traced = qtorch.jit.trace(self.net, x)
+        self.assertEqual(traced.ops, ['conv2d+batch_norm', 'relu', 'reshape', 'linear+batch_norm',
+                                      'linear_relu', 'softmax', 'mul', 'sub'])
+        self.assertTrue(self.net.training)
+
+        for _ in range(2):  # buffers are reused across calls
+            fresh = qtorch.randn(4, 3, 6, 6)
+            np.testing.assert_allclose(traced(fresh).numpy(), self._eager(fresh), rtol=1e-10, atol=1e-12)
+
+    def test_replay_builds_no_autograd_state(self):
+        """Verifies outputs are plain leaves and earlier results are not overwritten."""
+        x = qtorch.randn(2, 3, 6, 6, requires_grad=True)
+        traced = qtorch.jit.trace(self.net, x)
+        first = traced(x)
+        self.assertIsNone(first._ctx)
+        self.assertFalse(first.requires_grad)
+        snapshot = first.numpy()
+        traced(qtorch.randn(2, 3, 6, 6))
+        np.testing.assert_array_equal(first.numpy(), snapshot)
+
+    def test_constants_are_frozen_and_shape_is_checked(self):
+        """Verifies the plan snapshots parameters and rejects other input shapes."""
+        x = qtorch.randn(1, 3, 6, 6)
+        traced = qtorch.jit.trace(self.net, x)
+        before = traced(x).numpy()
+        self.net._modules['head'].weight.data[...] = 0.0
+        np.testing.assert_array_equal(traced(x).numpy(), before)
+        with self.assertRaises(ValueError):
+            traced(qtorch.randn(2, 3, 6, 6))
+
+    def test_untraceable_graph_raises(self):
+        """Verifies outputs that bypass the tape are rejected instead of frozen."""
+        class Detached(qtorch.Module):
+            def forward(self, x):
+                return x.detach() * 2.0
+
+        with self.assertRaises(RuntimeError):
+            qtorch.jit.trace(Detached(), qtorch.randn(3))
+
+
+    def test_half_model_with_casts_traces(self):
+        """Verifies dtype casts replay into buffers of the target dtype on a .half() model."""
+        net = _HalfNet().half()
+        x = qtorch.randn(5, 6)
+        traced = qtorch.jit.trace(net, x)
+        self.assertEqual(traced.ops, ['cast', 'linear', 'relu', 'linear', 'cast'])
+        self.assertEqual([out.dtype for _, out, _, _ in traced._steps][:4], [np.float16] * 4)
+        net.eval()
+        with qtorch.no_grad():
+            expected = net(x).numpy()
+        replayed = traced(x).numpy()
+        self.assertEqual(replayed.dtype, np.float32)
+        np.testing.assert_allclose(replayed, expected, rtol=1e-3, atol=1e-3)
+
+if __name__ == "__main__":
+    unittest.main()